@@ -37,6 +37,14 @@ Within the condition list should be the conditions for executing the event, spec
 
 By default, after the event has happened once, the eventActive flag is turned to false. For repeated events, this behavior can be overriden by calling the function ``setEventActivity``. Likewise, the eventActive flags of other events can be set using ``setAllButCurrentEventActivity``. See the associated documentation for more details.
 
+A condition can also be a :class:`~Basilisk.utilities.eventConditions.MessageCondition` that compares a message field,
+or the norm of an array field, with a threshold, such as::
+
+    MessageCondition(scObject.scStateOutMsg, "r_BN_N", "<", 6778e3, norm=True)
+
+If all the conditions of an event are message conditions, they are checked by the C++ scheduler and the simulation only
+returns to Python when the event fires.
+
 Setting up the faults
 ---------------------
 
@@ -42,6 +42,28 @@ multi-threading only functions for simulations where each Basilisk process can b
     The Basilisk v2.1 multi-threading does not have a thread-safe messaging system.  This will be
     added in a later release.
 
+The way the threads wait on each other can be tuned before the simulation is initialized.  With short task periods
+the time a thread needs to wake up can exceed the work done in a frame.  Setting::
+
+    TheScenario.TotalSim.threadSpinCount = 100000
+
+makes a waiting thread poll that many times before it goes to sleep.  This only pays off if there are more CPU cores
+than threads, otherwise the threads sleep right away.  ``TotalSim.threadPinning = True`` pins each thread to its own
+CPU core on Linux.  By default a thread runs its processes up to the stop time without waiting on the other threads.
+Setting ``TotalSim.threadMaxLag`` to zero or a positive number of nanoseconds keeps the threads within that much
+simulation time of each other, such that a message written by a process in another thread is seen at most that much
+simulation time later.  The bound holds in simulation time, so it also applies to threads with different task rates.
+
+Rather than specifying the threads by hand, the processes can be assigned to threads after the simulation is
+initialized with::
+
+    TheScenario.partitionThreads(numThreads, macros.sec2nano(60.))
+
+This runs the simulation for the given warm up time to measure the execution time of each process, and then spreads
+the processes over the threads such that the threads take about the same time, while processes that exchange messages
+are kept on the same thread where possible.  The modules reading a message from another thread see that message as
+it was at the start of the current frame.
+
 Illustration of Simulation Results
 ----------------------------------
 
@@ -24,6 +24,9 @@ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 #include "architecture/utilities/bskLogging.h"
 #include <typeinfo>
 #include <stdlib.h>
+#include <fstream>
+#include <string>
+#include <algorithm>
 
 /*! forward-declare sim message for use by read functor */
 template<typename messageType>
@@ -232,6 +235,48 @@ messageType* Message<messageType>::getMsgPointers(Msg2Header **msgPtr){
     return &this->payload;
 }
 
+/*! Snapshot of the messages recorded by a Recorder.  The snapshot shares the recorder's buffers, such that python
+ can access the recorded payloads in place as numpy arrays.  The recorder never moves or clears a buffer that is
+ shared with a snapshot, thus the snapshot memory stays valid as long as the snapshot exists. */
+template<typename messageType>
+class RecorderBuffer{
+public:
+    //! constructor
+    RecorderBuffer(std::shared_ptr<std::vector<messageType>> record,
+                   std::shared_ptr<std::vector<uint64_t>> recordTimes,
+                   std::shared_ptr<std::vector<uint64_t>> writtenTimes,
+                   std::shared_ptr<std::vector<messageType>> recordMin,
+                   std::shared_ptr<std::vector<messageType>> recordMax,
+                   uint64_t firstIndex) :
+        record(record), recordTimes(recordTimes), writtenTimes(writtenTimes), recordMin(recordMin),
+        recordMax(recordMax), firstIndex(firstIndex), numRecords(record->size() - firstIndex){};
+    //! address of the first recorded message payload
+    uint64_t recordAddress(){return (uint64_t) (this->record->data() + this->firstIndex);};
+    //! address of the first message recording time
+    uint64_t recordTimesAddress(){return (uint64_t) (this->recordTimes->data() + this->firstIndex);};
+    //! address of the first message written time
+    uint64_t writtenTimesAddress(){return (uint64_t) (this->writtenTimes->data() + this->firstIndex);};
+    //! address of the first window minimum payload, 0 if the recorder doesn't decimate
+    uint64_t recordMinAddress(){
+        return this->recordMin->empty() ? 0 : (uint64_t) (this->recordMin->data() + this->firstIndex);};
+    //! address of the first window maximum payload, 0 if the recorder doesn't decimate
+    uint64_t recordMaxAddress(){
+        return this->recordMax->empty() ? 0 : (uint64_t) (this->recordMax->data() + this->firstIndex);};
+    //! number of messages in the snapshot
+    uint64_t size(){return this->numRecords;};
+    //! memory size of one message payload
+    uint64_t payloadSize(){return sizeof(messageType);};
+
+private:
+    std::shared_ptr<std::vector<messageType>> record;       //!< shared buffer of recorded messages
+    std::shared_ptr<std::vector<uint64_t>> recordTimes;     //!< shared buffer of message recording times
+    std::shared_ptr<std::vector<uint64_t>> writtenTimes;    //!< shared buffer of message written times
+    std::shared_ptr<std::vector<messageType>> recordMin;    //!< shared buffer of window minimum messages
+    std::shared_ptr<std::vector<messageType>> recordMax;    //!< shared buffer of window maximum messages
+    uint64_t firstIndex;                                    //!< index of the first message in the snapshot
+    uint64_t numRecords;                                    //!< number of messages recorded when the snapshot was taken
+};
+
 /*! Keep a time history of messages accessible to users from python */
 template<typename messageType>
 class Recorder : public SysModel{
@@ -268,6 +313,37 @@ public:
         }
         this->ModelTag = "Rec:" + findMsgName(std::string(typeid(*messageReader).name()));
     }
+    //! -- copies of a recorder don't share the recorded data
+    Recorder(const Recorder<messageType>& other) : SysModel(other){
+        *this = other;
+    }
+    //! -- copies of a recorder don't share the recorded data
+    Recorder<messageType>& operator=(const Recorder<messageType>& other){
+        SysModel::operator=(other);
+        this->bskLogger = other.bskLogger;
+        this->msgRecord = std::make_shared<std::vector<messageType>>(*other.msgRecord);
+        this->msgRecordTimes = std::make_shared<std::vector<uint64_t>>(*other.msgRecordTimes);
+        this->msgWrittenTimes = std::make_shared<std::vector<uint64_t>>(*other.msgWrittenTimes);
+        this->msgRecordMin = std::make_shared<std::vector<messageType>>(*other.msgRecordMin);
+        this->msgRecordMax = std::make_shared<std::vector<messageType>>(*other.msgRecordMax);
+        this->nextUpdateTime = other.nextUpdateTime;
+        this->timeInterval = other.timeInterval;
+        this->ringSize = other.ringSize;
+        this->decimationWindow = other.decimationWindow;
+        this->decimationOffsets = other.decimationOffsets;
+        this->windowCount = other.windowCount;
+        this->windowStartTime = other.windowStartTime;
+        this->windowWrittenTime = other.windowWrittenTime;
+        this->windowSum = other.windowSum;
+        this->windowMin = other.windowMin;
+        this->windowMax = other.windowMax;
+        this->windowLast = other.windowLast;
+        this->spillFileName = other.spillFileName;
+        this->spillChunkSize = other.spillChunkSize;
+        this->numSpilled = other.numSpilled;
+        this->readMessage = other.readMessage;
+        return *this;
+    }
     ~Recorder(){};
 
     //! -- self initialization
@@ -277,26 +353,44 @@ public:
     //! -- Read and record the message
     void UpdateState(uint64_t CurrentSimNanos){
         if (CurrentSimNanos >= this->nextUpdateTime) {
-            this->msgRecordTimes.push_back(CurrentSimNanos);
-            this->msgWrittenTimes.push_back(this->readMessage.timeWritten());
-            this->msgRecord.push_back(this->readMessage());
+            if (this->decimationWindow > 0) {
+                this->accumulateWindow(CurrentSimNanos, this->readMessage.timeWritten(), this->readMessage());
+            } else {
+                this->storeRecord(CurrentSimNanos, this->readMessage.timeWritten(), this->readMessage());
+            }
             this->nextUpdateTime += this->timeInterval;
         }
     };
     //! Reset method
     void Reset(uint64_t CurrentSimNanos){
-        this->msgRecord.clear();    //!< -- Can only reset to 0 for now
-        this->msgRecordTimes.clear();
-        this->msgWrittenTimes.clear();
+        this->clear();    //!< -- Can only reset to 0 for now
         this->nextUpdateTime = CurrentSimNanos;
     };
     //! time recorded method
-    std::vector<uint64_t>& times(){return this->msgRecordTimes;}
+    std::vector<uint64_t>& times(){
+        this->trimRingBuffer();
+        return *this->msgRecordTimes;
+    }
     //! time written method
-    std::vector<uint64_t>& timesWritten(){return this->msgWrittenTimes;}
+    std::vector<uint64_t>& timesWritten(){
+        this->trimRingBuffer();
+        return *this->msgWrittenTimes;
+    }
     //! record method
-    std::vector<messageType>& record(){return this->msgRecord;};
-    
+    std::vector<messageType>& record(){
+        this->trimRingBuffer();
+        return *this->msgRecord;
+    };
+    //! snapshot of the recorded messages that can be accessed in place
+    RecorderBuffer<messageType>* buffer(){
+        uint64_t firstIndex = 0;
+        if (this->ringSize > 0 && this->msgRecord->size() > this->ringSize) {
+            firstIndex = this->msgRecord->size() - this->ringSize;
+        }
+        return new RecorderBuffer<messageType>(this->msgRecord, this->msgRecordTimes, this->msgWrittenTimes,
+                                               this->msgRecordMin, this->msgRecordMax, firstIndex);
+    };
+
     //! determine message name
     std::string findMsgName(std::string msgName) {
         size_t locMsg = msgName.find("Payload");
@@ -318,9 +412,15 @@ public:
 
     //! clear the recorded messages, i.e. purge the history
     void clear(){
-        this->msgRecord.clear();
-        this->msgRecordTimes.clear();
-        this->msgWrittenTimes.clear();
+        this->clearUnshared(this->msgRecord);
+        this->clearUnshared(this->msgRecordTimes);
+        this->clearUnshared(this->msgWrittenTimes);
+        this->clearUnshared(this->msgRecordMin);
+        this->clearUnshared(this->msgRecordMax);
+        this->windowCount = 0;
+        if (!this->spillFileName.empty()) {
+            this->startSpillFile();
+        }
     };
 
     BSKLogger bskLogger;                          //!< -- BSK Logging
@@ -330,13 +430,226 @@ public:
         this->timeInterval = timeDiff;
     };
 
+    //! only keep the latest numSamples recorded messages in memory, 0 keeps all messages
+    void setRingBuffer(uint64_t numSamples) {
+        this->ringSize = numSamples;
+    };
+
+    /*! record one message per time window that contains the mean, minimum and maximum of the double
+     precision payload variables registered with addDecimationField() over the window, 0 turns decimation off.
+     A window is recorded when the first message past the window is recorded, such that the last window of a
+     simulation is only recorded by closeDecimationWindow(). */
+    void setDecimationWindow(uint64_t windowNanos) {
+        this->decimationWindow = windowNanos;
+        this->windowCount = 0;
+    };
+
+    /*! record the decimation window that is still open, such as the last window at the end of the simulation.
+     The next recorded message starts a new window. */
+    void closeDecimationWindow() {
+        if (this->decimationWindow > 0 && this->windowCount > 0) {
+            this->storeWindow();
+        }
+    };
+
+    //! register the byte offset of a double precision payload variable that is averaged over the decimation window
+    void addDecimationField(uint64_t byteOffset) {
+        if (byteOffset + sizeof(double) > sizeof(messageType)) {
+            bskLogger.bskLog(BSK_ERROR, "Recorder decimation field offset %llu is outside of the message payload.",
+                             (unsigned long long) byteOffset);
+            return;
+        }
+        if (std::find(this->decimationOffsets.begin(), this->decimationOffsets.end(), byteOffset)
+            == this->decimationOffsets.end()) {
+            this->decimationOffsets.push_back(byteOffset);
+        }
+    };
+
+    /*! stream the recorded messages to a binary file, only keeping up to chunkSize messages in memory.
+     An empty file name turns streaming off.  The file contains a header with the record count and sizes, followed
+     by the recording time, the written time and the message payload(s) of each recorded message. */
+    void setSpillFile(std::string fileName, uint64_t chunkSize = 1000) {
+        this->spillFileName = fileName;
+        this->spillChunkSize = chunkSize > 0 ? chunkSize : 1;
+        if (!this->spillFileName.empty()) {
+            this->startSpillFile();
+        }
+    };
+
+    //! name of the file that the recorded messages are streamed to
+    std::string getSpillFile() {return this->spillFileName;};
+
+    //! write all messages that are still in memory to the spill file
+    void flushSpillFile() {
+        if (this->spillFileName.empty() || this->msgRecord->empty()) {
+            return;
+        }
+        std::ofstream spillFile(this->spillFileName, std::ios::binary | std::ios::app);
+        bool decimating = !this->msgRecordMin->empty();
+        for (size_t c = 0; c < this->msgRecord->size(); c++) {
+            spillFile.write((const char*) &(*this->msgRecordTimes)[c], sizeof(uint64_t));
+            spillFile.write((const char*) &(*this->msgWrittenTimes)[c], sizeof(uint64_t));
+            spillFile.write((const char*) &(*this->msgRecord)[c], sizeof(messageType));
+            if (decimating) {
+                spillFile.write((const char*) &(*this->msgRecordMin)[c], sizeof(messageType));
+                spillFile.write((const char*) &(*this->msgRecordMax)[c], sizeof(messageType));
+            }
+        }
+        this->numSpilled += this->msgRecord->size();
+        spillFile.close();
+        // the append mode ignores seeks, update the record count in the header separately
+        std::fstream headerFile(this->spillFileName, std::ios::binary | std::ios::in | std::ios::out);
+        uint64_t header[2] = {this->numSpilled, decimating ? (uint64_t) 3 : (uint64_t) 1};
+        headerFile.seekp(sizeof(uint64_t));
+        headerFile.write((const char*) header, sizeof(header));
+        headerFile.close();
+
+        this->clearUnshared(this->msgRecord);
+        this->clearUnshared(this->msgRecordTimes);
+        this->clearUnshared(this->msgWrittenTimes);
+        this->clearUnshared(this->msgRecordMin);
+        this->clearUnshared(this->msgRecordMax);
+    };
+
 private:
-    std::vector<messageType> msgRecord;           //!< vector of recorded messages
-    std::vector<uint64_t> msgRecordTimes;         //!< vector of times at which messages are recorded
-    std::vector<uint64_t> msgWrittenTimes;        //!< vector of times at which messages are written
+    //! add a record to the in-memory buffers, the spill file or the ring buffer
+    void storeRecord(uint64_t recordTime, uint64_t writtenTime, const messageType& payload,
+                     const messageType* payloadMin = nullptr, const messageType* payloadMax = nullptr){
+        this->reserveUnshared(this->msgRecordTimes);
+        this->reserveUnshared(this->msgWrittenTimes);
+        this->reserveUnshared(this->msgRecord);
+        this->msgRecordTimes->push_back(recordTime);
+        this->msgWrittenTimes->push_back(writtenTime);
+        this->msgRecord->push_back(payload);
+        if (payloadMin) {
+            this->reserveUnshared(this->msgRecordMin);
+            this->reserveUnshared(this->msgRecordMax);
+            this->msgRecordMin->push_back(*payloadMin);
+            this->msgRecordMax->push_back(*payloadMax);
+        }
+
+        if (!this->spillFileName.empty()) {
+            if (this->msgRecord->size() >= this->spillChunkSize) {
+                this->flushSpillFile();
+            }
+        } else if (this->ringSize > 0 && this->msgRecord->size() >= 2*this->ringSize) {
+            // drop the oldest messages once the buffer holds twice the ring size, such that the memory stays
+            // bounded while the latest ringSize messages remain contiguous
+            this->trimRingBuffer();
+        }
+    };
+    //! only keep the latest ringSize messages, the accessors call this such that they never return older messages
+    void trimRingBuffer(){
+        if (this->ringSize == 0 || !this->spillFileName.empty() || this->msgRecord->size() <= this->ringSize) {
+            return;
+        }
+        this->dropOldest(this->msgRecordTimes);
+        this->dropOldest(this->msgWrittenTimes);
+        this->dropOldest(this->msgRecord);
+        if (!this->msgRecordMin->empty()) {
+            this->dropOldest(this->msgRecordMin);
+            this->dropOldest(this->msgRecordMax);
+        }
+    };
+    //! accumulate the mean, minimum and maximum over the decimation window
+    void accumulateWindow(uint64_t recordTime, uint64_t writtenTime, const messageType& payload){
+        if (this->windowCount > 0 && recordTime >= this->windowStartTime + this->decimationWindow) {
+            this->storeWindow();
+        }
+        if (this->windowCount == 0) {
+            this->windowStartTime = recordTime;
+            this->windowMin = payload;
+            this->windowMax = payload;
+            this->windowSum.assign(this->decimationOffsets.size(), 0.0);
+        }
+        for (size_t c = 0; c < this->decimationOffsets.size(); c++) {
+            double value = *this->field(payload, this->decimationOffsets[c]);
+            this->windowSum[c] += value;
+            double* minValue = this->field(this->windowMin, this->decimationOffsets[c]);
+            double* maxValue = this->field(this->windowMax, this->decimationOffsets[c]);
+            *minValue = std::min(*minValue, value);
+            *maxValue = std::max(*maxValue, value);
+        }
+        this->windowLast = payload;
+        this->windowWrittenTime = writtenTime;
+        this->windowCount++;
+    };
+    //! record the current window, the mean message has the non-decimated variables of the last message
+    void storeWindow(){
+        messageType payloadMean = this->windowLast;
+        for (size_t c = 0; c < this->decimationOffsets.size(); c++) {
+            *this->field(payloadMean, this->decimationOffsets[c]) = this->windowSum[c] / this->windowCount;
+        }
+        this->storeRecord(this->windowStartTime, this->windowWrittenTime, payloadMean,
+                          &this->windowMin, &this->windowMax);
+        this->windowCount = 0;
+    };
+    //! pointer to the double precision payload variable at a byte offset
+    double* field(const messageType& payload, uint64_t byteOffset){
+        return (double*) ((char*) &payload + byteOffset);
+    };
+    //! write the spill file header, discarding earlier content
+    void startSpillFile(){
+        std::ofstream spillFile(this->spillFileName, std::ios::binary | std::ios::trunc);
+        uint64_t header[4] = {(uint64_t) sizeof(messageType), 0, 1, 0};
+        spillFile.write((const char*) header, sizeof(header));
+        spillFile.close();
+        this->numSpilled = 0;
+    };
+    //! make sure appending to the buffer doesn't move memory that is still viewed by a RecorderBuffer snapshot
+    template<typename T>
+    void reserveUnshared(std::shared_ptr<std::vector<T>>& buffer){
+        if (buffer.use_count() > 1 && buffer->size() == buffer->capacity()) {
+            std::shared_ptr<std::vector<T>> newBuffer = std::make_shared<std::vector<T>>();
+            newBuffer->reserve(2*buffer->capacity() + 1);
+            newBuffer->insert(newBuffer->end(), buffer->begin(), buffer->end());
+            buffer = newBuffer;
+        }
+    };
+    //! clear the buffer, leaving the memory of RecorderBuffer snapshots untouched
+    template<typename T>
+    void clearUnshared(std::shared_ptr<std::vector<T>>& buffer){
+        if (buffer.use_count() > 1) {
+            buffer = std::make_shared<std::vector<T>>();
+        } else {
+            buffer->clear();
+        }
+    };
+    //! only keep the latest ringSize entries of the buffer, leaving the memory of RecorderBuffer snapshots untouched
+    template<typename T>
+    void dropOldest(std::shared_ptr<std::vector<T>>& buffer){
+        if (buffer.use_count() > 1) {
+            std::shared_ptr<std::vector<T>> newBuffer = std::make_shared<std::vector<T>>();
+            newBuffer->reserve(2*this->ringSize);
+            newBuffer->insert(newBuffer->end(), buffer->end() - this->ringSize, buffer->end());
+            buffer = newBuffer;
+        } else {
+            buffer->erase(buffer->begin(), buffer->end() - this->ringSize);
+        }
+    };
+
+    std::shared_ptr<std::vector<messageType>> msgRecord = std::make_shared<std::vector<messageType>>();   //!< vector of recorded messages
+    std::shared_ptr<std::vector<uint64_t>> msgRecordTimes = std::make_shared<std::vector<uint64_t>>();    //!< vector of times at which messages are recorded
+    std::shared_ptr<std::vector<uint64_t>> msgWrittenTimes = std::make_shared<std::vector<uint64_t>>();   //!< vector of times at which messages are written
+    std::shared_ptr<std::vector<messageType>> msgRecordMin = std::make_shared<std::vector<messageType>>();   //!< vector of window minimum messages when decimating
+    std::shared_ptr<std::vector<messageType>> msgRecordMax = std::make_shared<std::vector<messageType>>();   //!< vector of window maximum messages when decimating
     uint64_t nextUpdateTime = 0;                  //!< [ns] earliest time at which the msg is recorded again
     uint64_t timeInterval;                        //!< [ns] recording time intervale
 
+    uint64_t ringSize = 0;                        //!< number of latest messages kept in memory, 0 keeps all messages
+    uint64_t decimationWindow = 0;                //!< [ns] decimation time window, 0 if not decimating
+    std::vector<uint64_t> decimationOffsets;      //!< byte offsets of the decimated double payload variables
+    uint64_t windowCount = 0;                     //!< number of messages accumulated in the current window
+    uint64_t windowStartTime = 0;                 //!< [ns] recording time of the first message in the current window
+    uint64_t windowWrittenTime = 0;               //!< [ns] written time of the last message in the current window
+    std::vector<double> windowSum;                //!< sum of the decimated variables over the current window
+    messageType windowMin = {};                   //!< minimum of the decimated variables over the current window
+    messageType windowMax = {};                   //!< maximum of the decimated variables over the current window
+    messageType windowLast = {};                  //!< last message of the current window
+    std::string spillFileName;                    //!< file the recorded messages are streamed to, empty if not streaming
+    uint64_t spillChunkSize = 1000;               //!< number of messages kept in memory before writing to the spill file
+    uint64_t numSpilled = 0;                      //!< number of messages written to the spill file
+
 private:
     ReadFunctor<messageType> readMessage;   //!< method description
 };
@@ -1,4 +1,90 @@
-import sys, os
+import sys, os, re
+
+# numpy type codes of the C types that can be viewed in place in the recorded message buffer
+NUMPY_TYPES = {
+    'double': 'f8',
+    'float': 'f4',
+    'bool': '?',
+    'int': 'intc',
+    'unsigned int': 'uintc',
+    'short': 'h',
+    'unsigned short': 'H',
+    'long': 'l',
+    'unsigned long': 'L',
+    'long long': 'q',
+    'unsigned long long': 'Q',
+    'size_t': 'uintp',
+    'int8_t': 'i1',
+    'uint8_t': 'u1',
+    'int16_t': 'i2',
+    'uint16_t': 'u2',
+    'int32_t': 'i4',
+    'uint32_t': 'u4',
+    'int64_t': 'i8',
+    'uint64_t': 'u8',
+}
+
+
+def parsePayloadFields(headerPath, payloadName):
+    """
+    Find the plain data fields (scalars and fixed size arrays of numeric types) of a message payload structure.
+    Fields of any other type, such as structures, pointers, strings or vectors, are skipped.
+
+    :return: list of (fieldName, numpyType, [array dimensions]) tuples
+    """
+    with open(headerPath, 'r') as headerFid:
+        source = headerFid.read()
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'//.*', '', source)
+
+    # find the body of the typedef'd struct that ends with the payload name
+    match = None
+    for candidate in re.finditer(r'typedef\s+struct[^{]*\{(.*?)\}\s*' + payloadName + r'\s*;', source, flags=re.S):
+        match = candidate
+    if match is None:
+        return []
+
+    fields = []
+    declPattern = re.compile(r'^(?:const\s+)?([A-Za-z_][\w ]*?)\s+([A-Za-z_]\w*)\s*((?:\[[^\]]+\])*)$')
+    for decl in match.group(1).split(';'):
+        decl = ' '.join(decl.split())
+        # strip a default member initializer, such as ``= 0`` or ``= {0}`` or ``{0}``
+        decl = re.sub(r'\s*(=.*|\{.*\})$', '', decl)
+        if decl == '' or ',' in decl or '*' in decl or '<' in decl:
+            continue
+        declMatch = declPattern.match(decl)
+        if declMatch is None or declMatch.group(1) not in NUMPY_TYPES:
+            continue
+        dims = re.findall(r'\[([^\]]+)\]', declMatch.group(3))
+        fields.append((declMatch.group(2), NUMPY_TYPES[declMatch.group(1)], dims))
+    return fields
+
+
+def generateFieldLayout(structType, fields):
+    """
+    Generate the swig code that describes the memory layout of the plain data payload fields.  The offsets and array
+    sizes are evaluated by the compiler, such that padding and array size macros are accounted for.
+    """
+    payload = structType + 'Payload'
+    layout = []
+    for name, _, dims in fields:
+        layout.append('offsetof({0}, {1})'.format(payload, name))
+        for i in range(len(dims)):
+            layout.append('std::extent<decltype({0}::{1}), {2}>::value'.format(payload, name, i))
+    layout.append('sizeof({0})'.format(payload))
+
+    code = '%{\n#include <cstddef>\n#include <type_traits>\n%}\n'
+    code += '%inline %{\n'
+    code += '/*! offset and array dimensions of each plain data field, followed by the payload size */\n'
+    code += 'std::vector<unsigned long long> ' + payload + 'FieldLayout() {\n'
+    code += '    return {' + ',\n            '.join(layout) + '};\n'
+    code += '}\n%}\n'
+    code += '%pythoncode %{\n'
+    code += payload + 'Fields = [' + ', '.join(
+        '("{0}", "{1}", {2})'.format(name, npType, len(dims)) for name, npType, dims in fields) + ']\n'
+    code += '%}\n'
+    return code
+
 
 if __name__ == "__main__":
      moduleOutputPath = sys.argv[1]
@@ -8,7 +94,7 @@ if __name__ == "__main__":
      generateCInfo = sys.argv[5] == 'True'
 
      swigTemplateFile = 'msgInterfacePy.i.in'
-     swigCTemplateFile = 'cMsgCInterfacePy.i.in'     
+     swigCTemplateFile = 'cMsgCInterfacePy.i.in'
 
      swigFid = open(swigTemplateFile, 'r')
      swigTemplateData = swigFid.read()
@@ -20,8 +106,7 @@ if __name__ == "__main__":
 
      moduleFileOut = open(moduleOutputPath, 'w')
      moduleFileOut.write(swigTemplateData.format(type=structType, baseDir=baseDir))
+     moduleFileOut.write(generateFieldLayout(structType, parsePayloadFields(headerinputPath, structType + 'Payload')))
      if(generateCInfo):
          moduleFileOut.write(swigCTemplateData.format(type=structType))
      moduleFileOut.close()
-
-
@@ -0,0 +1,35 @@
+/*
+ ISC License
+
+ Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef eclipseEventSimMsg_h
+#define eclipseEventSimMsg_h
+
+#include <stdint.h>
+
+//!@brief Eclipse event message definition, providing the entry and exit times of the eclipses of a spacecraft.
+typedef struct {
+    int inEclipse;              //!< [-] 1 if the spacecraft is currently shadowed, 0 otherwise
+    int numEclipses;            //!< [-] number of eclipses entered since the module reset
+    uint64_t entryTime;         //!< [ns] time of the last eclipse entry
+    uint64_t exitTime;          //!< [ns] time of the last eclipse exit, zero if no eclipse has ended yet
+    double minShadowFactor;     //!< [-] minimum shadow factor of the current or last eclipse
+}EclipseEventMsgPayload;
+
+
+#endif /* eclipseEventSimMsg_h */
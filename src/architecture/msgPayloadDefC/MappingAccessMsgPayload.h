@@ -0,0 +1,39 @@
+/*
+ ISC License
+
+ Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef MAPPING_ACCESS_MESSAGE_H
+#define MAPPING_ACCESS_MESSAGE_H
+
+#include <stdint.h>
+#include "architecture/utilities/macroDefinitions.h"
+
+/*! @brief Bulk access message of a set of mapping points.  Only the points that are currently accessible are listed,
+ * ordered by increasing point index.  Only the first numAccessPoints entries of the arrays are valid.
+ */
+typedef struct {
+    int numAccessPoints;                                    //!< [-] number of accessible points stored in this message
+    int numDroppedPoints;                                   //!< [-] number of accessible points that did not fit in this message
+    uint64_t pointIndex[MAX_MAPPING_ACCESS_POINTS];         //!< [-] index of the accessible mapping point, in the order the points were added
+    double slantRange[MAX_MAPPING_ACCESS_POINTS];           //!< [m] range from the mapping point to the spacecraft
+    double elevation[MAX_MAPPING_ACCESS_POINTS];            //!< [rad] elevation angle of the spacecraft seen from the mapping point
+    double azimuth[MAX_MAPPING_ACCESS_POINTS];              //!< [rad] azimuth angle of the spacecraft seen from the mapping point
+}MappingAccessMsgPayload;
+
+
+#endif
@@ -0,0 +1,41 @@
+/*
+ ISC License
+
+ Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include <vector>
+#include <cstdint>
+
+#ifndef BASILISK_DATASTORAGELEVELSSIMMSG_H
+#define BASILISK_DATASTORAGELEVELSSIMMSG_H
+
+
+/*! @brief Message with the stored data amounts of a storage unit, without the data names.  The names are in the
+ storage status message, which only needs to be read again when storedDataNameCount changes.*/
+typedef struct
+//@cond DOXYGEN_IGNORE
+DataStorageLevelsMsgPayload
+//@endcond
+{
+    double storageLevel; //!< [b] Storage unit stored data in bits.
+    double storageCapacity; //!< [b] Maximum data storage unit capacity.
+    double currentNetBaud; //!< [baud] Current data written to or removed from the storage unit net power.
+    uint64_t storedDataNameCount; //!< [] Number of times the data names of the storage status message have changed
+    std::vector<double> storedData;             //!< [] vector of stored data amount for each data name group
+}DataStorageLevelsMsgPayload;
+
+#endif //BASILISK_DATASTORAGELEVELSSIMMSG_H
@@ -0,0 +1,153 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Compiled Events Unit Test
+#
+# Purpose:  Test that events with message conditions checked by the scheduler fire at the same times as the
+#           equivalent Python events, without returning to Python at every event check
+#
+
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities import simulationArchTypes
+from Basilisk.utilities.eventConditions import MessageCondition
+
+
+class EventActivatingModel(simulationArchTypes.PythonModelClass):
+    """Python module that activates an event of its simulation at a given time"""
+    def __init__(self, modelName, sim, eventName, activationTime):
+        super(EventActivatingModel, self).__init__(modelName)
+        self.sim = sim
+        self.eventName = eventName
+        self.activationTime = activationTime
+
+    def updateState(self, currentTime):
+        if currentTime == self.activationTime:
+            self.sim.setEventActivity(self.eventName, True)
+
+
+def runEventSim(compiled):
+    """run a counter module with a threshold event that activates an event on the norm of the counter output, and
+    return the event firing times, the number of returns to Python and the events"""
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    proc = sim.CreateNewProcess("proc")
+    proc.addTask(sim.CreateNewTask("task", macros.sec2nano(0.1)))
+    module = cppModuleTemplate.CppModuleTemplate()
+    module.ModelTag = "counter"
+    sim.AddModelToTask("task", module)
+    sim.counterModule = module
+    sim.firedTimes = []
+
+    if compiled:
+        thresholdCondition = MessageCondition(module.dataOutMsg, "dataVector", ">", 25., index=0)
+        normCondition = MessageCondition(module.dataOutMsg, "dataVector", ">=", 60., norm=True)
+    else:
+        thresholdCondition = "self.counterModule.dataOutMsg.read().dataVector[0] > 25."
+        normCondition = "np.linalg.norm(self.counterModule.dataOutMsg.read().dataVector) >= 60."
+    sim.createNewEvent("threshold", macros.sec2nano(1.), True, [thresholdCondition],
+                       ["self.firedTimes.append(self.TotalSim.CurrentNanos)",
+                        "self.setEventActivity('norm', True)"])
+    sim.createNewEvent("norm", macros.sec2nano(2.), False, [normCondition],
+                       ["self.firedTimes.append(self.TotalSim.CurrentNanos)"])
+
+    sim.InitializeSimulation()
+    sim.enableProfiling()
+    sim.ConfigureStopTime(macros.sec2nano(10.))
+    sim.ExecuteSimulation()
+    profile = sim.getProfile().set_index("module")
+    return sim.firedTimes, profile.loc["RecordLogVars", "calls"], sim.eventMap
+
+
+def test_compiledEvents():
+    r"""
+    **Validation Test Description**
+
+    The counter output exceeds the threshold of the first event at 3 s, which then activates the second event that
+    checks the norm of the counter output every 2 s, and fires at 6 s.  The compiled and the Python events must fire
+    at these times, and the compiled events may only return to Python when they fire.
+    """
+    pythonTimes, pythonReturns, pythonEvents = runEventSim(False)
+    compiledTimes, compiledReturns, compiledEvents = runEventSim(True)
+
+    expectedTimes = [macros.sec2nano(3.), macros.sec2nano(6.)]
+    assert pythonTimes == expectedTimes
+    assert compiledTimes == expectedTimes
+    for eventName in ["threshold", "norm"]:
+        assert compiledEvents[eventName].compiledIndex is not None
+        assert compiledEvents[eventName].occurCounter == pythonEvents[eventName].occurCounter == 1
+        assert not compiledEvents[eventName].eventActive
+    # the simulation returns to Python after the first time step, at the two firings and at the stop time
+    assert pythonReturns > 10
+    assert compiledReturns == 4
+
+
+def test_pythonEventActivatedMidRun():
+    r"""
+    **Validation Test Description**
+
+    The only Python event is inactive, such that the simulation stops checking the events.  A Python module then
+    activates the event at 2 s, and the event must fire at this time within the same ``ExecuteSimulation()`` call.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    proc = sim.CreateNewProcess("proc")
+    proc.addTask(sim.CreateNewTask("task", macros.sec2nano(0.1)))
+    module = cppModuleTemplate.CppModuleTemplate()
+    module.ModelTag = "counter"
+    sim.AddModelToTask("task", module)
+    pyProc = sim.CreateNewPythonProcess("pyProcess")
+    pyProc.createPythonTask("pyTask", macros.sec2nano(1.))
+    pyProc.addModelToTask("pyTask", EventActivatingModel("activator", sim, "activated", macros.sec2nano(2.)))
+    sim.firedTimes = []
+    sim.createNewEvent("activated", macros.sec2nano(1.), False, ["True"],
+                       ["self.firedTimes.append(self.TotalSim.CurrentNanos)"])
+
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(macros.sec2nano(5.))
+    sim.ExecuteSimulation()
+    assert sim.firedTimes == [macros.sec2nano(2.)]
+
+
+def test_messageConditionErrors():
+    r"""
+    **Validation Test Description**
+
+    Message conditions must reject fields that can't be compared in C++ and ambiguous array comparisons.
+    """
+    module = cppModuleTemplate.CppModuleTemplate()
+    with pytest.raises(ValueError):
+        MessageCondition(module.dataOutMsg, "noSuchField", ">", 0.)
+    with pytest.raises(ValueError):
+        MessageCondition(module.dataOutMsg, "dataVector", ">", 0.)
+    with pytest.raises(ValueError):
+        MessageCondition(module.dataOutMsg, "dataVector", "=>", 0., index=0)
+    with pytest.raises(ValueError):
+        MessageCondition(module.dataOutMsg, "dataVector", ">", 0., index=0, norm=True)
+    with pytest.raises(ValueError):
+        MessageCondition(module.dataInMsg, "dataVector", ">", 0., index=0)
+
+
+if __name__ == "__main__":
+    test_compiledEvents()
+    test_pythonEventActivatedMidRun()
+    test_messageConditionErrors()
@@ -0,0 +1,115 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Execution Profiling Unit Test
+#
+# Purpose:  Test the call counts and times of the module, task and process execution profiles, and the Chrome
+#           trace export
+#
+
+import json
+import os
+import time
+
+import numpy as np
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities import simulationArchTypes
+
+
+class SleepingModel(simulationArchTypes.PythonModelClass):
+    """Python module that takes at least a millisecond per call"""
+    def updateState(self, currentTime):
+        time.sleep(0.001)
+
+
+def test_executionProfiling(tmp_path):
+    r"""
+    **Validation Test Description**
+
+    A simulation with two C++ tasks, a Python task, an event and a logged variable is profiled over part of its run.
+    The call counts of every module, task and process must match the number of calls while profiling, and the times
+    must add up.  The recorded calls are exported as a Chrome trace.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    proc = sim.CreateNewProcess("dynProcess")
+    for taskName, rate in [("fastTask", 0.1), ("slowTask", 1.)]:
+        proc.addTask(sim.CreateNewTask(taskName, macros.sec2nano(rate)))
+        for k in range(2):
+            module = cppModuleTemplate.CppModuleTemplate()
+            module.ModelTag = taskName + "Module" + str(k)
+            sim.AddModelToTask(taskName, module)
+    pyProc = sim.CreateNewPythonProcess("pyProcess")
+    pyProc.createPythonTask("pyTask", macros.sec2nano(1.))
+    pyProc.addModelToTask("pyTask", SleepingModel("pyModel"))
+    sim.AddVariableForLogging("fastTaskModule0.dummy", macros.sec2nano(1.))
+    sim.createNewEvent("neverEvent", macros.sec2nano(1.), True, ["False"], [])
+
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(macros.sec2nano(2.))
+    sim.ExecuteSimulation()
+    sim.enableProfiling(maxTraceEvents=1000)
+    sim.ConfigureStopTime(macros.sec2nano(12.))
+    sim.ExecuteSimulation()
+    sim.disableProfiling()
+    sim.ConfigureStopTime(macros.sec2nano(14.))
+    sim.ExecuteSimulation()
+
+    profile = sim.getProfile()
+    modules = profile[profile.level == "module"].set_index("module")
+    np.testing.assert_array_equal(modules.loc[["fastTaskModule0", "fastTaskModule1"], "calls"], [100, 100])
+    np.testing.assert_array_equal(modules.loc[["slowTaskModule0", "slowTaskModule1"], "calls"], [10, 10])
+    assert modules.loc["pyModel", "calls"] == 10
+    assert modules.loc["pyModel", "meanTime"] >= 1e6
+    assert modules.loc["checkEvents", "calls"] > 0
+    assert modules.loc["RecordLogVars", "calls"] > 0
+    assert (modules.loc["fastTaskModule0", "process"], modules.loc["pyModel", "process"]) == \
+           ("dynProcess", "pyProcess")
+
+    tasks = profile[profile.level == "task"].set_index("task")
+    np.testing.assert_array_equal(tasks.loc[["fastTask", "slowTask", "pyTask"], "calls"], [100, 10, 10])
+    for taskName in ["fastTask", "slowTask", "pyTask"]:
+        taskModules = modules[modules.task == taskName]
+        assert tasks.loc[taskName, "totalTime"] >= taskModules.totalTime.sum()
+    processes = profile[profile.level == "process"].set_index("process")
+    assert processes.loc["dynProcess", "calls"] == 110
+    assert processes.loc["dynProcess", "totalTime"] == tasks.loc[["fastTask", "slowTask"], "totalTime"].sum()
+
+    for _, row in profile.iterrows():
+        assert sum(row.histogram) == row.calls
+        assert row.maxTime <= row.totalTime
+        assert row.meanTime <= row.maxTime
+
+    traceFile = os.path.join(str(tmp_path), "profile.json")
+    sim.writeProfileTrace(traceFile)
+    with open(traceFile) as f:
+        trace = json.load(f)
+    names = [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert names.count("fastTaskModule1") == 100
+    assert names.count("pyModel") == 10
+
+    sim.clearProfile()
+    assert sim.getProfile().calls.sum() == 0
+
+
+if __name__ == "__main__":
+    test_executionProfiling(".")
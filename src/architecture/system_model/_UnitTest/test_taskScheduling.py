@@ -0,0 +1,151 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Task Scheduling Unit Test
+#
+# Purpose:  Test that the processes and tasks are executed at the right times and in the order of their
+#           priorities, with the processes and tasks of equal priority executed in the order they were added
+#
+
+import time
+
+import numpy as np
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def addCounterTask(sim, proc, taskName, rate, taskPriority=-1, firstStart=0):
+    """add a task with a counter module and a recorder of the counter output, and return both"""
+    proc.addTask(sim.CreateNewTask(taskName, rate, FirstStart=firstStart), taskPriority)
+    module = cppModuleTemplate.CppModuleTemplate()
+    module.ModelTag = taskName + "Module"
+    sim.AddModelToTask(taskName, module)
+    dataLog = module.dataOutMsg.recorder()
+    sim.AddModelToTask(taskName, dataLog)
+    return module, dataLog
+
+
+def test_taskExecutionOrder():
+    r"""
+    **Validation Test Description**
+
+    Tasks of the same rate are spread over three processes with equal and different priorities, and are added in
+    an order that differs from the expected execution order.  The counter module of each task reads the output of the
+    counter module of the task expected to run just before it, such that the output of the last module only equals
+    the sum of all the call counts if all the tasks were executed in the expected order at every time step.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    # processes of equal priority run in the order they were added
+    procB = sim.CreateNewProcess("procB", 5)
+    procA = sim.CreateNewProcess("procA", 10)
+    procC = sim.CreateNewProcess("procC", 5)
+
+    # (process, task name, task priority) in the order the tasks are added
+    taskSetup = [(procA, "a2", 1), (procA, "a0", 20), (procA, "a1", 1),
+                 (procB, "b1", -1), (procB, "b0", 3), (procB, "b2", -1), (procB, "b3", -5),
+                 (procC, "c0", -1), (procC, "c1", -1)]
+    expectedOrder = ["a0", "a1", "a2", "b0", "b1", "b2", "b3", "c0", "c1"]
+
+    modules = {}
+    dataLogs = {}
+    for proc, taskName, taskPriority in taskSetup:
+        modules[taskName], dataLogs[taskName] = addCounterTask(sim, proc, taskName, macros.sec2nano(1.),
+                                                               taskPriority)
+    for previousName, taskName in zip(expectedOrder[:-1], expectedOrder[1:]):
+        modules[taskName].dataInMsg.subscribeTo(modules[previousName].dataOutMsg)
+
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(macros.sec2nano(10.))
+    sim.ExecuteSimulation()
+
+    numCalls = np.arange(1, 12)
+    for k, taskName in enumerate(expectedOrder):
+        np.testing.assert_array_equal(dataLogs[taskName].times(), (numCalls - 1) * macros.sec2nano(1.))
+        np.testing.assert_array_equal(dataLogs[taskName].dataVector[:, 0], (k + 1) * numCalls)
+
+
+def test_taskRescheduling():
+    r"""
+    **Validation Test Description**
+
+    Many tasks with different rates and first start times are added to a process.  Every task must be executed at
+    its first start time and then at every multiple of its period, also after the period of some of the tasks is
+    changed during the simulation.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    proc = sim.CreateNewProcess("proc")
+
+    rates = [1., 2., 3., 5., 0.5, 4.]
+    tasks = []
+    for k in range(60):
+        rate = macros.sec2nano(rates[k % len(rates)])
+        firstStart = (k % 4) * rate
+        _, dataLog = addCounterTask(sim, proc, "task" + str(k), rate, k % 3, firstStart)
+        tasks.append([rate, firstStart, dataLog])
+
+    stopTime = macros.sec2nano(30.)
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(stopTime)
+    sim.ExecuteSimulation()
+    for rate, firstStart, dataLog in tasks:
+        np.testing.assert_array_equal(dataLog.times(), np.arange(firstStart, stopTime + 1, rate))
+
+    # after a period change a task runs at the multiples of the new period that follow its last call
+    for k in range(6):
+        proc.updateTaskPeriod("task" + str(k), 2 * tasks[k][0])
+    sim.ConfigureStopTime(2 * stopTime)
+    sim.ExecuteSimulation()
+    for k, (rate, firstStart, dataLog) in enumerate(tasks):
+        expectedTimes = np.arange(firstStart, stopTime + 1, rate)
+        if k < 6:
+            nextTime = (expectedTimes[-1] // (2 * rate) + 1) * 2 * rate
+            expectedTimes = np.concatenate([expectedTimes, np.arange(nextTime, 2 * stopTime + 1, 2 * rate)])
+        else:
+            expectedTimes = np.arange(firstStart, 2 * stopTime + 1, rate)
+        np.testing.assert_array_equal(dataLog.times(), expectedTimes)
+
+
+def benchmarkTaskScheduling():
+    """print the time needed to run a process with a growing number of tasks"""
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    rates = [0.1, 0.2, 0.25, 0.5, 1., 3.]
+    for numTasks in [10, 100, 1000, 10000]:
+        sim = SimulationBaseClass.SimBaseClass()
+        proc = sim.CreateNewProcess("proc")
+        for k in range(numTasks):
+            taskName = "task" + str(k)
+            proc.addTask(sim.CreateNewTask(taskName, macros.sec2nano(rates[k % len(rates)])))
+            module = cppModuleTemplate.CppModuleTemplate()
+            module.ModelTag = taskName + "Module"
+            sim.AddModelToTask(taskName, module)
+        sim.InitializeSimulation()
+        sim.ConfigureStopTime(macros.sec2nano(20.))
+        start = time.perf_counter()
+        sim.ExecuteSimulation()
+        print(f"{numTasks} tasks: {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    test_taskExecutionOrder()
+    test_taskRescheduling()
+    benchmarkTaskScheduling()
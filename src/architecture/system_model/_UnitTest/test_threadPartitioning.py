@@ -0,0 +1,114 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Thread Partitioning Unit Test
+#
+# Purpose:  Test the assignment of the processes to threads and the exchange of the messages read by other threads
+#
+
+import numpy as np
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities import threadPartitioning
+
+
+def test_partitionProcesses():
+    r"""
+    **Validation Test Description**
+
+    Independent processes of different costs must be balanced over the threads, and processes linked by messages
+    must share a thread as long as the balance limit allows it.
+    """
+    costs = [5., 4., 3., 3., 2., 2., 1.]
+    assignment = threadPartitioning.partitionProcesses(costs, [], 2, 0.)
+    loads = [sum(c for c, t in zip(costs, assignment) if t == thread) for thread in range(2)]
+    assert sorted(loads) == [10., 10.]
+
+    # two chains of linked processes of equal cost end up on their own thread
+    links = [(0, 2), (2, 4), (1, 3), (3, 5)]
+    assignment = threadPartitioning.partitionProcesses([1.] * 6, links, 2, 0.)
+    assert assignment[0] == assignment[2] == assignment[4]
+    assert assignment[1] == assignment[3] == assignment[5]
+    assert assignment[0] != assignment[1]
+
+    # there are never more threads than processes
+    assert threadPartitioning.partitionProcesses([1., 1.], [], 8) == [0, 1]
+
+
+def runPartitionedSim(warmupTime):
+    """run two processes of a counter module, the second one reading the output of the first one, partitioned
+    over two threads after the warm up time, and return the process threads and the two output recorders"""
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    modules = []
+    dataLogs = []
+    for k in range(2):
+        taskName = "task" + str(k)
+        proc = sim.CreateNewProcess("proc" + str(k), 10 - k)
+        proc.addTask(sim.CreateNewTask(taskName, macros.sec2nano(0.1)))
+        module = cppModuleTemplate.CppModuleTemplate()
+        module.ModelTag = taskName + "Module"
+        sim.AddModelToTask(taskName, module)
+        modules.append(module)
+        dataLogs.append(module.dataOutMsg.recorder())
+        sim.AddModelToTask(taskName, dataLogs[-1])
+    modules[1].dataInMsg.subscribeTo(modules[0].dataOutMsg)
+
+    sim.InitializeSimulation()
+    # without imbalance the two processes of similar cost can not share a thread
+    threads = sim.partitionThreads(2, warmupTime, 0.)
+    sim.ConfigureStopTime(macros.sec2nano(10.))
+    sim.ExecuteSimulation()
+    return threads, dataLogs
+
+
+def test_threadPartitioning():
+    r"""
+    **Validation Test Description**
+
+    The reading and the writing counter modules run on different threads after the partition.  The reading module
+    must then see the output of the writing module at the previous frame, independently of the progress of the
+    threads, such that repeated runs give the same results.
+    """
+    warmupTime = macros.sec2nano(1.)
+    results = [runPartitionedSim(warmupTime) for _ in range(3)]
+
+    threads, dataLogs = results[0]
+    assert threads["proc0"] != threads["proc1"]
+    times = dataLogs[0].times()
+    out0 = dataLogs[0].dataVector[:, 0]
+    out1 = dataLogs[1].dataVector[:, 0]
+    np.testing.assert_array_equal(dataLogs[1].times(), times)
+    warmup = times <= warmupTime
+    # during the warm up the second process reads the output of the first process of the same frame
+    np.testing.assert_array_equal((out1 - out0)[warmup], out0[warmup])
+    # after the partition it reads the output of the previous frame
+    partitioned = np.flatnonzero(~warmup)
+    np.testing.assert_array_equal((out1 - out0)[partitioned], out0[partitioned - 1])
+
+    for _, otherLogs in results[1:]:
+        for dataLog, otherLog in zip(dataLogs, otherLogs):
+            np.testing.assert_array_equal(otherLog.dataVector, dataLog.dataVector)
+
+
+if __name__ == "__main__":
+    test_partitionProcesses()
+    test_threadPartitioning()
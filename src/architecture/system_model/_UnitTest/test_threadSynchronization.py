@@ -0,0 +1,150 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Thread Synchronization Unit Test
+#
+# Purpose:  Test the spinning, lockstep and CPU pinning options of the multi-threaded simulation stepping
+#
+
+import time
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def createThreadedSim(numProcesses, numThreads, spinCount=0, maxLag=-1, pinning=False, modulesPerTask=1,
+                      taskPeriods=None):
+    """create a simulation with a process of one task per thread, and return the simulation and the modules"""
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    sim = SimulationBaseClass.SimBaseClass()
+    modules = []
+    for k in range(numProcesses):
+        taskName = "task" + str(k)
+        proc = sim.CreateNewProcess("proc" + str(k))
+        period = 0.1 if taskPeriods is None else taskPeriods[k]
+        proc.addTask(sim.CreateNewTask(taskName, macros.sec2nano(period)))
+        for j in range(modulesPerTask):
+            module = cppModuleTemplate.CppModuleTemplate()
+            module.ModelTag = taskName + "Module" + str(j)
+            sim.AddModelToTask(taskName, module)
+            modules.append(module)
+    sim.TotalSim.resetThreads(numThreads)
+    sim.TotalSim.threadSpinCount = spinCount
+    sim.TotalSim.threadMaxLag = maxLag
+    sim.TotalSim.threadPinning = pinning
+    return sim, modules
+
+
+@pytest.mark.parametrize("spinCount", [0, 100000])
+@pytest.mark.parametrize("maxLag", [-1, 0, 0.3])
+def test_threadSynchronization(spinCount, maxLag):
+    r"""
+    **Validation Test Description**
+
+    Independent processes are run on four threads with the different synchronization options, and the module
+    outputs must match those of a simulation run on a single thread.  The simulation is stepped in several calls
+    to check the synchronization with the main thread as well.
+    """
+    dataLogs = []
+    for numThreads, spin, lag in [(1, 0, -1), (4, spinCount, maxLag)]:
+        sim, modules = createThreadedSim(8, numThreads, spin, lag if lag < 0 else macros.sec2nano(lag))
+        logs = []
+        for k, module in enumerate(modules):
+            logs.append(module.dataOutMsg.recorder())
+            sim.AddModelToTask("task" + str(k), logs[-1])
+        sim.InitializeSimulation()
+        for stopTime in [0.05, 1., 1.2, 5.]:
+            sim.ConfigureStopTime(macros.sec2nano(stopTime))
+            sim.ExecuteSimulation()
+        dataLogs.append(logs)
+
+    for singleLog, threadedLog in zip(*dataLogs):
+        np.testing.assert_array_equal(threadedLog.times(), singleLog.times())
+        np.testing.assert_array_equal(threadedLog.dataVector, singleLog.dataVector)
+
+
+@pytest.mark.parametrize("maxLag", [0, 0.2])
+@pytest.mark.parametrize("taskPeriods", [[0.1, 0.1], [0.1, 0.3], [0.3, 0.1]])
+def test_threadMaxLag(maxLag, taskPeriods):
+    r"""
+    **Validation Test Description**
+
+    Two threads each run a counter module, and the counter of the second thread reads the output of the counter of
+    the first thread.  The value read tells how many frames the first thread had completed, and thus up to which
+    time it had run.  The threads run at equal and at different task rates, and the time of the last frame of the
+    first thread must be within ``threadMaxLag`` of the time of the reading frame.  Because the bound holds in
+    simulation time, the frames in between the task times of the first thread are not counted against it.
+    """
+    lagNanos = macros.sec2nano(maxLag)
+    sim, modules = createThreadedSim(2, 2, maxLag=lagNanos, taskPeriods=taskPeriods)
+    modules[1].dataInMsg.subscribeTo(modules[0].dataOutMsg)
+    dataLog = modules[1].dataOutMsg.recorder()
+    sim.AddModelToTask("task1", dataLog)
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(macros.sec2nano(100.))
+    sim.ExecuteSimulation()
+
+    readTimes = dataLog.times().astype(np.int64)
+    framesRead = dataLog.dataVector[:, 0].astype(np.int64) - np.arange(1, len(readTimes) + 1)
+    writePeriod = macros.sec2nano(taskPeriods[0])
+    # all the frames of the first thread before the reading time minus the lag are completed
+    assert np.all(framesRead * writePeriod >= readTimes - lagNanos)
+    # the first thread does not start a frame later than the reading time plus the lag
+    assert np.all((framesRead - 1) * writePeriod <= readTimes + lagNanos)
+
+
+def test_threadPinning():
+    r"""
+    **Validation Test Description**
+
+    The threads are pinned to CPU cores, which must not change the module outputs.
+    """
+    sim, modules = createThreadedSim(2, 2, pinning=True)
+    dataLog = modules[1].dataOutMsg.recorder()
+    sim.AddModelToTask("task1", dataLog)
+    sim.InitializeSimulation()
+    sim.ConfigureStopTime(macros.sec2nano(1.))
+    sim.ExecuteSimulation()
+    np.testing.assert_array_equal(dataLog.dataVector[:, 0], np.arange(1, 12))
+
+
+def benchmarkThreadSynchronization():
+    """print the time needed to step a simulation one task period at a time with a growing number of threads"""
+    numSteps = 2000
+    for spinCount, maxLag in [(0, -1), (100000, -1), (100000, 0)]:
+        for numThreads in [1, 2, 4, 8, 16, 32]:
+            sim, _ = createThreadedSim(32, numThreads, spinCount, maxLag, modulesPerTask=10)
+            sim.InitializeSimulation()
+            start = time.perf_counter()
+            for step in range(1, numSteps + 1):
+                sim.ConfigureStopTime(step * macros.sec2nano(0.1))
+                sim.ExecuteSimulation()
+            print(f"spin count {spinCount:6d}, max lag {maxLag:2d} ns, {numThreads:2d} threads: "
+                  f"{time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    test_threadSynchronization(100000, 0)
+    test_threadMaxLag(0, [0.1, 0.3])
+    test_threadPinning()
+    benchmarkThreadSynchronization()
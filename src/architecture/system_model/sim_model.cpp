@@ -20,6 +20,11 @@
 #include "sim_model.h"
 #include <cstring>
 #include <iostream>
+#include <algorithm>
+#include <cmath>
+#if defined(__linux__)
+#include <pthread.h>
+#endif
 
 void activateNewThread(void *threadData)
 {
@@ -78,6 +83,9 @@ SimThreadExecution::SimThreadExecution() {
     stopThreadNanos=0;
     nextProcPriority = -1;
     threadContext = nullptr;
+    maxLagNanos = -1;
+    frameSpinCount = 0;
+    pendingFrameNanos = 0;
 
 }
 
@@ -118,43 +126,90 @@ void SimThreadExecution::unlockParent() {
     this->parentThreadLock.release();
 }
 
+/*! This method orders two processes of the thread for execution.  The process with the earlier next task time
+    goes first, then the process with the higher priority, and then the process that comes first in processList.
+    @param first index of the first process in processList
+    @param second index of the second process in processList
+    @return bool true if the first process fires before the second process
+*/
+bool SimThreadExecution::processFiresBefore(size_t first, size_t second)
+{
+    SysProcess *firstProc = this->processList[first];
+    SysProcess *secondProc = this->processList[second];
+    if (firstProc->getNextTime() != secondProc->getNextTime()) {
+        return firstProc->getNextTime() < secondProc->getNextTime();
+    }
+    if (firstProc->processPriority != secondProc->processPriority) {
+        return firstProc->processPriority > secondProc->processPriority;
+    }
+    return first < second;
+}
+
+/*! This method builds the heap of the enabled processes such that the next process to fire is at its front.  The
+    heap is rebuilt every time the thread is stepped to a new stop time, as processes can only be enabled or
+    disabled between these calls.
+    @return void
+*/
+void SimThreadExecution::buildProcessQueue()
+{
+    this->processQueue.clear();
+    for (size_t i = 0; i < this->processList.size(); i++) {
+        if (this->processList[i]->processEnabled()) {
+            this->processQueue.push_back(i);
+        }
+    }
+    std::make_heap(this->processQueue.begin(), this->processQueue.end(),
+                   [this](size_t a, size_t b) { return this->processFiresBefore(b, a); });
+}
+
 /*! This method steps all of the processes forward to the current time.  It also
     increments the internal simulation time appropriately as the simulation
-    processes are triggered
+    processes are triggered.  Only the processes that are due are taken off the
+    process heap, and they are stepped in the order of the process list.
     @param stopPri The priority level below which the sim won't go
     @return void
 */
 void SimThreadExecution::SingleStepProcesses(int64_t stopPri)
 {
-    uint64_t nextCallTime = ~((uint64_t) 0);
-    std::vector<SysProcess *>::iterator it = this->processList.begin();
+    auto firesLater = [this](size_t a, size_t b) { return this->processFiresBefore(b, a); };
     this->CurrentNanos = this->NextTaskTime;
-    while(it!= this->processList.end() && this->threadValid())
-    {
-        SysProcess *localProc = (*it);
-        if(localProc->processEnabled())
-        {
+
+    //! - Take all of the processes that need to step at the current time off the heap
+    this->dueProcesses.clear();
+    while (!this->processQueue.empty()) {
+        SysProcess *localProc = this->processList[this->processQueue.front()];
+        if (!(localProc->nextTaskTime < this->CurrentNanos ||
+              (localProc->nextTaskTime == this->CurrentNanos && localProc->processPriority >= stopPri))) {
+            break;
+        }
+        std::pop_heap(this->processQueue.begin(), this->processQueue.end(), firesLater);
+        this->dueProcesses.push_back(this->processQueue.back());
+        this->processQueue.pop_back();
+    }
+    std::sort(this->dueProcesses.begin(), this->dueProcesses.end());
+
+    //! - Step the due processes and put them back on the heap with their next task time
+    for (size_t i = 0; i < this->dueProcesses.size(); i++) {
+        SysProcess *localProc = this->processList[this->dueProcesses[i]];
+        if (this->threadValid()) {
             while(localProc->nextTaskTime < this->CurrentNanos ||
                   (localProc->nextTaskTime == this->CurrentNanos &&
                    localProc->processPriority >= stopPri))
             {
                 localProc->singleStepNextTask(this->CurrentNanos);
             }
-            if(localProc->getNextTime() < nextCallTime)
-            {
-                nextCallTime = localProc->getNextTime();
-                this->nextProcPriority = localProc->processPriority;
-            }
-            else if(localProc->getNextTime() == nextCallTime &&
-                    localProc->processPriority > this->nextProcPriority)
-            {
-                this->nextProcPriority = localProc->processPriority;
-            }
         }
-        it++;
+        this->processQueue.push_back(this->dueProcesses[i]);
+        std::push_heap(this->processQueue.begin(), this->processQueue.end(), firesLater);
     }
-    this->NextTaskTime = nextCallTime != ~((uint64_t) 0) ? nextCallTime : this->CurrentNanos;
 
+    if (this->processQueue.empty()) {
+        this->NextTaskTime = this->CurrentNanos;
+    } else {
+        SysProcess *nextProc = this->processList[this->processQueue.front()];
+        this->NextTaskTime = nextProc->getNextTime();
+        this->nextProcPriority = nextProc->processPriority;
+    }
 }
 
 /*! This method steps the simulation until the specified stop time and
@@ -163,18 +218,115 @@ void SimThreadExecution::SingleStepProcesses(int64_t stopPri)
  */
 void SimThreadExecution::StepUntilStop()
 {
+    this->buildProcessQueue();
     /*! - Note that we have to step until both the time is greater and the next
      Task's start time is in the future. If the NextTaskTime is less than
      SimStopTime, then the inPri shouldn't come into effect, so set it to -1
      (that's less than all process priorities, so it will run through the next
      process)*/
     int64_t inPri = stopThreadNanos == this->NextTaskTime ? stopThreadPriority : -1;
+    //! - Publish the time of the first frame before waiting on the peers, such that they can never all wait
+    this->pendingFrameNanos.store(this->NextTaskTime, std::memory_order_release);
     while(this->threadValid() && (this->NextTaskTime < stopThreadNanos || (this->NextTaskTime == stopThreadNanos &&
                                                this->nextProcPriority >= stopThreadPriority)) )
     {
+        this->waitOnFramePeers(this->NextTaskTime);
         this->SingleStepProcesses(inPri);
+        this->pendingFrameNanos.store(this->NextTaskTime, std::memory_order_release);
         inPri = stopThreadNanos == this->NextTaskTime ? stopThreadPriority : -1;
     }
+    //! - Once the thread has reached the stop time it no longer holds back its peers
+    this->pendingFrameNanos.store(~((uint64_t) 0), std::memory_order_release);
+}
+
+/*! This method holds the thread before it executes the frame at frameNanos
+    until every peer thread has completed its frames before frameNanos minus
+    maxLagNanos.  The lag is bounded in simulation time, such that threads
+    with different task rates are held to the same time and not to the same
+    number of frames.  With maxLagNanos equal to zero, the threads step in
+    lockstep and the messages written by a thread at a time are seen by the
+    other threads at all later times.  The peer frame times are polled
+    frameSpinCount times before the thread starts to yield.
+    @param frameNanos [ns] time of the frame the thread is about to execute
+    @return void
+*/
+void SimThreadExecution::waitOnFramePeers(uint64_t frameNanos)
+{
+    if(this->maxLagNanos < 0 || frameNanos <= (uint64_t) this->maxLagNanos)
+    {
+        return;
+    }
+    uint64_t requiredNanos = frameNanos - (uint64_t) this->maxLagNanos;
+    std::vector<SimThreadExecution*>::iterator it;
+    for(it = this->framePeers.begin(); it != this->framePeers.end(); it++)
+    {
+        uint64_t polls = 0;
+        while((*it)->pendingFrameNanos.load(std::memory_order_acquire) < requiredNanos && this->threadValid())
+        {
+            if(polls < this->frameSpinCount)
+            {
+                polls++;
+                bskCpuRelax();
+            }
+            else
+            {
+                std::this_thread::yield();
+            }
+        }
+    }
+}
+
+/*! This method sets the number of times a waiting thread polls before it goes
+    to sleep, both when it waits to be released by the parent thread and when
+    the parent waits for it to finish.
+    @param spinCount number of polls before the waiting thread sleeps
+    @return void
+*/
+void SimThreadExecution::setSpinCount(uint64_t spinCount)
+{
+    this->selfThreadLock.setSpinCount(spinCount);
+    this->parentThreadLock.setSpinCount(spinCount);
+    this->frameSpinCount = spinCount;
+}
+
+/*! This method sets the threads that this thread keeps in step with.
+    @param peers threads that execute processes at the same time as this thread
+    @param maxLagNanos [ns] simulation time the thread may run ahead of its peers, -1 for no limit
+    @return void
+*/
+void SimThreadExecution::setFramePeers(std::vector<SimThreadExecution*> peers, int64_t maxLagNanos)
+{
+    this->framePeers.clear();
+    std::vector<SimThreadExecution*>::iterator it;
+    for(it = peers.begin(); it != peers.end(); it++)
+    {
+        if((*it) != this)
+        {
+            this->framePeers.push_back(*it);
+        }
+    }
+    this->maxLagNanos = maxLagNanos;
+}
+
+/*! This method pins the thread to a CPU core such that the operating system
+    does not move it between cores.  This is only supported on Linux.
+    @param coreIndex index of the CPU core
+    @return bool true if the thread was pinned
+*/
+bool SimThreadExecution::pinToCore(uint64_t coreIndex)
+{
+#if defined(__linux__)
+    if(this->threadContext == nullptr)
+    {
+        return false;
+    }
+    cpu_set_t cpuSet;
+    CPU_ZERO(&cpuSet);
+    CPU_SET(coreIndex, &cpuSet);
+    return pthread_setaffinity_np(this->threadContext->native_handle(), sizeof(cpu_set_t), &cpuSet) == 0;
+#else
+    return false;
+#endif
 }
 
 /*! This method is currently vestigial and needs to be populated once the message
@@ -283,6 +435,10 @@ SimModel::SimModel()
     this->CurrentNanos = 0;
     this->NextTaskTime = 0;
     this->nextProcPriority = -1;
+    this->threadSpinCount = 0;
+    this->threadPinning = false;
+    this->threadMaxLag = -1;
+    this->threadExchangePeriod = 0;
 }
 
 /*! Nothing to destroy really */
@@ -292,18 +448,78 @@ SimModel::~SimModel()
 }
 
 /*! This method steps the simulation until the specified stop time and
- stop priority have been reached.
+ stop priority have been reached.  The conditions of the active compiled
+ events are checked at every multiple of their event rate, once all the tasks
+ up to that time have been executed.  If an event fires, the method returns
+ right after that check, such that its actions can be executed.
  @param SimStopTime Nanoseconds to step the simulation for
  @param stopPri The priority level below which the sim won't go
  @return void
  */
 void SimModel::StepUntilStop(uint64_t SimStopTime, int64_t stopPri)
+{
+    uint64_t checkTime = this->nextEventCheckTime(this->NextTaskTime);
+    while(checkTime < SimStopTime)
+    {
+        this->stepFrames(checkTime, -1);
+        if(this->checkCompiledEvents(checkTime))
+        {
+            return;
+        }
+        //! - The state can only change at the next task time, later checks are skipped until then
+        uint64_t earliestTime = this->NextTaskTime > checkTime ? this->NextTaskTime : checkTime + 1;
+        checkTime = this->nextEventCheckTime(earliestTime);
+    }
+    this->stepFrames(SimStopTime, stopPri);
+    if(checkTime == SimStopTime)
+    {
+        this->checkCompiledEvents(checkTime);
+    }
+}
+
+/*! This method steps the threads until the specified stop time and stop
+ priority have been reached.  If messages are exchanged between threads
+ and threadExchangePeriod is set, the threads are stepped one frame of that
+ period at a time, and the messages are exchanged at every frame boundary.
+ @param SimStopTime Nanoseconds to step the simulation for
+ @param stopPri The priority level below which the sim won't go
+ @return void
+ */
+void SimModel::stepFrames(uint64_t SimStopTime, int64_t stopPri)
+{
+    if(this->messageExchanges.empty() || this->threadExchangePeriod == 0)
+    {
+        this->stepThreads(SimStopTime, stopPri);
+        return;
+    }
+    uint64_t period = this->threadExchangePeriod;
+    uint64_t frameEnd = (this->NextTaskTime / period + 1) * period - 1;
+    while(frameEnd < SimStopTime)
+    {
+        this->stepThreads(frameEnd, -1);
+        //! - Skip the frames in which no task is executed
+        uint64_t nextFrameEnd = (this->NextTaskTime / period + 1) * period - 1;
+        frameEnd = nextFrameEnd > frameEnd ? nextFrameEnd : frameEnd + period;
+    }
+    this->stepThreads(SimStopTime, stopPri);
+}
+
+/*! This method releases the threads to step until the specified stop time and
+ stop priority, and waits until all of them have reached it.  The messages
+ read by other threads are exchanged before the threads are released.
+ @param SimStopTime Nanoseconds to step the simulation for
+ @param stopPri The priority level below which the sim won't go
+ @return void
+ */
+void SimModel::stepThreads(uint64_t SimStopTime, int64_t stopPri)
 {
     std::vector<SimThreadExecution*>::iterator thrIt;
     std::cout << std::flush;
+    this->exchangeMessages();
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
         (*thrIt)->moveProcessMessages();
+        (*thrIt)->clearFrameTime();
     }
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
@@ -328,6 +544,238 @@ void SimModel::StepUntilStop(uint64_t SimStopTime, int64_t stopPri)
 }
 
 
+/*! This method adds a message that is copied to a buffer message before the
+    threads are released.  The modules of another thread read the buffer
+    message, such that they see the message as it was at the last frame
+    boundary, no matter how far the writing thread has progressed.
+ @param sourcePayload address of the payload of the message written by its module
+ @param sourceHeader address of the header of the message written by its module
+ @param bufferPayload address of the payload of the buffer message
+ @param bufferHeader address of the header of the buffer message
+ @param payloadSize [bytes] size of the message payload
+ @return void
+ */
+void SimModel::addMessageExchange(uint64_t sourcePayload, uint64_t sourceHeader, uint64_t bufferPayload,
+                                  uint64_t bufferHeader, uint64_t payloadSize)
+{
+    MessageExchange exchange;
+    exchange.sourcePayload = reinterpret_cast<uint8_t *> (sourcePayload);
+    exchange.sourceHeader = reinterpret_cast<Msg2Header *> (sourceHeader);
+    exchange.bufferPayload = reinterpret_cast<uint8_t *> (bufferPayload);
+    exchange.bufferHeader = reinterpret_cast<Msg2Header *> (bufferHeader);
+    exchange.payloadSize = payloadSize;
+    this->messageExchanges.push_back(exchange);
+}
+
+/*! This method copies the messages that are read by other threads into their
+    buffer messages.  It is only called while all the threads are waiting.
+ @return void
+ */
+void SimModel::exchangeMessages()
+{
+    std::vector<MessageExchange>::iterator it;
+    for(it = this->messageExchanges.begin(); it != this->messageExchanges.end(); it++)
+    {
+        memcpy(it->bufferPayload, it->sourcePayload, it->payloadSize);
+        *it->bufferHeader = *it->sourceHeader;
+    }
+}
+
+
+/*! This method adds an event whose conditions are checked by the scheduler
+    instead of by Python.  The conditions are added with addEventCondition().
+ @param eventRate [ns] Period at which the event conditions are checked
+ @param eventActive Flag indicating that the conditions are checked
+ @return The index of the event
+ */
+uint64_t SimModel::addCompiledEvent(uint64_t eventRate, bool eventActive)
+{
+    CompiledEvent newEvent;
+    newEvent.eventRate = eventRate > 0 ? eventRate : 1;
+    newEvent.eventActive = eventActive;
+    this->compiledEvents.push_back(newEvent);
+    return this->compiledEvents.size() - 1;
+}
+
+/*! This method adds a condition to a compiled event.  The event fires when all
+    of its conditions hold.
+ @param eventIndex Index of the event returned by addCompiledEvent()
+ @param fieldAddress Address of the first compared element of the message payload field
+ @param fieldType EventFieldType of the field elements
+ @param numElements Number of elements, the norm of the elements is compared if larger than one
+ @param comparison EventComparison of the field value with the threshold
+ @param threshold Threshold the field value is compared with
+ @return void
+ */
+void SimModel::addEventCondition(uint64_t eventIndex, uint64_t fieldAddress, int32_t fieldType,
+                                 uint64_t numElements, int32_t comparison, double threshold)
+{
+    if(eventIndex >= this->compiledEvents.size())
+    {
+        bskLogger.bskLog(BSK_ERROR, "There is no compiled event with index %d.", (int) eventIndex);
+        return;
+    }
+    EventCondition condition;
+    condition.fieldAddress = reinterpret_cast<uint8_t *> (fieldAddress);
+    condition.fieldType = fieldType;
+    condition.numElements = numElements > 0 ? numElements : 1;
+    condition.comparison = comparison;
+    condition.threshold = threshold;
+    this->compiledEvents[eventIndex].conditions.push_back(condition);
+}
+
+/*! This method sets whether the conditions of a compiled event are checked.
+ @param eventIndex Index of the event returned by addCompiledEvent()
+ @param eventActive Flag indicating that the conditions are checked
+ @return void
+ */
+void SimModel::setCompiledEventActivity(uint64_t eventIndex, bool eventActive)
+{
+    if(eventIndex >= this->compiledEvents.size())
+    {
+        bskLogger.bskLog(BSK_ERROR, "There is no compiled event with index %d.", (int) eventIndex);
+        return;
+    }
+    this->compiledEvents[eventIndex].eventActive = eventActive;
+}
+
+/*! This method returns the indices of the compiled events that fired since the
+    last call, in the order they fired.  A fired event is deactivated.
+ @return The indices of the fired events
+ */
+std::vector<int> SimModel::popFiredEvents()
+{
+    std::vector<int> fired;
+    fired.swap(this->firedEvents);
+    return fired;
+}
+
+/*! This method returns the first time at or after the given time at which the
+    conditions of an active compiled event are checked.
+ @param earliestTime [ns] Earliest check time
+ @return [ns] The next check time, ~0 if no compiled event is active
+ */
+uint64_t SimModel::nextEventCheckTime(uint64_t earliestTime)
+{
+    uint64_t checkTime = ~((uint64_t) 0);
+    std::vector<CompiledEvent>::iterator it;
+    for(it = this->compiledEvents.begin(); it != this->compiledEvents.end(); it++)
+    {
+        if(!it->eventActive || earliestTime > ~((uint64_t) 0) - (it->eventRate - 1))
+        {
+            continue;
+        }
+        uint64_t eventTime = ((earliestTime + it->eventRate - 1) / it->eventRate) * it->eventRate;
+        checkTime = eventTime < checkTime ? eventTime : checkTime;
+    }
+    return checkTime;
+}
+
+/*! This function returns the value of a message field element as a double.
+ @param address Address of the field element
+ @param fieldType EventFieldType of the field element
+ @return The field element value
+ */
+static double readEventField(const uint8_t *address, int32_t fieldType)
+{
+    switch(fieldType)
+    {
+        case EVENT_FIELD_DOUBLE: return *reinterpret_cast<const double *> (address);
+        case EVENT_FIELD_FLOAT: return *reinterpret_cast<const float *> (address);
+        case EVENT_FIELD_INT8: return *reinterpret_cast<const int8_t *> (address);
+        case EVENT_FIELD_UINT8: return *reinterpret_cast<const uint8_t *> (address);
+        case EVENT_FIELD_INT16: return *reinterpret_cast<const int16_t *> (address);
+        case EVENT_FIELD_UINT16: return *reinterpret_cast<const uint16_t *> (address);
+        case EVENT_FIELD_INT32: return *reinterpret_cast<const int32_t *> (address);
+        case EVENT_FIELD_UINT32: return *reinterpret_cast<const uint32_t *> (address);
+        case EVENT_FIELD_INT64: return (double) *reinterpret_cast<const int64_t *> (address);
+        case EVENT_FIELD_UINT64: return (double) *reinterpret_cast<const uint64_t *> (address);
+        case EVENT_FIELD_BOOL: return *reinterpret_cast<const bool *> (address) ? 1.0 : 0.0;
+        default: return 0.0;
+    }
+}
+
+/*! This function returns the size in bytes of a message field element.
+ @param fieldType EventFieldType of the field element
+ @return [bytes] The field element size
+ */
+static size_t eventFieldSize(int32_t fieldType)
+{
+    switch(fieldType)
+    {
+        case EVENT_FIELD_DOUBLE: case EVENT_FIELD_INT64: case EVENT_FIELD_UINT64: return 8;
+        case EVENT_FIELD_FLOAT: case EVENT_FIELD_INT32: case EVENT_FIELD_UINT32: return 4;
+        case EVENT_FIELD_INT16: case EVENT_FIELD_UINT16: return 2;
+        default: return 1;
+    }
+}
+
+/*! This function evaluates an event condition on the current message content.
+ @param condition The condition to evaluate
+ @return True if the condition holds
+ */
+static bool eventConditionHolds(const EventCondition &condition)
+{
+    double value;
+    if(condition.numElements > 1)
+    {
+        size_t elementSize = eventFieldSize(condition.fieldType);
+        value = 0.0;
+        for(uint64_t i = 0; i < condition.numElements; i++)
+        {
+            double element = readEventField(condition.fieldAddress + i*elementSize, condition.fieldType);
+            value += element*element;
+        }
+        value = sqrt(value);
+    }
+    else
+    {
+        value = readEventField(condition.fieldAddress, condition.fieldType);
+    }
+    switch(condition.comparison)
+    {
+        case EVENT_LESS: return value < condition.threshold;
+        case EVENT_LESS_EQUAL: return value <= condition.threshold;
+        case EVENT_GREATER: return value > condition.threshold;
+        case EVENT_GREATER_EQUAL: return value >= condition.threshold;
+        case EVENT_EQUAL: return value == condition.threshold;
+        case EVENT_NOT_EQUAL: return value != condition.threshold;
+        default: return false;
+    }
+}
+
+/*! This method checks the conditions of the active compiled events that are
+    due at the given time.  An event whose conditions all hold is deactivated
+    and added to the fired events.
+ @param checkTime [ns] Current check time
+ @return True if an event fired
+ */
+bool SimModel::checkCompiledEvents(uint64_t checkTime)
+{
+    bool eventFired = false;
+    for(size_t i = 0; i < this->compiledEvents.size(); i++)
+    {
+        CompiledEvent &event = this->compiledEvents[i];
+        if(!event.eventActive || checkTime % event.eventRate != 0)
+        {
+            continue;
+        }
+        bool conditionsHold = true;
+        std::vector<EventCondition>::iterator it;
+        for(it = event.conditions.begin(); it != event.conditions.end() && conditionsHold; it++)
+        {
+            conditionsHold = eventConditionHolds(*it);
+        }
+        if(conditionsHold)
+        {
+            event.eventActive = false;
+            this->firedEvents.push_back((int) i);
+            eventFired = true;
+        }
+    }
+    return eventFired;
+}
+
 /*! This method allows the user to attach a process to the simulation for
     execution.  Note that the priority level of the process determines what
     order it gets called in: higher priorities are called before lower
@@ -543,14 +991,39 @@ void SimModel::assignRemainingProcs() {
             (*thrIt)->addNewProcess((*it));
         }
     }
+    std::vector<SimThreadExecution*> activeThreads;
+    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    {
+        if((*thrIt)->procCount() > 0) {
+            activeThreads.push_back(*thrIt);
+        }
+    }
+    uint64_t coreCount = std::thread::hardware_concurrency();
+    uint64_t spinCount = this->threadSpinCount;
+    if(spinCount > 0 && activeThreads.size() >= coreCount)
+    {
+        //! - A spinning thread would hold the core needed by the thread it waits on
+        bskLogger.bskLog(BSK_WARNING, "The %d threads and the main thread exceed the %d CPU cores, the threads "
+                         "will sleep instead of spin while waiting.", (int) activeThreads.size(), (int) coreCount);
+        spinCount = 0;
+    }
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
         it=this->processList.begin();
         (*thrIt)->nextProcPriority = (*it)->processPriority;
-        (*thrIt)->NextTaskTime = 0;
-        (*thrIt)->CurrentNanos = 0;
+        //! - Threads that are created during the simulation resume at the current time
+        (*thrIt)->NextTaskTime = this->NextTaskTime;
+        (*thrIt)->CurrentNanos = this->CurrentNanos;
+        (*thrIt)->setSpinCount(spinCount);
+        (*thrIt)->setFramePeers(activeThreads, this->threadMaxLag);
         //(*thrIt)->lockThread();
         (*thrIt)->threadContext = new std::thread(activateNewThread, (*thrIt));
+        if(this->threadPinning && (coreCount == 0 ||
+            !(*thrIt)->pinToCore((uint64_t) (thrIt - this->threadList.begin()) % coreCount)))
+        {
+            bskLogger.bskLog(BSK_WARNING, "Thread %d could not be pinned to a CPU core.",
+                             (int) (thrIt - this->threadList.begin()));
+        }
     }
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
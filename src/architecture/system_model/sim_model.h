@@ -25,10 +25,62 @@
 #include <thread>
 #include <mutex>
 #include <condition_variable>
+#include <atomic>
 #include <iostream>
 #include "architecture/system_model/sys_process.h"
 #include "architecture/utilities/bskLogging.h"
 #include "architecture/utilities/bskSemaphore.h"
+#include "architecture/messaging/msg2Header.h"
+
+//! Structure describing the copy of a message into a buffer message that is read by another thread
+typedef struct {
+    uint8_t *sourcePayload;     //!< payload of the message as written by its module
+    Msg2Header *sourceHeader;   //!< header of the message as written by its module
+    uint8_t *bufferPayload;     //!< payload of the buffer message read in the other thread
+    Msg2Header *bufferHeader;   //!< header of the buffer message read in the other thread
+    uint64_t payloadSize;       //!< [bytes] size of the message payload
+}MessageExchange;
+
+//! Comparisons of a message field with the threshold of an event condition
+enum EventComparison {
+    EVENT_LESS,
+    EVENT_LESS_EQUAL,
+    EVENT_GREATER,
+    EVENT_GREATER_EQUAL,
+    EVENT_EQUAL,
+    EVENT_NOT_EQUAL
+};
+
+//! Types of the message fields compared by an event condition
+enum EventFieldType {
+    EVENT_FIELD_DOUBLE,
+    EVENT_FIELD_FLOAT,
+    EVENT_FIELD_INT8,
+    EVENT_FIELD_UINT8,
+    EVENT_FIELD_INT16,
+    EVENT_FIELD_UINT16,
+    EVENT_FIELD_INT32,
+    EVENT_FIELD_UINT32,
+    EVENT_FIELD_INT64,
+    EVENT_FIELD_UINT64,
+    EVENT_FIELD_BOOL
+};
+
+//! Structure describing the comparison of a message field, or of the norm of an array field, with a threshold
+typedef struct {
+    uint8_t *fieldAddress;      //!< address of the first compared field element in the message payload
+    int32_t fieldType;          //!< EventFieldType of the field elements
+    uint64_t numElements;       //!< number of elements, the norm of the elements is compared if larger than one
+    int32_t comparison;         //!< EventComparison of the field value with the threshold
+    double threshold;           //!< threshold the field value is compared with
+}EventCondition;
+
+//! Structure describing an event whose conditions are all evaluated by the simulation scheduler
+typedef struct {
+    uint64_t eventRate;         //!< [ns] period at which the conditions are checked
+    bool eventActive;           //!< flag indicating that the conditions are checked
+    std::vector<EventCondition> conditions;  //!< conditions that must all hold for the event to fire
+}CompiledEvent;
 
 //! This class handles the management of a given "thread" of execution and provides the main mechanism for running concurrent jobs inside BSK
 class SimThreadExecution
@@ -57,6 +109,14 @@ public:
     void StepUntilStop();  //!< Step simulation until stop time uint64_t reached
     void SingleStepProcesses(int64_t stopPri=-1); //!< Step only the next Task in the simulation
     void moveProcessMessages();
+    void setSpinCount(uint64_t spinCount);
+    void setFramePeers(std::vector<SimThreadExecution*> peers, int64_t maxLagNanos);
+    void clearFrameTime() {this->pendingFrameNanos = 0;} //!< Marks the thread as not started in the current step
+    bool pinToCore(uint64_t coreIndex);
+private:
+    bool processFiresBefore(size_t first, size_t second);
+    void buildProcessQueue();
+    void waitOnFramePeers(uint64_t frameNanos);
 public:
     uint64_t currentThreadNanos;  //!< Current simulation time available at thread
     uint64_t stopThreadNanos;   //!< Current stop conditions for the thread
@@ -75,6 +135,12 @@ private:
     BSKSemaphore parentThreadLock;   //!< Lock that ensures parent thread won't proceed
     BSKSemaphore selfThreadLock;     //!< Lock that ensures this thread only reaches allowed time
     std::vector<SysProcess*> processList;  //!< List of processes associated with thread
+    std::vector<size_t> processQueue;      //!< Heap of enabled processList indices ordered by next task time and priority
+    std::vector<size_t> dueProcesses;      //!< processList indices of the processes stepped at the current time
+    std::vector<SimThreadExecution*> framePeers;  //!< Other threads this thread keeps in step with
+    int64_t maxLagNanos;           //!< [ns] Simulation time the thread may run ahead of its peers, -1 for no limit
+    uint64_t frameSpinCount;       //!< Number of polls of the peer frame times before the thread yields
+    std::atomic<uint64_t> pendingFrameNanos;  //!< [ns] Time of the next frame to execute, all earlier frames are completed
     std::mutex initReadyLock;      //!< Lock function to ensure runtime locks are configured
     std::condition_variable initHoldVar; //!< Conditional variable used to prevent race conditions
 };
@@ -98,6 +164,17 @@ public:
     void deleteThreads();
     void assignRemainingProcs();
     uint64_t getThreadCount() {return threadList.size();} //!< returns the number of threads used
+    void addMessageExchange(uint64_t sourcePayload, uint64_t sourceHeader, uint64_t bufferPayload,
+                            uint64_t bufferHeader, uint64_t payloadSize);
+    void clearMessageExchanges() {this->messageExchanges.clear();} //!< removes all the message exchanges between threads
+    uint64_t getMessageExchangeCount() {return this->messageExchanges.size();} //!< returns the number of message exchanges
+    uint64_t addCompiledEvent(uint64_t eventRate, bool eventActive);
+    void addEventCondition(uint64_t eventIndex, uint64_t fieldAddress, int32_t fieldType, uint64_t numElements,
+                           int32_t comparison, double threshold);
+    void setCompiledEventActivity(uint64_t eventIndex, bool eventActive);
+    bool getCompiledEventActivity(uint64_t eventIndex) {return this->compiledEvents.at(eventIndex).eventActive;} //!< returns if the conditions of the event are checked
+    void clearCompiledEvents() {this->compiledEvents.clear(); this->firedEvents.clear();} //!< removes all the compiled events
+    std::vector<int> popFiredEvents();
 
     BSKLogger bskLogger;                      //!< -- BSK Logging
 
@@ -108,6 +185,20 @@ public:
     uint64_t CurrentNanos;  //!< [ns] Current sim time
     uint64_t NextTaskTime;  //!< [ns] time for the next Task
     int64_t nextProcPriority;  //!< [-] Priority level for the next process
+    uint64_t threadSpinCount;  //!< -- Number of polls a waiting thread makes before it sleeps, 0 to sleep right away
+    bool threadPinning;  //!< -- Flag to pin each thread to its own CPU core (Linux only)
+    int64_t threadMaxLag;  //!< [ns] Simulation time a thread may run ahead of the other threads, -1 for no limit
+    uint64_t threadExchangePeriod;  //!< [ns] Period at which the messages are exchanged between threads, 0 to only exchange them at the stop times
+
+private:
+    void stepFrames(uint64_t SimStopTime, int64_t stopPri);
+    void stepThreads(uint64_t SimStopTime, int64_t stopPri);
+    void exchangeMessages();
+    uint64_t nextEventCheckTime(uint64_t earliestTime);
+    bool checkCompiledEvents(uint64_t checkTime);
+    std::vector<MessageExchange> messageExchanges;  //!< -- Messages that are copied to buffer messages read by other threads
+    std::vector<CompiledEvent> compiledEvents;  //!< -- Events whose conditions are checked by the scheduler
+    std::vector<int> firedEvents;  //!< -- Indices of the compiled events that fired since the last popFiredEvents()
 };
 
 #endif /* _SimModel_H_ */
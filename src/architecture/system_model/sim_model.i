@@ -51,6 +51,9 @@ namespace std {
    %template(intSet) set<unsigned long>;
    %template(int64Set) set<long int>;
    %template(ConstCharVector) vector<const char*>;
+   %template(UInt64Vector) vector<uint64_t>;
+   %template(ExecutionProfileVector) vector<ExecutionProfile>;
+   %template(ProfileTraceEventVector) vector<ProfileTraceEvent>;
    %template() std::pair<long int, long int>;
    %template() std::pair<long long int, long long int>;
    %template() std::pair<int64_t, int64_t>;
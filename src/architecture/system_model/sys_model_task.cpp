@@ -20,6 +20,26 @@
 #include "sys_model_task.h"
 #include <cstring>
 #include <iostream>
+#include <chrono>
+
+/*! This function adds a timed call to an execution profile.
+ @return void
+ @param profile The profile of the model or task that was called
+ @param duration [ns] Wall-clock duration of the call
+ */
+static void addProfileCall(ExecutionProfile &profile, uint64_t duration)
+{
+    size_t bin = 0;
+    uint64_t remaining = duration;
+    while(remaining >>= 1)
+    {
+        bin++;
+    }
+    profile.callCount += 1;
+    profile.totalTime += duration;
+    profile.maxTime = duration > profile.maxTime ? duration : profile.maxTime;
+    profile.histogram[bin] += 1;
+}
 
 /*! The task constructor.  */
 SysModelTask::SysModelTask()
@@ -32,6 +52,9 @@ SysModelTask::SysModelTask()
     this->PickupDelay = 0;
     this->FirstTaskTime = 0;
     this->taskActive = true;
+    this->profileExecution = false;
+    this->maxTraceEvents = 0;
+    this->clearProfile();
 }
 /*! A construction option that allows the user to set some task parameters.
  Note that the only required argument is InputPeriod.
@@ -48,6 +71,9 @@ SysModelTask::SysModelTask(uint64_t InputPeriod, uint64_t InputDelay,
     this->NextPickupTime = this->NextStartTime + this->TaskPeriod;
     this->FirstTaskTime = FirstStartTime;
     this->taskActive = true;
+    this->profileExecution = false;
+    this->maxTraceEvents = 0;
+    this->clearProfile();
 }
 
 //! The destructor.
@@ -100,7 +126,12 @@ void SysModelTask::ExecuteTaskList(uint64_t CurrentSimNanos)
 {
     std::vector<ModelPriorityPair>::iterator ModelPair;
     SysModel* NonIt;
-    
+
+    if(this->profileExecution)
+    {
+        this->executeProfiledTaskList(CurrentSimNanos);
+        return;
+    }
     //! - Loop over all of the models in the simulation and call their UpdateState
     for(ModelPair = this->TaskModels.begin(); (ModelPair != this->TaskModels.end() && this->taskActive);
         ModelPair++)
@@ -113,8 +144,72 @@ void SysModelTask::ExecuteTaskList(uint64_t CurrentSimNanos)
     this->NextStartTime += this->TaskPeriod;
 }
 
+/*! This method executes all of the models on the Task like ExecuteTaskList,
+ and adds the wall-clock time of every model call and of the whole task to
+ their execution profiles.  The calls are also recorded in traceEvents until
+ maxTraceEvents calls have been recorded.  As in ExecuteTaskList, the remaining
+ models are skipped once a model disables the task.
+ @return void
+ @param CurrentSimNanos The current simulation time in [ns]
+ */
+void SysModelTask::executeProfiledTaskList(uint64_t CurrentSimNanos)
+{
+    ProfileTraceEvent event;
+    event.simTime = CurrentSimNanos;
+    if(this->taskActive)
+    {
+        auto taskStart = std::chrono::steady_clock::now();
+        for(size_t i = 0; (i < this->TaskModels.size() && this->taskActive); i++)
+        {
+            SysModel *model = this->TaskModels[i].ModelPtr;
+            auto modelStart = std::chrono::steady_clock::now();
+            model->UpdateState(CurrentSimNanos);
+            model->CallCounts += 1;
+            auto modelEnd = std::chrono::steady_clock::now();
+            event.duration = (uint64_t) std::chrono::duration_cast<std::chrono::nanoseconds>(
+                modelEnd - modelStart).count();
+            addProfileCall(this->modelProfiles[i], event.duration);
+            if(this->traceEvents.size() < this->maxTraceEvents)
+            {
+                event.startTime = (uint64_t) std::chrono::duration_cast<std::chrono::nanoseconds>(
+                    modelStart.time_since_epoch()).count();
+                event.modelIndex = (int64_t) i;
+                this->traceEvents.push_back(event);
+            }
+        }
+        event.duration = (uint64_t) std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now() - taskStart).count();
+        addProfileCall(this->taskProfile, event.duration);
+        if(this->traceEvents.size() < this->maxTraceEvents)
+        {
+            event.startTime = (uint64_t) std::chrono::duration_cast<std::chrono::nanoseconds>(
+                taskStart.time_since_epoch()).count();
+            event.modelIndex = -1;
+            this->traceEvents.push_back(event);
+        }
+    }
+    this->NextStartTime += this->TaskPeriod;
+}
+
+/*! This method clears the execution profiles of the task and of its models,
+ and the recorded trace events.
+ @return void
+ */
+void SysModelTask::clearProfile()
+{
+    ExecutionProfile emptyProfile;
+    emptyProfile.callCount = 0;
+    emptyProfile.totalTime = 0;
+    emptyProfile.maxTime = 0;
+    emptyProfile.histogram.assign(PROFILE_HISTOGRAM_BINS, 0);
+    this->taskProfile = emptyProfile;
+    this->modelProfiles.assign(this->TaskModels.size(), emptyProfile);
+    this->traceEvents.clear();
+}
+
 /*! This method adds a new model into the Task list.  Note that the Priority
- parameter is option as it defaults to -1 (lowest, latest)
+ parameter is option as it defaults to -1 (lowest, latest).  The execution
+ profiles are cleared as the model indices change.
  @return void
  @param NewModel The new model that we are adding to the Task
  @param Priority The selected priority of the model being added (highest goes first)
@@ -136,11 +231,13 @@ void SysModelTask::AddNewObject(SysModel *NewModel, int32_t Priority)
         if(Priority > ModelPair->CurrentModelPriority)
         {
             this->TaskModels.insert(ModelPair, LocalPair);
+            this->clearProfile();
             return;
         }
     }
     //! - If we make it to the end of the loop, this is lowest priority, put it at end
     this->TaskModels.push_back(LocalPair);
+    this->clearProfile();
 }
 
 /*! This method changes the period of a given task over to the requested period.
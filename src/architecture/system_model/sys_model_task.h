@@ -31,6 +31,25 @@ typedef struct {
     SysModel *ModelPtr;  //!< The model associated with this priority
 }ModelPriorityPair;
 
+//! Number of power of two bins of the execution time histograms
+#define PROFILE_HISTOGRAM_BINS 64
+
+//! Structure holding the execution time statistics of a model or a task
+typedef struct {
+    uint64_t callCount;  //!< -- Number of timed calls
+    uint64_t totalTime;  //!< [ns] Wall-clock time spent in the calls
+    uint64_t maxTime;  //!< [ns] Longest call
+    std::vector<uint64_t> histogram;  //!< -- Number of calls that took between 2^k and 2^(k+1) ns for bin k
+}ExecutionProfile;
+
+//! Structure recording a single timed call for an execution trace
+typedef struct {
+    uint64_t startTime;  //!< [ns] Steady clock time at the start of the call
+    uint64_t duration;  //!< [ns] Wall-clock duration of the call
+    uint64_t simTime;  //!< [ns] Simulation time of the call
+    int64_t modelIndex;  //!< -- Index of the model in TaskModels, -1 for the whole task
+}ProfileTraceEvent;
+
 //! Class used to group a set of models into one "Task" of execution
 class SysModelTask
 {
@@ -50,7 +69,8 @@ public:
 	void disableTask() {this->taskActive = false;} //!< Disables the task.  I know.
     void updatePeriod(uint64_t newPeriod);
     void updateParentProc(std::string parent) {this->parentProc = parent;} //!< Allows the system to move task to a different process
-    
+    void clearProfile();
+
 public:
     std::vector<ModelPriorityPair> TaskModels;  //!< -- Array that has pointers to all task sysModels
     std::string TaskName;  //!< -- Identifier for Task
@@ -62,6 +82,14 @@ public:
     uint64_t FirstTaskTime;  //!< [ns] Time to start Task for first time
 	bool taskActive;  //!< -- Flag indicating whether the Task has been disabled
   BSKLogger bskLogger;                      //!< -- BSK Logging
+    bool profileExecution;  //!< -- Flag to time the model calls, the task executes a single branch more when not set
+    uint64_t maxTraceEvents;  //!< -- Maximum number of calls recorded in traceEvents while profiling, 0 for none
+    ExecutionProfile taskProfile;  //!< -- Execution time statistics of the task
+    std::vector<ExecutionProfile> modelProfiles;  //!< -- Execution time statistics of each model in TaskModels
+    std::vector<ProfileTraceEvent> traceEvents;  //!< -- Timed model and task calls recorded while profiling
+
+private:
+    void executeProfiledTaskList(uint64_t CurrentSimNanos);
 };
 
 #endif /* _SysModelTask_H_ */
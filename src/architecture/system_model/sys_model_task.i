@@ -31,6 +31,9 @@ namespace std {
    %template(DoubleVector) vector<double>;
    %template(StringVector) vector<string>;
    %template(ConstCharVector) vector<const char*>;
+   %template(UInt64Vector) vector<uint64_t>;
+   %template(ExecutionProfileVector) vector<ExecutionProfile>;
+   %template(ProfileTraceEventVector) vector<ProfileTraceEvent>;
 }
 %include "sys_model.h"
 %include "sys_model_task.h"
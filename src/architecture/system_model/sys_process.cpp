@@ -20,6 +20,7 @@
 #include "sys_process.h"
 #include <cstring>
 #include <iostream>
+#include <algorithm>
 
 /*! The task constructor.  */
 SysProcess :: SysProcess()
@@ -28,6 +29,7 @@ SysProcess :: SysProcess()
     this->processActive = true;
     this->processPriority = -1;
     this->processOnThread = false;
+    this->taskQueueValid = false;
     this->disableProcess();
 }
 /*! Make a process AND attach a storage bucket with the provided name. Give
@@ -42,6 +44,7 @@ SysProcess::SysProcess(std::string messageContainer)
     this->processName = messageContainer;
     this->prevRouteTime = 0xFF;
     this->processOnThread = false;
+    this->taskQueueValid = false;
     this->disableProcess();
 }
 
@@ -85,6 +88,7 @@ void SysProcess::resetProcess(uint64_t currentTime)
         SysModelTask *localTask = it->TaskPtr;
         localTask->ResetTaskList(currentTime); //! Time of reset. Models that utilize currentTime will start at this.
     }
+    this->taskQueueValid = false;
     this->nextTaskTime = currentTime;
     return;
 }
@@ -114,31 +118,59 @@ void SysProcess::reInitProcess()
     return;
 }
 
+/*! This method orders two tasks of the process for execution.  The task with the earlier next start time goes
+ first, then the task with the higher priority, and then the task that comes first in processTasks.
+ @return bool true if the first task fires before the second task
+ @param first index of the first task in processTasks
+ @param second index of the second task in processTasks
+ */
+bool SysProcess::taskFiresBefore(size_t first, size_t second) const
+{
+    const ModelScheduleEntry &firstTask = this->processTasks[first];
+    const ModelScheduleEntry &secondTask = this->processTasks[second];
+    if (firstTask.NextTaskStart != secondTask.NextTaskStart) {
+        return firstTask.NextTaskStart < secondTask.NextTaskStart;
+    }
+    if (firstTask.taskPriority != secondTask.taskPriority) {
+        return firstTask.taskPriority > secondTask.taskPriority;
+    }
+    return first < second;
+}
+
+/*! This method builds the heap of tasks such that the next task to fire is at its front.
+ @return void
+ */
+void SysProcess::buildTaskQueue()
+{
+    this->taskQueue.resize(this->processTasks.size());
+    for (size_t i = 0; i < this->taskQueue.size(); i++) {
+        this->taskQueue[i] = i;
+    }
+    std::make_heap(this->taskQueue.begin(), this->taskQueue.end(),
+                   [this](size_t a, size_t b) { return this->taskFiresBefore(b, a); });
+    this->taskQueueValid = true;
+}
+
 /*! This method steps the next task up to currentNanos
- * unless it isn't supposed to run yet.
+ * unless it isn't supposed to run yet.  The tasks are kept in a heap, such that finding and rescheduling
+ * the next task takes O(log n) operations for n tasks.
  @return void
  */
 void SysProcess::singleStepNextTask(uint64_t currentNanos)
 {
-    std::vector<ModelScheduleEntry>::iterator it;
-    std::vector<ModelScheduleEntry>::iterator fireIt;
-
     //! - Check to make sure that there are models to be called.
     if(this->processTasks.begin() == this->processTasks.end())
     {
         bskLogger.bskLog(BSK_WARNING, "Received a step command on sim that has no active Tasks.");
         return;
     }
-    fireIt=this->processTasks.begin();
-    //! - If the requested time does not meet our next start time, just return
-    for(it=this->processTasks.begin(); it!=this->processTasks.end(); it++)
-    {
-        if(it->NextTaskStart < fireIt->NextTaskStart ||
-                (it->NextTaskStart==fireIt->NextTaskStart && it->taskPriority > fireIt->taskPriority))
-        {
-            fireIt = it;
-        }
+    if (!this->taskQueueValid || this->taskQueue.size() != this->processTasks.size()) {
+        this->buildTaskQueue();
     }
+    auto firesLater = [this](size_t a, size_t b) { return this->taskFiresBefore(b, a); };
+
+    //! - If the requested time does not meet our next start time, just return
+    ModelScheduleEntry *fireIt = &this->processTasks[this->taskQueue.front()];
     if(fireIt->NextTaskStart > currentNanos)
     {
         this->nextTaskTime = fireIt->NextTaskStart;
@@ -147,20 +179,12 @@ void SysProcess::singleStepNextTask(uint64_t currentNanos)
     //! - Call the next scheduled model, and set the time to its start
     SysModelTask *localTask = fireIt->TaskPtr;
     localTask->ExecuteTaskList(currentNanos);
+    std::pop_heap(this->taskQueue.begin(), this->taskQueue.end(), firesLater);
     fireIt->NextTaskStart = localTask->NextStartTime;
-    
+    std::push_heap(this->taskQueue.begin(), this->taskQueue.end(), firesLater);
+
     //! - Figure out when we are going to be called next for scheduling purposes
-    fireIt=this->processTasks.begin();
-    //! - If the requested time does not meet our next start time, just return
-    for(it=this->processTasks.begin(); it!=this->processTasks.end(); it++)
-    {
-        if(it->NextTaskStart < fireIt->NextTaskStart ||
-           (it->NextTaskStart==fireIt->NextTaskStart && it->taskPriority > fireIt->taskPriority))
-        {
-            fireIt = it;
-        }
-    }
-    this->nextTaskTime = fireIt->NextTaskStart;
+    this->nextTaskTime = this->processTasks[this->taskQueue.front()].NextTaskStart;
 }
 
 /*! This method adds a new task into the Task list.  Note that
@@ -191,6 +215,7 @@ void SysProcess::addNewTask(SysModelTask *newTask, int32_t taskPriority)
 void SysProcess::scheduleTask(ModelScheduleEntry & taskCall)
 {
     std::vector<ModelScheduleEntry>::iterator it;
+    this->taskQueueValid = false;
     //! - Iteratre through all of the task models to find correct place
     for(it = this->processTasks.begin(); it != this->processTasks.end(); it++)
     {
@@ -253,6 +278,7 @@ void SysProcess::changeTaskPeriod(std::string taskName, uint64_t newPeriod)
 			it->TaskPtr->updatePeriod(newPeriod);
 			it->NextTaskStart = it->TaskPtr->NextStartTime;
 			it->TaskUpdatePeriod = it->TaskPtr->TaskPeriod;
+			this->taskQueueValid = false;
 			return;
 		}
 	}
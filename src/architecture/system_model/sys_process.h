@@ -59,7 +59,11 @@ public:
     void enableAllTasks(); //!< class method
     bool getProcessControlStatus() {return this->processOnThread;} //!< Allows caller to see if this process is parented by a thread
     void setProcessControlStatus(bool processTaken) {processOnThread = processTaken;} //!< Provides a mechanism to say that this process is allocated to a thread
-    
+
+private:
+    bool taskFiresBefore(size_t first, size_t second) const;
+    void buildTaskQueue();
+
 public:
     std::vector<ModelScheduleEntry> processTasks;  //!< -- Array that has pointers to all process tasks
     uint64_t nextTaskTime;  //!< [ns] time for the next Task
@@ -69,6 +73,10 @@ public:
 	bool processOnThread; //!< -- Flag indicating that the process has been added to a thread for execution
     int64_t processPriority;  //!< [-] Priority level for process (higher first)
     BSKLogger bskLogger;                      //!< -- BSK Logging
+
+private:
+    std::vector<size_t> taskQueue;  //!< -- Heap of processTasks indices ordered by next start time, priority and list position
+    bool taskQueueValid;  //!< -- Flag indicating that taskQueue matches processTasks
 };
 
 #endif /* _SysProcess_H_ */
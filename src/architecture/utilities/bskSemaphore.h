@@ -23,43 +23,94 @@
 
 #include <mutex>
 #include <condition_variable>
+#include <atomic>
+#include <thread>
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+#include <immintrin.h>
+#endif
+
+/*! tell the processor that the calling thread is busy-waiting */
+inline void bskCpuRelax()
+{
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+    _mm_pause();
+#elif defined(__aarch64__) || defined(__arm__)
+    __asm__ __volatile__("yield");
+#else
+    std::this_thread::yield();
+#endif
+}
 
 
-/*! Basilisk semaphore class */
+/*! Basilisk semaphore class.  By default a thread waiting on the semaphore sleeps on a condition variable.  With
+    a non-zero spin count the waiting thread first polls the atomic count that many times, which avoids the
+    sleep and wake-up round trip when the semaphore is released shortly after. */
 class BSKSemaphore
 {
     std::mutex mutex;
     std::condition_variable cv;
-    size_t count;
+    std::atomic<size_t> count;
+    std::atomic<size_t> sleepers;   //!< number of threads sleeping on the condition variable
+    uint64_t spinCount;             //!< number of polls before a waiting thread sleeps
+
+    /*! take one count if available */
+    inline bool tryAcquire()
+    {
+        size_t current = count.load();
+        while (current > 0)
+        {
+            if (count.compare_exchange_weak(current, current - 1))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
 
 public:
     /*! method description */
     BSKSemaphore(int count_in = 0)
-        : count(count_in)
+        : count(count_in), sleepers(0), spinCount(0)
+    {
+    }
+
+    /*! set the number of polls before a waiting thread sleeps */
+    inline void setSpinCount(uint64_t spinCount_in)
     {
+        spinCount = spinCount_in;
     }
-    
+
     /*! release the lock */
     inline void release()
     {
+        ++count;
+        //notify the waiting thread if it went to sleep
+        if (sleepers.load() > 0)
         {
             std::unique_lock<std::mutex> lock(mutex);
-            ++count;
-            //notify the waiting thread
+            cv.notify_one();
         }
-        cv.notify_one();
     }
-    
+
     /*! aquire the lock */
     inline void acquire()
     {
+        for (uint64_t i = 0; i < spinCount; i++)
+        {
+            if (tryAcquire())
+            {
+                return;
+            }
+            bskCpuRelax();
+        }
         std::unique_lock<std::mutex> lock(mutex);
-        while (count == 0)
+        ++sleepers;
+        while (!tryAcquire())
         {
             //wait on the mutex until notify is called
             cv.wait(lock);
         }
-        --count;
+        --sleepers;
     }
 };
 
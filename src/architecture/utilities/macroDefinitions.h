@@ -25,6 +25,7 @@
 #define MAX_EFF_CNT 36
 #define MAX_NUM_CSS_SENSORS 32
 #define MAX_ST_VEH_COUNT 4
+#define MAX_MAPPING_ACCESS_POINTS 2000
 
 #define NANO2SEC        1e-9
 #define SEC2NANO        1e9
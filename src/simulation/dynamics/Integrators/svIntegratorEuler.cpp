@@ -41,21 +41,13 @@ svIntegratorEuler::~svIntegratorEuler()
  */
 void svIntegratorEuler::integrate(double currentTime, double timeStep)
 {
-	StateVector stateOut;
-	StateVector stateInit;
-	std::map<std::string, StateData>::iterator it;
-	std::map<std::string, StateData>::iterator itOut;
-	std::map<std::string, StateData>::iterator itInit;
-	stateOut = dynPtr->dynManager.getStateVector();
-	stateInit = dynPtr->dynManager.getStateVector();
-	dynPtr->equationsOfMotion(currentTime, timeStep);
-	for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itOut = stateOut.stateMap.begin(), itInit = stateInit.stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itOut++, itInit++)
-	{
-		itOut->second.setDerivative(it->second.getStateDeriv());
-		itOut->second.propagateState(timeStep);
-	}
-
-	dynPtr->dynManager.updateStateVector(stateOut);	
+    Eigen::VectorXd& states = dynPtr->dynManager.getPackedStates();
+    Eigen::VectorXd& stateDerivs = dynPtr->dynManager.getPackedStateDerivs();
+    stateOut = states;
+    dynPtr->equationsOfMotion(currentTime, timeStep);
+    stateOut += stateDerivs * timeStep;
+
+    states = stateOut;
 
     return;
 }
@@ -31,7 +31,9 @@ public:
     svIntegratorEuler(DynamicObject* dyn); //!< class method
     virtual ~svIntegratorEuler();
     virtual void integrate(double currentTime, double timeStep);
-    
+
+private:
+    Eigen::VectorXd stateOut;       //!< output state vector, allocated once
 };
 
 
@@ -39,29 +39,18 @@ svIntegratorRK2::~svIntegratorRK2()
  */
 void svIntegratorRK2::integrate(double currentTime, double timeStep)
 {
-	StateVector stateOut;
-	StateVector stateInit;
-	std::map<std::string, StateData>::iterator it;
-	std::map<std::string, StateData>::iterator itOut;
-	std::map<std::string, StateData>::iterator itInit;
-	stateOut = dynPtr->dynManager.getStateVector();
-	stateInit = dynPtr->dynManager.getStateVector();
+    Eigen::VectorXd& states = dynPtr->dynManager.getPackedStates();
+    Eigen::VectorXd& stateDerivs = dynPtr->dynManager.getPackedStateDerivs();
+    stateOut = states;
+    stateInit = states;
     dynPtr->equationsOfMotion(currentTime, timeStep);
-    for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itOut = stateOut.stateMap.begin(), itInit = stateInit.stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itOut++, itInit++)
-    {
-        itOut->second.setDerivative(it->second.getStateDeriv());
-        itOut->second.propagateState(timeStep / 2.0);
-        it->second.state = itInit->second.state + timeStep*it->second.stateDeriv;
-    }
+    stateOut += stateDerivs * (timeStep / 2.0);
+    states = stateInit + timeStep*stateDerivs;
 
     dynPtr->equationsOfMotion(currentTime + timeStep, timeStep);
-    for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itOut = stateOut.stateMap.begin(), itInit = stateInit.stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itOut++, itInit++)
-    {
-        itOut->second.setDerivative(it->second.getStateDeriv());
-        itOut->second.propagateState(timeStep / 2.0);
-    }
+    stateOut += stateDerivs * (timeStep / 2.0);
 
-	dynPtr->dynManager.updateStateVector(stateOut);	
+    states = stateOut;
 
     return;
 }
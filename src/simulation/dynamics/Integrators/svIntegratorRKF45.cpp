@@ -88,18 +88,13 @@ svIntegratorRKF45::~svIntegratorRKF45()
  */
 void svIntegratorRKF45::integrate(double currentTime, double timeStep)
 {
-	StateVector stateOut;  // output state vector
-	StateVector stateInit;  // initial state vector
-    StateVector errorMatrix;  // error state vector
-    std::vector<StateVector> kMatrix;  // matrix of k coefficients
-	std::map<std::string, StateData>::iterator it;
-	std::map<std::string, StateData>::iterator itOut;
-	std::map<std::string, StateData>::iterator itInit;
-    std::map<std::string, StateData>::iterator itkMatrix;
-    std::map<std::string, StateData>::iterator itError;
-	stateOut = dynPtr->dynManager.getStateVector();  // copy current state variables
-	stateInit = dynPtr->dynManager.getStateVector();  // copy current state variables
-    errorMatrix = dynPtr->dynManager.getStateVector();  // copy current state variables
+    Eigen::VectorXd& states = dynPtr->dynManager.getPackedStates();  // all state variables, stored contiguously
+    Eigen::VectorXd& stateDerivs = dynPtr->dynManager.getPackedStateDerivs();  // all state derivatives, stored contiguously
+    const std::vector<std::pair<Eigen::Index, Eigen::Index>>& segments = dynPtr->dynManager.getPackedStateSegments();  // location of each state variable
+    stateOut = states;  // copy current state variables
+    stateInit = states;  // copy current state variables
+    errorVector = states;  // copy current state variables
+    kMatrixDerivs.resize(6);
     double h = timeStep;  // updated variable time step that depends on the relative error and the relative tolerance
     double t = currentTime;  // integration time
     double hInt = timeStep;  // time step used for the current integration loop
@@ -121,67 +116,51 @@ void svIntegratorRKF45::integrate(double currentTime, double timeStep)
             // Reset the time step for integration
             hInt = h;
 
-            // Reset the k matrix
-            kMatrix.clear();
-
             // Compute the equations of motion for t
             dynPtr->equationsOfMotion(t, hInt);
 
             // Reset the ouput and error vectors
-            for (itOut = stateOut.stateMap.begin(), itInit = stateInit.stateMap.begin(), itError = errorMatrix.stateMap.begin(); itOut != stateOut.stateMap.end(); itOut++, itInit++, itError++)
-            {
-                itOut->second.state = itInit->second.state;
-                itError->second.state.setZero();
-            }
+            stateOut = stateInit;
+            errorVector.setZero();
 
             // Loop through all 6 coefficients (k1 through k6)
             for (uint64_t i = 0; i < 6; i++)
             {
-                // Initialize the state iterators. The state variables are defined in a dictionary and are pulled and populated one by one
-                for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itInit = stateInit.stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itInit++)
-                {
-                    it->second.state = itInit->second.state;
-                }
+                // Initialize the state variables
+                states = stateInit;
 
                 // Loop through the B matrix coefficients that define the point of integration
                 for (uint64_t j = 0; j < i; j++)
                 {
-                    for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itOut = kMatrix[j].stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itOut++)
-                    {
-                        it->second.state = it->second.state + hInt * betaMatrix[i][j] * itOut->second.stateDeriv;
-                    }
+                    states = states + hInt * betaMatrix[i][j] * kMatrixDerivs[j];
                 }
 
                 // Integrate with the appropriate time step using the A matrix coefficients
                 dynPtr->equationsOfMotion(t + hInt * alphaMatrix[i], hInt);
 
                 // Save the current k coefficient
-                kMatrix.push_back(dynPtr->dynManager.getStateVector());
+                kMatrixDerivs[i] = stateDerivs;
 
                 // Update the state at the end of the current integration step
-                for (it = dynPtr->dynManager.stateContainer.stateMap.begin(), itOut = stateOut.stateMap.begin(); it != dynPtr->dynManager.stateContainer.stateMap.end(); it++, itOut++)
-                {
-                    itOut->second.state += hInt * chMatrix[i] * it->second.stateDeriv;
-                }
+                stateOut += hInt * chMatrix[i] * stateDerivs;
 
-                // Update the current error vector
-                for (itkMatrix = kMatrix[i].stateMap.begin(), itError = errorMatrix.stateMap.begin(); itkMatrix != kMatrix[i].stateMap.end(); itkMatrix++, itError++)
-                {
-                    // Update the error vector with the appropriate coefficients
-                    itError->second.state += hInt * ctMatrix[i] * itkMatrix->second.stateDeriv;
-                }
+                // Update the current error vector with the appropriate coefficients
+                errorVector += hInt * ctMatrix[i] * kMatrixDerivs[i];
             }
 
             // Calculate the relative error. The error is calculated using the norm of each state variable
-            for (it = stateOut.stateMap.begin(), itError = errorMatrix.stateMap.begin(); it != stateOut.stateMap.end(); it++, itError++)
+            for (size_t k = 0; k < segments.size(); k++)
             {
+                double stateNorm = stateOut.segment(segments[k].first, segments[k].second).norm();
+                double errorNorm = errorVector.segment(segments[k].first, segments[k].second).norm();
+
                 // Check if the norm is smaller than the absolute tolerance. If it is, calculate the error relative to the absolute tolerance instead
-                if (it->second.state.norm() < this->absTol)
-                    relError = itError->second.state.norm() / this->absTol;
+                if (stateNorm < this->absTol)
+                    relError = errorNorm / this->absTol;
                 else {
-                    relError = itError->second.state.norm() / it->second.state.norm();
+                    relError = errorNorm / stateNorm;
                 }
-                
+
                 // Save the maximum relative error to use on the time step refinement
                 if (maxRelError < relError) {
                     maxRelError = relError;
@@ -193,10 +172,10 @@ void svIntegratorRKF45::integrate(double currentTime, double timeStep)
         }
 
         // Update the entire state vector after integration
-        dynPtr->dynManager.updateStateVector(stateOut);
+        states = stateOut;
 
         // Update the initial state
-        stateInit = dynPtr->dynManager.getStateVector();
+        stateInit = states;
 
         // Update the time
         t += hInt;
@@ -206,6 +185,6 @@ void svIntegratorRKF45::integrate(double currentTime, double timeStep)
             h = currentTime + timeStep - t;
         }
     }
-    
+
     return;
 }
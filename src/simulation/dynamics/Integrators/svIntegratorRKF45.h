@@ -39,6 +39,12 @@ public:
 
     double absTol;      //!< absolute tolerance
     double relTol;      //!< relative tolerance
+
+private:
+    Eigen::VectorXd stateOut;       //!< output state vector, allocated once
+    Eigen::VectorXd stateInit;      //!< initial state vector, allocated once
+    Eigen::VectorXd errorVector;    //!< error state vector, allocated once
+    std::vector<Eigen::VectorXd> kMatrixDerivs;  //!< state derivatives of the k coefficients
 };
 
 
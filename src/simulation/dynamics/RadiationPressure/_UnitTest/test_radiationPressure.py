@@ -285,5 +285,69 @@ def unitRadiationPressure(show_plots, modelType, eclipseOn):
     # testMessage
     return [testFailCount, ''.join(testMessages)]
 
+
+def test_lookupInterpolation(tmp_path):
+    r"""
+    **Validation Test Description**
+
+    A lookup table of a sphere with a force of 1 N at 1 AU away from the sun is saved to and loaded from a binary
+    file, and set in two modules with a single call each.  The nearest entry found through the spherical index of the
+    table must match the nearest entry of all the table entries, and the interpolation between the entries around
+    the sun direction must be much closer to the force of the sphere than the nearest entry.
+    """
+    numEntries = 2000
+    z = 1. - (2.*np.arange(numEntries) + 1.)/numEntries
+    phi = np.arange(numEntries)*np.pi*(3. - np.sqrt(5.))
+    sHat_B = np.column_stack([np.sqrt(1. - z*z)*np.cos(phi), np.sqrt(1. - z*z)*np.sin(phi), z])
+    handler = radiationPressure.SRPLookupTableHandler()
+    handler.sHatBLookup = sHat_B
+    handler.forceBLookup = -sHat_B
+    handler.torqueBLookup = np.cross(sHat_B, [0., 0., 1e-6])
+    tableFile = os.path.join(str(tmp_path), "sphereLookup.npz")
+    handler.saveNpz(tableFile)
+    handler = radiationPressure.SRPLookupTableHandler()
+    handler.parseAndLoadNpz(tableFile)
+    np.testing.assert_array_equal(handler.sHatBLookup, sHat_B)
+
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("unitTestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask("unitTestTask", macros.sec2nano(0.1)))
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraft"
+    unitTestSim.AddModelToTask("unitTestTask", scObject)
+    sunMsg = messaging.SpicePlanetStateMsg().write(messaging.SpicePlanetStateMsgPayload())
+
+    srpEffectors = []
+    for interpolate in [False, True]:
+        srpEffector = radiationPressure.RadiationPressure()
+        srpEffector.ModelTag = "RadiationPressure" + str(interpolate)
+        srpEffector.setUseFacetedCPUModel()
+        srpEffector.useLookupInterpolation = interpolate
+        handler.loadIntoModule(srpEffector)
+        srpEffector.sunEphmInMsg.subscribeTo(sunMsg)
+        scObject.addDynamicEffector(srpEffector)
+        unitTestSim.AddModelToTask("unitTestTask", srpEffector, None, 3)
+        srpEffectors.append(srpEffector)
+
+    sunDir_N = np.array([0.3, -0.5, 0.8])
+    sunDir_N = sunDir_N/np.linalg.norm(sunDir_N)
+    scObject.hub.r_CN_NInit = -sunDir_N*om.AU*1000.
+    scObject.hub.sigma_BNInit = [0., 0., 0.]
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.TotalSim.SingleStepProcesses()
+    forces = []
+    for srpEffector in srpEffectors:
+        assert srpEffector.isLookupIndexed()
+        srpEffector.computeForceTorque(unitTestSim.TotalSim.CurrentNanos, macros.sec2nano(0.1))
+        forces.append(np.array(srpEffector.forceExternal_B).flatten())
+
+    nearestIdx = np.argmax(sHat_B.dot(sunDir_N))
+    np.testing.assert_allclose(forces[0], -sHat_B[nearestIdx], atol=1e-12)
+    nearestError = np.linalg.norm(forces[0] + sunDir_N)
+    interpolationError = np.linalg.norm(forces[1] + sunDir_N)
+    assert interpolationError < 2e-3
+    assert interpolationError < 0.1*nearestError
+
 if __name__ == "__main__":
     unitRadiationPressure(False, "cannonball", False)
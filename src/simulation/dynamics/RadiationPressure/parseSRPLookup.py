@@ -67,3 +67,20 @@ class SRPLookupTableHandler:
                     self.torqueBLookup[idx, 1] = value.text
                 if value.tag == 'value_3':
                     self.torqueBLookup[idx, 2] = value.text
+
+    def parseAndLoadNpz(self, filePath):
+        """Load the lookup table from a numpy ``.npz`` binary file with the ``sHatBLookup``, ``forceBLookup`` and
+        ``torqueBLookup`` arrays, as written by :meth:`saveNpz`"""
+        with np.load(filePath) as table:
+            self.sHatBLookup = np.array(table['sHatBLookup'], dtype=float)
+            self.forceBLookup = np.array(table['forceBLookup'], dtype=float)
+            self.torqueBLookup = np.array(table['torqueBLookup'], dtype=float)
+
+    def saveNpz(self, filePath):
+        """Save the lookup table as a numpy ``.npz`` binary file, which loads much faster than the XML file"""
+        np.savez(filePath, sHatBLookup=self.sHatBLookup, forceBLookup=self.forceBLookup,
+                 torqueBLookup=self.torqueBLookup)
+
+    def loadIntoModule(self, srpEffector):
+        """Set the whole lookup table of a ``RadiationPressure`` module with a single call"""
+        srpEffector.setLookupTable(self.sHatBLookup, self.forceBLookup, self.torqueBLookup)
@@ -23,6 +23,7 @@
 #include "architecture/utilities/avsEigenSupport.h"
 #include "architecture/utilities/avsEigenMRP.h"
 #include <inttypes.h>
+#include <algorithm>
 
 /*! This is the constructor.  It sets some default initializers that can be
  overriden by the user.*/
@@ -31,8 +32,13 @@ RadiationPressure::RadiationPressure()
     ,coefficientReflection(1.2)
     ,srpModel(SRP_CANNONBALL_MODEL)
     ,stateRead(false)
+    ,lookupIndexSize(0)
+    ,lookupIndexValid(false)
+    ,lookupFace(0)
+    ,lookupVertex(0)
 {
     this->sunVisibilityFactor.shadowFactor = 1.0;
+    this->useLookupInterpolation = false;
     this->forceExternal_N.setZero();
     this->forceExternal_B.setZero();
     this->torqueExternalPntB_B.setZero();
@@ -58,6 +64,11 @@ void RadiationPressure::Reset(uint64_t CurrenSimNanos)
     {
         bskLogger.bskLog(BSK_ERROR, "Did not find a valid sun ephemeris message connection.");
     }
+
+    //! - index the lookup table sun directions
+    if (this->srpModel == SRP_FACETED_CPU_MODEL) {
+        this->buildLookupIndex();
+    }
 }
 
 /*! This method retrieves pointers to parameters/data stored
@@ -194,25 +205,61 @@ void RadiationPressure::computeLookupModel(Eigen::Vector3d s_B)
         this->torqueExternalPntB_B.setZero();
         return;
     }
-    
-    // Find the lookup entry that most closely aligns with the current sHat_B direction
+
+    //! - index the lookup table if it changed since it was last indexed
+    if (this->lookupIndexSize != this->lookupSHat_B.size()) {
+        this->buildLookupIndex();
+    }
+    if (this->lookupSHat_B.empty() || this->lookupForce_B.size() != this->lookupSHat_B.size()
+        || this->lookupTorque_B.size() != this->lookupSHat_B.size()) {
+        this->forceExternal_B.setZero();
+        this->torqueExternalPntB_B.setZero();
+        return;
+    }
+
     // Look up force is expected to be evaluated at 1AU.
     // Therefore, we must scale the force by its distance from the sun squared.
-    // @TODO: this lookup search should be optimized, possibly by saving the
-    // index for later use and generate lookup table as azimuth and elevation
-    // because then we can use a simple gradient decent search to find the nearest next attitude
-    for(int i = 0; i < (int) this->lookupSHat_B.size(); i++) {
-        tmpLookupSHat_B = this->lookupSHat_B[i];
-        tmpDotProduct = tmpLookupSHat_B.dot(sHat_B);
-        if (tmpDotProduct > currentDotProduct)
-        {
-            currentIdx = i;
-            currentDotProduct = tmpDotProduct;
+    double distanceScale = pow(AU*1000/sunDist, 2);
+
+    if (this->lookupIndexValid && this->useLookupInterpolation) {
+        //! - interpolate the entries of the triangle around the sun direction with barycentric coordinates
+        int faceIdx = this->findLookupFace(sHat_B);
+        if (faceIdx >= 0) {
+            std::array<int, 3> face = this->lookupFaces[faceIdx];
+            const Eigen::Vector3d &a = this->lookupIndexPoints[face[0]];
+            const Eigen::Vector3d &b = this->lookupIndexPoints[face[1]];
+            const Eigen::Vector3d &c = this->lookupIndexPoints[face[2]];
+            Eigen::Vector3d weights(sHat_B.dot(b.cross(c)), sHat_B.dot(c.cross(a)), sHat_B.dot(a.cross(b)));
+            weights /= weights.sum();
+            this->forceExternal_B.setZero();
+            this->torqueExternalPntB_B.setZero();
+            for (int k = 0; k < 3; k++) {
+                this->forceExternal_B += weights[k]*this->lookupForce_B[face[k]];
+                this->torqueExternalPntB_B += weights[k]*this->lookupTorque_B[face[k]];
+            }
+            this->forceExternal_B *= distanceScale;
+            this->torqueExternalPntB_B *= distanceScale;
+            return;
+        }
+    }
+
+    // Find the lookup entry that most closely aligns with the current sHat_B direction
+    if (this->lookupIndexValid) {
+        currentIdx = this->findNearestLookupEntry(sHat_B);
+    } else {
+        for(int i = 0; i < (int) this->lookupSHat_B.size(); i++) {
+            tmpLookupSHat_B = this->lookupSHat_B[i];
+            tmpDotProduct = tmpLookupSHat_B.dot(sHat_B);
+            if (tmpDotProduct > currentDotProduct)
+            {
+                currentIdx = i;
+                currentDotProduct = tmpDotProduct;
+            }
         }
     }
     
-    this->forceExternal_B = this->lookupForce_B[currentIdx]*pow(AU*1000/sunDist, 2);
-    this->torqueExternalPntB_B = this->lookupTorque_B[currentIdx]*pow(AU*1000/sunDist, 2);
+    this->forceExternal_B = this->lookupForce_B[currentIdx]*distanceScale;
+    this->torqueExternalPntB_B = this->lookupTorque_B[currentIdx]*distanceScale;
 }
 
 /*! Add force vector in the body frame to lookup table.
@@ -223,6 +270,7 @@ void RadiationPressure::computeLookupModel(Eigen::Vector3d s_B)
 void RadiationPressure::addForceLookupBEntry(Eigen::Vector3d vec)
 {
     this->lookupForce_B.push_back(vec);
+    this->lookupIndexSize = 0;
 }
 
 /*! Add torque vector to lookup table.
@@ -233,6 +281,7 @@ void RadiationPressure::addForceLookupBEntry(Eigen::Vector3d vec)
 void RadiationPressure::addTorqueLookupBEntry(Eigen::Vector3d vec)
 {
     this->lookupTorque_B.push_back(vec);
+    this->lookupIndexSize = 0;
 }
 
 /*! Add sun unit direction vector in body frame to lookup table.
@@ -243,4 +292,357 @@ void RadiationPressure::addTorqueLookupBEntry(Eigen::Vector3d vec)
 void RadiationPressure::addSHatLookupBEntry(Eigen::Vector3d vec)
 {
     this->lookupSHat_B.push_back(vec);
+    this->lookupIndexSize = 0;
+}
+
+/*! Set the whole lookup table at once, replacing any prior entries.
+ *
+ @return void
+ @param sHat_B sun unit direction vectors in body frame, one per row
+ @param force_B (N) force vectors at 1AU for each sun direction, one per row
+ @param torque_B (Nm) torque vectors at 1AU for each sun direction, one per row
+ */
+void RadiationPressure::setLookupTable(Eigen::MatrixXd sHat_B, Eigen::MatrixXd force_B, Eigen::MatrixXd torque_B)
+{
+    if (sHat_B.cols() != 3 || force_B.cols() != 3 || torque_B.cols() != 3
+        || force_B.rows() != sHat_B.rows() || torque_B.rows() != sHat_B.rows()) {
+        bskLogger.bskLog(BSK_ERROR, "The SRP lookup table sun direction, force and torque arrays must have the same number of rows with 3 columns.");
+        return;
+    }
+
+    this->lookupSHat_B.resize(sHat_B.rows());
+    this->lookupForce_B.resize(sHat_B.rows());
+    this->lookupTorque_B.resize(sHat_B.rows());
+    for (long i = 0; i < sHat_B.rows(); i++) {
+        this->lookupSHat_B[i] = sHat_B.row(i).transpose();
+        this->lookupForce_B[i] = force_B.row(i).transpose();
+        this->lookupTorque_B[i] = torque_B.row(i).transpose();
+    }
+    this->lookupIndexSize = 0;
+}
+
+/*! Returns if the lookup table sun directions are indexed by a triangulation that surrounds the spacecraft.  If not,
+ the nearest entry is found by comparing all entries and the table can't be interpolated.
+ *
+ @return bool
+ */
+bool RadiationPressure::isLookupIndexed()
+{
+    if (this->lookupIndexSize != this->lookupSHat_B.size()) {
+        this->buildLookupIndex();
+    }
+    return this->lookupIndexValid;
+}
+
+/*! Builds the spherical Delaunay triangulation of the lookup table sun directions, which is the convex hull of the
+ unit vectors.  The hull is built by inserting the entries in a spatially sorted order, and each insertion replaces
+ the triangles that see the new entry.  Entries that are duplicate directions are left out of the triangulation.
+ *
+ @return void
+ */
+void RadiationPressure::buildLookupIndex()
+{
+    size_t numEntries = this->lookupSHat_B.size();
+    this->lookupIndexSize = numEntries;
+    this->lookupIndexValid = false;
+    this->lookupIndexPoints.clear();
+    this->lookupFaces.clear();
+    this->lookupFaceNormals.clear();
+    this->lookupFaceAlive.clear();
+    this->lookupFaceNeighbors.clear();
+    this->lookupNeighbors.clear();
+    this->lookupFace = 0;
+    this->lookupVertex = 0;
+
+    if (this->lookupForce_B.size() != numEntries || this->lookupTorque_B.size() != numEntries) {
+        bskLogger.bskLog(BSK_ERROR, "The SRP lookup table force, torque and sun direction entries must have the same size.");
+        return;
+    }
+    if (numEntries < 4) {
+        return;
+    }
+    for (size_t i = 0; i < numEntries; i++) {
+        this->lookupIndexPoints.push_back(this->lookupSHat_B[i].normalized());
+    }
+    std::vector<Eigen::Vector3d> &points = this->lookupIndexPoints;
+
+    //! - start from a tetrahedron of widely spread entries
+    int i0 = 0, i1 = 0, i2 = 0, i3 = 0;
+    double maxMeasure[3] = {0., 0., 0.};
+    for (int i = 0; i < (int) numEntries; i++) {
+        double dist = (points[i] - points[i0]).norm();
+        if (dist > maxMeasure[0]) { maxMeasure[0] = dist; i1 = i; }
+    }
+    for (int i = 0; i < (int) numEntries; i++) {
+        double dist = (points[i] - points[i0]).cross(points[i1] - points[i0]).norm();
+        if (dist > maxMeasure[1]) { maxMeasure[1] = dist; i2 = i; }
+    }
+    Eigen::Vector3d normal012 = (points[i1] - points[i0]).cross(points[i2] - points[i0]);
+    for (int i = 0; i < (int) numEntries; i++) {
+        double dist = fabs(normal012.dot(points[i] - points[i0]));
+        if (dist > maxMeasure[2]) { maxMeasure[2] = dist; i3 = i; }
+    }
+    if (maxMeasure[0] < 1e-10 || maxMeasure[1] < 1e-10 || maxMeasure[2] < 1e-10) {
+        return;
+    }
+    if (normal012.dot(points[i3] - points[i0]) > 0) {
+        std::swap(i1, i2);
+    }
+    this->addLookupIndexFace(i0, i1, i2);
+    this->addLookupIndexFace(i0, i3, i1);
+    this->addLookupIndexFace(i1, i3, i2);
+    this->addLookupIndexFace(i0, i2, i3);
+    for (int f = 0; f < 4; f++) {
+        for (int g = 0; g < 4; g++) {
+            for (int k = 0; k < 3 && f != g; k++) {
+                this->linkLookupIndexFaces(f, k, g);
+            }
+        }
+    }
+
+    //! - insert the other entries sorted along a Z-order curve, such that each search starts close to the entry
+    std::vector<std::pair<uint32_t, int>> order;
+    for (int i = 0; i < (int) numEntries; i++) {
+        if (i == i0 || i == i1 || i == i2 || i == i3) {
+            continue;
+        }
+        uint32_t key = 0;
+        for (int bit = 9; bit >= 0; bit--) {
+            for (int axis = 0; axis < 3; axis++) {
+                uint32_t cell = (uint32_t) std::min(1023., std::max(0., (points[i][axis] + 1.)*512.));
+                key = (key << 1) | ((cell >> bit) & 1);
+            }
+        }
+        order.push_back({key, i});
+    }
+    std::sort(order.begin(), order.end());
+    for (const std::pair<uint32_t, int> &entry : order) {
+        this->addLookupIndexPoint(entry.second);
+    }
+
+    //! - keep the triangles of the hull and find the neighbors of each entry
+    std::vector<int> newIndex(this->lookupFaces.size(), -1);
+    std::vector<std::array<int, 3>> faces;
+    std::vector<std::array<int, 3>> faceNeighbors;
+    for (size_t f = 0; f < this->lookupFaces.size(); f++) {
+        if (this->lookupFaceAlive[f]) {
+            newIndex[f] = (int) faces.size();
+            faces.push_back(this->lookupFaces[f]);
+            faceNeighbors.push_back(this->lookupFaceNeighbors[f]);
+        }
+    }
+    this->lookupFaces.clear();
+    this->lookupFaceNormals.clear();
+    this->lookupFaceAlive.clear();
+    this->lookupFaceNeighbors.clear();
+    this->lookupNeighbors.assign(numEntries, std::vector<int>());
+    this->lookupIndexValid = true;
+    for (size_t f = 0; f < faces.size(); f++) {
+        const std::array<int, 3> &face = faces[f];
+        this->addLookupIndexFace(face[0], face[1], face[2]);
+        for (int k = 0; k < 3; k++) {
+            this->lookupFaceNeighbors[f][k] = newIndex[faceNeighbors[f][k]];
+            this->lookupNeighbors[face[k]].push_back(face[(k + 1) % 3]);
+        }
+        //! - the triangles only cover all the sun directions if the body frame origin is inside of the hull
+        if (this->lookupFaceNormals[f].dot(points[face[0]]) < 1e-9) {
+            this->lookupIndexValid = false;
+        }
+    }
+    this->lookupVertex = this->lookupFaces[0][0];
+
+    if (!this->lookupIndexValid && this->useLookupInterpolation) {
+        bskLogger.bskLog(BSK_WARNING, "The SRP lookup table sun directions don't surround the spacecraft.  The nearest entry is used instead of interpolating.");
+    }
+}
+
+/*! Adds a triangle to the lookup table triangulation.
+ *
+ @return int index of the triangle
+ @param a first entry of the triangle
+ @param b second entry of the triangle
+ @param c third entry of the triangle, counter-clockwise seen from outside of the hull
+ */
+int RadiationPressure::addLookupIndexFace(int a, int b, int c)
+{
+    const std::vector<Eigen::Vector3d> &points = this->lookupIndexPoints;
+
+    this->lookupFaces.push_back({a, b, c});
+    this->lookupFaceNormals.push_back((points[b] - points[a]).cross(points[c] - points[a]).normalized());
+    this->lookupFaceAlive.push_back(true);
+    this->lookupFaceNeighbors.push_back({-1, -1, -1});
+    return (int) this->lookupFaces.size() - 1;
+}
+
+/*! Links a triangle and its neighbor across an edge, if the neighbor has that edge in the opposite direction.
+ *
+ @return void
+ @param faceIdx index of the triangle
+ @param edgeIdx index of the edge of the triangle, from its entry edgeIdx to the next entry
+ @param neighborIdx index of the neighbor triangle
+ */
+void RadiationPressure::linkLookupIndexFaces(int faceIdx, int edgeIdx, int neighborIdx)
+{
+    int a = this->lookupFaces[faceIdx][edgeIdx];
+    int b = this->lookupFaces[faceIdx][(edgeIdx + 1) % 3];
+    for (int k = 0; k < 3; k++) {
+        if (this->lookupFaces[neighborIdx][k] == b && this->lookupFaces[neighborIdx][(k + 1) % 3] == a) {
+            this->lookupFaceNeighbors[faceIdx][edgeIdx] = neighborIdx;
+            this->lookupFaceNeighbors[neighborIdx][k] = faceIdx;
+        }
+    }
+}
+
+/*! Returns if a point is in front of a triangle of the lookup table hull.
+ *
+ @return bool
+ @param faceIdx index of the triangle
+ @param point point to check
+ */
+bool RadiationPressure::isLookupFaceVisible(int faceIdx, const Eigen::Vector3d &point)
+{
+    return this->lookupFaceAlive[faceIdx]
+           && this->lookupFaceNormals[faceIdx].dot(point - this->lookupIndexPoints[this->lookupFaces[faceIdx][0]]) > 1e-12;
+}
+
+/*! Inserts a lookup table entry into the hull.  The triangles that see the entry are replaced by a fan of triangles
+ from their boundary to the entry.
+ *
+ @return bool true if the entry is outside of the hull and was inserted
+ @param pointIdx index of the entry
+ */
+bool RadiationPressure::addLookupIndexPoint(int pointIdx)
+{
+    const Eigen::Vector3d &point = this->lookupIndexPoints[pointIdx];
+
+    //! - walk from the last new triangle towards the entry direction to find a triangle that sees it
+    int faceIdx = this->lookupFace;
+    for (size_t step = 0; step < this->lookupFaces.size() && !this->isLookupFaceVisible(faceIdx, point); step++) {
+        std::array<int, 3> face = this->lookupFaces[faceIdx];
+        int nextIdx = -1;
+        for (int k = 0; k < 3 && nextIdx < 0; k++) {
+            if (point.dot(this->lookupIndexPoints[face[k]].cross(this->lookupIndexPoints[face[(k + 1) % 3]])) < 0.) {
+                nextIdx = this->lookupFaceNeighbors[faceIdx][k];
+            }
+        }
+        if (nextIdx < 0) {
+            break;
+        }
+        faceIdx = nextIdx;
+    }
+    if (!this->isLookupFaceVisible(faceIdx, point)) {
+        faceIdx = -1;
+        for (int f = (int) this->lookupFaces.size() - 1; f >= 0 && faceIdx < 0; f--) {
+            if (this->isLookupFaceVisible(f, point)) {
+                faceIdx = f;
+            }
+        }
+        if (faceIdx < 0) {
+            return false;
+        }
+    }
+
+    //! - collect the triangles that see the entry and the edges of the boundary of that region
+    std::vector<int> visibleFaces = {faceIdx};
+    std::vector<std::array<int, 3>> horizon;                // start entry, end entry and outer triangle of the edges
+    for (size_t v = 0; v < visibleFaces.size(); v++) {
+        std::array<int, 3> face = this->lookupFaces[visibleFaces[v]];
+        for (int k = 0; k < 3; k++) {
+            int neighborIdx = this->lookupFaceNeighbors[visibleFaces[v]][k];
+            if (std::find(visibleFaces.begin(), visibleFaces.end(), neighborIdx) != visibleFaces.end()) {
+                continue;
+            }
+            if (this->isLookupFaceVisible(neighborIdx, point)) {
+                visibleFaces.push_back(neighborIdx);
+            } else {
+                horizon.push_back({face[k], face[(k + 1) % 3], neighborIdx});
+            }
+        }
+    }
+
+    //! - replace the visible triangles by the triangles from the boundary edges to the entry
+    for (int f : visibleFaces) {
+        this->lookupFaceAlive[f] = false;
+    }
+    std::vector<int> newFaces;
+    for (const std::array<int, 3> &edge : horizon) {
+        newFaces.push_back(this->addLookupIndexFace(edge[0], edge[1], pointIdx));
+        this->linkLookupIndexFaces(newFaces.back(), 0, edge[2]);
+    }
+    for (int f : newFaces) {
+        for (int g : newFaces) {
+            for (int k = 1; k < 3 && f != g; k++) {
+                this->linkLookupIndexFaces(f, k, g);
+            }
+        }
+    }
+    this->lookupFace = newFaces.back();
+
+    return true;
+}
+
+/*! Finds the triangle of the lookup table triangulation around a sun direction, walking from the last triangle found.
+ *
+ @return int index of the triangle, -1 if no triangle was found
+ @param sHat_B sun unit direction vector in body frame
+ */
+int RadiationPressure::findLookupFace(const Eigen::Vector3d &sHat_B)
+{
+    int faceIdx = this->lookupFace;
+
+    for (size_t step = 0; step < this->lookupFaces.size(); step++) {
+        std::array<int, 3> face = this->lookupFaces[faceIdx];
+        int nextIdx = faceIdx;
+        for (int k = 0; k < 3 && nextIdx == faceIdx; k++) {
+            if (sHat_B.dot(this->lookupIndexPoints[face[k]].cross(this->lookupIndexPoints[face[(k + 1) % 3]])) < -1e-15) {
+                nextIdx = this->lookupFaceNeighbors[faceIdx][k];
+            }
+        }
+        if (nextIdx == faceIdx) {
+            this->lookupFace = faceIdx;
+            return faceIdx;
+        }
+        faceIdx = nextIdx;
+    }
+
+    //! - fall back to checking all the triangles if the walk cycles
+    for (int f = 0; f < (int) this->lookupFaces.size(); f++) {
+        std::array<int, 3> face = this->lookupFaces[f];
+        bool inside = true;
+        for (int k = 0; k < 3; k++) {
+            inside = inside && sHat_B.dot(this->lookupIndexPoints[face[k]].cross(this->lookupIndexPoints[face[(k + 1) % 3]])) >= -1e-12;
+        }
+        if (inside) {
+            this->lookupFace = f;
+            return f;
+        }
+    }
+    return -1;
+}
+
+/*! Finds the lookup table entry closest to a sun direction.  Walking from the last nearest entry to a closer
+ neighbor finds the nearest entry of a Delaunay triangulation.
+ *
+ @return int index of the nearest entry
+ @param sHat_B sun unit direction vector in body frame
+ */
+int RadiationPressure::findNearestLookupEntry(const Eigen::Vector3d &sHat_B)
+{
+    int current = this->lookupVertex;
+    double currentDotProduct = sHat_B.dot(this->lookupIndexPoints[current]);
+    bool moved = true;
+
+    while (moved) {
+        moved = false;
+        for (int neighbor : this->lookupNeighbors[current]) {
+            double tmpDotProduct = sHat_B.dot(this->lookupIndexPoints[neighbor]);
+            if (tmpDotProduct > currentDotProduct) {
+                current = neighbor;
+                currentDotProduct = tmpDotProduct;
+                moved = true;
+            }
+        }
+    }
+    this->lookupVertex = current;
+    return current;
 }
@@ -21,6 +21,7 @@
 #define RADIATION_PRESSURE_H
 
 #include <vector>
+#include <array>
 #include "architecture/_GeneralModuleFiles/sys_model.h"
 #include "simulation/dynamics/_GeneralModuleFiles/dynamicEffector.h"
 #include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
@@ -60,10 +61,19 @@ public:
     void addForceLookupBEntry(Eigen::Vector3d vec);
     void addTorqueLookupBEntry(Eigen::Vector3d vec);
     void addSHatLookupBEntry(Eigen::Vector3d vec);
-    
+    void setLookupTable(Eigen::MatrixXd sHat_B, Eigen::MatrixXd force_B, Eigen::MatrixXd torque_B);
+    bool isLookupIndexed();
+
 private:
     void computeCannonballModel(Eigen::Vector3d rSunB_B);
     void computeLookupModel(Eigen::Vector3d rSunB_B);
+    void buildLookupIndex();
+    bool addLookupIndexPoint(int pointIdx);
+    int addLookupIndexFace(int a, int b, int c);
+    void linkLookupIndexFaces(int faceIdx, int edgeIdx, int neighborIdx);
+    bool isLookupFaceVisible(int faceIdx, const Eigen::Vector3d &point);
+    int findLookupFace(const Eigen::Vector3d &sHat_B);
+    int findNearestLookupEntry(const Eigen::Vector3d &sHat_B);
 
 public:
     double  area; //!< m^2 Body surface area
@@ -73,6 +83,7 @@ public:
     std::vector<Eigen::Vector3d> lookupForce_B;     //!< -- Force on S/C at 1 AU from sun
     std::vector<Eigen::Vector3d> lookupTorque_B;    //!< -- Torque on S/C
     std::vector<Eigen::Vector3d> lookupSHat_B;      //!< -- S/C to sun unit vector defined in the body frame.
+    bool useLookupInterpolation;                    //!< -- flag to interpolate the lookup table between the three entries around the sun direction instead of using the nearest entry, default is off
     BSKLogger bskLogger;                      //!< -- BSK Logging
 
 private:
@@ -83,6 +94,18 @@ private:
     StateData *hubR_N;                          //!< -- State data accesss to inertial position for the hub
     StateData *hubSigma;                                   //!< -- Hub/Inertial attitude represented by MRP
 
+    // Spherical Delaunay triangulation of the lookup table sun directions, the convex hull of the unit vectors
+    size_t lookupIndexSize;                                 //!< -- number of lookup entries the index was built for
+    bool lookupIndexValid;                                  //!< -- flag if the triangulation covers all the sun directions
+    std::vector<Eigen::Vector3d> lookupIndexPoints;         //!< -- normalized lookup table sun directions
+    std::vector<std::array<int, 3>> lookupFaces;            //!< -- entries of the triangles, counter-clockwise seen from outside
+    std::vector<Eigen::Vector3d> lookupFaceNormals;         //!< -- outward normals of the triangles
+    std::vector<bool> lookupFaceAlive;                      //!< -- flag if a triangle is part of the triangulation
+    std::vector<std::array<int, 3>> lookupFaceNeighbors;    //!< -- neighbor triangle across each edge of the triangles
+    std::vector<std::vector<int>> lookupNeighbors;          //!< -- neighbor entries of each entry in the triangulation
+    int lookupFace;                                         //!< -- last triangle found, where the next search starts
+    int lookupVertex;                                       //!< -- last nearest entry found, where the next search starts
+
 };
 
 
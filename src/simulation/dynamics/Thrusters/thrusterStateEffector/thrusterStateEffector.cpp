@@ -328,6 +328,7 @@ void ThrusterStateEffector::computeDerivatives(double integTime, Eigen::Vector3d
 
     // - Compute Derivatives
     Eigen::MatrixXd kappaDot(this->thrusterData.size(), 1);
+    Eigen::MatrixXd kappa = this->kappaState->getState();
 
     // Loop through all thrusters to initialize each state variable
     for (it = this->thrusterData.begin(), i = 0; it != this->thrusterData.end(); it++, i++)
@@ -337,17 +338,17 @@ void ThrusterStateEffector::computeDerivatives(double integTime, Eigen::Vector3d
 
         //! - For each thruster check if the end time is greater than the current time, and if so thrust
         if ((ops->ThrusterEndTime - integTime) >= 0.0 && ops->ThrustOnCmd > 0.0) {
-            kappaDot(i, 0) = (1.0 - this->kappaState->state(i, 0)) * it->cutoffFrequency;
+            kappaDot(i, 0) = (1.0 - kappa(i, 0)) * it->cutoffFrequency;
         }
         else {
-            kappaDot(i, 0) = -this->kappaState->state(i, 0) * it->cutoffFrequency;
+            kappaDot(i, 0) = -kappa(i, 0) * it->cutoffFrequency;
         }
 
         // Set the IspFactor to 1 to check that there is mass flow
         ops->IspFactor = 1.0;
 
         // Save the state to thruster ops
-        ops->ThrustFactor = this->kappaState->state(i, 0);
+        ops->ThrustFactor = kappa(i, 0);
     }
     this->kappaState->setDerivative(kappaDot);
    
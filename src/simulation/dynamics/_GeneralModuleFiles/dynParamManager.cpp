@@ -26,11 +26,66 @@ DynParamManager::DynParamManager()
     return;
 }
 
+DynParamManager::DynParamManager(const DynParamManager &inManager)
+{
+    *this = inManager;
+}
+
+/*! The copied states are packed in the storage of this manager */
+DynParamManager& DynParamManager::operator=(const DynParamManager &inManager)
+{
+    if (this != &inManager) {
+        dynProperties = inManager.dynProperties;
+        stateContainer = inManager.stateContainer;
+        bskLogger = inManager.bskLogger;
+        packStates();
+    }
+    return *this;
+}
+
 DynParamManager::~DynParamManager()
 {
     return;
 }
 
+/*! Lay out all states contiguously in stateMap order and point each state to its segment of the packed storage.
+ Each segment starts at an offset that keeps Eigen's vectorization alignment, such that Eigen operations on a
+ segment of the packed storage give the same results as on a separately allocated matrix. */
+void DynParamManager::packStates()
+{
+    const Eigen::Index alignment = EIGEN_MAX_ALIGN_BYTES > (int) sizeof(double) ?
+                                   EIGEN_MAX_ALIGN_BYTES / (int) sizeof(double) : 1;
+    std::map<std::string, StateData>::iterator it;
+    std::vector<std::pair<Eigen::Index, Eigen::Index>> segments;
+    Eigen::Index offset = 0;
+    for (it = stateContainer.stateMap.begin(); it != stateContainer.stateMap.end(); it++)
+    {
+        Eigen::Index size = it->second.state.size();
+        segments.push_back(std::make_pair(offset, size));
+        offset += ((size + alignment - 1) / alignment) * alignment;
+    }
+
+    Eigen::VectorXd newStates = Eigen::VectorXd::Zero(offset);
+    Eigen::VectorXd newStateDerivs = Eigen::VectorXd::Zero(offset);
+    size_t i = 0;
+    for (it = stateContainer.stateMap.begin(); it != stateContainer.stateMap.end(); it++, i++)
+    {
+        Eigen::Index size = segments[i].second;
+        newStates.segment(segments[i].first, size) = Eigen::Map<Eigen::VectorXd>(it->second.state.data(), size);
+        newStateDerivs.segment(segments[i].first, size) = Eigen::Map<Eigen::VectorXd>(it->second.stateDeriv.data(), size);
+    }
+    packedStates.swap(newStates);
+    packedStateDerivs.swap(newStateDerivs);
+    packedSegments = segments;
+
+    i = 0;
+    for (it = stateContainer.stateMap.begin(); it != stateContainer.stateMap.end(); it++, i++)
+    {
+        it->second.mapStorage(packedStates.data() + packedSegments[i].first,
+                              packedStateDerivs.data() + packedSegments[i].first);
+    }
+}
+
 StateData* DynParamManager::registerState(uint32_t nRow, uint32_t nCol,
     std::string stateName)
 {
@@ -52,6 +107,7 @@ StateData* DynParamManager::registerState(uint32_t nRow, uint32_t nCol,
         StateData newState(stateName, stateMatrix);
         stateContainer.stateMap.insert(std::pair<std::string, StateData>
                               (stateName, newState));
+        packStates();
         it = stateContainer.stateMap.find(stateName);
     }
     return (&(it->second));
@@ -38,7 +38,10 @@ public:
     StateVector operator*(double scaleFactor);          //!< class method
 };
 
-/*! dynamic parameter manager class */
+/*! dynamic parameter manager class.  The values and derivatives of all registered states are packed in two
+ contiguous vectors, such that the integrators can propagate all states at once.  Registering a state packs all
+ states again, such that the packed vectors and their segments move.  The StateData pointers returned by
+ registerState() and getStateObject() stay valid, but pointers into the packed vectors must be fetched again. */
 class DynParamManager {
 public:
     std::map<std::string, Eigen::MatrixXd> dynProperties; //!< class variable
@@ -46,6 +49,8 @@ public:
     BSKLogger bskLogger;                      //!< -- BSK Logging
 public:
     DynParamManager();
+    DynParamManager(const DynParamManager &inManager);  //!< class method
+    DynParamManager& operator= (const DynParamManager &inManager);  //!< class method
     ~DynParamManager();
     StateData* registerState(uint32_t nRow, uint32_t nCol, std::string stateName); //!< class method
     StateData* getStateObject(std::string stateName); //!< class method
@@ -57,7 +62,15 @@ public:
     Eigen::MatrixXd* getPropertyReference(std::string propName); //!< class method
     void setPropertyValue(const std::string propName,
                           const Eigen::MatrixXd & propValue); //!< class method
-    
+    Eigen::VectorXd& getPackedStates() {return packedStates;}  //!< class method
+    Eigen::VectorXd& getPackedStateDerivs() {return packedStateDerivs;}  //!< class method
+    const std::vector<std::pair<Eigen::Index, Eigen::Index>>& getPackedStateSegments() {return packedSegments;}  //!< class method
+
+private:
+    void packStates();                          //!< class method
+    Eigen::VectorXd packedStates;               //!< [-] contiguous storage of all state values
+    Eigen::VectorXd packedStateDerivs;          //!< [-] contiguous storage of all state derivatives
+    std::vector<std::pair<Eigen::Index, Eigen::Index>> packedSegments;  //!< [-] (offset, size) of each state in stateMap order
 };
 
 
@@ -28,6 +28,7 @@ Polyhedral::Polyhedral()
 {
     this->volPoly = 0.0;
     this->muBody = 0.0;
+    this->normalsFromShape = false;
     return;
 }
 
@@ -47,31 +48,54 @@ bool Polyhedral::initializeParameters()
     }
     
     int i, j, k;
-    Eigen::Vector3d v, xyz1, xyz2, xyz3, e21, e32;
-    
-    /* Initialize normal */
-    this->normalFacet.setZero(this->nFacet,3);
-    
-    /* Loop through each facet to compute volume */
+    Eigen::Vector3d v, xyz1, xyz2, xyz3, e21, e32, nf, r21;
+    Eigen::Vector3i idx;
+
+    /* Compute the facet normals and the volume unless they were provided together with the shape model */
+    if (!this->normalsFromShape || this->normalFacet.rows() != this->nFacet || this->normalFacet.cols() != 3)
+    {
+        /* Initialize normal and volume */
+        this->normalFacet.setZero(this->nFacet,3);
+        this->volPoly = 0.0;
+
+        /* Loop through each facet to compute volume */
+        for (unsigned int m = 0; m < this->nFacet; m++)
+        {
+            /* Fill auxiliary variables with vertex order on each facet */
+            v = orderFacet.row(m);
+            i = v[0] - 1;
+            j = v[1] - 1;
+            k = v[2] - 1;
+
+            xyz1 = xyzVertex.row(i);
+            xyz2 = xyzVertex.row(j);
+            xyz3 = xyzVertex.row(k);
+
+            /* Compute two edge vectors and normal to facet */
+            e21 = xyz2 - xyz1;
+            e32 = xyz3 - xyz2;
+            this->normalFacet.row(m) = e21.cross(e32) / e21.cross(e32).norm();
+
+            /* Add volume contribution */
+            this->volPoly += abs(xyz1.cross(xyz2).transpose()*xyz3)/6;
+        }
+    }
+
+    /* The edge geometry does not depend on the evaluation point, compute it once */
+    this->normalEdge.setZero(3*this->nFacet, 3);
+    this->lengthEdge.setZero(3*this->nFacet);
     for (unsigned int m = 0; m < this->nFacet; m++)
     {
-        /* Fill auxiliary variables with vertex order on each facet */
         v = orderFacet.row(m);
-        i = v[0] - 1;
-        j = v[1] - 1;
-        k = v[2] - 1;
-        
-        xyz1 = xyzVertex.row(i);
-        xyz2 = xyzVertex.row(j);
-        xyz3 = xyzVertex.row(k);
-        
-        /* Compute two edge vectors and normal to facet */
-        e21 = xyz2 - xyz1;
-        e32 = xyz3 - xyz2;
-        this->normalFacet.row(m) = e21.cross(e32) / e21.cross(e32).norm();
-        
-        /* Add volume contribution */
-        this->volPoly += abs(xyz1.cross(xyz2).transpose()*xyz3)/6;
+        idx << (int) v[0] - 1, (int) v[1] - 1, (int) v[2] - 1;
+        nf = this->normalFacet.row(m).transpose();
+        for (unsigned int n = 0; n <= 2; n++)
+        {
+            /* Edges run from vertex i to j, j to k and k to i */
+            r21 = (xyzVertex.row(idx[(n + 1) % 3]) - xyzVertex.row(idx[n])).transpose();
+            this->lengthEdge[3*m + n] = r21.norm();
+            this->normalEdge.row(3*m + n) = r21.cross(nf) / r21.cross(nf).norm();
+        }
     }
     
     paramsDone = true;
@@ -90,12 +114,12 @@ Eigen::Vector3d Polyhedral::computeField(const Eigen::Vector3d pos_Pfix)
     Eigen::Vector3d v;
     Eigen::Vector3d ri, rj, rk;
     Eigen::Vector3d nf;
-    Eigen::Vector3d r1, r2, re;
-    Eigen::Vector3d r21, n21;
-    Eigen::Matrix3d Ee;
+    Eigen::Vector3d re;
+    Eigen::Vector3d n21;
     
     int idx_min;
     double a, b, e, Le;
+    double ni, nj, nk;
     double wy, wx, wf;
     
     Eigen::Vector3d dUe, dUf, acc;
@@ -114,6 +138,9 @@ Eigen::Vector3d Polyhedral::computeField(const Eigen::Vector3d pos_Pfix)
         ri = xyzVertex.row(i).transpose() - pos_Pfix;
         rj = xyzVertex.row(j).transpose() - pos_Pfix;
         rk = xyzVertex.row(k).transpose() - pos_Pfix;
+        ni = ri.norm();
+        nj = rj.norm();
+        nk = rk.norm();
         
         /* Extract normal to facet */
         nf = this->normalFacet.row(m).transpose();
@@ -123,53 +150,37 @@ Eigen::Vector3d Polyhedral::computeField(const Eigen::Vector3d pos_Pfix)
             switch(n){
                 case 0:
                     idx_min = fmin(i,j);
-                    r1 = ri;
-                    r2 = rj;
-                    re = xyzVertex.row(idx_min).transpose() - pos_Pfix;
-                    
-                    a = ri.norm();
-                    b = rj.norm();
+                    a = ni;
+                    b = nj;
                     break;
                 case 1:
                     idx_min = fmin(j,k);
-                    r1 = rj;
-                    r2 = rk;
-                    re = xyzVertex.row(idx_min).transpose() - pos_Pfix;
-                    
-                    a = rj.norm();
-                    b = rk.norm();
+                    a = nj;
+                    b = nk;
                     break;
-                case 2:
+                default:
                     idx_min = fmin(i,k);
-                    r1 = rk;
-                    r2 = ri;
-                    re = xyzVertex.row(idx_min).transpose() - pos_Pfix;
-                    
-                    a = rk.norm();
-                    b = ri.norm();
+                    a = nk;
+                    b = ni;
                     break;
             }
-            
+            re = xyzVertex.row(idx_min).transpose() - pos_Pfix;
         
-            /* Compute along edge vector and norm */
-            r21 = r2 - r1;
-            e = r21.norm();
-            n21 = r21.cross(nf) / r21.cross(nf).norm();
+            /* Extract precomputed edge length and normal */
+            e = this->lengthEdge[3*m + n];
+            n21 = this->normalEdge.row(3*m + n).transpose();
         
             /* Dimensionless per edge factor */
             Le = log((a+b+e) / (a+b-e));
         
-            /* Compute dyad product */
-            Ee = nf*n21.transpose();
-        
-            /* Add current facet distribution */
-            dUe += Ee*re*Le;
+            /* Add current facet distribution, the edge dyad nf*n21^T applied to re */
+            dUe += nf*(n21.dot(re))*Le;
         }
         
         /* Compute solid angle for the current facet */
         wy = ri.transpose()*rj.cross(rk);
-        wx = ri.norm()*rj.norm()*rk.norm() + ri.norm()*rj.transpose()*rk
-            + rj.norm()*rk.transpose()*ri + rk.norm()*ri.transpose()*rj;
+        wx = ni*nj*nk + ni*rj.transpose()*rk
+            + nj*rk.transpose()*ri + nk*ri.transpose()*rj;
         wf = 2*atan2(wy, wx);
         
         /* Add current solid angle facet */
@@ -223,50 +234,70 @@ bool SphericalHarmonics::initializeParameters()
         return paramsDone;
     }
 
+    //! - Store the coefficients up to the maximum degree in flat arrays
+    size_t numTerms = (size_t) (this->maxDeg + 1)*(this->maxDeg + 2)/2;
+    this->cBarFlat.assign(numTerms, 0.0);
+    this->sBarFlat.assign(numTerms, 0.0);
+    for (unsigned int l = 0; l <= this->maxDeg; l++)
+    {
+        for (unsigned int m = 0; m <= l; m++)
+        {
+            size_t lm = (size_t) l*(l+1)/2 + m;
+            if (l < cBar.size() && m < cBar[l].size())
+            {
+                this->cBarFlat[lm] = cBar[l][m];
+            }
+            if (l < sBar.size() && m < sBar[l].size())
+            {
+                this->sBarFlat[lm] = sBar[l][m];
+            }
+        }
+    }
+
+    //! - Compute the Assoc. Legendre recursion factors up to degree maxDeg+1
+    numTerms = (size_t) (this->maxDeg + 2)*(this->maxDeg + 3)/2;
+    this->aBar.assign(numTerms, 0.0);
+    this->n1.assign(numTerms, 0.0);
+    this->n2.assign(numTerms, 0.0);
+    this->aBarLowFactor.assign(this->maxDeg + 2, 0.0);
     for(unsigned int i = 0; i <= this->maxDeg + 1; i++)
     {
-        std::vector<double> aRow, n1Row, n2Row;
-        aRow.resize(i+1, 0.0);
+        size_t i0 = (size_t) i*(i+1)/2;
         // Diagonal elements of A_bar
         if (i == 0)
         {
-             aRow[i] = 1.0;
+             this->aBar[i0 + i] = 1.0;
         }
         else
         {
-            aRow[i] = sqrt(double((2*i+1)*getK(i))/(2*i*getK(i-1))) * aBar[i-1][i-1];
+            this->aBar[i0 + i] = sqrt(double((2*i+1)*getK(i))/(2*i*getK(i-1))) * this->aBar[(i-1)*i/2 + i-1];
+            this->aBarLowFactor[i] = sqrt(double((2*i)*getK(i-1))/getK(i));
         }
-        n1Row.resize(i+1, 0.0);
-        n2Row.resize(i+1, 0.0);
         for (unsigned int m = 0; m <= i; m++)
         {
             if (i >= m + 2)
             {
-                n1Row[m] = sqrt(double((2*i+1)*(2*i-1))/((i-m)*(i+m)));
-                n2Row[m] = sqrt(double((i+m-1)*(2*i+1)*(i-m-1))/((i+m)*(i-m)*(2*i-3)));
+                this->n1[i0 + m] = sqrt(double((2*i+1)*(2*i-1))/((i-m)*(i+m)));
+                this->n2[i0 + m] = sqrt(double((i+m-1)*(2*i+1)*(i-m-1))/((i+m)*(i-m)*(2*i-3)));
 
             }
         }
-        n1.push_back(n1Row);
-        n2.push_back(n2Row);
-        aBar.push_back(aRow);
     }
 
+    numTerms = (size_t) (this->maxDeg + 1)*(this->maxDeg + 2)/2;
+    this->nQuot1.assign(numTerms, 0.0);
+    this->nQuot2.assign(numTerms, 0.0);
     for (unsigned int l = 0; l <= this->maxDeg; l++) // up to _maxDegree-1
     {
-        std::vector<double> nq1Row, nq2Row;
-        nq1Row.resize(l+1, 0.0);
-        nq2Row.resize(l+1, 0.0);
+        size_t l0 = (size_t) l*(l+1)/2;
         for (unsigned int m = 0; m <= l; m++)
         {
             if (m < l)
             {
-                nq1Row[m] = sqrt(double((l-m)*getK(m)*(l+m+1))/getK(m+1));
+                this->nQuot1[l0 + m] = sqrt(double((l-m)*getK(m)*(l+m+1))/getK(m+1));
             }
-            nq2Row[m] = sqrt(double((l+m+2)*(l+m+1)*(2*l+1)*getK(m))/((2*l+3)*getK(m+1)));
+            this->nQuot2[l0 + m] = sqrt(double((l+m+2)*(l+m+1)*(2*l+1)*getK(m))/((2*l+3)*getK(m+1)));
         }
-        nQuot1.push_back(nq1Row);
-        nQuot2.push_back(nq2Row);
     }
     paramsDone = true;
 
@@ -283,6 +314,58 @@ bool SphericalHarmonics::initializeParameters()
  */
 Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix, unsigned int degree,
     bool include_zero_degree)
+{
+    static thread_local FieldScratch scratch;
+    Eigen::Vector3d acc;
+    this->computeFieldPoint(pos_Pfix.data(), acc.data(), degree, include_zero_degree, scratch);
+    return acc;
+}
+
+/*!
+ @brief Compute the field at a batch of positions, given in a body frame.  The recursion factors and the scratch
+ memory are shared by all positions.
+ @param pos_Pfix N x 3 matrix of the positions in which the field is to be computed.
+ @param degree used to compute the field.
+ @param include_zero_degree Boolean that determines whether the zero-degree term is included.
+ @return N x 3 matrix of the computed field.
+ */
+Eigen::MatrixXd SphericalHarmonics::computeFieldBatch(const Eigen::MatrixXd & pos_Pfix, unsigned int degree,
+    bool include_zero_degree)
+{
+    Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor> pos = pos_Pfix;
+    Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor> acc(pos.rows(), 3);
+    this->computeFieldBatch(pos.data(), acc.data(), (uint64_t) pos.rows(), degree, include_zero_degree);
+    return acc;
+}
+
+/*!
+ @brief Compute the field at a batch of positions, given in a body frame.
+ @param pos_Pfix array of numPositions x 3 positions in which the field is to be computed, stored row by row.
+ @param acc_Pfix array of numPositions x 3 computed field values, stored row by row.
+ @param numPositions number of positions
+ @param degree used to compute the field.
+ @param include_zero_degree Boolean that determines whether the zero-degree term is included.
+ */
+void SphericalHarmonics::computeFieldBatch(const double *pos_Pfix, double *acc_Pfix, uint64_t numPositions,
+    unsigned int degree, bool include_zero_degree)
+{
+    FieldScratch scratch;
+    for (uint64_t i = 0; i < numPositions; i++)
+    {
+        this->computeFieldPoint(pos_Pfix + 3*i, acc_Pfix + 3*i, degree, include_zero_degree, scratch);
+    }
+}
+
+/*!
+ @brief Compute the field in a single position, given in a body frame.
+ @param pos_Pfix Position in which the field is to be computed.
+ @param acc_Pfix Computed field.
+ @param degree used to compute the field.
+ @param include_zero_degree Boolean that determines whether the zero-degree term is included.
+ @param scratch memory used for the recursion
+ */
+void SphericalHarmonics::computeFieldPoint(const double *pos_Pfix, double *acc_Pfix, unsigned int degree,
+    bool include_zero_degree, FieldScratch &scratch)
 {
     double x = pos_Pfix[0];
     double y = pos_Pfix[1];
@@ -291,9 +374,6 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
     double order;
     double rho;
     double a1, a2, a3, a4, sum_a1, sum_a2, sum_a3, sum_a4;
-    std::vector<double> rE, iM, rhol;
-    Eigen::Vector3d acc;
-    acc.fill(0.0);
 
     // Change of variables: direction cosines
     r = sqrt(x*x + y*y + z*z);
@@ -307,11 +387,23 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
 
     order = degree;
 
+    std::vector<double> &aBar = scratch.aBar;
+    std::vector<double> &rE = scratch.rE;
+    std::vector<double> &iM = scratch.iM;
+    std::vector<double> &rhol = scratch.rhol;
+    aBar.resize((size_t) (degree + 2)*(degree + 3)/2);
+    rE.resize(degree + 2);
+    iM.resize(degree + 2);
+    rhol.resize(degree + 2);
+
+    // Diagonal terms are computed in initialize()
+    aBar[0] = this->aBar[0];
     for (unsigned int l = 1; l <= degree+1; l++)
     {
-        //Diagonal terms are computed in initialize()
+        size_t l0 = (size_t) l*(l+1)/2;
+        aBar[l0 + l] = this->aBar[l0 + l];
         // Low diagonal terms
-        aBar[l][l-1] = sqrt(double((2*l)*getK(l-1))/getK(l)) * aBar[l][l] * u;
+        aBar[l0 + l-1] = this->aBarLowFactor[l] * aBar[l0 + l] * u;
     }
 
     // Lower terms of A_bar
@@ -319,27 +411,27 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
     {
         for(unsigned int l = m + 2; l <= degree+1; l++)
         {
-            aBar[l][m] = u * n1[l][m] * aBar[l-1][m] - n2[l][m] * aBar[l-2][m];
+            size_t lm = (size_t) l*(l+1)/2 + m;
+            aBar[lm] = u * this->n1[lm] * aBar[(size_t) (l-1)*l/2 + m] - this->n2[lm] * aBar[(size_t) (l-2)*(l-1)/2 + m];
 
         }
 
         // Computation of real and imaginary parts of (2+j*t)^m
         if (m == 0)
         {
-            rE.push_back(1.0);
-            iM.push_back(0.0);
+            rE[m] = 1.0;
+            iM[m] = 0.0;
         }
         else
         {
-            rE.push_back(s * rE[m-1] - t * iM[m-1]);
-            iM.push_back(s * iM[m-1] + t * rE[m-1]);
+            rE[m] = s * rE[m-1] - t * iM[m-1];
+            iM[m] = s * iM[m-1] + t * rE[m-1];
         }
 
 
     }
 
     rho = radEquator/r;
-    rhol.resize(degree+2, 0.0);
     rhol[0] = muBody/r;
     rhol[1] = rhol[0]*rho;
 
@@ -360,6 +452,10 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
 
     for (unsigned int l = 1; l <= degree; l++) // does not include l = maxDegree
     {
+        size_t l0 = (size_t) l*(l+1)/2;
+        size_t l1 = (size_t) (l+1)*(l+2)/2;
+        const double *cBarRow = &this->cBarFlat[l0];
+        const double *sBarRow = &this->sBarFlat[l0];
         rhol[l+1] =  rho * rhol[l]; // rho_l computed
 
         sum_a1 = 0.0;
@@ -370,7 +466,7 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
         for(unsigned int m = 0; m <= l; m++)
         {
             double D, E, F;
-            D = cBar[l][m] * rE[m] + sBar[l][m] * iM[m];
+            D = cBarRow[m] * rE[m] + sBarRow[m] * iM[m];
             if (m == 0)
             {
                 E = 0.0;
@@ -378,37 +474,29 @@ Eigen::Vector3d SphericalHarmonics::computeField(const Eigen::Vector3d pos_Pfix,
             }
             else
             {
-                E = cBar[l][m] * rE[m-1] + sBar[l][m] * iM[m-1];
-                F = sBar[l][m] * rE[m-1] - cBar[l][m] * iM[m-1];
+                E = cBarRow[m] * rE[m-1] + sBarRow[m] * iM[m-1];
+                F = sBarRow[m] * rE[m-1] - cBarRow[m] * iM[m-1];
             }
 
-            //            if (l < degree)   // Gravity contains up to max_degree-1 harmonics
-            //            {
-            sum_a1 = sum_a1 + m * aBar[l][m] * E;
-            sum_a2 = sum_a2 + m * aBar[l][m] * F;
+            sum_a1 = sum_a1 + m * aBar[l0 + m] * E;
+            sum_a2 = sum_a2 + m * aBar[l0 + m] * F;
             if (m < l)
             {
-                sum_a3 = sum_a3 + nQuot1[l][m] * aBar[l][m+1] * D;
+                sum_a3 = sum_a3 + this->nQuot1[l0 + m] * aBar[l0 + m+1] * D;
             }
-            sum_a4 = sum_a4 + nQuot2[l][m] * aBar[l+1][m+1] * D;
-            //            }
+            sum_a4 = sum_a4 + this->nQuot2[l0 + m] * aBar[l1 + m+1] * D;
 
         }
 
-        //        if (l < degree)   // Gravity contains up to max_degree-1 harmonics
-        //        {
         a1 = a1 + rhol[l+1]/radEquator * sum_a1;
         a2 = a2 + rhol[l+1]/radEquator * sum_a2;
         a3 = a3 + rhol[l+1]/radEquator * sum_a3;
         a4 = a4 - rhol[l+1]/radEquator * sum_a4;
-        //        }
     }
 
-    acc[0] = a1 + s * a4;
-    acc[1] = a2 + t * a4;
-    acc[2] = a3 + u * a4;
-
-    return acc;
+    acc_Pfix[0] = a1 + s * a4;
+    acc_Pfix[1] = a2 + t * a4;
+    acc_Pfix[2] = a3 + u * a4;
 }
 
 bool SphericalHarmonics::harmReady()
@@ -42,7 +42,8 @@ public:
     Eigen::MatrixXd xyzVertex;    //!< [m] Position of vertex
     Eigen::MatrixXd orderFacet;   //!< [-] Vertexes of a facet
 
-    Eigen::MatrixXd normalFacet;  //!< [-] Normal of a facet
+    Eigen::MatrixXd normalFacet;  //!< [-] Normal of a facet, computed at initialization if not provided
+    bool normalsFromShape;        //!< [-] Flag indicating that normalFacet and volPoly were provided with the shape model
 
     BSKLogger bskLogger;          //!< -- BSK Logging
 
@@ -53,9 +54,14 @@ public:
     bool initializeParameters();            //!< [-] configure polyhedral based on inputs
     Eigen::Vector3d computeField(const Eigen::Vector3d pos_Pfix);
     bool polyReady();                       //!< class variable
+
+private:
+    Eigen::MatrixXd normalEdge;   //!< [-] In-plane normal of the three edges of each facet, rows 3*m to 3*m+2
+    Eigen::VectorXd lengthEdge;   //!< [m] Length of the three edges of each facet
 };
 
-/*! @brief spherical harmonics class */
+/*! @brief spherical harmonics class.  The coefficients and the Legendre recursion factors are stored in flat
+ arrays, where the term of degree l and order m is found at index l*(l+1)/2 + m. */
 class SphericalHarmonics
 {
 public:
@@ -65,11 +71,11 @@ public:
     
     std::vector<std::vector<double>> cBar;  //!< [-] C coefficient set
     std::vector<std::vector<double>> sBar;  //!< [-] S coefficient set
-    std::vector<std::vector<double>> aBar;  //!< [-] Normalized 'derived' Assoc. Legendre
-    std::vector<std::vector<double>> n1;    //!< [-] What am I
-    std::vector<std::vector<double>> n2;    //!< [-] What am I
-    std::vector<std::vector<double>> nQuot1;//!< [-] What am I
-    std::vector<std::vector<double>> nQuot2;//!< [-] What am I
+    std::vector<double> aBar;               //!< [-] Diagonal terms of the normalized 'derived' Assoc. Legendre
+    std::vector<double> n1;                 //!< [-] Recursion factor of the Assoc. Legendre of degree l-1
+    std::vector<double> n2;                 //!< [-] Recursion factor of the Assoc. Legendre of degree l-2
+    std::vector<double> nQuot1;             //!< [-] Gravity factor of the Assoc. Legendre of order m+1
+    std::vector<double> nQuot2;             //!< [-] Gravity factor of the Assoc. Legendre of degree l+1, order m+1
 
     BSKLogger bskLogger;                      //!< -- BSK Logging
 
@@ -81,8 +87,26 @@ public:
     double getK(const unsigned int degree); //!< class method
     Eigen::Vector3d computeField(const Eigen::Vector3d pos_Pfix, unsigned int degree,
                                                      bool include_zero_degree);
+    Eigen::MatrixXd computeFieldBatch(const Eigen::MatrixXd & pos_Pfix, unsigned int degree,
+                                      bool include_zero_degree);  //!< class method
+    void computeFieldBatch(const double *pos_Pfix, double *acc_Pfix, uint64_t numPositions, unsigned int degree,
+                           bool include_zero_degree);  //!< class method
     bool harmReady();                       //!< class variable
-    
+
+private:
+    /*! scratch memory of one field evaluation */
+    struct FieldScratch {
+        std::vector<double> aBar;           //!< [-] Normalized 'derived' Assoc. Legendre
+        std::vector<double> rE;             //!< [-] Real part of (s+j*t)^m
+        std::vector<double> iM;             //!< [-] Imaginary part of (s+j*t)^m
+        std::vector<double> rhol;           //!< [-] (radEquator/r)^l * mu/r
+    };
+    void computeFieldPoint(const double *pos_Pfix, double *acc_Pfix, unsigned int degree,
+                           bool include_zero_degree, FieldScratch &scratch);  //!< class method
+
+    std::vector<double> cBarFlat;           //!< [-] C coefficient set up to maxDeg
+    std::vector<double> sBarFlat;           //!< [-] S coefficient set up to maxDeg
+    std::vector<double> aBarLowFactor;      //!< [-] Factor of the first sub-diagonal Assoc. Legendre of each degree
 };
 
 //!@brief Container for gravitational body data
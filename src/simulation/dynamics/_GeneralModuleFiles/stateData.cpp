@@ -19,18 +19,30 @@
 
 
 #include "stateData.h"
+#include <new>
 
-StateData::StateData()
+StateData::StateData() : state(nullptr, 0, 0), stateDeriv(nullptr, 0, 0)
 {
     return;
 }
 
-StateData::StateData(const StateData &inState)
+StateData::StateData(const StateData &inState) : state(nullptr, 0, 0), stateDeriv(nullptr, 0, 0)
 {
-    state = inState.state;
-    stateDeriv = inState.stateDeriv;
-    stateName = inState.stateName;
-    stateEnabled = inState.stateEnabled;
+    *this = inState;
+}
+
+/*! Copies of a state own their memory, they never view the storage of the copied state */
+StateData& StateData::operator=(const StateData &inState)
+{
+    if (this != &inState) {
+        stateStorage = inState.state;
+        stateDerivStorage = inState.stateDeriv;
+        externalStorage = false;
+        mapOwnStorage();
+        stateName = inState.stateName;
+        stateEnabled = inState.stateEnabled;
+    }
+    return *this;
 }
 
 StateData::~StateData()
@@ -38,21 +50,54 @@ StateData::~StateData()
     return;
 }
 
-StateData::StateData(std::string inName, const Eigen::MatrixXd & newState)
+StateData::StateData(std::string inName, const Eigen::MatrixXd & newState) : state(nullptr, 0, 0), stateDeriv(nullptr, 0, 0)
 {
     stateName = inName;
-    setState(newState);
-    if(state.innerSize() != stateDeriv.innerSize() ||
-       state.outerSize() != stateDeriv.outerSize())
-    {
-        stateDeriv = state;
-    }
-    stateDeriv.setZero();
+    stateStorage = newState;
+    stateDerivStorage = Eigen::MatrixXd::Zero(newState.rows(), newState.cols());
+    mapOwnStorage();
+}
+
+/*! Point the state and its derivative to the memory owned by the state */
+void StateData::mapOwnStorage()
+{
+    new (&state) Eigen::Map<Eigen::MatrixXd>(stateStorage.data(), stateStorage.rows(), stateStorage.cols());
+    new (&stateDeriv) Eigen::Map<Eigen::MatrixXd>(stateDerivStorage.data(), stateDerivStorage.rows(),
+                                                  stateDerivStorage.cols());
 }
 
+/*! Point the state and its derivative to external memory, such as the contiguous state storage of a
+ DynParamManager.  The current values are not copied, and the state size can't change afterwards.
+ @param statePtr memory of rows x columns state values
+ @param stateDerivPtr memory of rows x columns state derivative values
+ */
+void StateData::mapStorage(double *statePtr, double *stateDerivPtr)
+{
+    Eigen::Index nRow = state.rows();
+    Eigen::Index nCol = state.cols();
+    new (&state) Eigen::Map<Eigen::MatrixXd>(statePtr, nRow, nCol);
+    new (&stateDeriv) Eigen::Map<Eigen::MatrixXd>(stateDerivPtr, nRow, nCol);
+    stateStorage.resize(0, 0);
+    stateDerivStorage.resize(0, 0);
+    externalStorage = true;
+}
+
+/*! Sets the state value.  A state that is packed in the storage of a DynParamManager keeps its size, and a value
+ of another size is rejected with an error and leaves the state unchanged.
+ @param newState new state value
+ */
 void StateData::setState(const Eigen::MatrixXd & newState)
 {
-    state = newState;
+    if (externalStorage) {
+        if (newState.rows() != state.rows() || newState.cols() != state.cols()) {
+            bskLogger.bskLog(BSK_ERROR, "The state %s can't change size after it is registered.", stateName.c_str());
+            return;
+        }
+        state = newState;
+        return;
+    }
+    stateStorage = newState;
+    new (&state) Eigen::Map<Eigen::MatrixXd>(stateStorage.data(), stateStorage.rows(), stateStorage.cols());
     return;
 }
 
@@ -62,9 +107,23 @@ void StateData::propagateState(double dt)
 }
 
 
+/*! Sets the state derivative.  As for setState(), a packed state rejects a derivative of another size.
+ @param newDeriv new state derivative
+ */
 void StateData::setDerivative(const Eigen::MatrixXd & newDeriv)
 {
-    stateDeriv = newDeriv;
+    if (externalStorage) {
+        if (newDeriv.rows() != stateDeriv.rows() || newDeriv.cols() != stateDeriv.cols()) {
+            bskLogger.bskLog(BSK_ERROR, "The derivative of state %s can't change size after it is registered.",
+                             stateName.c_str());
+            return;
+        }
+        stateDeriv = newDeriv;
+        return;
+    }
+    stateDerivStorage = newDeriv;
+    new (&stateDeriv) Eigen::Map<Eigen::MatrixXd>(stateDerivStorage.data(), stateDerivStorage.rows(),
+                                                  stateDerivStorage.cols());
 }
 
 void StateData::scaleState(double scaleFactor)
@@ -23,11 +23,13 @@
 #include <stdint.h>
 #include "architecture/utilities/bskLogging.h"
 
-/*! @brief state data class*/
+/*! @brief state data class.  The state and its derivative are views of memory that is either owned by the state
+ itself, or that is part of the contiguous state storage of a DynParamManager.  The views are private and are read
+ with getState() and getStateDeriv(), because the memory moves whenever the DynParamManager packs its states.  Once a
+ state is packed, setState() and setDerivative() keep its size and reject values of another size.*/
 class StateData {
+    friend class DynParamManager;
 public:
-    Eigen::MatrixXd state;                        //!< [-] State value storage
-    Eigen::MatrixXd stateDeriv;                   //!< [-] State derivative value storage
     std::string stateName;                        //!< [-] Name of the state
     bool stateEnabled;                            //!< [-] Flag indicating state is enabled
     BSKLogger bskLogger;                          //!< -- BSK Logging
@@ -36,6 +38,7 @@ public:
     StateData();
     StateData(std::string inName, const Eigen::MatrixXd & newState);  //!< class method
     StateData(const StateData &inState);                //!< class method
+    StateData& operator= (const StateData &inState);    //!< class method
     ~StateData();
     void setState(const Eigen::MatrixXd & newState);    //!< class method
     void propagateState(double dt);                     //!< class method
@@ -49,10 +52,18 @@ public:
     void disable() {stateEnabled = false;}              //!< class method
     void enable() {stateEnabled = true;}                //!< class method
     void scaleState(double scaleFactor);                //!< class method
+    void mapStorage(double *statePtr, double *stateDerivPtr);  //!< class method
 
     StateData operator+ (const StateData & operand);    //!< class method
     StateData operator* (double scaleFactor);           //!< class method
 
+private:
+    void mapOwnStorage();                         //!< class method
+    Eigen::Map<Eigen::MatrixXd> state;            //!< [-] State value storage
+    Eigen::Map<Eigen::MatrixXd> stateDeriv;       //!< [-] State derivative value storage
+    Eigen::MatrixXd stateStorage;                 //!< [-] State storage if the state is not packed in external memory
+    Eigen::MatrixXd stateDerivStorage;            //!< [-] State derivative storage if the state is not packed in external memory
+    bool externalStorage = false;                 //!< [-] Flag indicating the state views external memory
 };
 
 
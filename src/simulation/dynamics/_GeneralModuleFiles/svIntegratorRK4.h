@@ -31,7 +31,10 @@ public:
     svIntegratorRK4(DynamicObject* dyn);            //!< class method
     virtual ~svIntegratorRK4();
     virtual void integrate(double currentTime, double timeStep); //!< class method
-    
+
+private:
+    Eigen::VectorXd stateOut;       //!< output state vector, allocated once
+    Eigen::VectorXd stateInit;      //!< initial state vector, allocated once
 };
 
 
@@ -152,6 +152,74 @@ def test_gravityEffectorAllTest(show_plots):
     [testResults, testMessage] = multiBodyGravity(show_plots)
     assert testResults < 1, testMessage
 
+def test_sphericalHarmonicsBatch():
+    """Check that the batched field evaluation matches the single point evaluation"""
+    spherHarm = gravityEffector.SphericalHarmonics()
+    gravityEffector.loadGravFromFile(path + '/GGM03S.txt', spherHarm, 20)
+    spherHarm.initializeParameters()
+
+    np.random.seed(42)
+    positions = np.random.uniform(-1.0, 1.0, (50, 3))
+    positions *= (6378.1363E3 + np.random.uniform(0., 1000.E3, (50, 1))) / np.linalg.norm(positions, axis=1)[:, None]
+
+    for degree, includeZero in [(20, True), (8, False), (0, True)]:
+        accBatch = spherHarm.computeFieldArray(positions, degree, includeZero)
+        assert accBatch.shape == (50, 3)
+        for pos, acc in zip(positions, accBatch):
+            accPoint = np.array(spherHarm.computeField([[pos[0]], [pos[1]], [pos[2]]], degree, includeZero))
+            np.testing.assert_array_equal(acc, accPoint.flatten())
+
+def test_gravDataCache(tmp_path, monkeypatch):
+    """Check that gravity and shape model files loaded through the binary cache match the parsed files"""
+    monkeypatch.setattr(gravityEffector, 'cacheDirectory', str(tmp_path))
+    monkeypatch.setattr(gravityEffector, '_loadedData', {})
+
+    gravParsed = gravityEffector.loadGravFromFileToList(path + '/GGM03S.txt', useCache=False)
+    gravWritten = gravityEffector.loadGravFromFileToList(path + '/GGM03S.txt')
+    gravityEffector._loadedData.clear()
+    gravRead = gravityEffector.loadGravFromFileToList(path + '/GGM03S.txt')
+    assert gravParsed == gravWritten == gravRead
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    polyFile = path + '/EROS856Vert1708Fac.txt'
+    polyParsed = gravityEffector.Polyhedral()
+    gravityEffector.loadPolyFromFile(polyFile, polyParsed, useCache=False)
+    polyParsed.initializeParameters()
+    polyCached = gravityEffector.Polyhedral()
+    gravityEffector.loadPolyFromFile(polyFile, polyCached)
+    gravityEffector._loadedData.clear()
+    gravityEffector.loadPolyFromFile(polyFile, polyCached)
+    assert polyCached.nFacet == polyParsed.nFacet == 1708
+    np.testing.assert_array_equal(polyCached.xyzVertex, polyParsed.xyzVertex)
+    np.testing.assert_array_equal(polyCached.orderFacet, polyParsed.orderFacet)
+    np.testing.assert_allclose(polyCached.normalFacet, polyParsed.normalFacet, rtol=0, atol=1e-15)
+
+    # the shape model computes its normals and volume itself if they were not provided
+    polyComputed = gravityEffector.Polyhedral()
+    polyComputed.nVertex = polyParsed.nVertex
+    polyComputed.nFacet = polyParsed.nFacet
+    polyComputed.xyzVertex = polyParsed.xyzVertex
+    polyComputed.orderFacet = polyParsed.orderFacet
+    polyComputed.initializeParameters()
+    polyComputed.initializeParameters()
+    assert polyComputed.volPoly == polyParsed.volPoly
+    np.testing.assert_allclose(polyComputed.normalFacet, polyParsed.normalFacet, rtol=0, atol=1e-15)
+
+    # normals and a volume that were set by hand are recomputed, even if they have the size of the shape model
+    polyComputed.normalFacet = np.zeros((polyParsed.nFacet, 3)).tolist()
+    polyComputed.volPoly = 1.0
+    polyComputed.initializeParameters()
+    assert not polyComputed.normalsFromShape and polyCached.normalsFromShape
+    assert polyComputed.volPoly == polyParsed.volPoly
+    np.testing.assert_allclose(polyComputed.normalFacet, polyParsed.normalFacet, rtol=0, atol=1e-15)
+
+    # only the most recently used cached files stay loaded
+    monkeypatch.setattr(gravityEffector, 'maxLoadedData', 1)
+    gravityEffector.loadGravFromFileToList(path + '/GGM03S.txt')
+    gravityEffector.loadPolyFromFileToList(polyFile)
+    assert len(gravityEffector._loadedData) == 1
+    assert next(iter(gravityEffector._loadedData)).startswith('poly')
+
 def independentSphericalHarmonics(show_plots):
     testCase = "independentCheck"
     # The __tracebackhide__ setting influences pytest showing of tracebacks:
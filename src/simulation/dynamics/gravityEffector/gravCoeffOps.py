@@ -16,53 +16,94 @@
 #  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 import csv
+import os
+import hashlib
+import tempfile
+import shutil
+import numpy as np
 from Basilisk.architecture import sim_model
 
-def loadGravFromFile(fileName, spherHarm, maxDeg=2):
-
-    with open(fileName, 'r') as csvfile:
-        gravReader = csv.reader(csvfile, delimiter=',')
-        firstRow = next(gravReader)
-        clmList = []
-        slmList = []
+#: Version of the binary data cache layout, part of the cache key such that old entries are not reused.
+CACHE_VERSION = 1
+#: Directory of the binary data cache.  The cache is only used if this is set, either directly or with the
+#: ``BSK_DATA_CACHE`` environment variable, such that nothing is written outside of the Basilisk folders by default.
+cacheDirectory = os.environ.get('BSK_DATA_CACHE')
+#: Number of cached data files that are kept loaded in this process.
+maxLoadedData = 16
+
+# cached data files loaded by this process, shared copy-on-write with forked Monte Carlo workers.  The entries are
+# kept in the order of their last use, and the least recently used entry is dropped beyond maxLoadedData entries.
+_loadedData = {}
+
+
+def _cacheKey(fileName, kind):
+    hasher = hashlib.sha1()
+    hasher.update('{0}-{1}'.format(kind, CACHE_VERSION).encode())
+    with open(fileName, 'rb') as dataFile:
+        for block in iter(lambda: dataFile.read(1 << 20), b''):
+            hasher.update(block)
+    return kind + '-' + hasher.hexdigest()
+
+
+def _loadCached(fileName, kind, parser, useCache):
+    """
+    Return the arrays of a data file parsed by ``parser``.  If ``cacheDirectory`` is set, the arrays are read from
+    the binary cache, keyed by the hash of the file content, if available.  Otherwise the file is parsed and the
+    arrays are written to the cache.  Cached arrays are memory mapped read-only, such that the pages are shared
+    between processes.
+
+    :return: dictionary of numpy arrays
+    """
+    if not useCache or cacheDirectory is None:
+        return parser(fileName)
+
+    key = _cacheKey(fileName, kind)
+    if key in _loadedData:
+        _loadedData[key] = _loadedData.pop(key)
+        return _loadedData[key]
+
+    entryPath = os.path.join(cacheDirectory, key)
+    if not os.path.isdir(entryPath):
+        data = parser(fileName)
         try:
-            valCurr = int(firstRow[0])
-        except ValueError:
-            spherHarm.muBody = float(firstRow[1])
-            spherHarm.radEquator = float(firstRow[0])
-
-        clmRow = []
-        slmRow = []
-        currDeg = 0
-        for gravRow in gravReader:
-           while int(gravRow[0]) > currDeg:
-               if( len(clmRow) < currDeg+1):
-                   clmRow.extend([0.0]*(currDeg+1 - len(clmRow)))
-                   slmRow.extend([0.0]*(currDeg+1 - len(slmRow)))
-               clmList.append(clmRow)
-               slmList.append(slmRow)
-               clmRow = []
-               slmRow = []
-               currDeg += 1
-           clmRow.append(float(gravRow[2]))
-           slmRow.append(float(gravRow[3]))
-
-        spherHarm.cBar = sim_model.MultiArray(clmList)
-        spherHarm.sBar = sim_model.MultiArray(slmList)
-        spherHarm.maxDeg = maxDeg
-
-
-def loadGravFromFileToList(fileName, maxDeg=2):
+            os.makedirs(cacheDirectory, exist_ok=True)
+            # write to a temporary directory first such that concurrent loaders never read a partial entry
+            tmpPath = tempfile.mkdtemp(dir=cacheDirectory, prefix='.' + key)
+            for name, value in data.items():
+                np.save(os.path.join(tmpPath, name + '.npy'), value)
+            try:
+                os.rename(tmpPath, entryPath)
+            except OSError:
+                shutil.rmtree(tmpPath, ignore_errors=True)  # another process created the entry first
+        except OSError:
+            _rememberData(key, data)  # cache directory is not writable
+            return data
+
+    data = {}
+    for entry in os.listdir(entryPath):
+        if entry.endswith('.npy'):
+            data[entry[:-4]] = np.load(os.path.join(entryPath, entry), mmap_mode='r')
+    _rememberData(key, data)
+    return data
+
+
+def _rememberData(key, data):
+    _loadedData[key] = data
+    while len(_loadedData) > max(maxLoadedData, 0):
+        del _loadedData[next(iter(_loadedData))]
+
+
+def _parseGravFile(fileName):
     with open(fileName, 'r') as csvfile:
         gravReader = csv.reader(csvfile, delimiter=',')
         firstRow = next(gravReader)
         clmList = []
         slmList = []
+        header = np.array([np.nan, np.nan])
         try:
             valCurr = int(firstRow[0])
         except ValueError:
-            mu = float(firstRow[1])
-            radEquator = float(firstRow[0])
+            header = np.array([float(firstRow[1]), float(firstRow[0])])
 
         clmRow = []
         slmRow = []
@@ -80,119 +121,111 @@ def loadGravFromFileToList(fileName, maxDeg=2):
             clmRow.append(float(gravRow[2]))
             slmRow.append(float(gravRow[3]))
 
-        return [clmList, slmList, mu, radEquator]
-        
-        
-def loadPolyFromFile(fileName, poly):
-    with open(fileName) as polyFile:
-        if fileName.endswith('.tab'):
-            nVertex, nFacet = [int(x) for x in next(polyFile).split()] # read first line
-            vertList = []
-            faceList = []
-
-            contLines = 0
-            for line in polyFile:
-                arrtemp = []
+    rowLength = np.array([len(row) for row in clmList], dtype=np.int64)
+    flatten = lambda rows: np.array([value for row in rows for value in row], dtype=np.float64)
+    return {'header': header, 'rowLength': rowLength, 'clm': flatten(clmList), 'slm': flatten(slmList)}
 
-                for x in line.split():
-                    arrtemp.append(float(x))
 
-                if contLines < nVertex:
-                    vertList.append([float(arrtemp[1]*1e3),float(arrtemp[2]*1e3),float(arrtemp[3]*1e3)])
-                else:
-                    faceList.append([int(arrtemp[1]),int(arrtemp[2]),int(arrtemp[3])])
+def _gravData(fileName, useCache):
+    data = _loadCached(fileName, 'grav', _parseGravFile, useCache)
+    rowStart = np.concatenate(([0], np.cumsum(data['rowLength'])))
+    clm = np.asarray(data['clm'])
+    slm = np.asarray(data['slm'])
+    clmList = [clm[rowStart[i]:rowStart[i+1]].tolist() for i in range(len(rowStart) - 1)]
+    slmList = [slm[rowStart[i]:rowStart[i+1]].tolist() for i in range(len(rowStart) - 1)]
+    mu, radEquator = [None if np.isnan(value) else float(value) for value in data['header']]
+    return clmList, slmList, mu, radEquator
 
-                contLines += 1
-        elif fileName.endswith('.obj'):
-            nVertex = 0
-            nFacet = 0
-            vertList = []
-            faceList = []
-            for line in polyFile:
-                arrtemp = line.split()
-                if arrtemp:
-                    if arrtemp[0] == 'v':
-                        nVertex += 1
-                        vertList.append([float(arrtemp[1])*1e3, float(arrtemp[2])*1e3, float(arrtemp[3])*1e3])
-                    elif arrtemp[0] == 'f':
-                        nFacet += 1
-                        faceList.append([int(arrtemp[1]), int(arrtemp[2]), int(arrtemp[3])])
-        elif fileName.endswith('.txt'):
-            nVertex, nFacet = [int(x) for x in next(polyFile).split()] # read first line
-            vertList = []
-            faceList = []
 
-            contLines = 0
-            for line in polyFile:
-                arrtemp = []
+def loadGravFromFile(fileName, spherHarm, maxDeg=2, useCache=True):
+    """
+    Load the spherical harmonics coefficients of a gravity field file into ``spherHarm``.
+    The parsed coefficients are kept in the binary data cache if ``useCache`` is set and ``cacheDirectory`` is set.
+    """
+    clmList, slmList, mu, radEquator = _gravData(fileName, useCache)
+    if mu is not None:
+        spherHarm.muBody = mu
+        spherHarm.radEquator = radEquator
 
-                for x in line.split():
-                    arrtemp.append(float(x))
+    spherHarm.cBar = sim_model.MultiArray(clmList)
+    spherHarm.sBar = sim_model.MultiArray(slmList)
+    spherHarm.maxDeg = maxDeg
 
-                if contLines < nVertex:
-                    vertList.append([float(arrtemp[0]*1e3),float(arrtemp[1]*1e3),float(arrtemp[2]*1e3)])
-                else:
-                    faceList.append([int(arrtemp[0]),int(arrtemp[1]),int(arrtemp[2])])
 
-                contLines += 1
+def loadGravFromFileToList(fileName, maxDeg=2, useCache=True):
+    """
+    Load the spherical harmonics coefficients of a gravity field file.
 
-        poly.nVertex = nVertex
-        poly.nFacet = nFacet
-        poly.xyzVertex = vertList
-        poly.orderFacet = faceList
+    :return: [clmList, slmList, mu, radEquator]
+    """
+    return list(_gravData(fileName, useCache))
 
 
-def loadPolyFromFileToList(fileName):
+def _parsePolyFile(fileName):
     with open(fileName) as polyFile:
-        if fileName.endswith('.tab'):
+        if fileName.endswith('.tab') or fileName.endswith('.txt'):
+            # .tab files have an index column in front of the vertex coordinates and facet indexes
+            firstCol = 1 if fileName.endswith('.tab') else 0
             nVertex, nFacet = [int(x) for x in next(polyFile).split()] # read first line
             vertList = []
             faceList = []
 
             contLines = 0
             for line in polyFile:
-                arrtemp = []
-
-                for x in line.split():
-                    arrtemp.append(float(x))
-
+                arrtemp = [float(x) for x in line.split()]
+                if not arrtemp:
+                    continue
                 if contLines < nVertex:
-                    vertList.append([float(arrtemp[1]*1e3),float(arrtemp[2]*1e3),float(arrtemp[3]*1e3)])
+                    vertList.append(arrtemp[firstCol:firstCol+3])
                 else:
-                    faceList.append([int(arrtemp[1]),int(arrtemp[2]),int(arrtemp[3])])
-
+                    faceList.append(arrtemp[firstCol:firstCol+3])
                 contLines += 1
         elif fileName.endswith('.obj'):
-            nVertex = 0
-            nFacet = 0
             vertList = []
             faceList = []
             for line in polyFile:
                 arrtemp = line.split()
                 if arrtemp:
                     if arrtemp[0] == 'v':
-                        nVertex += 1
-                        vertList.append([float(arrtemp[1])*1e3, float(arrtemp[2])*1e3, float(arrtemp[3])*1e3])
+                        vertList.append([float(arrtemp[1]), float(arrtemp[2]), float(arrtemp[3])])
                     elif arrtemp[0] == 'f':
-                        nFacet += 1
                         faceList.append([int(arrtemp[1]), int(arrtemp[2]), int(arrtemp[3])])
-        elif fileName.endswith('.txt'):
-            nVertex, nFacet = [int(x) for x in next(polyFile).split()] # read first line
-            vertList = []
-            faceList = []
-
-            contLines = 0
-            for line in polyFile:
-                arrtemp = []
-
-                for x in line.split():
-                    arrtemp.append(float(x))
-
-                if contLines < nVertex:
-                    vertList.append([float(arrtemp[0]*1e3),float(arrtemp[1]*1e3),float(arrtemp[2]*1e3)])
-                else:
-                    faceList.append([int(arrtemp[0]),int(arrtemp[1]),int(arrtemp[2])])
-
-                contLines += 1
-
-        return [vertList, faceList, nVertex, nFacet]
+        else:
+            raise ValueError('loadPolyFromFile: unknown shape model file type of ' + fileName)
+    vertArray = np.array(vertList, dtype=np.float64).reshape(-1, 3) * 1e3
+    faceArray = np.array(faceList, dtype=np.float64).reshape(-1, 3).astype(np.int64)
+
+    # facet normals and volume, computed in the same order as Polyhedral::initializeParameters()
+    xyz1 = vertArray[faceArray[:, 0] - 1]
+    xyz2 = vertArray[faceArray[:, 1] - 1]
+    xyz3 = vertArray[faceArray[:, 2] - 1]
+    normal = np.cross(xyz2 - xyz1, xyz3 - xyz2)
+    normal /= np.sqrt(np.sum(normal * normal, axis=1))[:, None]
+    volume = np.cumsum(np.abs(np.sum(np.cross(xyz1, xyz2) * xyz3, axis=1)) / 6)
+    return {'vertex': np.ascontiguousarray(vertArray), 'facet': np.ascontiguousarray(faceArray),
+            'normal': normal, 'volume': volume[-1:] if len(volume) else np.zeros(1)}
+
+
+def loadPolyFromFile(fileName, poly, useCache=True):
+    """
+    Load a polyhedral shape model file (``.tab``, ``.obj`` or ``.txt``) into ``poly``.  The facet normals and the
+    polyhedron volume are computed along with the parsing and kept in the binary data cache if ``useCache`` is set
+    and ``cacheDirectory`` is set.
+    """
+    data = _loadCached(fileName, 'poly', _parsePolyFile, useCache)
+    vertArray = np.ascontiguousarray(data['vertex'], dtype=np.float64)
+    faceArray = np.ascontiguousarray(data['facet'], dtype=np.float64)
+    normalArray = np.ascontiguousarray(data['normal'], dtype=np.float64)
+    poly._setShape(vertArray.ctypes.data, vertArray.shape[0], faceArray.ctypes.data, faceArray.shape[0],
+                   normalArray.ctypes.data, float(data['volume'][0]))
+
+
+def loadPolyFromFileToList(fileName, useCache=True):
+    """
+    Load a polyhedral shape model file (``.tab``, ``.obj`` or ``.txt``).
+
+    :return: [vertList, faceList, nVertex, nFacet]
+    """
+    data = _loadCached(fileName, 'poly', _parsePolyFile, useCache)
+    return [np.asarray(data['vertex']).tolist(), np.asarray(data['facet']).tolist(),
+            len(data['vertex']), len(data['facet'])]
@@ -33,8 +33,47 @@ from Basilisk.architecture.swig_common_model import *
 %include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
 %include "sys_model.h"
 #pragma SWIG nowarn=362
+%ignore SphericalHarmonics::computeFieldBatch(const double *, double *, uint64_t, unsigned int, bool);
 %include "simulation/dynamics/_GeneralModuleFiles/gravityEffector.h"
 
+%extend Polyhedral {
+    void _setShape(uint64_t vertexAddress, unsigned int numVertex, uint64_t facetAddress, unsigned int numFacet,
+                   uint64_t normalAddress, double volume) {
+        typedef Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor> RowMatrix;
+        $self->nVertex = numVertex;
+        $self->nFacet = numFacet;
+        $self->xyzVertex = Eigen::Map<const RowMatrix>(reinterpret_cast<const double *>(vertexAddress), numVertex, 3);
+        $self->orderFacet = Eigen::Map<const RowMatrix>(reinterpret_cast<const double *>(facetAddress), numFacet, 3);
+        $self->normalFacet = Eigen::Map<const RowMatrix>(reinterpret_cast<const double *>(normalAddress), numFacet, 3);
+        $self->volPoly = volume;
+        $self->normalsFromShape = true;
+    }
+}
+
+%extend SphericalHarmonics {
+    void _computeFieldArray(uint64_t posAddress, uint64_t accAddress, uint64_t numPositions, unsigned int degree,
+                            bool include_zero_degree) {
+        $self->computeFieldBatch(reinterpret_cast<const double *>(posAddress), reinterpret_cast<double *>(accAddress),
+                                 numPositions, degree, include_zero_degree);
+    }
+    %pythoncode %{
+    def computeFieldArray(self, pos_Pfix, degree, include_zero_degree):
+        """
+        Evaluate the spherical harmonics field at many planet fixed positions in one call.
+
+        :param pos_Pfix: (N, 3) array of planet fixed positions [m]
+        :param degree: maximum degree of the expansion
+        :param include_zero_degree: include the point mass term
+        :return: (N, 3) numpy array of planet fixed accelerations [m/s^2]
+        """
+        import numpy as np
+        pos = np.ascontiguousarray(pos_Pfix, dtype=np.float64).reshape(-1, 3)
+        acc = np.empty_like(pos)
+        self._computeFieldArray(pos.ctypes.data, acc.ctypes.data, pos.shape[0], degree, include_zero_degree)
+        return acc
+    %}
+}
+
 %include "std_vector.i"
 
 namespace std {
@@ -259,6 +259,14 @@ def stateArchitectureTest(show_plots):
         testFailCount += 1
         testMessages.append("Position state propagation via state-manager failed")
 
+    # a registered state is packed in the storage of the manager and must reject values of another size
+    posState.setState([[1.0], [2.0]])
+    posState.setDerivative([[1.0], [2.0], [3.0], [4.0]])
+    if(posState.getRowSize() != stateDim[0] or posState.getState() != numpyOutput.tolist()
+            or posState.getStateDeriv() != vecStart):
+        testFailCount += 1
+        testMessages.append("Registered state accepted a value of another size")
+
     if testFailCount == 0:
         print("PASSED: " + " State manager")
     # return fail count and join into a single string all messages in the list
@@ -246,6 +246,67 @@ def run(show_plots, orbitCase, setEpoch):
 
     return [testFailCount, ''.join(testMessages)]
 
+def test_msisSurrogate():
+    r"""
+    **Validation Test Description**
+
+    A formation of spacecraft at 400 km altitude is evaluated with and without the surrogate grid.  The interpolated
+    densities must be within 2 percent and the temperatures within 5 K of the direct NRLMSISE-00 evaluations, which
+    is also checked by the surrogate validation.  Positions outside of the grid altitudes are evaluated directly.
+    """
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("simProcess")
+    dynProcess.addTask(scSim.CreateNewTask("simTask", macros.sec2nano(10.)))
+
+    r0 = orbitalMotion.REQ_EARTH*1000. + 400e3
+    positions = [[r0*np.cos(0.01*k), r0*np.sin(0.01*k), 1000.*k] for k in range(10)]
+    positions.append([orbitalMotion.REQ_EARTH*1000. + 1200e3, 0., 0.])
+    scMsgs = []
+    for position in positions:
+        scStateMsgData = messaging.SCStatesMsgPayload()
+        scStateMsgData.r_BN_N = position
+        scMsgs.append(messaging.SCStatesMsg().write(scStateMsgData))
+
+    swMsgList = []
+    for c in range(23):
+        swMsgData = messaging.SwDataMsgPayload()
+        swMsgData.dataValue = 150. if c > 20 else 15.
+        swMsgList.append(messaging.SwDataMsg().write(swMsgData))
+
+    atmoModules = []
+    for useSurrogate in [False, True]:
+        atmo = msisAtmosphere.MsisAtmosphere()
+        atmo.ModelTag = "MsisAtmo" + str(useSurrogate)
+        atmo.epochDoy = 1
+        atmo.useSurrogate = useSurrogate
+        atmo.validateSurrogate = True
+        for msg in scMsgs:
+            atmo.addSpacecraftToModel(msg)
+        for c in range(23):
+            atmo.swDataInMsgs[c].subscribeTo(swMsgList[c])
+        scSim.AddModelToTask("simTask", atmo)
+        atmoModules.append(atmo)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(20.))
+    scSim.ExecuteSimulation()
+
+    direct, surrogate = [[[atmo.envOutMsgs[c].read().neutralDensity, atmo.envOutMsgs[c].read().localTemp]
+                          for c in range(len(positions))] for atmo in atmoModules]
+    direct = np.array(direct)
+    surrogate = np.array(surrogate)
+    np.testing.assert_allclose(surrogate[:, 0], direct[:, 0], rtol=0.02)
+    np.testing.assert_allclose(surrogate[:, 1], direct[:, 1], atol=5.)
+    assert surrogate[-1, 0] == direct[-1, 0]
+
+    surrogateAtmo = atmoModules[1]
+    assert surrogateAtmo.surrogateInterpolations == 3*(len(positions) - 1)
+    assert 0 < surrogateAtmo.surrogateNodeEvaluations < surrogateAtmo.surrogateInterpolations*8
+    assert 0 < surrogateAtmo.surrogateMaxDensityError < 0.02
+    assert surrogateAtmo.surrogateMaxTemperatureError < 5.
+    assert atmoModules[0].surrogateInterpolations == 0
+
+
 if __name__ == '__main__':
     run(True,
         "LPO",          # orbitCase
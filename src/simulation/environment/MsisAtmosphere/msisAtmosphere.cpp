@@ -44,6 +44,23 @@ MsisAtmosphere::MsisAtmosphere()
     this->msisInput.ap_a = &this->aph;
     this->updateInputParams();
 
+    //! - Set the default surrogate grid, which is off by default
+    this->useSurrogate = false;
+    this->surrogateMinAltitude = 100.0;
+    this->surrogateMaxAltitude = 1000.0;
+    this->surrogateAltitudeStep = 5.0;
+    this->surrogateLocalTimeStep = 0.5;
+    this->surrogateLatitudeStep = 5.0;
+    this->validateSurrogate = false;
+    this->surrogateMaxDensityError = 0.0;
+    this->surrogateMaxTemperatureError = 0.0;
+    this->surrogateInterpolations = 0;
+    this->surrogateNodeEvaluations = 0;
+    this->surrogateAltitudeCount = 0;
+    this->surrogateLocalTimeCount = 0;
+    this->surrogateLatitudeCount = 0;
+    this->surrogateSec = 0.0;
+
 
     this->msisFlags.switches[0] = 1; //! NRLMSISE-00 should output in kg/m^3 for consistency with other atmospheric modules.
     //! Set default settings for NRLMSISE-00; we're using all the settings by default
@@ -106,6 +123,30 @@ void MsisAtmosphere::customReset(uint64_t CurrentSimNanos)
             bskLogger.bskLog(BSK_ERROR, "Required MSIS input messages No. %d are not connected.", ind);
         }
     }
+
+    //! - Check the surrogate grid setup and clear any prior grid and statistics
+    if (this->useSurrogate && (this->surrogateMaxAltitude <= this->surrogateMinAltitude
+                               || this->surrogateAltitudeStep <= 0.0
+                               || this->surrogateLocalTimeStep <= 0.0
+                               || this->surrogateLatitudeStep <= 0.0)) {
+        bskLogger.bskLog(BSK_ERROR, "The MSIS surrogate grid altitude range or spacing is invalid.  The surrogate is turned off.");
+        this->useSurrogate = false;
+    }
+    this->clearSurrogate();
+    this->surrogateMaxDensityError = 0.0;
+    this->surrogateMaxTemperatureError = 0.0;
+    this->surrogateInterpolations = 0;
+    this->surrogateNodeEvaluations = 0;
+}
+
+/*! Clears the surrogate grid such that its nodes are evaluated again when they are needed.
+ @return void
+ */
+void MsisAtmosphere::clearSurrogate()
+{
+    this->surrogateWindow.clear();
+    this->surrogateLogDensity.clear();
+    this->surrogateTemperature.clear();
 }
 
 
@@ -159,6 +200,10 @@ bool MsisAtmosphere::customReadMessages(){
 
     if (failCount > 0) {
         swRead = false;
+    } else {
+        //! - the space weather inputs are the same for all the spacecraft
+        this->updateSwIndices();
+        this->updateInputParams();
     }
     return(swRead);
 }
@@ -210,8 +255,9 @@ void MsisAtmosphere::updateSwIndices()
 
 void MsisAtmosphere::evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double currentTime)
 {
-    this->updateSwIndices();
-    this->updateInputParams();
+    double density;                                     // [kg/m^3] surrogate density
+    double temperature;                                 // [K]      surrogate temperature
+
     //! Compute the geodetic position using the planet orientation.
 
     this->currentLLA = PCI2LLA(this->r_BP_N, this->planetState.J20002Pfix, this->planetRadius);
@@ -232,11 +278,39 @@ void MsisAtmosphere::evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double cu
     //WIP - need to actually figure out how to pull in these values.
     this->msisInput.lst = this->msisInput.sec/3600.0 + this->msisInput.g_long/15.0;
 
+    //! - Interpolate from the surrogate grid if it is used and covers this altitude
+    if (this->useSurrogate && this->interpolateSurrogate(&density, &temperature)) {
+        this->surrogateInterpolations++;
+        if (this->validateSurrogate) {
+            this->evaluateMsis(&this->msisInput, &this->msisOutput);
+            this->surrogateMaxDensityError = std::max(this->surrogateMaxDensityError,
+                                                      fabs(density/this->msisOutput.d[5] - 1.0));
+            this->surrogateMaxTemperatureError = std::max(this->surrogateMaxTemperatureError,
+                                                          fabs(temperature - this->msisOutput.t[1]));
+        }
+        msg->neutralDensity = density;
+        msg->localTemp = temperature;
+        return;
+    }
+
+    this->evaluateMsis(&this->msisInput, &this->msisOutput);
+    msg->neutralDensity = this->msisOutput.d[5];
+    msg->localTemp = this->msisOutput.t[1];
+    return;
+}
+
+/*! Evaluates NRLMSISE-00 for the given inputs.
+ @param input NRLMSISE-00 inputs
+ @param output NRLMSISE-00 outputs
+ @return void
+ */
+void MsisAtmosphere::evaluateMsis(nrlmsise_input *input, nrlmsise_output *output)
+{
     //!  NRLMSISE-00 uses different models depending on the altitude.
-    if(this->msisInput.alt < 500.0){
-        gtd7(&this->msisInput, \
+    if(input->alt < 500.0){
+        gtd7(input, \
        &this->msisFlags, \
-       &this->msisOutput);
+       output);
     }
 
         /* GTD7D */
@@ -245,12 +319,121 @@ void MsisAtmosphere::evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double cu
          *   affect satellite drag above 500 km. See the section "output" for
          *   additional details.
          */
-    else if(this->msisInput.alt >= 500.0){
-        gtd7d(&this->msisInput, \
+    else if(input->alt >= 500.0){
+        gtd7d(input, \
        &this->msisFlags, \
-       &this->msisOutput);
+       output);
     }
-    msg->neutralDensity = this->msisOutput.d[5];
-    msg->localTemp = this->msisOutput.t[1];
     return;
 }
+
+/*! Starts a new surrogate grid if the space weather indices or the day of year changed since the current grid was
+ computed.  The grid nodes are only evaluated when an interpolation needs them.
+ @return void
+ */
+void MsisAtmosphere::updateSurrogateWindow()
+{
+    std::vector<double> window = {this->ap, this->f107, this->f107A, (double) this->msisInput.doy};
+    window.insert(window.end(), this->aph.a, this->aph.a + 7);
+    if (window == this->surrogateWindow) {
+        return;
+    }
+
+    this->surrogateWindow = window;
+    this->surrogateSec = this->msisInput.sec;
+    this->surrogateAltitudeCount = std::max(2L, (long) ceil((this->surrogateMaxAltitude - this->surrogateMinAltitude)
+                                                            / this->surrogateAltitudeStep) + 1);
+    this->surrogateLocalTimeCount = std::max(2L, (long) ceil(24.0/this->surrogateLocalTimeStep));
+    this->surrogateLatitudeCount = std::max(2L, (long) ceil(180.0/this->surrogateLatitudeStep) + 1);
+    long nodeCount = this->surrogateAltitudeCount*this->surrogateLocalTimeCount*this->surrogateLatitudeCount;
+    this->surrogateLogDensity.assign(nodeCount, NAN);
+    this->surrogateTemperature.assign(nodeCount, NAN);
+
+    return;
+}
+
+/*! Evaluates NRLMSISE-00 at a surrogate grid node if it was not evaluated yet.  The node longitude is the one with
+ the node local solar time at the time of day of the grid.
+ @param iAlt altitude index of the node
+ @param iLst local solar time index of the node
+ @param iLat latitude index of the node
+ @return bool true if the node has a positive density
+ */
+bool MsisAtmosphere::evaluateSurrogateNode(long iAlt, long iLst, long iLat)
+{
+    nrlmsise_input nodeInput;
+    nrlmsise_output nodeOutput;
+    long index = (iAlt*this->surrogateLocalTimeCount + iLst)*this->surrogateLatitudeCount + iLat;
+
+    if (!std::isnan(this->surrogateLogDensity[index])) {
+        return true;
+    }
+
+    nodeInput = this->msisInput;
+    nodeInput.sec = this->surrogateSec;
+    nodeInput.alt = this->surrogateMinAltitude + iAlt*(this->surrogateMaxAltitude - this->surrogateMinAltitude)
+                    / (this->surrogateAltitudeCount - 1);
+    nodeInput.lst = iLst*24.0/this->surrogateLocalTimeCount;
+    nodeInput.g_lat = -90.0 + iLat*180.0/(this->surrogateLatitudeCount - 1);
+    nodeInput.g_long = 15.0*(nodeInput.lst - nodeInput.sec/3600.0);
+    this->evaluateMsis(&nodeInput, &nodeOutput);
+    this->surrogateNodeEvaluations++;
+    if (nodeOutput.d[5] <= 0.0) {
+        return false;
+    }
+    this->surrogateLogDensity[index] = log(nodeOutput.d[5]);
+    this->surrogateTemperature[index] = nodeOutput.t[1];
+
+    return true;
+}
+
+/*! Interpolates the density and temperature at the current NRLMSISE-00 inputs from the surrogate grid.  The log of
+ the density and the temperature are interpolated linearly in altitude, local solar time and latitude.
+ @param density [kg/m^3] interpolated density
+ @param temperature [K] interpolated temperature
+ @return bool true if the grid covers the altitude and the interpolation succeeded
+ */
+bool MsisAtmosphere::interpolateSurrogate(double *density, double *temperature)
+{
+    if (this->msisInput.alt < this->surrogateMinAltitude || this->msisInput.alt > this->surrogateMaxAltitude) {
+        return false;
+    }
+    this->updateSurrogateWindow();
+
+    //! - find the grid cell and the interpolation fractions along each axis
+    double xAlt = (this->msisInput.alt - this->surrogateMinAltitude)*(this->surrogateAltitudeCount - 1)
+                  / (this->surrogateMaxAltitude - this->surrogateMinAltitude);
+    long iAlt = std::min((long) floor(xAlt), this->surrogateAltitudeCount - 2);
+    double xLst = fmod(this->msisInput.lst, 24.0);
+    if (xLst < 0.0) {
+        xLst += 24.0;
+    }
+    xLst *= this->surrogateLocalTimeCount/24.0;
+    long iLst = std::min((long) floor(xLst), this->surrogateLocalTimeCount - 1);
+    double xLat = (this->msisInput.g_lat + 90.0)*(this->surrogateLatitudeCount - 1)/180.0;
+    long iLat = std::max(0L, std::min((long) floor(xLat), this->surrogateLatitudeCount - 2));
+    double fractions[3] = {xAlt - iAlt, xLst - iLst, xLat - iLat};
+
+    //! - blend the 8 nodes of the cell, with the local solar time wrapping around midnight
+    double logDensity = 0.0;
+    double temp = 0.0;
+    for (int corner = 0; corner < 8; corner++) {
+        long nodeAlt = iAlt + (corner & 1);
+        long nodeLst = (iLst + ((corner >> 1) & 1)) % this->surrogateLocalTimeCount;
+        long nodeLat = iLat + ((corner >> 2) & 1);
+        if (!this->evaluateSurrogateNode(nodeAlt, nodeLst, nodeLat)) {
+            return false;
+        }
+        double weight = 1.0;
+        for (int axis = 0; axis < 3; axis++) {
+            weight *= ((corner >> axis) & 1) ? fractions[axis] : 1.0 - fractions[axis];
+        }
+        long index = (nodeAlt*this->surrogateLocalTimeCount + nodeLst)*this->surrogateLatitudeCount + nodeLat;
+        logDensity += weight*this->surrogateLogDensity[index];
+        temp += weight*this->surrogateTemperature[index];
+    }
+    *density = exp(logDensity);
+    *temperature = temp;
+
+    return true;
+}
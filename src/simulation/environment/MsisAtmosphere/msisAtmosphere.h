@@ -43,6 +43,7 @@ class MsisAtmosphere: public AtmosphereBase {
 public:
     MsisAtmosphere();
     ~MsisAtmosphere();
+    void clearSurrogate();
 
 private:
     void customWriteMessages(uint64_t CurrentClock);
@@ -53,11 +54,26 @@ private:
     void updateSwIndices();
     void evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double currentTime);
     void customSetEpochFromVariable();
+    void evaluateMsis(nrlmsise_input *input, nrlmsise_output *output);
+    bool interpolateSurrogate(double *density, double *temperature);
+    bool evaluateSurrogateNode(long iAlt, long iLst, long iLat);
+    void updateSurrogateWindow();
 
 public:
     std::vector<ReadFunctor<SwDataMsgPayload>> swDataInMsgs; //!< Vector of space weather input message names
     int epochDoy;                               //!< [day] Day-of-Year at epoch
     std::string epochInMsgName;                 //!< epoch input msg name
+    bool useSurrogate;                          //!< flag to interpolate the density and temperature from a grid of NRLMSISE-00 evaluations, default is off
+    double surrogateMinAltitude;                //!< [km] minimum altitude of the surrogate grid, the model is evaluated directly below it
+    double surrogateMaxAltitude;                //!< [km] maximum altitude of the surrogate grid, the model is evaluated directly above it
+    double surrogateAltitudeStep;               //!< [km] maximum altitude spacing of the surrogate grid
+    double surrogateLocalTimeStep;              //!< [hr] maximum local solar time spacing of the surrogate grid
+    double surrogateLatitudeStep;               //!< [deg] maximum latitude spacing of the surrogate grid
+    bool validateSurrogate;                     //!< flag to also evaluate the model directly and record the surrogate errors
+    double surrogateMaxDensityError;            //!< [-] largest relative density error of the surrogate found with validateSurrogate
+    double surrogateMaxTemperatureError;        //!< [K] largest temperature error of the surrogate found with validateSurrogate
+    uint64_t surrogateInterpolations;           //!< number of densities interpolated from the surrogate grid
+    uint64_t surrogateNodeEvaluations;          //!< number of NRLMSISE-00 evaluations of surrogate grid nodes
     BSKLogger bskLogger;                        //!< -- BSK Logging
 
 
@@ -74,6 +90,14 @@ private:
     double f107;
     double f107A;
 
+    // Surrogate grid of the current space weather window
+    std::vector<double> surrogateWindow;        //!< space weather indices and day of year the surrogate grid was computed for
+    std::vector<double> surrogateLogDensity;    //!< [log(kg/m^3)] log of the density of the grid nodes, NAN if not evaluated yet
+    std::vector<double> surrogateTemperature;   //!< [K] temperature of the grid nodes
+    long surrogateAltitudeCount;                //!< number of altitude nodes of the surrogate grid
+    long surrogateLocalTimeCount;               //!< number of local solar time nodes of the surrogate grid
+    long surrogateLatitudeCount;                //!< number of latitude nodes of the surrogate grid
+    double surrogateSec;                        //!< [s] time of day used for the grid nodes
 
 };
 
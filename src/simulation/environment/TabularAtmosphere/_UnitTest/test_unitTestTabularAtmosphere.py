@@ -222,6 +222,163 @@ def tabularAtmosphereTestFunction(altitude, accuracy, useMinReach, useMaxReach):
     return [testFailCount, testMessage]         
 
 
+def setupTabularSimulation(altList, rhoList, tempList, altitudes, interpolationMethod=None, logDensity=False):
+    """Setup a simulation with a spacecraft at each of the given altitudes.  Returns the simulation, the module,
+    the spacecraft state input messages and the output recorders."""
+    unitTaskName = "unitTask"
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask(unitTaskName, macros.sec2nano(1.0)))
+
+    module = tabularAtmosphere.TabularAtmosphere()
+    module.ModelTag = "tabularAtmosphere"
+    module.planetRadius = 6378136.6
+    module.altList = tabularAtmosphere.DoubleVector(altList)
+    module.rhoList = tabularAtmosphere.DoubleVector(rhoList)
+    module.tempList = tabularAtmosphere.DoubleVector(tempList)
+    if interpolationMethod is not None:
+        module.interpolationMethod = interpolationMethod
+    module.logDensity = logDensity
+    unitTestSim.AddModelToTask(unitTaskName, module)
+
+    scInMsgs = []
+    dataLogs = []
+    for altitude in altitudes:
+        scStateMsg = messaging.SCStatesMsgPayload()
+        scStateMsg.r_BN_N = [module.planetRadius + altitude, 0., 0.]
+        scInMsgs.append(messaging.SCStatesMsg().write(scStateMsg))
+        module.addSpacecraftToModel(scInMsgs[-1])
+        dataLogs.append(module.envOutMsgs[-1].recorder())
+        unitTestSim.AddModelToTask(unitTaskName, dataLogs[-1])
+    unitTestSim.InitializeSimulation()
+
+    return unitTestSim, module, scInMsgs, dataLogs
+
+
+@pytest.mark.parametrize("uniformTable", [True, False])
+def test_tabularAtmosphereLookup(uniformTable):
+    r"""
+    **Validation Test Description**
+
+    Checks the table lookup for several spacecraft that move through the table, such that the cached table
+    interval of each spacecraft must be updated, jumps across many intervals, and lands exactly on table points.
+    Both an equally spaced table, which is indexed directly, and an unequally spaced table, which is searched, are
+    tested.  The linear interpolation must match ``numpy.interp`` and return the table value at the top altitude.
+    """
+    rng = np.random.default_rng(0)
+    # the altitudes are whole meters, such that the spacecraft altitudes match the table points exactly
+    steps = np.full(999, 1000.) if uniformTable else np.round(rng.uniform(200., 1800., 999))
+    altList = np.concatenate(([0.], np.cumsum(steps)))
+    rhoList = 1.2 * np.exp(-altList / 8500.)
+    tempList = 250. + 40. * np.sin(altList / 30000.)
+
+    altitudes = [altList[0], altList[500], altList[-1], 0.5 * altList[-1]]
+    unitTestSim, module, scInMsgs, dataLogs = setupTabularSimulation(altList, rhoList, tempList, altitudes)
+
+    altHistory = []
+    for step in range(40):
+        if step > 0:
+            altitudes = [altList[0] + 0.5 * (altList[-1] - altList[0]) * (1. + np.sin(0.3 * step + k))
+                         for k in range(3)] + [rng.uniform(altList[0], altList[-1])]
+            for scInMsg, altitude in zip(scInMsgs, altitudes):
+                scStateMsg = messaging.SCStatesMsgPayload()
+                scStateMsg.r_BN_N = [module.planetRadius + altitude, 0., 0.]
+                scInMsg.write(scStateMsg)
+        altHistory.append(altitudes)
+        unitTestSim.ConfigureStopTime(macros.sec2nano(step))
+        unitTestSim.ExecuteSimulation()
+
+    altHistory = np.array(altHistory)
+    for k, dataLog in enumerate(dataLogs):
+        np.testing.assert_allclose(dataLog.neutralDensity, np.interp(altHistory[:, k], altList, rhoList),
+                                   rtol=1e-9)
+        np.testing.assert_allclose(dataLog.localTemp, np.interp(altHistory[:, k], altList, tempList), rtol=1e-12)
+    assert dataLogs[2].neutralDensity[0] == pytest.approx(rhoList[-1], rel=1e-9)
+
+
+@pytest.mark.parametrize("interpolationMethod", ["linear", "monotoneCubic"])
+def test_tabularAtmosphereInterpolation(interpolationMethod):
+    r"""
+    **Validation Test Description**
+
+    Checks the optional interpolation settings on an exponential density profile and a piecewise linear temperature
+    profile.  Interpolating the log of the density reproduces the exponential profile exactly with both methods.
+    The monotone cubic interpolation reproduces the table points and linear data away from the kink of the
+    temperature profile, and does not overshoot next to the kink.
+    """
+    method = tabularAtmosphere.TABULAR_LINEAR if interpolationMethod == "linear" \
+        else tabularAtmosphere.TABULAR_MONOTONE_CUBIC
+    altList = np.linspace(0., 200000., 41)
+    rhoList = 1.2 * np.exp(-altList / 8500.)
+    tempList = np.where(altList < 100000., 200. + 1e-3 * altList, 300.)
+
+    altitudes = np.concatenate((altList[1:-1:5], np.linspace(1000., 199000., 37)))
+    unitTestSim, module, scInMsgs, dataLogs = setupTabularSimulation(altList, rhoList, tempList, altitudes,
+                                                                      interpolationMethod=method, logDensity=True)
+    unitTestSim.ConfigureStopTime(0)
+    unitTestSim.ExecuteSimulation()
+
+    density = np.array([dataLog.neutralDensity[0] for dataLog in dataLogs])
+    temperature = np.array([dataLog.localTemp[0] for dataLog in dataLogs])
+    np.testing.assert_allclose(density, 1.2 * np.exp(-altitudes / 8500.), rtol=1e-10)
+    nearKink = np.abs(altitudes - 100000.) < 5000.
+    np.testing.assert_allclose(temperature[~nearKink], np.interp(altitudes, altList, tempList)[~nearKink],
+                               rtol=1e-12)
+    order = np.argsort(altitudes)
+    assert np.all(np.diff(temperature[order]) >= 0.) and np.all(temperature <= 300.)
+
+
+@pytest.mark.parametrize("invalidTable", ["unsorted", "lengthMismatch", "empty"])
+def test_tabularAtmosphereInvalidTable(invalidTable):
+    r"""
+    **Validation Test Description**
+
+    Checks that a table which fails the checks of the reset, because the altitudes are not increasing, the lists
+    have different lengths or the lists are empty, yields a zero density and temperature instead of evaluating
+    the incomplete interpolation data.
+    """
+    altList = np.linspace(0., 100000., 11)
+    rhoList = 1.2 * np.exp(-altList / 8500.)
+    tempList = np.full(11, 250.)
+    if invalidTable == "unsorted":
+        altList[[3, 4]] = altList[[4, 3]]
+    elif invalidTable == "lengthMismatch":
+        rhoList = rhoList[:-1]
+    else:
+        altList, rhoList, tempList = [], [], []
+
+    unitTestSim, module, scInMsgs, dataLogs = setupTabularSimulation(altList, rhoList, tempList, [50000., 0.])
+    unitTestSim.ConfigureStopTime(macros.sec2nano(1.))
+    unitTestSim.ExecuteSimulation()
+
+    for dataLog in dataLogs:
+        np.testing.assert_array_equal(dataLog.neutralDensity, 0.)
+        np.testing.assert_array_equal(dataLog.localTemp, 0.)
+
+
+def benchmarkTabularAtmosphere(numRows=10000, numSpacecraft=20, numSteps=2000):
+    """Time the table lookup for an equally and an unequally spaced table of numRows altitudes"""
+    import time
+    rng = np.random.default_rng(1)
+    for uniformTable in [True, False]:
+        steps = np.full(numRows - 1, 100.) if uniformTable else rng.uniform(20., 180., numRows - 1)
+        altList = np.concatenate(([0.], np.cumsum(steps)))
+        rhoList = 1.2 * np.exp(-altList / 8500.)
+        tempList = 250. + 40. * np.sin(altList / 30000.)
+        altitudes = rng.uniform(altList[0], altList[-1], numSpacecraft)
+        for method in [tabularAtmosphere.TABULAR_LINEAR, tabularAtmosphere.TABULAR_MONOTONE_CUBIC]:
+            unitTestSim, module, scInMsgs, dataLogs = setupTabularSimulation(altList, rhoList, tempList, altitudes,
+                                                                              interpolationMethod=method)
+            startTime = time.perf_counter()
+            unitTestSim.ConfigureStopTime(macros.sec2nano(numSteps))
+            unitTestSim.ExecuteSimulation()
+            runTime = time.perf_counter() - startTime
+            print('{0} table, {1}: {2:d} rows, {3:d} spacecraft, {4:.2f} us per spacecraft and step'.format(
+                'uniform' if uniformTable else 'non-uniform',
+                'linear' if method == tabularAtmosphere.TABULAR_LINEAR else 'monotone cubic',
+                numRows, numSpacecraft, runTime / (numSteps * numSpacecraft) * 1e6))
+
+
 #
 # This statement below ensures that the unitTestScript can be run as a
 # stand-along python script
@@ -233,3 +390,4 @@ if __name__ == "__main__":
                  True,
                  True
                )
+    benchmarkTabularAtmosphere()
@@ -20,6 +20,8 @@
 #include "tabularAtmosphere.h"
 #include "architecture/utilities/linearAlgebra.h"
 #include <iostream>
+#include <algorithm>
+#include <cmath>
 
 /*! The constructor method initializes data list lengths to zero.
  @return void
@@ -30,6 +32,12 @@ TabularAtmosphere::TabularAtmosphere()
     this->altList_length = 0;
     this->rhoList_length = 0;
     this->tempList_length = 0;
+    this->tableValid = false;
+    this->uniformGrid = false;
+    this->altStep = 0.0;
+    this->interpolationMethod = TABULAR_LINEAR;
+    this->logDensity = false;
+    this->useLogDensity = false;
     return;
 }
 
@@ -49,6 +57,7 @@ void TabularAtmosphere::customReset(uint64_t CurrentClock)
     this->altList_length = (int) this->altList.size();
     this->rhoList_length = (int) this->rhoList.size();
     this->tempList_length = (int) this->tempList.size();
+    this->tableValid = false;
     
 
     if((this->altList_length != this->rhoList_length) || (this->altList_length != this->tempList_length)){
@@ -62,27 +71,206 @@ void TabularAtmosphere::customReset(uint64_t CurrentClock)
     } else if(this->tempList_length == 0){
         bskLogger.bskLog(BSK_ERROR, "No data in temperature list.");
     }
-    
+    if ((this->altList_length != this->rhoList_length) || (this->altList_length != this->tempList_length)
+        || this->altList_length == 0) {
+        return;
+    }
+
+    //! - check the table is sorted and determine if the altitudes are equally spaced
+    for (size_t i = 1; i < this->altList.size(); i++) {
+        if (this->altList[i] < this->altList[i - 1]) {
+            bskLogger.bskLog(BSK_ERROR, "Altitude list is not sorted in ascending order.");
+            return;
+        }
+    }
+    this->uniformGrid = false;
+    if (this->altList.size() > 1) {
+        this->altStep = (this->altList.back() - this->altList[0]) / (double) (this->altList.size() - 1);
+        this->uniformGrid = this->altStep > 0.0;
+        for (size_t i = 1; i < this->altList.size() && this->uniformGrid; i++) {
+            double altUniform = this->altList[0] + (double) i * this->altStep;
+            this->uniformGrid = std::fabs(this->altList[i] - altUniform) <= 1e-9 * this->altStep;
+        }
+    }
+
+    //! - setup the interpolated density values and the cubic interpolation slopes
+    this->densityList = this->rhoList;
+    this->useLogDensity = this->logDensity;
+    for (size_t i = 0; i < this->rhoList.size() && this->useLogDensity; i++) {
+        if (this->rhoList[i] <= 0.0) {
+            bskLogger.bskLog(BSK_ERROR, "Density list must be positive to interpolate the log of the density.");
+            this->densityList = this->rhoList;
+            this->useLogDensity = false;
+        } else {
+            this->densityList[i] = std::log(this->rhoList[i]);
+        }
+    }
+    this->densitySlopes.clear();
+    this->tempSlopes.clear();
+    if (this->interpolationMethod == TABULAR_MONOTONE_CUBIC) {
+        this->computeMonotoneSlopes(this->densityList, this->densitySlopes);
+        this->computeMonotoneSlopes(this->tempList, this->tempSlopes);
+    }
+
+    this->lastInterval.assign(this->scStateInMsgs.size(), 0);
+    this->tableValid = true;
+
     return;
 }
 
-/*! evaluate function interpolates from given data lists. Sets density and temp to 0 if altitude outside bounds of input lists OR if outside bounds of envMinReach and envMaxReach.
+/*! This method computes the slopes of a monotone piecewise cubic Hermite interpolation of the table values,
+ such that the interpolated values do not overshoot between the table points (Fritsch and Butland).
+ @return void
+ @param yList table values at the altitude points
+ @param slopeList slopes at the altitude points
+ */
+void TabularAtmosphere::computeMonotoneSlopes(const std::vector<double> &yList, std::vector<double> &slopeList)
+{
+    size_t n = yList.size();
+    slopeList.assign(n, 0.0);
+    if (n < 2) {
+        return;
+    }
+
+    //! - secant slopes of the table intervals
+    std::vector<double> steps(n - 1);
+    std::vector<double> secants(n - 1);
+    for (size_t k = 0; k < n - 1; k++) {
+        steps[k] = this->altList[k + 1] - this->altList[k];
+        secants[k] = steps[k] > 0.0 ? (yList[k + 1] - yList[k]) / steps[k] : 0.0;
+    }
+    if (n == 2) {
+        slopeList[0] = secants[0];
+        slopeList[1] = secants[0];
+        return;
+    }
+
+    //! - weighted harmonic mean of the secants at the interior points, zero at local extrema
+    for (size_t k = 1; k < n - 1; k++) {
+        if (secants[k - 1] * secants[k] <= 0.0) {
+            continue;
+        }
+        double w1 = 2.0 * steps[k] + steps[k - 1];
+        double w2 = steps[k] + 2.0 * steps[k - 1];
+        slopeList[k] = (w1 + w2) / (w1 / secants[k - 1] + w2 / secants[k]);
+    }
+
+    //! - shape preserving three point slopes at the end points
+    auto endSlope = [](double h0, double h1, double d0, double d1) {
+        if (h0 + h1 <= 0.0) {
+            return 0.0;
+        }
+        double m = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1);
+        if (m * d0 <= 0.0) {
+            m = 0.0;
+        } else if (d0 * d1 <= 0.0 && std::fabs(m) > 3.0 * std::fabs(d0)) {
+            m = 3.0 * d0;
+        }
+        return m;
+    };
+    slopeList[0] = endSlope(steps[0], steps[1], secants[0], secants[1]);
+    slopeList[n - 1] = endSlope(steps[n - 2], steps[n - 3], secants[n - 2], secants[n - 3]);
+
+    return;
+}
+
+/*! This method finds the table interval [altList[i], altList[i+1]] that contains the altitude.  Uniform tables are
+ indexed directly.  Otherwise the interval of the previous evaluation and its neighbors are checked before a binary
+ search is done, such that smooth trajectories are found in constant time.
+ @return index i of the lower point of the interval
+ @param altitude [m] altitude within the table range
+ @param hint interval index found at the previous evaluation
+ */
+size_t TabularAtmosphere::findInterval(double altitude, size_t hint)
+{
+    if (this->altList.size() < 2) {
+        return 0;
+    }
+    size_t last = this->altList.size() - 2;
+    size_t i;
+
+    if (this->uniformGrid) {
+        i = (size_t) ((altitude - this->altList[0]) / this->altStep);
+        i = std::min(i, last);
+        //! - correct for round off in the index computation
+        if (i > 0 && altitude < this->altList[i]) {
+            i--;
+        } else if (i < last && altitude >= this->altList[i + 1]) {
+            i++;
+        }
+        return i;
+    }
+
+    if (hint <= last) {
+        if (this->altList[hint] <= altitude) {
+            if (hint == last || altitude < this->altList[hint + 1]) {
+                return hint;
+            }
+            if (hint + 1 == last || altitude < this->altList[hint + 2]) {
+                return hint + 1;
+            }
+        } else if (hint > 0 && this->altList[hint - 1] <= altitude) {
+            return hint - 1;
+        }
+    }
+
+    std::vector<double>::const_iterator it = std::upper_bound(this->altList.begin(), this->altList.end(), altitude);
+    i = (size_t) (it - this->altList.begin());
+    return std::min(i > 0 ? i - 1 : 0, last);
+}
+
+/*! This method interpolates the table values within an interval.
+ @return interpolated value
+ @param yList table values at the altitude points
+ @param slopeList slopes at the altitude points, only used for the monotone cubic interpolation
+ @param i index of the lower point of the interval
+ @param altitude [m] altitude within the interval
+ */
+double TabularAtmosphere::interpolate(const std::vector<double> &yList, const std::vector<double> &slopeList,
+                                      size_t i, double altitude)
+{
+    if (yList.size() < 2) {
+        return yList[0];
+    }
+    double step = this->altList[i + 1] - this->altList[i];
+    if (step <= 0.0) {
+        return yList[i + 1];
+    }
+    if (this->interpolationMethod == TABULAR_MONOTONE_CUBIC) {
+        double t = (altitude - this->altList[i]) / step;
+        double t2 = t * t;
+        double t3 = t2 * t;
+        return (2.0 * t3 - 3.0 * t2 + 1.0) * yList[i] + (t3 - 2.0 * t2 + t) * step * slopeList[i]
+               + (-2.0 * t3 + 3.0 * t2) * yList[i + 1] + (t3 - t2) * step * slopeList[i + 1];
+    }
+    return yList[i] + (altitude - this->altList[i]) * (yList[i + 1] - yList[i]) / step;
+}
+
+/*! evaluate function interpolates from given data lists. Sets density and temp to 0 if altitude outside bounds of input lists OR if outside bounds of envMinReach and envMaxReach,
+ or if the data lists failed the checks of the reset.
 * @return void
 */
 void TabularAtmosphere::evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double currentTime)
 {
-    if ((this->orbitAltitude < this->altList[0]) || (this->orbitAltitude > this->altList.back())) {
+    if (!this->tableValid
+        || (this->orbitAltitude < this->altList[0]) || (this->orbitAltitude > this->altList.back())) {
         msg->neutralDensity = 0.0;
         msg->localTemp = 0.0;
+        return;
     }
-    else {
-        for (uint32_t i = 0; i <= this->altList.size() - 1; i++) {
-            if (this->altList[i] > this->orbitAltitude) {
-                msg->neutralDensity = this->rhoList[i - 1] + (this->orbitAltitude - this->altList[i - 1]) * (this->rhoList[i] - this->rhoList[i - 1]) / (this->altList[i] - this->altList[i - 1]);
-                msg->localTemp = this->tempList[i - 1] + (this->orbitAltitude - this->altList[i - 1]) * (this->tempList[i] - this->tempList[i - 1]) / (this->altList[i] - this->altList[i - 1]);
-                break;
-            }
-        }
+
+    //! - start the interval search from the interval of the previous evaluation of this spacecraft
+    if (this->scIndex >= this->lastInterval.size()) {
+        this->lastInterval.resize(this->scIndex + 1, 0);
     }
+    size_t i = this->findInterval(this->orbitAltitude, this->lastInterval[this->scIndex]);
+    this->lastInterval[this->scIndex] = i;
+
+    msg->neutralDensity = this->interpolate(this->densityList, this->densitySlopes, i, this->orbitAltitude);
+    if (this->useLogDensity) {
+        msg->neutralDensity = std::exp(msg->neutralDensity);
+    }
+    msg->localTemp = this->interpolate(this->tempList, this->tempSlopes, i, this->orbitAltitude);
+
     return;
 }
@@ -29,6 +29,12 @@
 #include "simulation/environment/_GeneralModuleFiles/atmosphereBase.h"
 #include "architecture/utilities/bskLogging.h"
 
+/*! interpolation methods between the atmosphere table points */
+typedef enum {
+    TABULAR_LINEAR,
+    TABULAR_MONOTONE_CUBIC
+} tabularInterpolation_t;
+
 /*! @brief tabular atmosphere model */
 class TabularAtmosphere:  public AtmosphereBase {
 
@@ -36,10 +42,21 @@ class TabularAtmosphere:  public AtmosphereBase {
     
         // pulls density and temperature from atmospheric table at requested altitude, performs linear interpolation if necessary
         void evaluateAtmosphereModel(AtmoPropsMsgPayload *msg, double currentTime);
+        size_t findInterval(double altitude, size_t hint);      // index of the table interval containing the altitude
+        double interpolate(const std::vector<double> &yList, const std::vector<double> &slopeList, size_t i, double altitude);
+        void computeMonotoneSlopes(const std::vector<double> &yList, std::vector<double> &slopeList);
         
         int altList_length;     // length of list of altitude values extracted from the atmosphere table
         int rhoList_length;     // length of list of density values extracted from the atmosphere table
         int tempList_length;    // length of list of temperature values extracted from the atmosphere table
+        bool tableValid;        // flag indicating that the table passed the checks of the last reset
+        bool uniformGrid;       // flag indicating that the altitude values are equally spaced
+        double altStep;         // [m] altitude step of a uniform table
+        bool useLogDensity;     // flag indicating that densityList contains the log of the density
+        std::vector<double> densityList;        // density values that are interpolated, log of the density if useLogDensity is set
+        std::vector<double> densitySlopes;      // monotone cubic slopes of densityList at the table points
+        std::vector<double> tempSlopes;         // monotone cubic slopes of tempList at the table points
+        std::vector<size_t> lastInterval;       // table interval found at the previous evaluation of each spacecraft
 
         virtual void customReset(uint64_t CurrentClock);        // reset if error thrown
 
@@ -49,6 +66,8 @@ class TabularAtmosphere:  public AtmosphereBase {
         std::vector<double> altList;    //!< vector of doubles of altitude values extracted from the atmosphere table
         std::vector<double> rhoList;    //!< vector of doubles of density values extracted from the atmosphere table
         std::vector<double> tempList;   //!< vector of doubles of temperature values extracted from the atmosphere table
+        tabularInterpolation_t interpolationMethod; //!< (optional) TABULAR_LINEAR (default) or TABULAR_MONOTONE_CUBIC interpolation between the table points
+        bool logDensity;                //!< (optional) flag to interpolate the logarithm of the density, defaults to false
         BSKLogger bskLogger;            //!< -- BSK Logging
 };
 
@@ -33,6 +33,7 @@ AtmosphereBase::AtmosphereBase()
     this->planetRadius = 0.0; // [m] Earth magnetic spherical reference radius (see p. 404 in doi:10.1007/978-1-4939-0802-8)
     this->r_BP_N.fill(0.0);
     this->r_BP_P.fill(0.0);
+    this->scIndex = 0;
     this->scStateInMsgs.clear();
     this->envOutMsgs.clear();
 
@@ -250,7 +251,8 @@ void AtmosphereBase::updateLocalAtmosphere(double currentTime)
     //! - loop over all the spacecraft
     std::vector<AtmoPropsMsgPayload>::iterator envMsgIt;
     envMsgIt = this->envOutBuffer.begin();
-    for(scIt = scStates.begin(); scIt != scStates.end(); scIt++, envMsgIt++){
+    this->scIndex = 0;
+    for(scIt = scStates.begin(); scIt != scStates.end(); scIt++, envMsgIt++, this->scIndex++){
         //! - Computes planet relative state vector
         this->updateRelativePos(&(this->planetState), &(*scIt));
 
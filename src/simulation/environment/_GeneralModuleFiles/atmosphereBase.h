@@ -68,6 +68,7 @@ protected:
     Eigen::Vector3d r_BP_P;                 //!< [m] sc position vector relative to planet in planet-fixed frame components
     double orbitRadius;                     //!< [m] sc orbit radius about planet
     double orbitAltitude;                   //!< [m] sc altitude above planetRadius
+    size_t scIndex;                         //!< index of the spacecraft whose atmosphere is evaluated
     std::vector<AtmoPropsMsgPayload> envOutBuffer; //!< -- Message buffer for magnetic field messages
     std::vector<SCStatesMsgPayload> scStates;  //!< vector of the spacecraft state messages
     SpicePlanetStateMsgPayload planetState; //!< planet state message
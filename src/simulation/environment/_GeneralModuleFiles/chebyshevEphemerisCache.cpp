@@ -0,0 +1,247 @@
+/*
+ ISC License
+
+ Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "simulation/environment/_GeneralModuleFiles/chebyshevEphemerisCache.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdio>
+#include <fstream>
+#include <random>
+
+/*! identifier at the start of a cache file, the last character is the file format version */
+static const char CACHE_FILE_MAGIC[8] = {'B', 'S', 'K', 'C', 'H', 'E', 'B', '1'};
+
+/*! The constructor creates an empty cache.
+ */
+ChebyshevEphemerisCache::ChebyshevEphemerisCache()
+{
+    this->clear();
+}
+
+/*! Empty destructor method.
+ */
+ChebyshevEphemerisCache::~ChebyshevEphemerisCache()
+{
+}
+
+/*! This method removes all the fits from the cache.
+ @return void
+ */
+void ChebyshevEphemerisCache::clear()
+{
+    this->key = "";
+    this->startTime = 0.0;
+    this->segmentTime = 0.0;
+    this->numSegments = 0;
+    this->numBodies = 0;
+    this->numComponents = 0;
+    this->numCoeff = 0;
+    this->coefficients.clear();
+}
+
+/*! This method fits the states of all the bodies over a time span.  The states are sampled at the Chebyshev nodes
+ of every segment, such that each fit interpolates the states at degree+1 times of the segment.
+ @return void
+ @param cacheKey description of the data the fits are made from, used to identify a cache file
+ @param spanStart [s] start time of the time span
+ @param spanDuration [s] duration of the time span, rounded up to a whole number of segments
+ @param segmentDuration [s] duration of a segment
+ @param degree degree of the Chebyshev series
+ @param bodies number of bodies
+ @param components number of state components per body
+ @param sampleStates function that writes the bodies x components states at the given time into the array
+ */
+void ChebyshevEphemerisCache::fit(const std::string &cacheKey, double spanStart, double spanDuration,
+                                  double segmentDuration, uint32_t degree, uint32_t bodies, uint32_t components,
+                                  const std::function<void(double time, double *states)> &sampleStates)
+{
+    this->clear();
+    if (segmentDuration <= 0.0 || spanDuration < 0.0 || bodies * components == 0) {
+        return;
+    }
+    this->key = cacheKey;
+    this->startTime = spanStart;
+    this->segmentTime = segmentDuration;
+    this->numSegments = (uint32_t) std::max(1.0, std::ceil(spanDuration / segmentDuration));
+    this->numBodies = bodies;
+    this->numComponents = components;
+    this->numCoeff = degree + 1;
+
+    uint32_t numStates = bodies * components;
+    uint32_t n = this->numCoeff;
+    std::vector<double> samples((size_t) n * numStates);
+    std::vector<double> nodeCosines((size_t) n * n);
+    for (uint32_t j = 0; j < n; j++) {
+        for (uint32_t k = 0; k < n; k++) {
+            nodeCosines[j * n + k] = std::cos(M_PI * j * (k + 0.5) / n);
+        }
+    }
+    this->coefficients.assign((size_t) this->numSegments * numStates * n, 0.0);
+
+    for (uint32_t s = 0; s < this->numSegments; s++) {
+        double timeMid = this->startTime + (s + 0.5) * this->segmentTime;
+        double timeRad = 0.5 * this->segmentTime;
+        //! - sample the states at the Chebyshev nodes x_k = cos(pi (k + 1/2) / n) of the segment
+        for (uint32_t k = 0; k < n; k++) {
+            sampleStates(timeMid + timeRad * std::cos(M_PI * (k + 0.5) / n), &samples[(size_t) k * numStates]);
+        }
+        //! - the coefficients follow from the discrete orthogonality of the Chebyshev polynomials at the nodes
+        double *segmentCoeff = &this->coefficients[(size_t) s * numStates * n];
+        for (uint32_t i = 0; i < numStates; i++) {
+            for (uint32_t j = 0; j < n; j++) {
+                double sum = 0.0;
+                for (uint32_t k = 0; k < n; k++) {
+                    sum += samples[(size_t) k * numStates + i] * nodeCosines[j * n + k];
+                }
+                segmentCoeff[(size_t) i * n + j] = (j == 0 ? 1.0 : 2.0) * sum / n;
+            }
+        }
+    }
+}
+
+/*! This method checks if a time lies within the time span of the fits.
+ @return bool
+ @param time [s] time to check
+ */
+bool ChebyshevEphemerisCache::contains(double time) const
+{
+    return this->numSegments > 0 && time >= this->startTime
+        && time <= this->startTime + this->numSegments * this->segmentTime;
+}
+
+/*! This method evaluates the fitted state of a body.  The time must lie within the time span of the fits.
+ @return void
+ @param time [s] time at which the state is evaluated
+ @param body index of the body
+ @param state array of the state components of the body
+ */
+void ChebyshevEphemerisCache::evaluate(double time, uint32_t body, double *state) const
+{
+    double scaledTime = (time - this->startTime) / this->segmentTime;
+    uint32_t s = (uint32_t) std::max(0.0, std::floor(scaledTime));
+    if (s >= this->numSegments) {
+        s = this->numSegments - 1;
+    }
+    double x = 2.0 * (scaledTime - s) - 1.0;
+    x = std::min(1.0, std::max(-1.0, x));
+
+    //! - evaluate the Chebyshev series of all the components with the Clenshaw recurrence
+    const double *coeff = &this->coefficients[((size_t) s * this->numBodies + body) * this->numComponents * this->numCoeff];
+    for (uint32_t i = 0; i < this->numComponents; i++, coeff += this->numCoeff) {
+        double b1 = 0.0;
+        double b2 = 0.0;
+        for (uint32_t j = this->numCoeff - 1; j > 0; j--) {
+            double b0 = 2.0 * x * b1 - b2 + coeff[j];
+            b2 = b1;
+            b1 = b0;
+        }
+        state[i] = x * b1 - b2 + coeff[0];
+    }
+}
+
+/*! This method saves the fits to a binary file.  The file is first written under a temporary name and then renamed,
+ such that other processes never read a partially written file.
+ @return bool true if the file was written
+ @param fileName path of the cache file
+ */
+bool ChebyshevEphemerisCache::save(const std::string &fileName) const
+{
+    std::random_device randomDevice;
+    std::string tmpName = fileName + ".tmp" + std::to_string(randomDevice());
+    std::ofstream file(tmpName, std::ios::binary);
+    if (!file) {
+        return false;
+    }
+    uint64_t keyLength = this->key.size();
+    uint32_t sizes[4] = {this->numSegments, this->numBodies, this->numComponents, this->numCoeff};
+    file.write(CACHE_FILE_MAGIC, sizeof(CACHE_FILE_MAGIC));
+    file.write(reinterpret_cast<const char *>(&keyLength), sizeof(keyLength));
+    file.write(this->key.data(), (std::streamsize) keyLength);
+    file.write(reinterpret_cast<const char *>(&this->startTime), sizeof(this->startTime));
+    file.write(reinterpret_cast<const char *>(&this->segmentTime), sizeof(this->segmentTime));
+    file.write(reinterpret_cast<const char *>(sizes), sizeof(sizes));
+    file.write(reinterpret_cast<const char *>(this->coefficients.data()),
+               (std::streamsize) (this->coefficients.size() * sizeof(double)));
+    file.close();
+    if (!file) {
+        std::remove(tmpName.c_str());
+        return false;
+    }
+    if (std::rename(tmpName.c_str(), fileName.c_str()) != 0) {
+        //! - renaming onto an existing file fails on some platforms
+        std::remove(fileName.c_str());
+        if (std::rename(tmpName.c_str(), fileName.c_str()) != 0) {
+            std::remove(tmpName.c_str());
+            return false;
+        }
+    }
+    return true;
+}
+
+/*! This method loads the fits from a binary file if the file was made from the data described by the key.
+ @return bool true if the fits were loaded, false if the file does not exist, is invalid or has a different key
+ @param fileName path of the cache file
+ @param cacheKey description of the data the fits must have been made from
+ */
+bool ChebyshevEphemerisCache::load(const std::string &fileName, const std::string &cacheKey)
+{
+    this->clear();
+    std::ifstream file(fileName, std::ios::binary);
+    if (!file) {
+        return false;
+    }
+    char magic[sizeof(CACHE_FILE_MAGIC)];
+    uint64_t keyLength = 0;
+    file.read(magic, sizeof(magic));
+    file.read(reinterpret_cast<char *>(&keyLength), sizeof(keyLength));
+    if (!file || !std::equal(magic, magic + sizeof(magic), CACHE_FILE_MAGIC) || keyLength != cacheKey.size()) {
+        return false;
+    }
+    std::string fileKey(keyLength, '\0');
+    file.read(&fileKey[0], (std::streamsize) keyLength);
+    if (!file || fileKey != cacheKey) {
+        return false;
+    }
+
+    double spanStart;
+    double segmentDuration;
+    uint32_t sizes[4];
+    file.read(reinterpret_cast<char *>(&spanStart), sizeof(spanStart));
+    file.read(reinterpret_cast<char *>(&segmentDuration), sizeof(segmentDuration));
+    file.read(reinterpret_cast<char *>(sizes), sizeof(sizes));
+    if (!file || segmentDuration <= 0.0) {
+        return false;
+    }
+    std::vector<double> fileCoefficients((size_t) sizes[0] * sizes[1] * sizes[2] * sizes[3]);
+    file.read(reinterpret_cast<char *>(fileCoefficients.data()),
+              (std::streamsize) (fileCoefficients.size() * sizeof(double)));
+    if (!file || fileCoefficients.empty()) {
+        return false;
+    }
+
+    this->key = fileKey;
+    this->startTime = spanStart;
+    this->segmentTime = segmentDuration;
+    this->numSegments = sizes[0];
+    this->numBodies = sizes[1];
+    this->numComponents = sizes[2];
+    this->numCoeff = sizes[3];
+    this->coefficients.swap(fileCoefficients);
+    return true;
+}
@@ -0,0 +1,65 @@
+/*
+ ISC License
+
+ Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+
+#ifndef CHEBYSHEV_EPHEMERIS_CACHE_H
+#define CHEBYSHEV_EPHEMERIS_CACHE_H
+
+#include <vector>
+#include <string>
+#include <functional>
+#include <stdint.h>
+
+/*! @brief Piecewise Chebyshev polynomial fits of the states of several bodies over a time span.
+
+ The time span is split into segments of equal duration.  In each segment every state component of every body is
+ interpolated by a Chebyshev series at the Chebyshev nodes of the segment, in the same way as the records of the
+ chebyPosEphem module.  The fits can be saved to and loaded from a compact binary file, which is identified by a key
+ string describing the data the fits were made from.
+ */
+class ChebyshevEphemerisCache {
+public:
+    ChebyshevEphemerisCache();
+    ~ChebyshevEphemerisCache();
+
+    void fit(const std::string &cacheKey, double spanStart, double spanDuration, double segmentDuration,
+             uint32_t degree, uint32_t bodies, uint32_t components,
+             const std::function<void(double time, double *states)> &sampleStates);
+    bool load(const std::string &fileName, const std::string &cacheKey);
+    bool save(const std::string &fileName) const;
+    void clear();
+    bool contains(double time) const;
+    void evaluate(double time, uint32_t body, double *state) const;
+
+    uint32_t getNumBodies() const { return this->numBodies; }                   //!< number of bodies in the cache
+    uint32_t getNumComponents() const { return this->numComponents; }           //!< number of state components per body
+
+private:
+    std::string key;                    //!< description of the data the fits were made from
+    double startTime;                   //!< [s] start time of the first segment
+    double segmentTime;                 //!< [s] duration of a segment
+    uint32_t numSegments;               //!< number of segments
+    uint32_t numBodies;                 //!< number of bodies
+    uint32_t numComponents;             //!< number of state components per body
+    uint32_t numCoeff;                  //!< number of Chebyshev coefficients per component
+    std::vector<double> coefficients;   //!< coefficients ordered by segment, body, component and degree
+};
+
+
+#endif /* CHEBYSHEV_EPHEMERIS_CACHE_H */
@@ -208,6 +208,69 @@ def unitAlbedo(show_plots, planetCase, modelType, useEclipse):
     print("This test uses a relative accuracy value of " + str(errTol * 100) + " percent")
 
     return [testFailCount, ''.join(testMessages)]
+
+
+def test_albedoMultipleInstruments():
+    """
+    **Validation Test Description**
+
+    The albedo of all the instruments of a spacecraft is integrated in a single pass over the planet facets.  This test
+    checks that a module with three instruments returns the same albedo values as three modules with one instrument
+    each, for a rotated planet and a spacecraft with a non-trivial attitude.
+    """
+    testTaskName = "unitTestTask"
+    testProcessName = "unitTestProcess"
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess(testProcessName)
+    testProc.addTask(unitTestSim.CreateNewTask(testTaskName, macros.sec2nano(1.0)))
+
+    planetPositionMsg = messaging.SpicePlanetStateMsgPayload()
+    planetPositionMsg.PositionVector = [0., 0., 0.]
+    planetPositionMsg.PlanetName = 'earth'
+    angle = 40. * macros.D2R
+    planetPositionMsg.J20002Pfix = [[np.cos(angle), np.sin(angle), 0.], [-np.sin(angle), np.cos(angle), 0.],
+                                    [0., 0., 1.]]
+    planetInMsg = messaging.SpicePlanetStateMsg().write(planetPositionMsg)
+
+    sunPositionMsg = messaging.SpicePlanetStateMsgPayload()
+    sunPositionMsg.PositionVector = [-om.AU * 1000., 0.0, 0.0]
+    sunInMsg = messaging.SpicePlanetStateMsg().write(sunPositionMsg)
+
+    scStateMsg = messaging.SCStatesMsgPayload()
+    scStateMsg.r_BN_N = [-2000. * 1000, 6500. * 1000, 1000. * 1000]
+    scStateMsg.sigma_BN = [0.1, -0.2, 0.3]
+    scInMsg = messaging.SCStatesMsg().write(scStateMsg)
+
+    instruments = [(80. * macros.D2R, [0., 1., 0.], [0., 0., 0.]),
+                   (30. * macros.D2R, [-0.5, -1., 0.2], [1., 0., 0.]),
+                   (60. * macros.D2R, [1., 0., 0.], [0., -0.5, 2.])]
+
+    def createAlbedoModule(instrumentList):
+        albModule = albedo.Albedo()
+        albModule.ModelTag = "Albedo"
+        albModule.addPlanetandAlbedoAverageModel(planetInMsg)
+        albModule.eclipseCase = True
+        for fov, nHat_B, r_IB_B in instrumentList:
+            albModule.addInstrumentConfig(fov, nHat_B, r_IB_B)
+        albModule.sunPositionInMsg.subscribeTo(sunInMsg)
+        albModule.spacecraftStateInMsg.subscribeTo(scInMsg)
+        unitTestSim.AddModelToTask(testTaskName, albModule)
+        return albModule
+
+    allModule = createAlbedoModule(instruments)
+    singleModules = [createAlbedoModule([instrument]) for instrument in instruments]
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.TotalSim.SingleStepProcesses()
+
+    for idx, singleModule in enumerate(singleModules):
+        allMsg = allModule.albOutMsgs[idx].read()
+        singleMsg = singleModule.albOutMsgs[0].read()
+        assert allMsg.albedoAtInstrumentMax > 0.
+        for field in ["albedoAtInstrumentMax", "albedoAtInstrument", "AfluxAtInstrumentMax", "AfluxAtInstrument"]:
+            np.testing.assert_allclose(getattr(allMsg, field), getattr(singleMsg, field), rtol=1e-12, atol=0.)
+
+
 if __name__ == "__main__":
     # unitAlbedo(False, 'earth', 'ALBEDO_AVG_EXPLICIT', True)
     unitAlbedo(False, 'mars', 'ALBEDO_AVG_IMPLICIT', False)
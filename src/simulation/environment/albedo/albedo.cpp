@@ -18,6 +18,7 @@
  */
 
 #include "albedo.h"
+#include <algorithm>
 
 /*! Albedo module constructor
  @return void
@@ -219,22 +220,11 @@ void Albedo::addPlanetandAlbedoDataModel(Message<SpicePlanetStateMsgPayload> *pl
 void Albedo::UpdateState(uint64_t CurrentSimNanos)
 {
     this->readMessages();
-    this->albOutData.clear();
-    std::vector<SpicePlanetStateMsgPayload>::iterator planetIt;
-    int idx;
-    for (int instIdx = 0; instIdx < this->albOutMsgs.size(); instIdx++)
+    this->albOutData.assign(this->albOutMsgs.size(), Eigen::Vector4d::Zero());
+    //! - Add the albedo of each planet, evaluating all the instruments in one pass over the planet facets
+    for (long unsigned int idx = 0; idx < this->planetMsgData.size(); idx++)
     {
-        idx = 0;
-        double tmpTot[4] = {};
-        double outData[4] = {};
-        for (planetIt = this->planetMsgData.begin(); planetIt != this->planetMsgData.end(); planetIt++)
-        {
-            this->computeAlbedo(idx, instIdx, *planetIt, albArray.at(idx), outData);
-            tmpTot[0] += outData[0]; tmpTot[1] += outData[1];
-            tmpTot[2] += outData[2]; tmpTot[3] += outData[3];
-            idx++;
-        }
-        this->albOutData.push_back(cArray2EigenMatrixXd(tmpTot, 4, 1));
+        this->computeAlbedo((int) idx, this->planetMsgData.at(idx), albArray.at(idx));
     }
     this->writeMessages(CurrentSimNanos);
 }
@@ -262,7 +252,8 @@ void Albedo::Reset(uint64_t CurrentSimNanos)
     this->ALB.clear();
     this->gdlat.clear(); this->gdlon.clear();
     this->latDiff.clear(); this->lonDiff.clear();
-    this->REQ_planets.clear();  this->RP_planets.clear();
+    this->REQ_planets.clear();  this->RP_planets.clear();  this->RA_planets.clear();
+    this->r_dAP_Ps.clear(); this->rHat_dAP_Ps.clear(); this->dAreas.clear();
     std::vector<SpicePlanetStateMsgPayload>::iterator planetIt;
     for (planetIt = this->planetMsgData.begin(); planetIt != this->planetMsgData.end(); planetIt++)
     {
@@ -271,6 +262,7 @@ void Albedo::Reset(uint64_t CurrentSimNanos)
         std::string plName(planetIt->PlanetName);
         this->getPlanetRadius(plName);  //! - [m] get the planet radius
         this->evaluateAlbedoModel(idx);
+        this->computeFacetGeometry(idx);
         idx++;
     }
 }
@@ -498,36 +490,14 @@ void Albedo::evaluateAlbedoModel(int idx)
     this->numLats.at(idx) = numLat;
 }
 
-/*! This method calculates the albedo at instrument
+/*! This method computes the planet-fixed geometry of the albedo grid facets, which does not change during the
+ simulation.  The facet centers and unit normals lie on the authalic sphere of the planet.
  @return void
  */
-void Albedo::computeAlbedo(int idx, int instIdx, SpicePlanetStateMsgPayload planetMsg, bool albArray, double outData[]) {
-    //! - Letters denoting the frames:
-    //! - P: planet frame
-    //! - B: spacecraft body frame
-    //! - N: inertial frame
-    //! - S: sun (helio) frame
-    //! - I: instrument body frame    
-    auto fov = this->fovs[instIdx];                                         //! - [rad] instrument's field of view half angle
-    auto nHat_B = this->nHat_Bs[instIdx];                                   //! - [-] unit normal vector of the instrument (spacecraft body)
-    auto r_IB_B = this->r_IB_Bs[instIdx];                                   //! - [m] instrument's misalignment vector wrt spacecraft's body frame
-    this->r_PN_N = Eigen::Vector3d(planetMsg.PositionVector);               //! - [m] Planet's position vector (inertial)
-    this->r_SN_N = Eigen::Vector3d(this->sunMsgData.PositionVector);        //! - [m] Sun's position vector (inertial)
-    this->r_BN_N = Eigen::Vector3d(this->scStatesMsgData.r_BN_N);           //! - [m] Spacecraft's position vector (inertial)
-    this->sigma_BN = Eigen::Vector3d(this->scStatesMsgData.sigma_BN);       //! - [m] Spacecraft's MRPs (inertial)
-    Eigen::Matrix3d dcm_BN = this->sigma_BN.toRotationMatrix().transpose(); //! - inertial to sc body transformation
-    this->nHat_N = dcm_BN.transpose() * nHat_B;                             //! - instrument's normal vector (inertial)
-    //! - [m] sun's position wrt planet (inertial)
-    auto r_SP_N = this->r_SN_N - this->r_PN_N;
-    //! - Vectors related to spacecraft
-    auto r_BP_N = this->r_BN_N - this->r_PN_N;        //! - [m] spacecraft's position wrt planet (inertial)
-    //! - Vectors related to instrument
-    auto r_IB_N = dcm_BN.transpose() * r_IB_B;        //! - [m] instrument's position vector wrt spacecraft (inertial)
-    auto r_IP_N = r_IB_N + r_BP_N;                    //! - [m] instrument's position vector wrt planet (inertial)
-    this->rHat_PI_N = -r_IP_N / r_IP_N.norm();        //! - [-] direction vector from instrument to planet (inertial)
-    auto r_SI_N = r_SP_N - r_IP_N;                    //! - [m] sun's position wrt instrument (inertial)
+void Albedo::computeFacetGeometry(int idx)
+{
     //! - Calculate the authalic radius, if the polar radius available
-    double t[3], t_aut[3], e, RA_planet, shadowFactorAtdA;
+    double t[3], t_aut[3], e, RA_planet;
     if (this->RP_planets.at(idx) > 0.0) {
         e = sqrt(1 - pow(this->RP_planets.at(idx), 2) / pow(this->REQ_planets.at(idx), 2));
         t[0] = pow(this->REQ_planets.at(idx), 2) * 0.5;
@@ -543,113 +513,202 @@ void Albedo::computeAlbedo(int idx, int instIdx, SpicePlanetStateMsgPayload plan
         RA_planet = this->REQ_planets.at(idx);
         v3SetZero(t_aut);
     }
+    this->RA_planets.push_back(RA_planet);
+
+    int numLat = this->numLats.at(idx);
+    int numLon = this->numLons.at(idx);
+    Eigen::Vector3d gdlla;
+    double lat1, lat2;
+    this->dAreas[idx] = std::vector < double >(numLat, 0.0);
+    this->r_dAP_Ps[idx] = std::vector < Eigen::Vector3d >(numLat * numLon);
+    this->rHat_dAP_Ps[idx] = std::vector < Eigen::Vector3d >(numLat * numLon);
+    for (int ilat = 0; ilat < numLat; ilat++) {
+        //! - Area of the incremental area, using the authalic latitude of the facet boundaries
+        lat1 = this->gdlat[idx][ilat] + 0.5 * this->latDiff[idx];
+        lat2 = this->gdlat[idx][ilat] - 0.5 * this->latDiff[idx];
+        if (this->RP_planets.at(idx) > 0.0) {
+            //! - Truncated series expansion relating geodetic to authalic latitude
+            lat1 -= t_aut[0] * sin(2.0 * lat1) - t_aut[1] * sin(4.0 * lat1) + t_aut[2] * sin(6.0 * lat1);
+            lat2 -= t_aut[0] * sin(2.0 * lat2) - t_aut[1] * sin(4.0 * lat2) + t_aut[2] * sin(6.0 * lat2);
+        }
+        this->dAreas[idx][ilat] = this->lonDiff[idx] * fabs(sin(lat1) - sin(lat2)) * pow(RA_planet, 2);
+        for (int ilon = 0; ilon < numLon; ilon++) {
+            //! - [m] position of the incremental area (planet-fixed), assuming that the planet is a sphere
+            gdlla[0] = this->gdlat[idx][ilat]; gdlla[1] = this->gdlon[idx][ilon]; gdlla[2] = 0.0;
+            Eigen::Vector3d r_dAP_P = LLA2PCPF(gdlla, RA_planet);
+            this->r_dAP_Ps[idx][ilat * numLon + ilon] = r_dAP_P;
+            this->rHat_dAP_Ps[idx][ilat * numLon + ilon] = r_dAP_P / r_dAP_P.norm();
+        }
+    }
+}
+
+/*! This function finds the half width of the longitude interval of a latitude row that intersects a spherical cap,
+ where the cap contains the directions within capAngle of a direction at latitude capLat.  A margin is added such
+ that rounding errors never exclude a grid point.
+ @return bool false if the latitude row does not intersect the cap
+ */
+static bool capLongitudeHalfWidth(double lat, double capLat, double capAngle, double &halfWidth)
+{
+    const double margin = 1e-6;  // [rad]
+    if (fabs(lat - capLat) > capAngle + margin) {
+        return false;
+    }
+    halfWidth = M_PI;
+    double den = cos(lat) * cos(capLat);
+    if (den > 1e-12) {
+        double cosHalfWidth = (cos(capAngle) - sin(lat) * sin(capLat)) / den;
+        if (cosHalfWidth > -1.0) {
+            halfWidth = std::min(M_PI, acos(std::min(1.0, cosHalfWidth)) + margin);
+        }
+    }
+    return true;
+}
+
+/*! This method calculates the albedo of a planet at all the instrument locations and adds it to the output data.
+ The integration only visits the grid facets in the intersection of the sunlit hemisphere and the planet cap
+ visible from the spacecraft.
+ @return void
+ */
+void Albedo::computeAlbedo(int idx, SpicePlanetStateMsgPayload planetMsg, bool albArray) {
+    //! - Letters denoting the frames:
+    //! - P: planet frame
+    //! - B: spacecraft body frame
+    //! - N: inertial frame
+    //! - S: sun (helio) frame
+    //! - I: instrument body frame
+    double RA_planet = this->RA_planets.at(idx);                            //! - [m] authalic radius of the planet
+    this->r_PN_N = Eigen::Vector3d(planetMsg.PositionVector);               //! - [m] Planet's position vector (inertial)
+    this->r_SN_N = Eigen::Vector3d(this->sunMsgData.PositionVector);        //! - [m] Sun's position vector (inertial)
+    this->r_BN_N = Eigen::Vector3d(this->scStatesMsgData.r_BN_N);           //! - [m] Spacecraft's position vector (inertial)
+    this->sigma_BN = Eigen::Vector3d(this->scStatesMsgData.sigma_BN);       //! - [m] Spacecraft's MRPs (inertial)
+    Eigen::Matrix3d dcm_BN = this->sigma_BN.toRotationMatrix().transpose(); //! - inertial to sc body transformation
+    //! - inertial to planet-fixed transformation, with the same convention as the LLA2PCI() and PCI2LLA() functions
+    Eigen::Matrix3d dcm_PN = cArray2EigenMatrixXd(*planetMsg.J20002Pfix, 3, 3);
+    //! - [m] sun's position wrt planet (inertial)
+    Eigen::Vector3d r_SP_N = this->r_SN_N - this->r_PN_N;
+    //! - Vectors related to spacecraft
+    Eigen::Vector3d r_BP_N = this->r_BN_N - this->r_PN_N;   //! - [m] spacecraft's position wrt planet (inertial)
     //! - Spacecraft's lla position (lat [rad], lon[rad], alti[m])
     auto LLA_B = PCI2LLA(r_BP_N, planetMsg.J20002Pfix, RA_planet);
     this->scLat = LLA_B[0] * 180 / M_PI;
     this->scLon = LLA_B[1] * 180 / M_PI;
-    //! - [m] altitude of the instrument
-    auto alti_I = r_IP_N.norm() - RA_planet;
-    /* Return zeross if the rate of the instrument's altitude
-    to the planet's radius exceeds the specified limit */
-    if (this->altitudeRateLimit >=0 && alti_I / RA_planet > this->altitudeRateLimit) {
-        bskLogger.bskLog(BSK_WARNING, "Albedo Module (computeAlbedo): The rate (altitude to planet's radii) limit is exceeded for the planet (%s) and albedo set to zero.", planetMsg.PlanetName);
-        outData[0] = 0.0;
-        outData[1] = 0.0;
-        outData[2] = 0.0;
-        outData[3] = 0.0;
+
+    //! - Vectors related to the instruments, expressed in the planet-fixed frame of the facet geometry
+    std::vector<int> instIdxs;
+    std::vector<Eigen::Vector3d> r_IP_Ps, nHat_Ps, r_IP_Ns;
+    std::vector<double> cosFovs;
+    double r_IB_max = 0.0;
+    for (int instIdx = 0; instIdx < (int) this->albOutMsgs.size(); instIdx++) {
+        this->nHat_N = dcm_BN.transpose() * this->nHat_Bs[instIdx];          //! - instrument's normal vector (inertial)
+        Eigen::Vector3d r_IB_N = dcm_BN.transpose() * this->r_IB_Bs[instIdx]; //! - [m] instrument's position vector wrt spacecraft (inertial)
+        Eigen::Vector3d r_IP_N = r_IB_N + r_BP_N;                            //! - [m] instrument's position vector wrt planet (inertial)
+        this->rHat_PI_N = -r_IP_N / r_IP_N.norm();                           //! - [-] direction vector from instrument to planet (inertial)
+        //! - [m] altitude of the instrument
+        auto alti_I = r_IP_N.norm() - RA_planet;
+        /* The albedo stays zero if the rate of the instrument's altitude
+        to the planet's radius exceeds the specified limit */
+        if (this->altitudeRateLimit >=0 && alti_I / RA_planet > this->altitudeRateLimit) {
+            bskLogger.bskLog(BSK_WARNING, "Albedo Module (computeAlbedo): The rate (altitude to planet's radii) limit is exceeded for the planet (%s) and albedo set to zero.", planetMsg.PlanetName);
+            continue;
+        }
+        instIdxs.push_back(instIdx);
+        r_IP_Ns.push_back(r_IP_N);
+        r_IP_Ps.push_back(dcm_PN * r_IP_N);
+        nHat_Ps.push_back(dcm_PN * this->nHat_N);
+        cosFovs.push_back(cos(this->fovs[instIdx]));
+        r_IB_max = std::max(r_IB_max, r_IB_N.norm());
+    }
+    if (instIdxs.empty()) {
+        return;
     }
-    else {
-        //! - Variable definitions needed for the albedo calculations
-        Eigen::Vector3d gdlla;
-        Eigen::Vector3d r_dAP_N, r_SdA_N, r_IdA_N;
-        Eigen::Vector3d rHat_dAP_N, sHat_SdA_N, rHat_IdA_N;
-        int ilat = 0, ilon = 0, ImaxIdx = 0, IIdx = 0;  // index
-        double lon1 = 0.0, lon2 = 0.0, lat1 = 0.0, lat2 = 0.0, tempmax = 0.0, tempfov = 0.0;
-        double f1 = 0.0, f2 = 0.0, f3 = 0.0;
-        double dArea = 0.0, alb_I = 0.0, alb_Imax = 0.0;
-        std::vector< double > albLon1, albLat1;
-        for (ilon = 0; ilon < this->numLons.at(idx); ilon++) {
-            lon1 = this->gdlon[idx][ilon] + 0.5 * this->lonDiff[idx];
-            lon2 = this->gdlon[idx][ilon] - 0.5 * this->lonDiff[idx];
-            for (ilat = 0; ilat < this->numLats.at(idx); ilat++) {
-                lat1 = this->gdlat[idx][ilat] + 0.5 * this->latDiff[idx];
-                lat2 = this->gdlat[idx][ilat] - 0.5 * this->latDiff[idx];
-                if (this->RP_planets.at(idx) > 0.0) {
-                    //! - Truncated series expansion relating geodetic to authalic latitude
-                    lat1 -= t_aut[0] * sin(2.0 * lat1) - t_aut[1] * sin(4.0 * lat1) + t_aut[2] * sin(6.0 * lat1);
-                    lat2 -= t_aut[0] * sin(2.0 * lat2) - t_aut[1] * sin(4.0 * lat2) + t_aut[2] * sin(6.0 * lat2);
+    int numInst = (int) instIdxs.size();
+    std::vector<double> alb_Imax(numInst, 0.0), alb_I(numInst, 0.0);
+
+    //! - Sunlit cap (f1 > 0) and the cap visible from all instruments (f2 > 0) in the planet-fixed frame
+    Eigen::Vector3d r_SP_P = dcm_PN * r_SP_N;
+    Eigen::Vector3d r_BP_P = dcm_PN * r_BP_N;
+    double cosCapSun = RA_planet / r_SP_P.norm();
+    double cosCapView = (RA_planet - r_IB_max) / r_BP_P.norm();
+    if (cosCapSun < 1.0 && cosCapView < 1.0) {
+        double capAngleSun = acos(std::max(-1.0, cosCapSun));
+        double capAngleView = acos(std::max(-1.0, cosCapView));
+        double capLatSun = atan2(r_SP_P[2], sqrt(pow(r_SP_P[0], 2) + pow(r_SP_P[1], 2)));
+        double capLonSun = atan2(r_SP_P[1], r_SP_P[0]);
+        double capLatView = atan2(r_BP_P[2], sqrt(pow(r_BP_P[0], 2) + pow(r_BP_P[1], 2)));
+        double capLonView = atan2(r_BP_P[1], r_BP_P[0]);
+
+        int numLat = this->numLats.at(idx);
+        int numLon = this->numLons.at(idx);
+        double halfLon = numLon / 2;
+        const std::vector<Eigen::Vector3d> &r_dAP_P = this->r_dAP_Ps[idx];
+        const std::vector<Eigen::Vector3d> &rHat_dAP_P = this->rHat_dAP_Ps[idx];
+        Eigen::Vector3d r_SdA_P, r_IdA_P, sHat_SdA_P, rHat_IdA_P;
+        double halfWidthSun, halfWidthView, halfWidth, capLon, f1, f2, f3, dArea, albCoeff, shadowFactorAtdA, tempmax, tempfov;
+        int jStart, jEnd, k;
+        bool shadowFactorComputed;
+        for (int ilat = 0; ilat < numLat; ilat++) {
+            //! - Longitude interval of the latitude row within both caps
+            if (!capLongitudeHalfWidth(this->gdlat[idx][ilat], capLatSun, capAngleSun, halfWidthSun) ||
+                !capLongitudeHalfWidth(this->gdlat[idx][ilat], capLatView, capAngleView, halfWidthView)) {
+                continue;
+            }
+            halfWidth = std::min(halfWidthSun, halfWidthView);
+            capLon = halfWidthSun < halfWidthView ? capLonSun : capLonView;
+            jStart = (int) floor((capLon - halfWidth) / this->lonDiff[idx] + halfLon - 0.5);
+            jEnd = (int) ceil((capLon + halfWidth) / this->lonDiff[idx] + halfLon - 0.5);
+            if (jEnd - jStart + 1 >= numLon || numLon % 2) {
+                jStart = 0;
+                jEnd = numLon - 1;
+            }
+            dArea = this->dAreas[idx][ilat];
+            for (int jlon = jStart; jlon <= jEnd; jlon++) {
+                int ilon = ((jlon % numLon) + numLon) % numLon;
+                k = ilat * numLon + ilon;
+                //! - Sunlit portion of the planet
+                r_SdA_P = r_SP_P - r_dAP_P[k];          //! - [m] position vector from dA to Sun
+                sHat_SdA_P = r_SdA_P / r_SdA_P.norm();  //! - [-] sun direction vector from dA
+                f1 = rHat_dAP_P[k].dot(sHat_SdA_P);
+                if (f1 <= 0) {
+                    continue;
                 }
-                gdlla[0] = this->gdlat[idx][ilat]; gdlla[1] = this->gdlon[idx][ilon]; gdlla[2] = 0.0;
-                //! - Vectors related to incremental area
-                //! - [m] position of the incremental area (inertial)
-                r_dAP_N = LLA2PCI(gdlla, planetMsg.J20002Pfix, RA_planet); //! - Assumes that the planet is a sphere.
-                r_SdA_N = r_SP_N - r_dAP_N;            //! - [m] position vector from dA to Sun (inertial)
-                r_IdA_N = r_IP_N - r_dAP_N;            //! - [m] position vector from dA to instrument (inertial)
-                rHat_dAP_N = r_dAP_N / r_dAP_N.norm(); //! - [-] -assuming- dA normal vector (inertial) 
-                sHat_SdA_N = r_SdA_N / r_SdA_N.norm(); //! - [-] sun direction vector from dA (inertial)
-                rHat_IdA_N = r_IdA_N / r_IdA_N.norm(); //! - [-] dA to instrument direction vector (inertial)
-                //! - Portions of the planet
-                f1 = rHat_dAP_N.dot(sHat_SdA_N);       //! - for sunlit
-                f2 = rHat_dAP_N.dot(rHat_IdA_N);       //! - for instrument's max fov
-                f3 = this->nHat_N.dot(-rHat_IdA_N);    //! - for instrument's config fov
-                //! - Detect the sunlit region of the planet seen by the instrument
-                if (f1 > 0 && f2 > 0) {
-                    //! - Sunlit portion of the planet seen by the instrument's position (max)
-                    //! - Shadow factor at dA (optional)
-                    shadowFactorAtdA = this->shadowFactorAtdA;
-                    if (this->eclipseCase) { shadowFactorAtdA = computeEclipseAtdA(RA_planet, r_dAP_N, r_SP_N); }
-                    //! - Area of the incremental area
-                    dArea = (fabs(lon1 - lon2) * fabs(sin(lat1) - sin(lat2)) * pow(r_dAP_N.norm(), 2));
-                    //! - Maximum albedo flux ratio at instrument's position [-]
-                    tempmax = f1 * f2 * dArea / (pow(r_IdA_N.norm(), 2) * M_PI);
-                    //if (this->ALB_data >= 0.0) { tempmax = this->ALB_data * tempmax; }
-                    if (albArray == false) {
-                        tempmax = this->ALB_avgs.at(idx) * tempmax;
+                albCoeff = albArray ? this->ALB[idx][ilat][ilon] : this->ALB_avgs.at(idx);
+                shadowFactorComputed = false;
+                shadowFactorAtdA = this->shadowFactorAtdA;
+                for (int i = 0; i < numInst; i++) {
+                    r_IdA_P = r_IP_Ps[i] - r_dAP_P[k];          //! - [m] position vector from dA to instrument
+                    double r_IdA_mag = r_IdA_P.norm();
+                    rHat_IdA_P = r_IdA_P / r_IdA_mag;           //! - [-] dA to instrument direction vector
+                    f2 = rHat_dAP_P[k].dot(rHat_IdA_P);        //! - for instrument's max fov
+                    if (f2 <= 0) {
+                        continue;
                     }
-                    else {
-                        tempmax = this->ALB[idx][ilat][ilon] * tempmax;
+                    //! - Shadow factor at dA (optional)
+                    if (this->eclipseCase && !shadowFactorComputed) {
+                        shadowFactorAtdA = computeEclipseAtdA(RA_planet, r_dAP_P[k], r_SP_P);
+                        shadowFactorComputed = true;
                     }
-                    alb_Imax = alb_Imax + tempmax * shadowFactorAtdA;
-                    ImaxIdx++;
-                    if (f3 >= cos(fov)) {
-                        //! - Sunlit portion of the planet seen by the instrument (fov)
-                        //! - Albedo flux ratio at instrument's position [-]
-                        tempfov = f1 * f2 * f3 * dArea / (pow(r_IdA_N.norm(), 2) * M_PI);
-                        if (albArray == false) {
-                            tempfov = this->ALB_avgs.at(idx) * tempfov;
-                        }
-                        else {
-                            tempfov = this->ALB[idx][ilat][ilon] * tempfov;
-                        }
-                        alb_I = alb_I + tempfov * shadowFactorAtdA;
-                        albLon1.push_back(this->gdlon[idx][ilon] * 180 / M_PI);
-                        albLat1.push_back(this->gdlat[idx][ilat] * 180 / M_PI);
-                        IIdx++;
+                    //! - Maximum albedo flux ratio at instrument's position [-]
+                    tempmax = albCoeff * f1 * f2 * dArea / (pow(r_IdA_mag, 2) * M_PI);
+                    alb_Imax[i] += tempmax * shadowFactorAtdA;
+                    f3 = nHat_Ps[i].dot(-rHat_IdA_P);          //! - for instrument's config fov
+                    if (f3 >= cosFovs[i]) {
+                        //! - Albedo flux ratio at instrument's position within the fov [-]
+                        tempfov = albCoeff * f1 * f2 * f3 * dArea / (pow(r_IdA_mag, 2) * M_PI);
+                        alb_I[i] += tempfov * shadowFactorAtdA;
                     }
                 }
             }
         }
-        //! - The sunlit area seen by the instrument fov
-        auto num1 = new double[IIdx];
-        auto num2 = new double[IIdx];
-        for (int i = 0; i < IIdx; i++) {
-            num1[i] = albLon1[i];
-            num2[i] = albLat1[i];
-        }
-        this->albLon = cArray2EigenMatrixXd(num1, 1, IIdx);
-        this->albLat = cArray2EigenMatrixXd(num2, 1, IIdx);
-        //! - Total albedo flux ratio [-]
-        auto albedoAtInstrumentMax = alb_Imax;
-        auto albedoAtInstrument = alb_I;
+    }
+
+    //! - Add the albedo ratio and flux of this planet to the instrument outputs
+    for (int i = 0; i < numInst; i++) {
         //! - Compute the solar flux value at instrument [W/m^2]
+        Eigen::Vector3d r_SI_N = r_SP_N - r_IP_Ns[i];  //! - [m] sun's position wrt instrument (inertial)
         this->SfluxAtInstrument = SOLAR_FLUX_EARTH * pow(AU * 1000, 2) / pow((r_SI_N.norm()), 2);
-        //! - Total albedo flux [W/m^2]
-        auto AfluxAtInstrumentMax = (this->SfluxAtInstrument) * alb_Imax;
-        auto AfluxAtInstrument = (this->SfluxAtInstrument) * alb_I;
-        outData[0] = (albedoAtInstrumentMax);
-        outData[1] = (albedoAtInstrument);
-        outData[2] = (AfluxAtInstrumentMax);
-        outData[3] = (AfluxAtInstrument);
+        Eigen::Vector4d planetAlbedo(alb_Imax[i], alb_I[i],
+                                     this->SfluxAtInstrument * alb_Imax[i], this->SfluxAtInstrument * alb_I[i]);
+        this->albOutData.at(instIdxs[i]) += planetAlbedo;
     }
     return;
 }
@@ -75,7 +75,8 @@ private:
     void writeMessages(uint64_t CurrentSimNanos);             //!< writes the outpus messages
     void getPlanetRadius(std::string planetSpiceName);        //!< gets the planet's radius
     void evaluateAlbedoModel(int idx);                        //!< evaluates the ALB model
-    void computeAlbedo(int idx, int instIdx, SpicePlanetStateMsgPayload planetMsg, bool AlbArray, double outData[]); //!< computes the albedo at instrument's location
+    void computeFacetGeometry(int idx);                       //!< computes the planet-fixed facet centers, normals and areas
+    void computeAlbedo(int idx, SpicePlanetStateMsgPayload planetMsg, bool AlbArray); //!< adds the albedo of a planet at all instrument locations
     double computeEclipseAtdA(double Rplanet, Eigen::Vector3d r_dAP_N, Eigen::Vector3d r_SP_N); //!< computes the shadow factor at dA
 
 public:
@@ -99,7 +100,7 @@ private:
     std::vector<std::string> modelNames;          //!< albedo model names
     std::vector<double> ALB_avgs;                 //!< [-] albedo average value vector for each planet defined
     std::vector<double> REQ_planets, RP_planets;  //!< [m] equatorial and polar radius of the planets
-    Eigen::MatrixXd albLon, albLat;          //!< sunlit area seen by the instroment fov
+    std::vector<double> RA_planets;               //!< [m] authalic radius of the planets
     double scLon, scLat;                     //!< [deg, deg] spaceccraft footprint
     std::vector<int> numLats, numLons;       //!< [-] vector of latitude and longitude number
     double albedoAtInstrument;               //!< [-] total albedo at instrument location
@@ -116,6 +117,9 @@ private:
     std::map < int, double > latDiff;               //!< [rad] latitude difference between grid points
     std::map < int, double > lonDiff;               //!< [rad] longitude difference between grid points
     std::map < int, std::vector < std::vector < double > > > ALB; //!< [-] ALB coefficients
+    std::map < int, std::vector < Eigen::Vector3d > > r_dAP_Ps;     //!< [m] facet centers (planet-fixed), indexed by ilat * numLon + ilon
+    std::map < int, std::vector < Eigen::Vector3d > > rHat_dAP_Ps;  //!< [-] facet unit normals (planet-fixed), indexed by ilat * numLon + ilon
+    std::map < int, std::vector < double > > dAreas;                 //!< [m^2] facet area of each latitude row
     bool readFile;                          //!< defines if there is a need for reading an albedo model file or not
     std::vector<bool> albArray;             //!< defines if the albedo data is formatted as array or not
     Eigen::Vector3d r_PN_N;                 //!< [m] planet position (inertial)
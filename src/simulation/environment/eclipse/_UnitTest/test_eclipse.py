@@ -27,6 +27,7 @@
 
 import pytest
 import os
+import numpy as np
 from Basilisk.utilities import SimulationBaseClass
 from Basilisk.utilities import unitTestSupport
 from Basilisk.simulation import spacecraft
@@ -291,5 +292,86 @@ def unitEclipse(show_plots, eclipseCondition, planet):
 
     return [testFailCount, ''.join(testMessages)]
 
+def test_eclipseSkipAhead():
+    """
+    Checks that skipping the shadow evaluation of a spacecraft far from the shadow cones does not change the shadow
+    factors, and that the eclipse event message reports the entry and exit times of the eclipse.  A spacecraft on a
+    geostationary orbit is propagated for half a day with the sun in the equatorial plane.
+    """
+    testTaskName = "unitTestTask"
+    testProcessName = "unitTestProcess"
+    testTaskRate = macros.sec2nano(60.)
+
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess(testProcessName)
+    testProc.addTask(unitTestSim.CreateNewTask(testTaskName, testTaskRate))
+
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraft"
+    unitTestSim.AddModelToTask(testTaskName, scObject)
+
+    gravFactory = simIncludeGravBody.gravBodyFactory()
+    earth = gravFactory.createEarth()
+    earth.isCentralBody = True
+    scObject.gravField.gravBodies = spacecraft.GravBodyVector(list(gravFactory.gravBodies.values()))
+
+    oe = orbitalMotion.ClassicElements()
+    oe.a = 42164.  # km
+    oe.e = 0.0
+    oe.i = 0.0
+    oe.Omega = 0.0
+    oe.omega = 0.0
+    oe.f = 90. * macros.D2R
+    r_N_0, v_N_0 = orbitalMotion.elem2rv(orbitalMotion.MU_EARTH, oe)
+    scObject.hub.r_CN_NInit = r_N_0 * 1000  # convert to meters
+    scObject.hub.v_CN_NInit = v_N_0 * 1000  # convert to meters
+
+    sunMsgData = messaging.SpicePlanetStateMsgPayload()
+    sunMsgData.PositionVector = [-orbitalMotion.AU * 1000., 0., 0.]
+    sunMsgData.PlanetName = "sun"
+    sunMsg = messaging.SpicePlanetStateMsg().write(sunMsgData)
+    earthMsgData = messaging.SpicePlanetStateMsgPayload()
+    earthMsgData.PositionVector = [0., 0., 0.]
+    earthMsgData.PlanetName = "earth"
+    earthMsg = messaging.SpicePlanetStateMsg().write(earthMsgData)
+
+    eclipseObjects = []
+    dataLogs = []
+    eventLogs = []
+    for skipAheadMaxTime in [0., 3600.]:
+        eclipseObject = eclipse.Eclipse()
+        eclipseObject.ModelTag = "eclipse"
+        eclipseObject.sunInMsg.subscribeTo(sunMsg)
+        eclipseObject.addPlanetToModel(earthMsg)
+        eclipseObject.addSpacecraftToModel(scObject.scStateOutMsg)
+        eclipseObject.skipAheadMaxTime = skipAheadMaxTime
+        unitTestSim.AddModelToTask(testTaskName, eclipseObject)
+        dataLogs.append(eclipseObject.eclipseOutMsgs[0].recorder())
+        eventLogs.append(eclipseObject.eclipseEventOutMsgs[0].recorder())
+        unitTestSim.AddModelToTask(testTaskName, dataLogs[-1])
+        unitTestSim.AddModelToTask(testTaskName, eventLogs[-1])
+        eclipseObjects.append(eclipseObject)
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.ConfigureStopTime(macros.hour2nano(12.))
+    unitTestSim.ExecuteSimulation()
+
+    shadowFactor = dataLogs[0].shadowFactor
+    times = dataLogs[0].times()
+    np.testing.assert_array_equal(dataLogs[1].shadowFactor, shadowFactor)
+
+    # a single eclipse of about 70 minutes around the anti-sun point of the orbit
+    shadowed = np.where(shadowFactor < 1.0)[0]
+    assert len(shadowed) > 0
+    assert np.all(np.diff(shadowed) == 1)
+    for eventLog in eventLogs:
+        assert eventLog.numEclipses[-1] == 1
+        assert eventLog.inEclipse[-1] == 0
+        assert eventLog.entryTime[-1] == times[shadowed[0]]
+        assert eventLog.exitTime[-1] == times[shadowed[-1] + 1]
+        assert eventLog.minShadowFactor[-1] == np.min(shadowFactor)
+        np.testing.assert_array_equal(eventLog.inEclipse, shadowFactor < 1.0)
+
+
 if __name__ == "__main__":
     unitEclipse(False, "annular", "mars")
@@ -19,12 +19,16 @@
 
 #include "eclipse.h"
 #include <iostream>
+#include <algorithm>
+#include <limits>
 #include "architecture/utilities/astroConstants.h"
 #include "architecture/utilities/avsEigenSupport.h"
+#include "architecture/utilities/macroDefinitions.h"
 
 
 Eclipse::Eclipse()
 {
+    this->skipAheadMaxTime = 0.0;
     return;
 }
 
@@ -32,6 +36,7 @@ Eclipse::~Eclipse()
 {
     for (long unsigned int c=0; c<this->eclipseOutMsgs.size(); c++) {
         delete this->eclipseOutMsgs.at(c);
+        delete this->eclipseEventOutMsgs.at(c);
     }
     return;
 }
@@ -55,15 +60,29 @@ void Eclipse::Reset(uint64_t CurrenSimNanos)
         bskLogger.bskLog(BSK_ERROR, "Eclipse: planetInMsgs is empty.  Must use addPlanetToModel() to add at least one planet.");
     }
 
+    // evaluate all spacecraft at the first update and clear the eclipse events
+    for (long unsigned int c = 0; c < this->eclipseEvents.size(); c++) {
+        this->nextEvaluationTimes.at(c) = 0;
+        this->eclipseEvents.at(c) = {};
+        this->eclipseEvents.at(c).minShadowFactor = 1.0;
+    }
+    this->planetNames.assign(this->planetInMsgs.size(), "");
+    this->planetRadii.assign(this->planetInMsgs.size(), 0.0);
 }
 
 /*! This method reads the spacecraft state, spice planet states and the sun position from the messaging system.
+ Only the states of the spacecraft that are evaluated at this time are read.
+ @param CurrentSimNanos The current clock time for the simulation
  @return void
  */
-void Eclipse::readInputMessages()
+void Eclipse::readInputMessages(uint64_t CurrentSimNanos)
 {
+    this->evaluatedSpacecraft.clear();
     for (long unsigned int c = 0; c<this->positionInMsgs.size(); c++){
-        this->scStateBuffer.at(c) = this->positionInMsgs.at(c)();
+        if (CurrentSimNanos >= this->nextEvaluationTimes.at(c)) {
+            this->scStateBuffer.at(c) = this->positionInMsgs.at(c)();
+            this->evaluatedSpacecraft.push_back((int) c);
+        }
     }
 
     this->sunInMsgState = this->sunInMsg();
@@ -73,6 +92,19 @@ void Eclipse::readInputMessages()
     }
 }
 
+/*! This method looks up the radius of each planet when the planet name of the input message changes.
+ @return void
+ */
+void Eclipse::updatePlanetRadii()
+{
+    for (long unsigned int c = 0; c < this->planetBuffer.size(); c++) {
+        if (this->planetNames.at(c) != this->planetBuffer[c].PlanetName) {
+            this->planetNames.at(c) = this->planetBuffer[c].PlanetName;
+            this->planetRadii.at(c) = this->getPlanetEquatorialRadius(this->planetNames.at(c));
+        }
+    }
+}
+
 /*! This method takes the computed shadow factors and outputs them to the
  messaging system.
  @param CurrentClock The current simulation time (used for time stamping)
@@ -84,104 +116,186 @@ void Eclipse::writeOutputMessages(uint64_t CurrentClock)
         EclipseMsgPayload tmpEclipseMsg = {};
         tmpEclipseMsg.shadowFactor = this->eclipseShadowFactors.at(c);
         this->eclipseOutMsgs.at(c)->write(&tmpEclipseMsg, this->moduleID, CurrentClock);
+        this->eclipseEventOutMsgs.at(c)->write(&this->eclipseEvents.at(c), this->moduleID, CurrentClock);
+    }
+}
+
+/*! This method updates the eclipse entry and exit event data of a spacecraft with its current shadow factor.
+ @param scIdx The spacecraft index
+ @param CurrentClock The current simulation time
+ @return void
+ */
+void Eclipse::updateEclipseEvent(int scIdx, uint64_t CurrentClock)
+{
+    EclipseEventMsgPayload &event = this->eclipseEvents.at(scIdx);
+    double shadowFactor = this->eclipseShadowFactors.at(scIdx);
+    if (shadowFactor < 1.0) {
+        if (!event.inEclipse) {
+            event.inEclipse = 1;
+            event.numEclipses++;
+            event.entryTime = CurrentClock;
+            event.minShadowFactor = shadowFactor;
+        } else {
+            event.minShadowFactor = std::min(event.minShadowFactor, shadowFactor);
+        }
+    } else if (event.inEclipse) {
+        event.inEclipse = 0;
+        event.exitTime = CurrentClock;
     }
 }
 
 /*! This method governs the calculation and checking for eclipse
- conditions.
+ conditions.  All the spacecraft are first tested against the penumbra cone of each planet.  The shadow factor is
+ only computed for the spacecraft within a cone, and a spacecraft far from all cones is not evaluated again until
+ it could have reached one of them.
  @param CurrentSimNanos The current clock time for the simulation
  @return void
  */
 void Eclipse::UpdateState(uint64_t CurrentSimNanos)
 {
-    this->readInputMessages();
-    
+    this->readInputMessages(CurrentSimNanos);
+    this->updatePlanetRadii();
+
     // A lot of different vectors here. The below letters denote frames
     // P: planet frame
     // B: spacecraft body frame
     // N: inertial frame
     // H: sun (helio) frame
+    // A: apex of the planet penumbra cone
+    Eigen::Vector3d r_HN_N(this->sunInMsgState.PositionVector); // r_sun
+    Eigen::Vector3d v_HN_N(this->sunInMsgState.VelocityVector); // v_sun
+    const double coneAngleMargin = 1e-6; // [rad] margin such that rounding errors never skip a shadowed spacecraft
+
+    //! - Spacecraft that are not evaluated at this time are known to be outside of all shadow cones
+    std::fill(this->eclipseShadowFactors.begin(), this->eclipseShadowFactors.end(), 1.0);
+    this->inShadowCone.assign(this->scStateBuffer.size(), false);
+    this->timeToShadowCone.assign(this->scStateBuffer.size(), std::numeric_limits<double>::infinity());
+
+    //! - Test all evaluated spacecraft against the penumbra cone of each planet
+    for (long unsigned int idx = 0; idx < this->planetBuffer.size(); idx++) {
+        Eigen::Vector3d r_PN_N = cArray2EigenVector3d(this->planetBuffer[idx].PositionVector);
+        Eigen::Vector3d v_PN_N = cArray2EigenVector3d(this->planetBuffer[idx].VelocityVector);
+        Eigen::Vector3d s_HP_N = r_HN_N - r_PN_N;
+        double planetRadius = this->planetRadii.at(idx);
+        double coneAngle = safeAsin((REQ_SUN*1000 + planetRadius)/s_HP_N.norm()) + coneAngleMargin; // penumbra cone half angle
+        double cosConeAngle = cos(coneAngle);
+        double sinConeAngle = sin(coneAngle);
+        Eigen::Vector3d uHat_N = -s_HP_N/s_HP_N.norm();                // shadow axis direction
+        double apexDistance = planetRadius/sin(coneAngle - coneAngleMargin);
+        Eigen::Vector3d r_AN_N = r_PN_N - apexDistance*uHat_N;
+        // rate at which the shadow axis rotates due to the relative motion of sun and planet
+        double axisRate = s_HP_N.cross(v_HN_N - v_PN_N).norm()/s_HP_N.squaredNorm();
+
+        for (int scIdx : this->evaluatedSpacecraft) {
+            Eigen::Vector3d r_BA_N = cArray2EigenVector3d(this->scStateBuffer[scIdx].r_BN_N) - r_AN_N;
+            double r_BA = r_BA_N.norm();
+            // cosine of the angle to the shadow axis, folded such that the cone continued through its apex is included
+            double cosAxisAngle = fabs(r_BA_N.dot(uHat_N))/r_BA;
+            if (cosAxisAngle >= cosConeAngle) {
+                this->inShadowCone[scIdx] = true;
+            } else if (this->skipAheadMaxTime > 0.0) {
+                // time for the spacecraft to reach the cone surface at the current relative speed
+                double sinAxisAngle = sqrt(1.0 - cosAxisAngle*cosAxisAngle);
+                double coneDistance = r_BA*(sinAxisAngle*cosConeAngle - cosAxisAngle*sinConeAngle);
+                Eigen::Vector3d v_BP_N = cArray2EigenVector3d(this->scStateBuffer[scIdx].v_BN_N) - v_PN_N;
+                double approachSpeed = v_BP_N.norm() + axisRate*(apexDistance + r_BA);
+                this->timeToShadowCone[scIdx] = std::min(this->timeToShadowCone[scIdx], coneDistance/approachSpeed);
+            }
+        }
+    }
+
+    //! - Compute the shadow factors within the shadow cones and schedule the next evaluation of the others
+    for (int scIdx : this->evaluatedSpacecraft) {
+        if (this->inShadowCone[scIdx]) {
+            this->eclipseShadowFactors.at(scIdx) = this->computeShadowFactor(this->scStateBuffer[scIdx]);
+        } else if (this->skipAheadMaxTime > 0.0) {
+            // half of the time to the cone allows the approach speed to double before the next evaluation
+            double skipTime = std::min(this->skipAheadMaxTime, 0.5*this->timeToShadowCone[scIdx]);
+            this->nextEvaluationTimes.at(scIdx) = CurrentSimNanos + (uint64_t) (skipTime*SEC2NANO);
+        }
+    }
+
+    for (long unsigned int c = 0; c < this->scStateBuffer.size(); c++) {
+        this->updateEclipseEvent((int) c, CurrentSimNanos);
+    }
+    this->writeOutputMessages(CurrentSimNanos);
+}
+
+/*! This method computes the shadow factor of a spacecraft due to the closest planet.
+ @param scState The spacecraft state
+ @return double The shadow factor, 1.0 representing no eclipse
+ */
+double Eclipse::computeShadowFactor(SCStatesMsgPayload &scState)
+{
     Eigen::Vector3d r_PN_N(0.0, 0.0, 0.0); // r_planet
     Eigen::Vector3d r_HN_N(this->sunInMsgState.PositionVector); // r_sun
     Eigen::Vector3d r_BN_N(0.0, 0.0, 0.0); // r_sc
     Eigen::Vector3d s_BP_N(0.0, 0.0, 0.0); // s_sc wrt planet
     Eigen::Vector3d s_HP_N(0.0, 0.0, 0.0); // s_sun wrt planet
     Eigen::Vector3d r_HB_N(0.0, 0.0, 0.0); // r_sun wrt sc
-    std::vector<SCStatesMsgPayload>::iterator scIt;
     std::vector<SpicePlanetStateMsgPayload>::iterator planetIt;
 
-    
-    // Index to assign the shadowFactor for each body position (S/C)
-    // being tracked
-    int scIdx = 0;
-    
-    for(scIt = this->scStateBuffer.begin(); scIt != this->scStateBuffer.end(); scIt++)
+    double tmpShadowFactor = 1.0; // 1.0 means 100% illumination (no eclipse)
+    double eclipsePlanetDistance = 0.0;
+    int64_t eclipsePlanetKey = -1;
+    r_BN_N = cArray2EigenVector3d(scState.r_BN_N);
+
+    // Find the closest planet if there is one
+    int idx = 0;
+    for(planetIt = this->planetBuffer.begin(); planetIt != this->planetBuffer.end(); planetIt++)
     {
-        double tmpShadowFactor = 1.0; // 1.0 means 100% illumination (no eclipse)
-        double eclipsePlanetDistance = 0.0;
-        int64_t eclipsePlanetKey = -1;
-        r_BN_N = cArray2EigenVector3d(scIt->r_BN_N);
-        
-        // Find the closest planet if there is one
-        int idx = 0;
-        for(planetIt = this->planetBuffer.begin(); planetIt != this->planetBuffer.end(); planetIt++)
-        {
-            r_PN_N = cArray2EigenVector3d(planetIt->PositionVector);
-            s_HP_N = r_HN_N - r_PN_N;
-            r_HB_N = r_HN_N - r_BN_N;
-            s_BP_N = r_BN_N - r_PN_N;
-
-            // If spacecraft is closer to sun than planet
-            // then eclipse not possible
-            if (r_HB_N.norm() < s_HP_N.norm()) {
-                break;
-            }
-            
-            // Find the closest planet and save its distance and vector index slot
-            if (idx == 0) {
-                eclipsePlanetDistance = s_BP_N.norm();
-                eclipsePlanetKey = idx;
-            } else if (s_BP_N.norm() < eclipsePlanetDistance) {
-                eclipsePlanetDistance = s_BP_N.norm();
-                eclipsePlanetKey = idx;
-            }
-            idx++;
+        r_PN_N = cArray2EigenVector3d(planetIt->PositionVector);
+        s_HP_N = r_HN_N - r_PN_N;
+        r_HB_N = r_HN_N - r_BN_N;
+        s_BP_N = r_BN_N - r_PN_N;
+
+        // If spacecraft is closer to sun than planet
+        // then eclipse not possible
+        if (r_HB_N.norm() < s_HP_N.norm()) {
+            break;
         }
-        
-        // If planetkey is not -1 then we have a planet for which
-        // we compute the eclipse conditions
-        if (eclipsePlanetKey >= 0) {
-            r_PN_N = cArray2EigenVector3d(this->planetBuffer[eclipsePlanetKey].PositionVector);
-            s_BP_N = r_BN_N - r_PN_N;
-            r_HB_N = r_HN_N - r_BN_N;
-            s_HP_N = r_HN_N - r_PN_N;
-            
-            double s = s_BP_N.norm();
-            std::string plName(this->planetBuffer[eclipsePlanetKey].PlanetName);
-            double planetRadius = this->getPlanetEquatorialRadius(plName);
-            double f_1 = safeAsin((REQ_SUN*1000 + planetRadius)/s_HP_N.norm());
-            double f_2 = safeAsin((REQ_SUN*1000 - planetRadius)/s_HP_N.norm());
-            double s_0 = (-s_BP_N.dot(s_HP_N))/s_HP_N.norm();
-            double c_1 = s_0 + planetRadius/sin(f_1);
-            double c_2 = s_0 - planetRadius/sin(f_2);
-            double l = sqrt(s*s - s_0*s_0);
-            double l_1 = c_1*tan(f_1);
-            double l_2 = c_2*tan(f_2);
-            
-            if (fabs(l) < fabs(l_2)) {
-                if (c_2 < 0) { // total eclipse
-                    tmpShadowFactor = this->computePercentShadow(planetRadius, r_HB_N, s_BP_N);
-                } else { //c_2 > 0 // annular
-                    tmpShadowFactor = this->computePercentShadow(planetRadius, r_HB_N, s_BP_N);
-                }
-            } else if (fabs(l) < fabs(l_1)) { // partial
+
+        // Find the closest planet and save its distance and vector index slot
+        if (idx == 0) {
+            eclipsePlanetDistance = s_BP_N.norm();
+            eclipsePlanetKey = idx;
+        } else if (s_BP_N.norm() < eclipsePlanetDistance) {
+            eclipsePlanetDistance = s_BP_N.norm();
+            eclipsePlanetKey = idx;
+        }
+        idx++;
+    }
+
+    // If planetkey is not -1 then we have a planet for which
+    // we compute the eclipse conditions
+    if (eclipsePlanetKey >= 0) {
+        r_PN_N = cArray2EigenVector3d(this->planetBuffer[eclipsePlanetKey].PositionVector);
+        s_BP_N = r_BN_N - r_PN_N;
+        r_HB_N = r_HN_N - r_BN_N;
+        s_HP_N = r_HN_N - r_PN_N;
+
+        double s = s_BP_N.norm();
+        double planetRadius = this->planetRadii.at(eclipsePlanetKey);
+        double f_1 = safeAsin((REQ_SUN*1000 + planetRadius)/s_HP_N.norm());
+        double f_2 = safeAsin((REQ_SUN*1000 - planetRadius)/s_HP_N.norm());
+        double s_0 = (-s_BP_N.dot(s_HP_N))/s_HP_N.norm();
+        double c_1 = s_0 + planetRadius/sin(f_1);
+        double c_2 = s_0 - planetRadius/sin(f_2);
+        double l = sqrt(s*s - s_0*s_0);
+        double l_1 = c_1*tan(f_1);
+        double l_2 = c_2*tan(f_2);
+
+        if (fabs(l) < fabs(l_2)) {
+            if (c_2 < 0) { // total eclipse
+                tmpShadowFactor = this->computePercentShadow(planetRadius, r_HB_N, s_BP_N);
+            } else { //c_2 > 0 // annular
                 tmpShadowFactor = this->computePercentShadow(planetRadius, r_HB_N, s_BP_N);
             }
+        } else if (fabs(l) < fabs(l_1)) { // partial
+            tmpShadowFactor = this->computePercentShadow(planetRadius, r_HB_N, s_BP_N);
         }
-        this->eclipseShadowFactors.at(scIdx) = tmpShadowFactor;
-        scIdx++;
     }
-    this->writeOutputMessages(CurrentSimNanos);
+    return tmpShadowFactor;
 }
 
 /*! This method computes the fraction of sunlight given an eclipse.
@@ -234,6 +348,15 @@ void Eclipse::addSpacecraftToModel(Message<SCStatesMsgPayload> *tmpScMsg)
     msg = new Message<EclipseMsgPayload>;
     this->eclipseOutMsgs.push_back(msg);
 
+    /* create eclipse event output message */
+    Message<EclipseEventMsgPayload> *eventMsg;
+    eventMsg = new Message<EclipseEventMsgPayload>;
+    this->eclipseEventOutMsgs.push_back(eventMsg);
+    EclipseEventMsgPayload event = {};
+    event.minShadowFactor = 1.0;
+    this->eclipseEvents.push_back(event);
+    this->nextEvaluationTimes.push_back(0);
+
     /* expand the sc state buffer vector */
     SCStatesMsgPayload scMsg;
     this->scStateBuffer.push_back(scMsg);
@@ -254,6 +377,8 @@ void Eclipse::addPlanetToModel(Message<SpicePlanetStateMsgPayload> *tmpSpMsg)
 
     SpicePlanetStateMsgPayload tmpMsg;
     this->planetBuffer.push_back(tmpMsg);
+    this->planetNames.push_back("");
+    this->planetRadii.push_back(0.0);
     return;
 }
 
@@ -27,6 +27,7 @@
 #include "architecture/msgPayloadDefC/SCStatesMsgPayload.h"
 #include "architecture/msgPayloadDefC/SpicePlanetStateMsgPayload.h"
 #include "architecture/msgPayloadDefC/EclipseMsgPayload.h"
+#include "architecture/msgPayloadDefC/EclipseEventMsgPayload.h"
 #include "architecture/messaging/messaging.h"
 
 #include "architecture/utilities/linearAlgebra.h"
@@ -50,17 +51,28 @@ public:
     std::vector<ReadFunctor<SpicePlanetStateMsgPayload>> planetInMsgs;  //!< A vector of planet incoming state message names ordered by the sequence in which planet are added to the module
     std::vector<ReadFunctor<SCStatesMsgPayload>> positionInMsgs;  //!< vector of msgs for each spacecraft position state for which to evaluate eclipse conditions.
     std::vector<Message<EclipseMsgPayload>*> eclipseOutMsgs;//!< vector of eclispe output msg names
+    std::vector<Message<EclipseEventMsgPayload>*> eclipseEventOutMsgs;//!< vector of eclipse entry and exit event output msgs
+    double skipAheadMaxTime;    //!< [s] (optional) maximum time for which the shadow evaluation of a spacecraft far from all shadow cones is skipped, defaults to 0 which evaluates every time step
     BSKLogger bskLogger;                        //!< BSK Logging
 
 private:
-    std::vector<float> planetRadii; //!< [m] A vector of planet radii ordered by the sequence in which planet names are added to the module
+    std::vector<double> planetRadii; //!< [m] A vector of planet radii ordered by the sequence in which planet names are added to the module
+    std::vector<std::string> planetNames;   //!< names of the planets for which planetRadii are evaluated
     std::vector<SCStatesMsgPayload> scStateBuffer;      //!< buffer of the spacecraft state input messages
     std::vector<SpicePlanetStateMsgPayload> planetBuffer;   //!< buffer of the spacecraft state input messages
     SpicePlanetStateMsgPayload sunInMsgState;               //!< copy of sun input msg
     std::vector<double> eclipseShadowFactors;               //!< vector of shadow factor output values
+    std::vector<EclipseEventMsgPayload> eclipseEvents;      //!< vector of eclipse event output values
+    std::vector<uint64_t> nextEvaluationTimes;              //!< [ns] time before which a spacecraft cannot enter a shadow cone
+    std::vector<int> evaluatedSpacecraft;                   //!< indices of the spacecraft evaluated at the current time
+    std::vector<bool> inShadowCone;                         //!< flags of the spacecraft within a planet penumbra cone
+    std::vector<double> timeToShadowCone;                   //!< [s] time for a spacecraft to reach the closest penumbra cone
 
 private:
-    void readInputMessages();
+    void readInputMessages(uint64_t CurrentSimNanos);
+    void updatePlanetRadii();
+    double computeShadowFactor(SCStatesMsgPayload &scState);
+    void updateEclipseEvent(int scIdx, uint64_t CurrentClock);
     double computePercentShadow(double planetRadius, Eigen::Vector3d r_HB_N, Eigen::Vector3d s_BP_N);
     double getPlanetEquatorialRadius(std::string planetSpiceName);
 
@@ -33,6 +33,8 @@ from Basilisk.architecture.swig_common_model import *
 
 %include "architecture/msgPayloadDefC/EclipseMsgPayload.h"
 struct EclipseMsg_C;
+%include "architecture/msgPayloadDefC/EclipseEventMsgPayload.h"
+struct EclipseEventMsg_C;
 %include "architecture/msgPayloadDefC/SCStatesMsgPayload.h"
 struct SCStatesMsg_C;
 %include "architecture/msgPayloadDefC/SpicePlanetStateMsgPayload.h"
@@ -118,7 +118,89 @@ def groundMappingTestFunction():
     return [testFailCount, "".join(testMessages)]
 
 
+def test_groundMappingCulling():
+    r"""
+    This test checks that the culling mode, which only evaluates the mapping points of the spatial index cells that
+    can be seen by the instrument, finds the same accessible points as evaluating every mapping point.  A grid of points
+    covering the planet is mapped by a spacecraft with a rotating planet and a slewing spacecraft.
+    """
+    unitTaskName = "unitTask"
+    unitProcessName = "TestProcess"
+
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProcessRate = macros.sec2nano(10.)
+    testProc = unitTestSim.CreateNewProcess(unitProcessName)
+    testProc.addTask(unitTestSim.CreateNewTask(unitTaskName, testProcessRate))
+
+    planetInMsgData = messaging.SpicePlanetStateMsgPayload()
+    planetInMsgData.J20002Pfix = [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]]
+    planetInMsgData.PositionVector = [0., 0., 0.]
+    planetInMsg = messaging.SpicePlanetStateMsg().write(planetInMsgData)
+
+    scStateInMsgData = messaging.SCStatesMsgPayload()
+    scStateInMsgData.r_BN_N = [7000e3, 0., 0.]
+    scStateInMsgData.v_BN_N = [0., 7.5e3, 0.]
+    scStateInMsgData.sigma_BN = [0., 0., 0.]
+    scStateInMsg = messaging.SCStatesMsg().write(scStateInMsgData)
+
+    # Fibonacci grid of points on the planet surface
+    numPoints = 5000
+    rEq = 6378e3
+    idx = np.arange(numPoints)
+    z = 1. - 2.*(idx + 0.5)/numPoints
+    phi = idx*np.pi*(3. - np.sqrt(5.))
+    points = rEq*np.array([np.sqrt(1. - z*z)*np.cos(phi), np.sqrt(1. - z*z)*np.sin(phi), z]).T
+
+    groundMaps = []
+    mapLogs = []
+    for cull in [False, True]:
+        groundMap = groundMapping.GroundMapping()
+        groundMap.ModelTag = "groundMapping"
+        for point in points:
+            groundMap.addPointToModel(unitTestSupport.np2EigenVectorXd(point))
+        groundMap.minimumElevation = np.radians(10.)
+        groundMap.maximumRange = 1e7
+        groundMap.cameraPos_B = [0.5, 0., 0.]
+        groundMap.nHat_B = [-2, 0, 0]  # not a unit vector, both evaluations must use the normalized boresight
+        groundMap.halfFieldOfView = np.radians(30.)
+        groundMap.cullMappingPoints = cull
+        groundMap.scStateInMsg.subscribeTo(scStateInMsg)
+        groundMap.planetInMsg.subscribeTo(planetInMsg)
+        unitTestSim.AddModelToTask(unitTaskName, groundMap)
+        mapLog = groundMap.mappingAccessOutMsg.recorder()
+        unitTestSim.AddModelToTask(unitTaskName, mapLog)
+        groundMaps.append(groundMap)
+        mapLogs.append(mapLog)
+
+    unitTestSim.InitializeSimulation()
+    for angle in np.radians([0., 20., 40.]):
+        planetInMsgData.J20002Pfix = [[np.cos(angle), np.sin(angle), 0.], [-np.sin(angle), np.cos(angle), 0.],
+                                      [0., 0., 1.]]
+        planetInMsg.write(planetInMsgData)
+        scStateInMsgData.sigma_BN = [0., 0.2*np.sin(angle), 0.1*angle]
+        scStateInMsg.write(scStateInMsgData)
+        unitTestSim.ConfigureStopTime(unitTestSim.TotalSim.CurrentNanos + testProcessRate)
+        unitTestSim.ExecuteSimulation()
+
+    numAccess = mapLogs[0].numAccessPoints
+    assert np.all(numAccess > 0)
+    np.testing.assert_array_equal(mapLogs[1].numAccessPoints, numAccess)
+    np.testing.assert_array_equal(mapLogs[1].numDroppedPoints, mapLogs[0].numDroppedPoints)
+    for k in range(len(numAccess)):
+        for field in ["pointIndex", "slantRange", "elevation", "azimuth"]:
+            np.testing.assert_array_equal(getattr(mapLogs[1], field)[k][:numAccess[k]],
+                                          getattr(mapLogs[0], field)[k][:numAccess[k]])
+
+    # the listed points must have access in the per point messages of the full evaluation
+    for k in [int(numAccess[-1]*i/4) for i in range(4)]:
+        pointIdx = int(mapLogs[0].pointIndex[-1][k])
+        access = groundMaps[0].accessOutMsgs[pointIdx].read()
+        assert access.hasAccess == 1
+        assert access.slantRange == mapLogs[0].slantRange[-1][k]
+
+
 if __name__ == "__main__":
     test_groundMapping()
+    test_groundMappingCulling()
 
 
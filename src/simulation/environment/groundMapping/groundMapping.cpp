@@ -24,8 +24,12 @@
 #include "architecture/utilities/rigidBodyKinematics.h"
 #include <iostream>
 #include <cstring>
+#include <algorithm>
 #include <math.h>
 
+/*! [rad] angular slack of the conservative culling tests, such that rounding never culls an accessible point */
+static const double CULL_ANGLE_TOLERANCE = 1e-9;
+
 /*! This is the constructor for the module class.  It sets default variable
     values and initializes the various parts of the model */
 GroundMapping::GroundMapping()
@@ -36,6 +40,9 @@ GroundMapping::GroundMapping()
     this->halfFieldOfView = 10.*D2R;  // [rad] half-angle field-of-view of the instrument
     this->cameraPos_B.setZero(3);  // Default to zero
     this->nHat_B.setZero(3);  // Default to zero
+    this->cullMappingPoints = false;  // evaluate every mapping point by default
+    this->pointsPerBucket = 32;  // average number of points per spatial index cell
+    this->numIndexedPoints = 0;
 
     this->planetInMsgBuffer = this->planetInMsg.zeroMsgPayload;
     this->planetInMsgBuffer.J20002Pfix[0][0] = 1;
@@ -67,6 +74,20 @@ void GroundMapping::Reset(uint64_t CurrentSimNanos)
     // check that the direction of the camera is provided
     if (this->nHat_B.isZero()){
         bskLogger.bskLog(BSK_ERROR, "GroundMapping.nHat_B vector not set.");
+    } else {
+        // the field of view check and the culling tests both use the unit boresight direction
+        this->nHat_B.normalize();
+    }
+
+    this->mappingAccessMsgBuffer = this->mappingAccessOutMsg.zeroMsgPayload;
+
+    // build the spatial index of the mapping points
+    if (this->cullMappingPoints) {
+        if (this->pointsPerBucket < 1) {
+            bskLogger.bskLog(BSK_ERROR, "GroundMapping.pointsPerBucket must be positive.");
+            this->pointsPerBucket = 1;
+        }
+        this->buildPointIndex();
     }
 }
 
@@ -89,6 +110,10 @@ void GroundMapping::addPointToModel(Eigen::Vector3d& r_LP_P_init){
     /* Add the mapping point */
     this->mappingPoints.push_back(r_LP_P_init);
 
+    /* Store the rotation to the local SEZ frame of the mapping point */
+    Eigen::Vector3d llaPosition = PCPF2LLA(r_LP_P_init, r_LP_P_init.norm());
+    this->mappingPointsDcm_LP.push_back(C_PCPF2SEZ(llaPosition[0], llaPosition[1]));
+
     /* Create buffer output messages */
     Message<AccessMsgPayload> *msg;
     msg = new Message<AccessMsgPayload>;
@@ -117,6 +142,7 @@ void GroundMapping::computeAccess(uint64_t c){
     this->currentGroundStateMsgBuffer.at(c) = this->currentGroundStateOutMsgs.at(c)->zeroMsgPayload;
 
     //! Compute the planet to inertial frame location position
+    this->dcm_LP = this->mappingPointsDcm_LP[c];
     this->r_LP_N = this->dcm_PN.transpose() * this->mappingPoints[c];
     this->rhat_LP_N = this->r_LP_N/this->r_LP_N.norm();
     this->r_LN_N = this->r_PN_N + this->r_LP_N;
@@ -203,16 +229,155 @@ uint64_t GroundMapping::checkInstrumentFOV(){
     }
 }
 
+/*! Method to sort the mapping points into a planet-fixed latitude/longitude grid.  Each non-empty cell stores the
+ bounding sphere of its points and the angular spread of the point directions, which are used by the culling tests.
+ */
+void GroundMapping::buildPointIndex()
+{
+    uint64_t numPoints = this->mappingPoints.size();
+    int numLat = std::max(1, (int) round(sqrt(numPoints/(2.0*this->pointsPerBucket))));
+    int numLon = 2*numLat;
+
+    //! - sort the points into the latitude/longitude cells
+    std::vector<PointBucket> buckets(numLat*numLon);
+    for (uint64_t c = 0; c < numPoints; c++) {
+        Eigen::Vector3d llaPosition = PCPF2LLA(this->mappingPoints[c], 0.);
+        int i = std::min(numLat-1, std::max(0, (int) floor((llaPosition[0] + M_PI_2)/M_PI*numLat)));
+        int j = std::min(numLon-1, std::max(0, (int) floor((llaPosition[1] + M_PI)/(2.*M_PI)*numLon)));
+        buckets[i*numLon + j].pointIndices.push_back(c);
+    }
+
+    //! - compute the bounding geometry of the non-empty cells
+    this->pointBuckets.clear();
+    for (auto& bucket : buckets) {
+        if (bucket.pointIndices.empty()) {
+            continue;
+        }
+        bucket.center_P.setZero();
+        Eigen::Vector3d directionSum;
+        directionSum.setZero();
+        bool hasZeroPoint = false;
+        for (uint64_t c : bucket.pointIndices) {
+            bucket.center_P += this->mappingPoints[c];
+            double r_LP_mag = this->mappingPoints[c].norm();
+            if (r_LP_mag > 0) {
+                directionSum += this->mappingPoints[c]/r_LP_mag;
+            } else {
+                hasZeroPoint = true;
+            }
+        }
+        bucket.center_P /= (double) bucket.pointIndices.size();
+
+        bucket.radius = 0.;
+        bucket.angularRadius = 0.;
+        if (hasZeroPoint || directionSum.norm() == 0.) {
+            /* the point directions do not bound the local horizon, never cull this cell with the elevation test */
+            bucket.centerHat_P.setZero();
+            bucket.angularRadius = M_PI;
+        } else {
+            bucket.centerHat_P = directionSum.normalized();
+        }
+        for (uint64_t c : bucket.pointIndices) {
+            bucket.radius = std::max(bucket.radius, (this->mappingPoints[c] - bucket.center_P).norm());
+            if (bucket.angularRadius < M_PI) {
+                bucket.angularRadius = std::max(bucket.angularRadius,
+                                                safeAcos(this->mappingPoints[c].normalized().dot(bucket.centerHat_P)));
+            }
+        }
+        /* pad the bounding sphere to absorb rounding errors */
+        bucket.radius += 1e-9*(bucket.radius + bucket.center_P.norm());
+        this->pointBuckets.push_back(bucket);
+    }
+    this->numIndexedPoints = numPoints;
+}
+
+/*! Method to find the mapping points that can have access.  A cell of the spatial index is discarded if its bounding
+ sphere lies outside of the instrument cone, beyond the maximum range, or below the minimum elevation of all its
+ points.  The tests are conservative, such that the candidate points are a superset of the accessible points.
+ */
+void GroundMapping::findCandidatePoints()
+{
+    this->candidatePoints.clear();
+
+    /* checkInstrumentFOV() requires a non-negative maximum range, without it no point is accessible */
+    if (this->maximumRange < 0) {
+        return;
+    }
+
+    //! - express the spacecraft, instrument and boresight in the planet-fixed frame
+    Eigen::Vector3d r_BP_P = this->dcm_PN * this->r_BP_N;
+    Eigen::Vector3d r_CP_P = this->dcm_PN * (this->r_BP_N + this->dcm_NB * this->cameraPos_B);
+    Eigen::Vector3d nHat_P = this->dcm_PN * this->dcm_NB * this->nHat_B;
+    double maximumViewAngle = M_PI_2 - this->minimumElevation;
+
+    for (const auto& bucket : this->pointBuckets) {
+        //! - instrument cone and range test of the bounding sphere
+        Eigen::Vector3d r_MC_P = bucket.center_P - r_CP_P;
+        double r_MC_mag = r_MC_P.norm();
+        if (r_MC_P.dot(nHat_P) - bucket.radius > this->maximumRange) {
+            continue;
+        }
+        if (r_MC_mag > bucket.radius) {
+            double coneAngle = safeAcos(r_MC_P.dot(nHat_P)/r_MC_mag) - asin(bucket.radius/r_MC_mag);
+            if (coneAngle > this->halfFieldOfView + CULL_ANGLE_TOLERANCE) {
+                continue;
+            }
+        }
+
+        //! - local horizon test, bounding the angle between the point normals and the spacecraft direction
+        Eigen::Vector3d r_BM_P = r_BP_P - bucket.center_P;
+        double r_BM_mag = r_BM_P.norm();
+        if (r_BM_mag > bucket.radius && bucket.angularRadius < M_PI) {
+            double viewAngle = safeAcos(bucket.centerHat_P.dot(r_BM_P)/r_BM_mag) - bucket.angularRadius
+                               - asin(bucket.radius/r_BM_mag);
+            if (viewAngle > maximumViewAngle + CULL_ANGLE_TOLERANCE) {
+                continue;
+            }
+        }
+
+        this->candidatePoints.insert(this->candidatePoints.end(),
+                                     bucket.pointIndices.begin(), bucket.pointIndices.end());
+    }
+
+    /* evaluate the points in the order they were added to the model */
+    std::sort(this->candidatePoints.begin(), this->candidatePoints.end());
+}
+
+/*! Method to add an accessible mapping point to the bulk access message
+ * @param c: index of the given location
+ */
+void GroundMapping::writeMappingAccess(uint64_t c)
+{
+    if (!this->accessMsgBuffer.at(c).hasAccess) {
+        return;
+    }
+    int k = this->mappingAccessMsgBuffer.numAccessPoints;
+    if (k >= MAX_MAPPING_ACCESS_POINTS) {
+        this->mappingAccessMsgBuffer.numDroppedPoints++;
+        return;
+    }
+    this->mappingAccessMsgBuffer.pointIndex[k] = c;
+    this->mappingAccessMsgBuffer.slantRange[k] = this->accessMsgBuffer.at(c).slantRange;
+    this->mappingAccessMsgBuffer.elevation[k] = this->accessMsgBuffer.at(c).elevation;
+    this->mappingAccessMsgBuffer.azimuth[k] = this->accessMsgBuffer.at(c).azimuth;
+    this->mappingAccessMsgBuffer.numAccessPoints++;
+}
+
 /*! write module messages
 */
 void GroundMapping::WriteMessages(uint64_t CurrentClock)
 {
     //! - write access message for each spacecraft
-    for (long unsigned int c=0; c< this->accessMsgBuffer.size(); c++) {
-        this->accessOutMsgs.at(c)->write(&this->accessMsgBuffer.at(c), this->moduleID, CurrentClock);
-        this->currentGroundStateOutMsgs.at(c)->write(&this->currentGroundStateMsgBuffer.at(c), this->moduleID, CurrentClock);
+    if (!this->cullMappingPoints) {
+        for (long unsigned int c=0; c< this->accessMsgBuffer.size(); c++) {
+            this->accessOutMsgs.at(c)->write(&this->accessMsgBuffer.at(c), this->moduleID, CurrentClock);
+            this->currentGroundStateOutMsgs.at(c)->write(&this->currentGroundStateMsgBuffer.at(c), this->moduleID, CurrentClock);
+        }
     }
 
+    //! - write the bulk access message
+    this->mappingAccessOutMsg.write(&this->mappingAccessMsgBuffer, this->moduleID, CurrentClock);
+
 }
 
 /*! This is the main method that gets called every time the module is updated.  Provide an appropriate description.
@@ -226,9 +391,26 @@ void GroundMapping::UpdateState(uint64_t CurrentSimNanos)
     // Update the inertial positions
     this->updateInertialPositions();
 
-    // Loop through each mapping point and perform computations
-    for (long unsigned int c = 0; c < this->mappingPoints.size(); c++) {
-        this->computeAccess(c);
+    // writeMappingAccess() fills the entries in order, only the first numAccessPoints entries are read
+    this->mappingAccessMsgBuffer.numAccessPoints = 0;
+    this->mappingAccessMsgBuffer.numDroppedPoints = 0;
+
+    if (this->cullMappingPoints) {
+        // Only evaluate the mapping points that can be within the instrument cone
+        if (this->numIndexedPoints != this->mappingPoints.size()) {
+            this->buildPointIndex();
+        }
+        this->findCandidatePoints();
+        for (uint64_t c : this->candidatePoints) {
+            this->computeAccess(c);
+            this->writeMappingAccess(c);
+        }
+    } else {
+        // Loop through each mapping point and perform computations
+        for (long unsigned int c = 0; c < this->mappingPoints.size(); c++) {
+            this->computeAccess(c);
+            this->writeMappingAccess(c);
+        }
     }
 
     // Write output messages
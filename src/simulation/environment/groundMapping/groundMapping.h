@@ -30,6 +30,7 @@
 #include "architecture/msgPayloadDefC/SCStatesMsgPayload.h"
 #include "architecture/msgPayloadDefC/AccessMsgPayload.h"
 #include "architecture/msgPayloadDefC/GroundStateMsgPayload.h"
+#include "architecture/msgPayloadDefC/MappingAccessMsgPayload.h"
 #include "architecture/utilities/bskLogging.h"
 #include "architecture/messaging/messaging.h"
 
@@ -54,6 +55,9 @@ private:
     void WriteMessages(uint64_t CurrentClock);
     void updateInertialPositions();
     uint64_t checkInstrumentFOV();
+    void buildPointIndex();
+    void findCandidatePoints();
+    void writeMappingAccess(uint64_t c);
 
 public:
     double minimumElevation; //!< [rad] (optional) minimum elevation above the local horizon needed to see a spacecraft; defaults to 10 degrees equivalent.
@@ -61,6 +65,8 @@ public:
     Eigen::Vector3d cameraPos_B;  //!< [m] (optional) Instrument position in body frame, defaults to (0,0,0)
     double halfFieldOfView;  //!< [r] Instrument half-fov, defaults to 10 degrees
     Eigen::Vector3d nHat_B;  //!< [-] Instrument unit direction vector in body frame components
+    bool cullMappingPoints;  //!< [-] (optional) flag to only evaluate the points that can be within the instrument cone, defaults to false. The per point output messages are not written when set.
+    int pointsPerBucket;  //!< [-] (optional) average number of mapping points per cell of the spatial index, defaults to 32
 
     BSKLogger bskLogger;              //!< -- BSK Logging
 
@@ -68,14 +74,25 @@ public:
     ReadFunctor<SCStatesMsgPayload> scStateInMsg;  //!< Spacecraft state input message
     std::vector<Message<GroundStateMsgPayload>*> currentGroundStateOutMsgs;    //!< vector of ground location output message
     std::vector<Message<AccessMsgPayload>*> accessOutMsgs;           //!< vector of ground location access messages
+    Message<MappingAccessMsgPayload> mappingAccessOutMsg;           //!< bulk message of the accessible mapping points
 
 private:
+    /*! Cell of the planet-fixed spatial index of the mapping points */
+    struct PointBucket {
+        std::vector<uint64_t> pointIndices;  //!< [-] indices of the mapping points in this cell
+        Eigen::Vector3d center_P;  //!< [m] center of the bounding sphere of the points
+        double radius;  //!< [m] radius of the bounding sphere of the points
+        Eigen::Vector3d centerHat_P;  //!< [-] mean direction of the points from the planet center
+        double angularRadius;  //!< [rad] maximum angle between a point direction and centerHat_P
+    };
+
     std::vector<AccessMsgPayload> accessMsgBuffer;                  //!< buffer of access output data
     std::vector<GroundStateMsgPayload> currentGroundStateMsgBuffer;                  //!< buffer of access output data
     SCStatesMsgPayload scStateInMsgBuffer;             //!< buffer of spacecraft states
     SpicePlanetStateMsgPayload planetInMsgBuffer;                         //!< buffer of planet data
 
     std::vector<Eigen::Vector3d> mappingPoints;  //!< Vector of mapping points
+    std::vector<Eigen::Matrix3d> mappingPointsDcm_LP;  //!< Rotation matrices from the planet-fixed frame P to the SEZ frame L of each mapping point
     Eigen::Matrix3d dcm_LP; //!< Rotation matrix from planet-centered, planet-fixed frame P to site-local topographic (SEZ) frame L coordinates.
     Eigen::Matrix3d dcm_PN; //!< Rotation matrix from inertial frame N to planet-centered to planet-fixed frame P.
     Eigen::Matrix3d dcm_PN_dot; //!< Rotation matrix derivative from inertial frame N to planet-centered to planet-fixed frame P.
@@ -89,6 +106,11 @@ private:
     Eigen::Vector3d r_BP_N; //!< [m] Inertial position of the body frame wrt the planet
     Eigen::Matrix3d dcm_NB;  //!< DCM from the body frame to the inertial frame
 
+    std::vector<PointBucket> pointBuckets;  //!< lat/lon cells of the spatial index of the mapping points
+    uint64_t numIndexedPoints;  //!< [-] number of mapping points contained in the spatial index
+    std::vector<uint64_t> candidatePoints;  //!< [-] indices of the points that passed the culling tests this step
+    MappingAccessMsgPayload mappingAccessMsgBuffer;  //!< buffer of the bulk access output data
+
 };
 
 
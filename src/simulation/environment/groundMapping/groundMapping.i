@@ -40,6 +40,8 @@ struct SCStatesMsg_C;
 struct AccessMsg_C;
 %include "architecture/msgPayloadDefC/GroundStateMsgPayload.h"
 struct GroundStateMsg_C;
+%include "architecture/msgPayloadDefC/MappingAccessMsgPayload.h"
+struct MappingAccessMsg_C;
 
 %pythoncode %{
 import sys
@@ -230,6 +230,51 @@ def run(show_plots, decimalYear, Height, Lat, Lon, BxTrue, ByTrue, BzTrue, useDe
     return [testFailCount, ''.join(testMessages)]
 
 
+def test_fieldBatchAndCache():
+    r"""
+    **Validation Test Description**
+
+    The magnetic field of two spacecraft must match the batch evaluation of their positions, along with the WMM
+    uncertainty of the field when it is requested.  The time adjusted WMM coefficients are only recomputed if the
+    date changes by more than ``decimalYearTolerance``.
+    """
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask("unitTask", macros.sec2nano(0.5)))
+
+    testModule = magneticFieldWMM.MagneticFieldWMM()
+    testModule.ModelTag = "WMM"
+    testModule.dataPath = bskPath + '/supportData/MagneticField/'
+    testModule.epochDateFractionalYear = 2017.5
+    testModule.computeFieldUncertainty = True
+
+    positions = np.array([[7000e3, 500e3, -1000e3], [-2000e3, 3000e3, 6500e3]])
+    scMsgs = []
+    for position in positions:
+        scStateMsgData = messaging.SCStatesMsgPayload()
+        scStateMsgData.r_BN_N = position
+        scMsgs.append(messaging.SCStatesMsg().write(scStateMsgData))
+        testModule.addSpacecraftToModel(scMsgs[-1])
+    unitTestSim.AddModelToTask("unitTask", testModule)
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.TotalSim.SingleStepProcesses()
+
+    magField_N = np.array([testModule.envOutMsgs[c].read().magField_N for c in range(len(positions))])
+    np.testing.assert_allclose(testModule.computeFieldBatch(positions.tolist(), 2017.5), magField_N,
+                               rtol=1e-6, atol=1e-12)
+    np.testing.assert_allclose(testModule.fieldUncertainty_M, [[138e-9, 89e-9, 165e-9]] * 2)
+
+    # a date change within the tolerance reuses the time adjusted coefficients
+    field2015 = np.array(testModule.computeFieldBatch(positions.tolist(), 2015.))
+    fieldCached = np.array(testModule.computeFieldBatch(positions.tolist(),
+                                                        2015. + 0.5 * testModule.decimalYearTolerance))
+    np.testing.assert_array_equal(fieldCached, field2015)
+    testModule.decimalYearTolerance = 0.
+    fieldUpdated = np.array(testModule.computeFieldBatch(positions.tolist(), 2016.))
+    assert np.all(fieldUpdated != field2015)
+
+
 #
 # This statement below ensures that the unitTestScript can be run as a
 # stand-along python script
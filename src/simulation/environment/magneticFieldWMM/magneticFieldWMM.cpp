@@ -33,8 +33,17 @@ MagneticFieldWMM::MagneticFieldWMM()
     //! - Set the default magnetic field properties
     this->planetRadius = REQ_EARTH*1000.;   // must be the radius of Earth for WMM
     this->magneticModels[0] = nullptr;      // a nullptr means no WMM coefficients have been loaded
+    this->timedMagneticModel = nullptr;
+    this->legendreFunction = nullptr;
+    this->sphVariables = nullptr;
     this->epochDateFractionalYear = -1;     // negative value means this variable has not been set
 
+    //! - recompute the time adjusted coefficients every simulated hour, and skip the uncertainty by default
+    this->decimalYearTolerance = 1.0/(365.25*24.);
+    this->computeFieldUncertainty = false;
+    this->timedModelDecimalYear = NAN;
+    this->evaluationTime = -1.0;
+
     return;
 }
 
@@ -62,6 +71,11 @@ void MagneticFieldWMM::customReset(uint64_t CurrentClock)
         this->magneticModels[0] = nullptr;
     }
 
+    //! - clear the cached time adjusted coefficients and decimal year
+    this->timedModelDecimalYear = NAN;
+    this->evaluationTime = -1.0;
+    this->fieldUncertainty_M = Eigen::MatrixXd::Zero((long) this->envOutMsgs.size(), 3);
+
     //! - Check that required module variables are set
     if(this->dataPath == "") {
         bskLogger.bskLog(BSK_ERROR, "WMM data path was not set.  No WMM.");
@@ -172,15 +186,9 @@ double MagneticFieldWMM::gregorian2DecimalYear(double currentTime)
  */
 void MagneticFieldWMM::evaluateMagneticFieldModel(MagneticFieldMsgPayload *msg, double currentTime)
 {
-    Eigen::Vector3d rHat_P;             // []    normalized position vector in E frame components
-    double phi;                         // [rad] latitude
-    double lambda;                      // [rad] longitude
-    double h;                           // [m]   height above geoid
     double PM[3][3];                    // []    DCM from magnetic field frame to planet frame P
     double NM[3][3];                    // []    DCM from magnetic field frame to inertial frame N
     double B_M[3];                      // [T]   magnetic field in Magnetic field aligned frame
-    double M2[3][3];                    // []    2nd axis rotation DCM
-    double M3[3][3];                    // []    3rd axis rotation DCM
 
     if (this->magneticModels[0] == NULL) {
         // no magnetic field was setup, set field to zero and return
@@ -188,23 +196,91 @@ void MagneticFieldWMM::evaluateMagneticFieldModel(MagneticFieldMsgPayload *msg,
         return;
     }
 
+    //! - the decimal year is the same for all the spacecraft evaluated at this time
+    if (currentTime != this->evaluationTime) {
+        this->evaluationDecimalYear = gregorian2DecimalYear(currentTime);
+        this->evaluationTime = currentTime;
+    }
+
+    //! - evaluate NED magnetic field
+    computePlanetFixedField(this->r_BP_P, this->evaluationDecimalYear, B_M, PM);
+
+    //! - convert NED magnetic field M vector components into N-frame components and store in output message
+    m33tMultM33(this->planetState.J20002Pfix, PM, NM);
+    m33MultV3(NM, B_M, msg->magField_N);
+
+    //! - optionally store the WMM uncertainty in the row of this spacecraft
+    long scIndex = (long) (msg - this->magFieldOutBuffer.data());
+    if (this->computeFieldUncertainty && scIndex >= 0 && scIndex < this->fieldUncertainty_M.rows()) {
+        MAGtype_GeoMagneticElements errors;
+        MAG_WMMErrorCalc(sqrt(B_M[0]*B_M[0] + B_M[1]*B_M[1])*1e9, &errors);
+        this->fieldUncertainty_M.row(scIndex) << errors.X*1e-9, errors.Y*1e-9, errors.Z*1e-9;
+    }
+
+    return;
+}
+
+/*! This method evaluates the WMM magnetic field for a batch of planet relative positions at the same date.
+ @param r_BP_P [m] planet relative positions in planet-fixed frame components, one position per row
+ @param decimalYear [yr] date as a decimal year
+ @return [T] magnetic field in planet-fixed frame components, one row per position
+ */
+Eigen::MatrixXd MagneticFieldWMM::computeFieldBatch(Eigen::MatrixXd r_BP_P, double decimalYear)
+{
+    Eigen::MatrixXd B_P = Eigen::MatrixXd::Zero(r_BP_P.rows(), 3);
+    double PM[3][3];                    // []    DCM from magnetic field frame to planet frame P
+    double B_M[3];                      // [T]   magnetic field in Magnetic field aligned frame
+    double B_Prow[3];                   // [T]   magnetic field in planet-fixed frame components
+
+    if (this->magneticModels[0] == NULL) {
+        bskLogger.bskLog(BSK_ERROR, "WMM coefficients are not loaded, reset the module first.");
+        return B_P;
+    }
+    if (r_BP_P.cols() != 3) {
+        bskLogger.bskLog(BSK_ERROR, "The WMM batch positions must have 3 columns.");
+        return B_P;
+    }
+
+    for (long c = 0; c < r_BP_P.rows(); c++) {
+        computePlanetFixedField(r_BP_P.row(c).transpose(), decimalYear, B_M, PM);
+        m33MultV3(PM, B_M, B_Prow);
+        B_P.row(c) << B_Prow[0], B_Prow[1], B_Prow[2];
+    }
+
+    return B_P;
+}
+
+/*! This method evaluates the WMM magnetic field at a planet relative position.
+ @param r_BP_P [m] planet relative position in planet-fixed frame components
+ @param decimalYear [yr] date as a decimal year
+ @param B_M [T] magnetic field in the north-east-down frame M
+ @param PM DCM from the north-east-down frame M to the planet-fixed frame P
+ @return void
+ */
+void MagneticFieldWMM::computePlanetFixedField(Eigen::Vector3d r_BP_P, double decimalYear, double B_M[3], double PM[3][3])
+{
+    Eigen::Vector3d rHat_P;             // []    normalized position vector in E frame components
+    double phi;                         // [rad] latitude
+    double lambda;                      // [rad] longitude
+    double h;                           // [km]  height above geoid
+    double M2[3][3];                    // []    2nd axis rotation DCM
+    double M3[3][3];                    // []    3rd axis rotation DCM
+
     //! - compute normalized E-frame position vector
-    rHat_P = this->r_BP_P.normalized();
+    rHat_P = r_BP_P.normalized();
 
     //! - compute spacecraft latitude and longitude
     phi = safeAsin(rHat_P[2]);
     lambda = atan2(rHat_P[1], rHat_P[0]);
-    h = (this->orbitRadius - this->planetRadius)/1000.; /* must be in km */
+    h = (r_BP_P.norm() - this->planetRadius)/1000.; /* must be in km */
 
     //! - evaluate NED magnetic field
-    computeWmmField(gregorian2DecimalYear(currentTime), phi, lambda, h, B_M);
+    computeWmmField(decimalYear, phi, lambda, h, B_M);
 
-    //! - convert NED magnetic field M vector components into N-frame components and store in output message
+    //! - compute the DCM from the NED frame to the planet-fixed frame
     Euler2(phi + M_PI_2, M2);
     Euler3(-lambda, M3);
     m33MultM33(M3, M2, PM);
-    m33tMultM33(this->planetState.J20002Pfix, PM, NM);
-    m33MultV3(NM, B_M, msg->magField_N);
 
     return;
 }
@@ -215,19 +291,58 @@ void MagneticFieldWMM::evaluateMagneticFieldModel(MagneticFieldMsgPayload *msg,
  */
 void MagneticFieldWMM::cleanupEarthMagFieldModel()
 {
-    MAG_FreeMagneticModelMemory(timedMagneticModel);
+    if (this->legendreFunction != nullptr) {
+        MAG_FreeLegendreMemory(this->legendreFunction);
+        this->legendreFunction = nullptr;
+    }
+    if (this->sphVariables != nullptr) {
+        MAG_FreeSphVarMemory(this->sphVariables);
+        this->sphVariables = nullptr;
+    }
+    if (this->timedMagneticModel != nullptr) {
+        MAG_FreeMagneticModelMemory(this->timedMagneticModel);
+        this->timedMagneticModel = nullptr;
+    }
     MAG_FreeMagneticModelMemory(magneticModels[0]);
 }
 
+/*! Time adjusts the WMM coefficients if the date moved by more than decimalYearTolerance since they were last
+ computed.  The secular variation only changes the coefficients on the scale of days.
+ @param decimalYear [yr] date as a decimal year
+ @return void
+ */
+void MagneticFieldWMM::updateTimedModel(double decimalYear)
+{
+    if (!std::isnan(this->timedModelDecimalYear)
+        && fabs(decimalYear - this->timedModelDecimalYear) <= this->decimalYearTolerance) {
+        return;
+    }
+
+    /* Time adjust the coefficients, Equation 19, WMM Technical report */
+    this->userDate.DecimalYear = decimalYear;
+    MAG_TimelyModifyMagneticModel(this->userDate, this->magneticModels[0], this->timedMagneticModel);
+    this->timedModelDecimalYear = decimalYear;
+
+    return;
+}
 
+/*! Evaluates the WMM magnetic field at a geodetic location, reusing the Legendre function and spherical harmonic
+ workspaces of the module.
+ @param decimalYear [yr] date as a decimal year
+ @param phi [rad] latitude
+ @param lambda [rad] longitude
+ @param h [km] height above the WGS-84 ellipsoid
+ @param B_M [T] magnetic field in the north-east-down frame M
+ @return void
+ */
 void MagneticFieldWMM::computeWmmField(double decimalYear, double phi, double lambda, double h, double B_M[3])
 {
     MAGtype_CoordSpherical      coordSpherical;
     MAGtype_CoordGeodetic       coordGeodetic;
-    MAGtype_GeoMagneticElements geoMagneticElements;
-    MAGtype_GeoMagneticElements errors;
+    MAGtype_MagneticResults     magneticResultsSph;
+    MAGtype_MagneticResults     magneticResultsGeo;
 
-    this->userDate.DecimalYear = decimalYear;
+    updateTimedModel(decimalYear);
 
     /* set the Geodetic coordinates of the satellite */
     coordGeodetic.phi = phi * R2D; /* degrees North */
@@ -244,13 +359,12 @@ void MagneticFieldWMM::computeWmmField(double decimalYear, double phi, double la
     /* Convert from geodetic to Spherical Equations: 17-18, WMM Technical report */
     MAG_GeodeticToSpherical(this->ellip, coordGeodetic, &coordSpherical);
 
-    /* Time adjust the coefficients, Equation 19, WMM Technical report */
-    MAG_TimelyModifyMagneticModel(this->userDate, this->magneticModels[0], this->timedMagneticModel);
-    /* Computes the geoMagnetic field elements and their time change */
-    MAG_Geomag(this->ellip, coordSpherical, coordGeodetic, this->timedMagneticModel, &geoMagneticElements);
-    MAG_CalculateGridVariation(coordGeodetic, &geoMagneticElements);
-    MAG_WMMErrorCalc(geoMagneticElements.H, &errors);
-    v3Set(geoMagneticElements.X, geoMagneticElements.Y, geoMagneticElements.Z, B_M);
+    /* Computes the geoMagnetic field elements as MAG_Geomag(), without the unused secular variation of the field */
+    MAG_ComputeSphericalHarmonicVariables(this->ellip, coordSpherical, this->timedMagneticModel->nMax, this->sphVariables);
+    MAG_AssociatedLegendreFunction(coordSpherical, this->timedMagneticModel->nMax, this->legendreFunction);
+    MAG_Summation(this->legendreFunction, this->timedMagneticModel, *this->sphVariables, coordSpherical, &magneticResultsSph);
+    MAG_RotateMagneticVector(coordSpherical, coordGeodetic, magneticResultsSph, &magneticResultsGeo);
+    v3Set(magneticResultsGeo.Bx, magneticResultsGeo.By, magneticResultsGeo.Bz, B_M);
 
     v3Scale(1e-9, B_M, B_M); /* convert nano-Tesla to Tesla */
 
@@ -277,7 +391,11 @@ void MagneticFieldWMM::initializeWmm(const char *dataPath)
     nTerms = ((nMax + 1) * (nMax + 2) / 2);
     /* For storing the time modified WMM Model parameters */
     this->timedMagneticModel = MAG_AllocateModelMemory(nTerms);
-    if(this->magneticModels[0] == NULL || this->timedMagneticModel == NULL) {
+    /* Workspace of the spherical harmonic evaluation, reused for every position */
+    this->legendreFunction = MAG_AllocateLegendreFunctionMemory(nTerms);
+    this->sphVariables = MAG_AllocateSphVarMemory(nMax);
+    if(this->magneticModels[0] == NULL || this->timedMagneticModel == NULL
+       || this->legendreFunction == NULL || this->sphVariables == NULL) {
         MAG_Error(2);
     }
     /* Set default values and constants */
@@ -36,11 +36,14 @@ class MagneticFieldWMM:  public MagneticFieldBase {
 public:
     MagneticFieldWMM();
     ~MagneticFieldWMM();
+    Eigen::MatrixXd computeFieldBatch(Eigen::MatrixXd r_BP_P, double decimalYear);
 
 private:
     void evaluateMagneticFieldModel(MagneticFieldMsgPayload *msg, double currentTime);
     void initializeWmm(const char *dataPath);
     void cleanupEarthMagFieldModel();
+    void updateTimedModel(double decimalYear);
+    void computePlanetFixedField(Eigen::Vector3d r_BP_P, double decimalYear, double B_M[3], double PM[3][3]);
     void computeWmmField(double decimalYear, double phi, double lambda, double h, double B_M[3]);
     void customReset(uint64_t CurrentClock);
     void customSetEpochFromVariable();
@@ -49,12 +52,20 @@ private:
 public:
     std::string dataPath;                   //!< -- String with the path to the WMM coefficient file
     double      epochDateFractionalYear;    //!< Specified epoch date as a fractional year
+    double      decimalYearTolerance;       //!< [yr] change of the date after which the time adjusted WMM coefficients are recomputed, default is one hour
+    bool        computeFieldUncertainty;    //!< flag to compute the WMM uncertainty of the field in fieldUncertainty_M, default is off
+    Eigen::MatrixXd fieldUncertainty_M;     //!< [T] WMM uncertainty of the north, east and down field components, one row per spacecraft
     BSKLogger bskLogger;                      //!< -- BSK Logging
 
 
 private:
     MAGtype_MagneticModel * magneticModels[1];
     MAGtype_MagneticModel *timedMagneticModel;
+    MAGtype_LegendreFunction *legendreFunction;             //!< workspace of the associated Legendre functions
+    MAGtype_SphericalHarmonicVariables *sphVariables;       //!< workspace of the spherical harmonic variables
+    double timedModelDecimalYear;                           //!< [yr] date of the time adjusted coefficients, NAN if not computed yet
+    double evaluationTime;                                  //!< [s] simulation time of the cached decimal year
+    double evaluationDecimalYear;                           //!< [yr] cached decimal year of the evaluation time
     MAGtype_Ellipsoid      ellip;
     MAGtype_Geoid          geoid;
     MAGtype_Date           userDate;
@@ -0,0 +1,106 @@
+# ISC License
+#
+# Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Spice Ephemeris Cache Unit Test
+#
+# Purpose:  Test that the Chebyshev ephemeris cache of the spiceInterface module reproduces the SPICE states,
+#           and that a cache file is reused or rebuilt depending on the kernels, bodies and time span
+#
+
+import os
+
+import numpy as np
+from Basilisk import __path__
+from Basilisk.simulation import spiceInterface
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+bskPath = __path__[0]
+
+planetNames = ["earth", "moon", "sun", "mars barycenter"]
+dateSpice = "2021 MAY 04 07:47:48.965 (UTC)"
+
+
+def createSpiceObject(cacheFile=None, cacheDuration=2*86400.):
+    spiceObject = spiceInterface.SpiceInterface()
+    spiceObject.SPICEDataPath = bskPath + '/supportData/EphemerisData/'
+    spiceObject.addPlanetNames(spiceInterface.StringVector(planetNames))
+    spiceObject.UTCCalInit = dateSpice
+    if cacheFile is not None:
+        spiceObject.ephemerisCacheFile = cacheFile
+        spiceObject.ephemerisCacheDuration = cacheDuration
+    return spiceObject
+
+
+def test_spiceEphemerisCache(tmp_path):
+    r"""
+    **Validation Test Description**
+
+    A spiceInterface module that queries SPICE at every update and two modules that use the same ephemeris cache file
+    are run side by side over two days.  The first cached module fits the states and writes the file, the second
+    one loads the file.  The cached planet positions, velocities and orientations must match the SPICE values, and the
+    two cached modules must output identical states.  A module with a different cache time span must not reuse the
+    file.
+    """
+    cacheFile = str(tmp_path / "ephemeris.bin")
+    unitTaskName = "unitTask"
+    sim = SimulationBaseClass.SimBaseClass()
+    proc = sim.CreateNewProcess("TestProcess")
+    proc.addTask(sim.CreateNewTask(unitTaskName, macros.sec2nano(600.)))
+
+    spiceObjects = [createSpiceObject(), createSpiceObject(cacheFile)]
+    spiceObjects[1].Reset(0)
+    assert os.path.exists(cacheFile)
+    fileTime = os.path.getmtime(cacheFile)
+    spiceObjects.append(createSpiceObject(cacheFile))
+
+    dataLogs = []
+    for spiceObject in spiceObjects:
+        sim.AddModelToTask(unitTaskName, spiceObject)
+        dataLogs.append([msg.recorder() for msg in spiceObject.planetStateOutMsgs])
+        for dataLog in dataLogs[-1]:
+            sim.AddModelToTask(unitTaskName, dataLog)
+    sim.InitializeSimulation()
+    assert not spiceObjects[0].ephemerisCacheActive()
+    assert spiceObjects[1].ephemerisCacheActive() and spiceObjects[2].ephemerisCacheActive()
+    assert os.path.getmtime(cacheFile) == fileTime
+
+    sim.ConfigureStopTime(macros.sec2nano(2*86400.))
+    sim.ExecuteSimulation()
+
+    for spiceLog, cacheLog, loadedLog in zip(*dataLogs):
+        np.testing.assert_allclose(cacheLog.PositionVector, spiceLog.PositionVector, rtol=0., atol=1.)
+        np.testing.assert_allclose(cacheLog.VelocityVector, spiceLog.VelocityVector, rtol=0., atol=1e-5)
+        np.testing.assert_allclose(np.array(cacheLog.J20002Pfix), np.array(spiceLog.J20002Pfix), rtol=0., atol=1e-9)
+        np.testing.assert_allclose(np.array(cacheLog.J20002Pfix_dot), np.array(spiceLog.J20002Pfix_dot),
+                                   rtol=0., atol=1e-13)
+        np.testing.assert_array_equal(loadedLog.PositionVector, cacheLog.PositionVector)
+        np.testing.assert_array_equal(np.array(loadedLog.J20002Pfix), np.array(cacheLog.J20002Pfix))
+
+    # a different time span is not served by the existing file
+    spiceObject = createSpiceObject(cacheFile, cacheDuration=86400.)
+    spiceObject.Reset(0)
+    assert spiceObject.ephemerisCacheActive()
+    spiceObject.UpdateState(macros.sec2nano(1.5*86400.))
+    assert not spiceObject.ephemerisCacheActive()
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    with tempfile.TemporaryDirectory() as tmpDir:
+        test_spiceEphemerisCache(pathlib.Path(tmpDir))
@@ -21,10 +21,14 @@
 #include <sstream>
 #include "../libs/cspice/include/SpiceUsr.h"
 #include <string.h>
+#include <fstream>
 #include "architecture/utilities/simDefinitions.h"
 #include "architecture/utilities/macroDefinitions.h"
 #include "architecture/utilities/rigidBodyKinematics.h"
 
+/*! number of state components of a body in the ephemeris cache: position, velocity, J20002Pfix and J20002Pfix_dot */
+static const uint32_t EPHEMERIS_CACHE_COMPONENTS = 24;
+
 /*! This constructor initializes the variables that spice uses.  Most of them are
  not intended to be changed, but a couple are user configurable.
  */
@@ -50,6 +54,11 @@ SpiceInterface::SpiceInterface()
     zeroBase = "SSB";
 	timeOutPicture = "MON DD,YYYY  HR:MN:SC.#### (UTC) ::UTC";
 
+    ephemerisCacheFile = "";
+    ephemerisCacheDuration = 0.0;
+    ephemerisCacheSegmentTime = 43200.0;
+    ephemerisCacheDegree = 15;
+
     //! - set default epoch time information
     char string[255];
     sprintf(string, "%4d/%02d/%02d, %02d:%02d:%04.1f (UTC)", EPOCH_YEAR, EPOCH_MONTH, EPOCH_DAY, EPOCH_HOUR, EPOCH_MIN, EPOCH_SEC);
@@ -149,6 +158,9 @@ void SpiceInterface::Reset(uint64_t CurrenSimNanos)
     }
     delete [] name;
 
+    //! - Load or create the optional Chebyshev ephemeris cache
+    this->setupEphemerisCache();
+
     // - Call Update state so that the spice bodies are inputted into the messaging system on reset
     this->UpdateState(CurrenSimNanos);
 }
@@ -274,9 +286,148 @@ void SpiceInterface::UpdateState(uint64_t CurrentSimNanos)
     this->julianDateCurrent = std::stod(localString);
     //! Get GPS and Planet data and then write the message outputs
     this->computeGPSData();
+    if (this->ephemerisCacheActive()) {
+        this->evaluateEphemerisCache();
+    } else {
+        this->pullSpiceData(&this->planetData);
+        this->pullSpiceData(&this->scData);
+    }
+    this->writeOutputMessages(CurrentSimNanos);
+}
+
+/*! This method loads the Chebyshev ephemeris cache from ephemerisCacheFile.  If the file does not exist or was
+ made for different kernels, bodies or time span, the planet and spacecraft states are fitted over the time span
+ [J2000ETInit, J2000ETInit + ephemerisCacheDuration] and the fits are saved to the file.
+ @return void
+ */
+void SpiceInterface::setupEphemerisCache()
+{
+    this->ephemerisCache.clear();
+    if (this->ephemerisCacheFile == "") {
+        return;
+    }
+    if (this->ephemerisCacheDuration <= 0.0 || this->ephemerisCacheSegmentTime <= 0.0
+        || this->ephemerisCacheDegree < 0) {
+        bskLogger.bskLog(BSK_ERROR, "The ephemeris cache requires a positive ephemerisCacheDuration and "
+                                    "ephemerisCacheSegmentTime, and a non-negative ephemerisCacheDegree.");
+        return;
+    }
+    uint32_t numBodies = (uint32_t) (this->planetData.size() + this->scData.size());
+    if (numBodies == 0) {
+        return;
+    }
+
+    std::string cacheKey = this->ephemerisCacheKey();
+    if (this->ephemerisCache.load(this->ephemerisCacheFile, cacheKey)) {
+        return;
+    }
+    this->ephemerisCache.fit(cacheKey, this->J2000ETInit, this->ephemerisCacheDuration,
+                             this->ephemerisCacheSegmentTime, (uint32_t) this->ephemerisCacheDegree, numBodies,
+                             EPHEMERIS_CACHE_COMPONENTS,
+                             [this](double ephemerisTime, double *states) {
+                                 this->sampleSpiceStates(ephemerisTime, states);
+                             });
+    if (!this->ephemerisCache.save(this->ephemerisCacheFile)) {
+        bskLogger.bskLog(BSK_WARNING, "Unable to write the ephemeris cache file %s.", this->ephemerisCacheFile.c_str());
+    }
+}
+
+/*! This method creates the key that identifies the data an ephemeris cache is made from.  It contains the name and
+ size of the loaded kernel files in the order they were loaded, the reference frame and origin, the time span and
+ segmentation, and the body and frame names.
+ @return std::string cache key
+ */
+std::string SpiceInterface::ephemerisCacheKey()
+{
+    std::ostringstream key;
+    key.precision(17);
+
+    SpiceInt numKernels;
+    SpiceInt handle;
+    SpiceBoolean found;
+    SpiceChar *fileName = new SpiceChar[this->charBufferSize];
+    SpiceChar fileType[32];
+    SpiceChar source[32];
+    ktotal_c("ALL", &numKernels);
+    for (SpiceInt i = 0; i < numKernels; i++) {
+        kdata_c(i, "ALL", this->charBufferSize, sizeof(fileType), sizeof(source), fileName, fileType, source,
+                &handle, &found);
+        if (!found) {
+            continue;
+        }
+        std::string path = fileName;
+        std::ifstream kernelFile(path, std::ios::binary | std::ios::ate);
+        key << path.substr(path.find_last_of("/\\") + 1) << ":" << (long long) kernelFile.tellg() << ";";
+    }
+    delete [] fileName;
+
+    key << "|" << this->referenceBase << "|" << this->zeroBase;
+    key << "|" << this->J2000ETInit << "|" << this->ephemerisCacheDuration << "|" << this->ephemerisCacheSegmentTime;
+    key << "|" << this->ephemerisCacheDegree;
+    for (long unsigned int c = 0; c < this->planetData.size(); c++) {
+        key << "|" << this->planetData[c].PlanetName << ":" << this->planetData[c].computeOrient;
+        if (c < this->planetFrames.size()) {
+            key << ":" << this->planetFrames[c];
+        }
+    }
+    for (long unsigned int c = 0; c < this->scData.size(); c++) {
+        key << "|" << this->scData[c].PlanetName << ":" << this->scData[c].computeOrient;
+    }
+
+    return key.str();
+}
+
+/*! This method queries SPICE for the states of all the planets and spacecraft at a given time.
+ @return void
+ @param ephemerisTime s ephemeris time at which the states are sampled
+ @param states array of the position, velocity, J20002Pfix and J20002Pfix_dot of every planet and spacecraft
+ */
+void SpiceInterface::sampleSpiceStates(double ephemerisTime, double *states)
+{
+    double currentTime = this->J2000Current;
+    this->J2000Current = ephemerisTime;
     this->pullSpiceData(&this->planetData);
     this->pullSpiceData(&this->scData);
-    this->writeOutputMessages(CurrentSimNanos);
+    this->J2000Current = currentTime;
+
+    for (std::vector<SpicePlanetStateMsgPayload> *spiceData : {&this->planetData, &this->scData}) {
+        for (SpicePlanetStateMsgPayload &body : *spiceData) {
+            v3Copy(body.PositionVector, &states[0]);
+            v3Copy(body.VelocityVector, &states[3]);
+            memcpy(&states[6], body.J20002Pfix, 9 * sizeof(double));
+            memcpy(&states[15], body.J20002Pfix_dot, 9 * sizeof(double));
+            states += EPHEMERIS_CACHE_COMPONENTS;
+        }
+    }
+}
+
+/*! This method checks if the states at the current time are provided by the ephemeris cache.
+ @return bool
+ */
+bool SpiceInterface::ephemerisCacheActive()
+{
+    return this->ephemerisCache.contains(this->J2000Current)
+        && this->ephemerisCache.getNumBodies() == this->planetData.size() + this->scData.size();
+}
+
+/*! This method evaluates the planet and spacecraft states at the current time from the ephemeris cache.
+ @return void
+ */
+void SpiceInterface::evaluateEphemerisCache()
+{
+    double state[EPHEMERIS_CACHE_COMPONENTS];
+    uint32_t c = 0;   // body counter
+    for (std::vector<SpicePlanetStateMsgPayload> *spiceData : {&this->planetData, &this->scData}) {
+        for (SpicePlanetStateMsgPayload &body : *spiceData) {
+            this->ephemerisCache.evaluate(this->J2000Current, c, state);
+            v3Copy(&state[0], body.PositionVector);
+            v3Copy(&state[3], body.VelocityVector);
+            memcpy(body.J20002Pfix, &state[6], 9 * sizeof(double));
+            memcpy(body.J20002Pfix_dot, &state[15], 9 * sizeof(double));
+            body.J2000Current = this->J2000Current;
+            c++;
+        }
+    }
 }
 
 /*! take a vector of planet name strings and create the vector of
@@ -290,6 +441,7 @@ void SpiceInterface::addPlanetNames(std::vector<std::string> planetNames) {
     }
     this->planetStateOutMsgs.clear();
     this->planetData.clear();
+    this->ephemerisCache.clear();
 
     for (it = planetNames.begin(); it != planetNames.end(); it++) {
         Message<SpicePlanetStateMsgPayload> *spiceOutMsg;
@@ -333,6 +485,7 @@ void SpiceInterface::addSpacecraftNames(std::vector<std::string> spacecraftNames
     this->attRefStateOutMsgs.clear();
     this->transRefStateOutMsgs.clear();
     this->scData.clear();
+    this->ephemerisCache.clear();
 
     for (it = spacecraftNames.begin(); it != spacecraftNames.end(); it++) {
         /* append to spacecraft related output messages */
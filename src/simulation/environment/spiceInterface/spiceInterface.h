@@ -26,6 +26,7 @@
 #include "architecture/utilities/linearAlgebra.h"
 #include "architecture/utilities/bskLogging.h"
 #include "architecture/utilities/avsEigenSupport.h"
+#include "simulation/environment/_GeneralModuleFiles/chebyshevEphemerisCache.h"
 
 #include "architecture/msgPayloadDefC/SpicePlanetStateMsgPayload.h"
 #include "architecture/msgPayloadDefC/SpiceTimeMsgPayload.h"
@@ -53,6 +54,7 @@ public:
     void clearKeeper();                         //!< class method
     void addPlanetNames(std::vector<std::string> planetNames);
     void addSpacecraftNames(std::vector<std::string> spacecraftNames);
+    bool ephemerisCacheActive();
 
 public:
     Message<SpiceTimeMsgPayload> spiceTimeOutMsg;    //!< spice time sampling output message
@@ -72,6 +74,11 @@ public:
     std::string UTCCalInit;     //!< -- UTC time string for init time
 
     std::vector<std::string>planetFrames; //!< -- Optional vector of planet frame names.  Default values are IAU_ + planet name
+
+    std::string ephemerisCacheFile;     //!< -- (optional) file of the Chebyshev ephemeris cache, default is empty and SPICE is queried at every update
+    double ephemerisCacheDuration;      //!< s  time span after the initial epoch covered by the ephemeris cache
+    double ephemerisCacheSegmentTime;   //!< s  duration of a Chebyshev segment of the ephemeris cache, default is 43200 s
+    int ephemerisCacheDegree;           //!< -- degree of the Chebyshev polynomials of the ephemeris cache, default is 15
     
     bool timeDataInit;          //!< -- Flag indicating whether time has been init
     double J2000ETInit;         //!< s Seconds elapsed since J2000 at init
@@ -87,8 +94,14 @@ private:
     std::string GPSEpochTime;   //!< -- String for the GPS epoch
     double JDGPSEpoch;          //!< s Epoch for GPS time.  Saved for efficiency
 
+    void setupEphemerisCache();
+    std::string ephemerisCacheKey();
+    void sampleSpiceStates(double ephemerisTime, double *states);
+    void evaluateEphemerisCache();
+
     std::vector<SpicePlanetStateMsgPayload> planetData;
     std::vector<SpicePlanetStateMsgPayload> scData;
+    ChebyshevEphemerisCache ephemerisCache;     //!< -- Chebyshev fits of the planet and spacecraft states
 
 };
 
@@ -28,6 +28,7 @@
 #include "architecture/msgPayloadDefC/DataNodeUsageMsgPayload.h"
 #include "architecture/msgPayloadDefC/DeviceCmdMsgPayload.h"
 #include "architecture/msgPayloadDefCpp/DataStorageStatusMsgPayload.h"
+#include "architecture/msgPayloadDefCpp/DataStorageLevelsMsgPayload.h"
 #include "architecture/messaging/messaging.h"
 
 
@@ -21,6 +21,14 @@
 #include "architecture/utilities/macroDefinitions.h"
 #include <iostream>
 
+/*! Returns the storedDataIndex key of a data name, which is cut to the length of a dataInstance name
+ @param dataName name of the data
+ @return key
+ */
+static std::string dataInstanceKey(const char *dataName){
+    return std::string(dataName, strnlen(dataName, sizeof(dataInstance::dataInstanceName) - 1));
+}
+
 /*! This method initializes some basic parameters for the module.
  @return void
  */
@@ -29,6 +37,8 @@ DataStorageUnitBase::DataStorageUnitBase(){
     this->nodeDataUseInMsgs.clear(); //! - Clear the vector of input messages.
     this->storedDataSum = 0.0; //! - Initialize the dataSum to 0.
     this->netBaud = 0.0; //! - Initialize the netBaudRate to 0.
+    this->storedDataIndexValid = false; //! - Build the name to index map at the first look up.
+    this->storageLevelsMsg = this->storageUnitLevelsOutMsg.zeroMsgPayload;
     return;
 }
 
@@ -131,22 +141,35 @@ bool DataStorageUnitBase::readMessages()
  @return void
  */
 void DataStorageUnitBase::writeMessages(uint64_t CurrentClock){
-    //! zero output message to begin with
-    this->storageStatusMsg = this->storageUnitDataOutMsg.zeroMsgPayload;
-
     //! - Set first three message parameters
     this->storageStatusMsg.currentNetBaud = this->netBaud;
     this->storageStatusMsg.storageCapacity = this->storageCapacity;
     this->storageStatusMsg.storageLevel = this->storedDataSum;
 
-    //! - Loop through stored data and copy over to the output message
+    //! - Copy the stored data to the output message in place, such that the names are only copied when they change
+    bool namesChanged = this->storageStatusMsg.storedDataName.size() != this->storedData.size();
+    this->storageStatusMsg.storedDataName.resize(this->storedData.size());
+    this->storageStatusMsg.storedData.resize(this->storedData.size());
     for(uint64_t i = 0; i < this->storedData.size(); i++){
-        this->storageStatusMsg.storedDataName.push_back(this->storedData[i].dataInstanceName);
-        this->storageStatusMsg.storedData.push_back(this->storedData[i].dataInstanceSum);
+        if (this->storageStatusMsg.storedDataName[i] != this->storedData[i].dataInstanceName) {
+            this->storageStatusMsg.storedDataName[i] = this->storedData[i].dataInstanceName;
+            namesChanged = true;
+        }
+        this->storageStatusMsg.storedData[i] = this->storedData[i].dataInstanceSum;
     }
 
     this->storageUnitDataOutMsg.write(&this->storageStatusMsg, this->moduleID, CurrentClock);
 
+    //! - Write the stored data amounts without the names, which readers only copy again when the names changed
+    this->storageLevelsMsg.currentNetBaud = this->storageStatusMsg.currentNetBaud;
+    this->storageLevelsMsg.storageCapacity = this->storageStatusMsg.storageCapacity;
+    this->storageLevelsMsg.storageLevel = this->storageStatusMsg.storageLevel;
+    this->storageLevelsMsg.storedData = this->storageStatusMsg.storedData;
+    if (namesChanged) {
+        this->storageLevelsMsg.storedDataNameCount++;
+    }
+    this->storageUnitLevelsOutMsg.write(&this->storageLevelsMsg, this->moduleID, CurrentClock);
+
     //! - call the custom method to perform additional output message writing
     customWriteMessages(CurrentClock);
     return;
@@ -158,35 +181,36 @@ void DataStorageUnitBase::writeMessages(uint64_t CurrentClock){
  */
 void DataStorageUnitBase::integrateDataStatus(double currentTime){
     int index = -1;
+    double dataChange;
     this->currentTimestep = currentTime - this->previousTime;
     this->netBaud = 0;
-    dataInstance tmpDataInstance;
+
+    //! - Sum all data in storedData vector, the sum is then updated with the data added by each data node
+    this->storedDataSum = this->sumAllData();
 
     //! - loop over all the data nodes
     std::vector<DataNodeUsageMsgPayload>::iterator it;
     for(it = nodeBaudMsgs.begin(); it != nodeBaudMsgs.end(); it++) {
         index = messageInStoredData(&(*it));
+        dataChange = it->baudRate * (this->currentTimestep);
 
         //! - If the storage capacity has not been reached or the baudRate is less than 0 and won't take below 0, then add the data
        if ((this->storedDataSum < this->storageCapacity) || (it->baudRate < 0)) {
            //! - if a dataNode exists in storedData vector, integrate and add to current amount
            if (index != -1) {
                //! Only perform if this operation will not take the sum below zero
-               if ((this->storedData[(size_t) index].dataInstanceSum + it->baudRate * (this->currentTimestep)) >= 0) {
-                   this->storedData[(size_t) index].dataInstanceSum += it->baudRate * (this->currentTimestep);
+               if ((this->storedData[(size_t) index].dataInstanceSum + dataChange) >= 0) {
+                   this->storedData[(size_t) index].dataInstanceSum += dataChange;
+                   this->storedDataSum += dataChange;
                }
                //! - if a dataNode does not exist in storedData, add it to storedData, integrate baud rate, and add amount
            }
            else if (strcmp(it->dataName, "") != 0) {
-               strncpy(tmpDataInstance.dataInstanceName, it->dataName, sizeof(tmpDataInstance.dataInstanceName));
-               tmpDataInstance.dataInstanceSum = it->baudRate * (this->currentTimestep);
-               this->storedData.push_back(tmpDataInstance);
+               this->addDataInstance(it->dataName, dataChange);
+               this->storedDataSum += dataChange;
            }
        }
         this->netBaud += it->baudRate;
-
-        //! - Sum all data in storedData vector
-        this->storedDataSum = this->sumAllData();
     }
 
     //! - Update previousTime
@@ -194,21 +218,88 @@ void DataStorageUnitBase::integrateDataStatus(double currentTime){
     return;
 }
 
-/*! Checks to see if a data node is in the storedData vector or not, returns the index.
+/*! Checks to see if a data node is in the storedData vector or not, returns the index.  The name is looked up in
+ the storedDataIndex map, which is rebuilt if it was invalidated.
  * @param tmpNodeMsg
  * @return index
  */
 int DataStorageUnitBase::messageInStoredData(DataNodeUsageMsgPayload *tmpNodeMsg){
-    // Initialize index as -1 (indicates data is not in storedData)
-    int index = -1;
+    if (!this->storedDataIndexValid) {
+        this->buildStoredDataIndex();
+    }
 
-    // Loop through storedData. If dataName is found, set index = i
-    for (uint64_t i = 0; i < this->storedData.size(); i++){
-        if (strcmp(this->storedData[i].dataInstanceName, tmpNodeMsg->dataName) == 0){
-            index = (int) i;
-        }
+    std::unordered_map<std::string, size_t>::const_iterator it;
+    it = this->storedDataIndex.find(dataInstanceKey(tmpNodeMsg->dataName));
+    if (it == this->storedDataIndex.end()) {
+        return -1;
+    }
+    return (int) it->second;
+}
+
+/*! Adds a data instance to the storedData vector and its name to the storedDataIndex map.  If the name is already
+ in storedData, the data is not added again.
+ @param dataName name of the data instance
+ @param dataSum [bits] initial amount of data
+ @return index of the data instance in storedData
+ */
+int DataStorageUnitBase::addDataInstance(const char *dataName, double dataSum){
+    dataInstance tmpDataInstance;
+    std::string name = dataInstanceKey(dataName);
+
+    if (!this->storedDataIndexValid) {
+        this->buildStoredDataIndex();
+    }
+    std::unordered_map<std::string, size_t>::const_iterator it = this->storedDataIndex.find(name);
+    if (it != this->storedDataIndex.end()) {
+        return (int) it->second;
+    }
+
+    strncpy(tmpDataInstance.dataInstanceName, name.c_str(), sizeof(tmpDataInstance.dataInstanceName));
+    tmpDataInstance.dataInstanceSum = dataSum;
+    this->storedData.push_back(tmpDataInstance);
+    this->storedDataIndex[name] = this->storedData.size() - 1;
+    return (int) (this->storedData.size() - 1);
+}
+
+/*! Removes a data instance from the storedData vector and the storedDataIndex map
+ @param dataName name of the data instance
+ @return true if the data instance was found and removed
+ */
+bool DataStorageUnitBase::removeDataInstance(const char *dataName){
+    if (!this->storedDataIndexValid) {
+        this->buildStoredDataIndex();
+    }
+    std::unordered_map<std::string, size_t>::iterator it;
+    it = this->storedDataIndex.find(dataInstanceKey(dataName));
+    if (it == this->storedDataIndex.end()) {
+        return false;
+    }
+
+    //! - The entries after the removed one move down by one in storedData
+    this->storedData.erase(this->storedData.begin() + (long) it->second);
+    this->buildStoredDataIndex();
+    return true;
+}
+
+/*! Marks the storedDataIndex map for a rebuild at the next look up.  Child classes call this method after they
+ add, remove or rename entries of the storedData vector directly.
+ @return void
+ */
+void DataStorageUnitBase::invalidateStoredDataIndex(){
+    this->storedDataIndexValid = false;
+}
+
+/*! Rebuilds the storedDataIndex map from the names in the storedData vector.  If a name is in storedData more than
+ once, the map holds its last index.
+ @return void
+ */
+void DataStorageUnitBase::buildStoredDataIndex(){
+    this->storedDataIndex.clear();
+    this->storedDataIndex.reserve(this->storedData.size());
+    for (size_t i = 0; i < this->storedData.size(); i++){
+        this->storedDataIndex[dataInstanceKey(this->storedData[i].dataInstanceName)] = i;
     }
-    return index;
+    this->storedDataIndexValid = true;
 }
 
 /*! Sums all of the data in the storedData vector
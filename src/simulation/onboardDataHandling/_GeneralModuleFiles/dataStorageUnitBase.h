@@ -21,10 +21,12 @@
 #include <vector>
 #include <string>
 #include <cstring>
+#include <unordered_map>
 #include "architecture/_GeneralModuleFiles/sys_model.h"
 
 #include "architecture/msgPayloadDefC/DataNodeUsageMsgPayload.h"
 #include "architecture/msgPayloadDefCpp/DataStorageStatusMsgPayload.h"
+#include "architecture/msgPayloadDefCpp/DataStorageLevelsMsgPayload.h"
 #include "architecture/messaging/messaging.h"
 
 #include "architecture/utilities/bskLogging.h"
@@ -54,19 +56,27 @@ protected:
     virtual void customWriteMessages(uint64_t CurrentClock); //!< custom Write method, similar to customSelfInit.
     virtual bool customReadMessages(); //!< Custom read method, similar to customSelfInit; returns `true' by default.
     int messageInStoredData(DataNodeUsageMsgPayload *tmpNodeMsg); //!< Returns index of the dataName if it's already in storedData
+    int addDataInstance(const char *dataName, double dataSum); //!< Adds a data instance to storedData and returns its index
+    bool removeDataInstance(const char *dataName); //!< Removes a data instance from storedData
+    void invalidateStoredDataIndex(); //!< Marks the name to index map of storedData for a rebuild
+    void buildStoredDataIndex(); //!< Rebuilds the name to index map of storedData
     double sumAllData(); //!< Sums all of the data in the storedData vector
 
 public:
     std::vector<ReadFunctor<DataNodeUsageMsgPayload>> nodeDataUseInMsgs; //!< Vector of data node input message names
     Message<DataStorageStatusMsgPayload> storageUnitDataOutMsg; //!< Vector of message names to be written out by the storage unit
+    Message<DataStorageLevelsMsgPayload> storageUnitLevelsOutMsg; //!< Stored data amounts of the storage unit without the data names
     double storageCapacity; //!< Storage capacity of the storage unit
     BSKLogger bskLogger;    //!< logging variable
 
 protected:
     DataStorageStatusMsgPayload storageStatusMsg; //!< class variable
+    DataStorageLevelsMsgPayload storageLevelsMsg; //!< class variable
     std::vector<DataNodeUsageMsgPayload> nodeBaudMsgs; //!< class variable
     double storedDataSum; //!< [bits] Stored data in bits.
-    std::vector<dataInstance> storedData; //!< Vector of data. Represents the makeup of the data buffer.
+    std::vector<dataInstance> storedData; //!< Vector of data. Represents the makeup of the data buffer.  Child classes that add, remove or rename entries without addDataInstance() or removeDataInstance() must call invalidateStoredDataIndex().
+    std::unordered_map<std::string, size_t> storedDataIndex; //!< Index of each data instance name in storedData
+    bool storedDataIndexValid; //!< Flag indicating that storedDataIndex matches the names in storedData
     double previousTime; //!< Previous time used for integration
     double currentTimestep;//!< [s] Timestep duration in seconds.
     double netBaud; //!< Net baud rate at a given time step
@@ -32,6 +32,8 @@ public:
     SpaceToGroundTransmitter();
     ~SpaceToGroundTransmitter();
     void addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg);
+    void addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg,
+                                     Message<DataStorageLevelsMsgPayload> *tmpStorageLevelsMsg);
     void addAccessMsgToTransmitter(Message<AccessMsgPayload> *tmpAccessMsg);
 
 private:
@@ -42,6 +44,7 @@ public:
     double packetSize; //!< Size of packet to downklink (bytes)
     int numBuffers; //!< Number of buffers the transmitter can access
     std::vector<ReadFunctor<DataStorageStatusMsgPayload>> storageUnitInMsgs; //!< vector of input messages for storage unit messages
+    std::vector<ReadFunctor<DataStorageLevelsMsgPayload>> storageUnitLevelsInMsgs; //!< vector of optional stored data amount messages of the storage units
     std::vector<ReadFunctor<AccessMsgPayload>> groundLocationAccessInMsgs;   //!< vector of input message for ground location access
     std::vector<DataStorageStatusMsgPayload> storageUnitMsgsBuffer;   //!< local copy of data storage messages
     uint64_t hasAccess;                                     //!< class variable
@@ -51,6 +54,7 @@ private:
     double packetTransmitted; //!< Amount of packet downlinked (bytes)
     double currentTimestep; //!< Current timestep tracked for data packet integration
     double previousTime; //!< Previous timestep tracked for data packet integration
+    std::vector<uint64_t> storedDataNameCounts; //!< storedDataNameCount of the storage unit names read last
     std::vector<AccessMsgPayload> groundLocationAccessMsgs; //!< local copy of ground access messages
 };
 #endif //BASILISK_SPACETOGROUNDTRANSMITTER_H
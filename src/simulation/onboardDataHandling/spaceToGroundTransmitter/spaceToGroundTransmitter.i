@@ -33,6 +33,7 @@ struct DataNodeUsageMsg_C;
 %include "architecture/msgPayloadDefC/DeviceCmdMsgPayload.h"
 struct DeviceCmdMsg_C;
 %include "architecture/msgPayloadDefCpp/DataStorageStatusMsgPayload.h"
+%include "architecture/msgPayloadDefCpp/DataStorageLevelsMsgPayload.h"
 %include "architecture/msgPayloadDefC/AccessMsgPayload.h"
 struct AccessMsg_C;
 
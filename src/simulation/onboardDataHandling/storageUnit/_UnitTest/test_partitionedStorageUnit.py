@@ -18,6 +18,7 @@
 
 import pytest
 import os, inspect
+import time
 
 filename = inspect.getframeinfo(inspect.currentframe()).filename
 path = os.path.dirname(os.path.abspath(filename))
@@ -25,6 +26,7 @@ bskName = 'Basilisk'
 splitPath = path.split(bskName)
 
 # Import all of the modules that we are going to be called in this simulation
+from Basilisk.architecture import bskLogging
 from Basilisk.utilities import SimulationBaseClass
 from Basilisk.utilities import unitTestSupport                  # general support file with common unit test functions
 from Basilisk.simulation import partitionedStorageUnit
@@ -124,5 +126,74 @@ def check_storage_limits(show_plots):
     return [testFailCount, ''.join(testMessages)]
 
 
+def test_partitionManagement():
+    r"""
+    **Validation Test Description**
+
+    Partitions are added, added twice and removed before the simulation.  The data of a node whose partition
+    doesn't exist is stored in a new partition after the existing ones.  The output message must list the
+    partitions in the order they were added, with the integrated data of each node.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_ERROR)
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask("unitTask", macros.sec2nano(0.1)))
+
+    storageUnit = partitionedStorageUnit.PartitionedStorageUnit()
+    storageUnit.storageCapacity = 1e6
+    for dataName in ["partitionA", "partitionB", "partitionC", "partitionA"]:
+        storageUnit.addPartition(dataName)
+    assert storageUnit.removePartition("partitionB")
+    assert not storageUnit.removePartition("partitionB")
+
+    dataMsgs = []
+    for dataName, baudRate in [("partitionC", 100.), ("partitionD", 50.)]:
+        dataPayload = messaging.DataNodeUsageMsgPayload()
+        dataPayload.baudRate = baudRate
+        dataPayload.dataName = dataName
+        dataMsgs.append(messaging.DataNodeUsageMsg().write(dataPayload))
+        storageUnit.addDataNodeToModel(dataMsgs[-1])
+    unitTestSim.AddModelToTask("unitTask", storageUnit)
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.ConfigureStopTime(macros.sec2nano(1.0))
+    unitTestSim.ExecuteSimulation()
+
+    status = storageUnit.storageUnitDataOutMsg.read()
+    assert list(status.storedDataName) == ["partitionA", "partitionC", "partitionD"]
+    assert status.storedData[0] == 0.
+    assert status.storedData[1] == pytest.approx(100.)
+    assert status.storedData[2] == pytest.approx(50.)
+    assert status.storageLevel == pytest.approx(150.)
+
+
+def benchmarkPartitions():
+    """print the time needed to run a partitioned storage unit with one data node per partition"""
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    for numPartitions in [10, 100, 1000, 10000]:
+        unitTestSim = SimulationBaseClass.SimBaseClass()
+        testProc = unitTestSim.CreateNewProcess("TestProcess")
+        testProc.addTask(unitTestSim.CreateNewTask("unitTask", macros.sec2nano(1.)))
+        storageUnit = partitionedStorageUnit.PartitionedStorageUnit()
+        storageUnit.storageCapacity = 1e12
+        dataMsgs = []
+        for k in range(numPartitions):
+            dataName = "target" + str(k)
+            storageUnit.addPartition(dataName)
+            dataPayload = messaging.DataNodeUsageMsgPayload()
+            dataPayload.baudRate = 1e3
+            dataPayload.dataName = dataName
+            dataMsgs.append(messaging.DataNodeUsageMsg().write(dataPayload))
+            storageUnit.addDataNodeToModel(dataMsgs[-1])
+        unitTestSim.AddModelToTask("unitTask", storageUnit)
+        unitTestSim.InitializeSimulation()
+        unitTestSim.ConfigureStopTime(macros.sec2nano(100.))
+        start = time.perf_counter()
+        unitTestSim.ExecuteSimulation()
+        print(f"{numPartitions} partitions: {time.perf_counter() - start:.3f} s")
+
+
 if __name__ == "__main__":
-    print(test_module(False))
\ No newline at end of file
+    print(test_module(False))
+    test_partitionManagement()
+    benchmarkPartitions()
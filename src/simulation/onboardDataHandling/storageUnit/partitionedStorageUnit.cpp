@@ -56,9 +56,22 @@ void PartitionedStorageUnit::customReset(uint64_t currentClock){
  @return void
  */
 void PartitionedStorageUnit::addPartition(std::string dataName){
-    dataInstance tmpDataInstance;
-    strncpy(tmpDataInstance.dataInstanceName, dataName.c_str(), sizeof(tmpDataInstance.dataInstanceName));
-    tmpDataInstance.dataInstanceSum = 0.0;
-    this->storedData.push_back(tmpDataInstance);
+    size_t numPartitions = this->storedData.size();
+    this->addDataInstance(dataName.c_str(), 0.0);
+    if (this->storedData.size() == numPartitions) {
+        bskLogger.bskLog(BSK_WARNING, "The partition %s is already in the storage unit.", dataName.c_str());
+    }
     return;
-}
\ No newline at end of file
+}
+
+/*! Removes a partition and its stored data from the storageUnit
+ @param dataName
+ @return true if the partition was found and removed
+ */
+bool PartitionedStorageUnit::removePartition(std::string dataName){
+    if (!this->removeDataInstance(dataName.c_str())) {
+        bskLogger.bskLog(BSK_WARNING, "The partition %s is not in the storage unit.", dataName.c_str());
+        return false;
+    }
+    return true;
+}
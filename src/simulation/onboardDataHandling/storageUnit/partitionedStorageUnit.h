@@ -30,6 +30,7 @@ public:
     PartitionedStorageUnit();
     ~PartitionedStorageUnit();
     void addPartition(std::string dataName);
+    bool removePartition(std::string dataName);
 
 private:
     void customReset(uint64_t CurrentClock) override;
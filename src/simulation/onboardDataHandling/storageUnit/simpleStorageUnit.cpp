@@ -61,7 +61,7 @@ void SimpleStorageUnit::integrateDataStatus(double currentTime){
     std::vector<DataNodeUsageMsgPayload>::iterator it;
     for(it = nodeBaudMsgs.begin(); it != nodeBaudMsgs.end(); it++) {
         if (storedData.size() == 0){
-            this->storedData.push_back({{'S','T','O','R','E','D',' ','D','A','T','A'}, 0});
+            this->addDataInstance("STORED DATA", 0.0);
         }
         else if ((this->storedDataSum < this->storageCapacity) || (it->baudRate <= 0)){
             //! - Only perform the operation if it will not result in less than 0 data
@@ -38,6 +38,7 @@ from Basilisk.architecture.swig_common_model import *
 %include "architecture/msgPayloadDefC/DataNodeUsageMsgPayload.h"
 struct DataNodeUsageMsg_C;
 %include "architecture/msgPayloadDefCpp/DataStorageStatusMsgPayload.h"
+%include "architecture/msgPayloadDefCpp/DataStorageLevelsMsgPayload.h"
 
 %pythoncode %{
 import sys
@@ -15,6 +15,7 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+import numpy as np
 import pytest
 import os, inspect
 
@@ -202,10 +203,80 @@ def checkStatus():
     # this check below just makes sure no sub-test failures were found
     return [testFailCount, ''.join(testMessages)]
 
+def test_storageLevelsInput():
+    r"""
+    **Validation Test Description**
+
+    Two transmitters downlink from two identical storage units with several instruments, one reading the storage
+    unit status message and one reading the stored data amounts of the storage levels message.  A partition that is
+    added during the simulation must reach the second transmitter through the data names of the status message,
+    and both transmitters must produce the same output.  The storage levels message must match the status message.
+    """
+    unitTaskName = "unitTask"
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask(unitTaskName, macros.sec2nano(0.5)))
+
+    instruments = []
+    for k in range(3):
+        instrument = simpleInstrument.SimpleInstrument()
+        instrument.ModelTag = "instrument" + str(k)
+        instrument.nodeBaudRate = 1200. * (k + 1)
+        instrument.nodeDataName = "Instrument " + str(k)
+        unitTestSim.AddModelToTask(unitTaskName, instrument)
+        instruments.append(instrument)
+
+    transmitters = []
+    dataMonitors = []
+    dataLogs = []
+    for useLevels in [False, True]:
+        transmitter = simpleTransmitter.SimpleTransmitter()
+        transmitter.ModelTag = "transmitter" + str(useLevels)
+        transmitter.nodeBaudRate = -2400.
+        transmitter.packetSize = -4800
+        transmitter.numBuffers = 1
+        unitTestSim.AddModelToTask(unitTaskName, transmitter)
+
+        dataMonitor = partitionedStorageUnit.PartitionedStorageUnit()
+        dataMonitor.ModelTag = "dataMonitor" + str(useLevels)
+        dataMonitor.storageCapacity = 8E9
+        for instrument in instruments[:2]:
+            dataMonitor.addDataNodeToModel(instrument.nodeDataOutMsg)
+        dataMonitor.addDataNodeToModel(transmitter.nodeDataOutMsg)
+        unitTestSim.AddModelToTask(unitTaskName, dataMonitor)
+
+        if useLevels:
+            transmitter.addStorageUnitToTransmitter(dataMonitor.storageUnitDataOutMsg,
+                                                    dataMonitor.storageUnitLevelsOutMsg)
+        else:
+            transmitter.addStorageUnitToTransmitter(dataMonitor.storageUnitDataOutMsg)
+        dataLogs.append(transmitter.nodeDataOutMsg.recorder())
+        unitTestSim.AddModelToTask(unitTaskName, dataLogs[-1])
+        transmitters.append(transmitter)
+        dataMonitors.append(dataMonitor)
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.ConfigureStopTime(macros.sec2nano(5.0))
+    unitTestSim.ExecuteSimulation()
+    for dataMonitor in dataMonitors:
+        dataMonitor.addDataNodeToModel(instruments[2].nodeDataOutMsg)
+    unitTestSim.ConfigureStopTime(macros.sec2nano(20.0))
+    unitTestSim.ExecuteSimulation()
+
+    np.testing.assert_array_equal(dataLogs[1].baudRate, dataLogs[0].baudRate)
+    assert list(transmitters[1].storageUnitMsgs[0].storedDataName) == ["Instrument 0", "Instrument 1",
+                                                                       "Instrument 2"]
+    statusMsg = dataMonitors[1].storageUnitDataOutMsg.read()
+    levelsMsg = dataMonitors[1].storageUnitLevelsOutMsg.read()
+    assert levelsMsg.storageLevel == statusMsg.storageLevel
+    assert list(levelsMsg.storedData) == list(statusMsg.storedData)
+
+
 #
 # This statement below ensures that the unitTestScript can be run as a
 # stand-alone python script
 #
 if __name__ == "__main__":
     checkDefault()
-    checkStatus()
\ No newline at end of file
+    checkStatus()
+    test_storageLevelsInput()
\ No newline at end of file
@@ -43,15 +43,30 @@ SimpleTransmitter::~SimpleTransmitter(){
  */
 void SimpleTransmitter::addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg){
     this->storageUnitInMsgs.push_back(tmpStorageUnitMsg->addSubscriber());
+    this->storageUnitLevelsInMsgs.push_back(ReadFunctor<DataStorageLevelsMsgPayload>());
+    this->storedDataNameCounts.push_back(~((uint64_t) 0));
     return;
 }
 
+/*! Adds a dataStorageStatusMsgPayload to be accessed by transmitter, together with the stored data amount message of
+ the same storage unit.  The amounts are then read every step, while the data names are only copied from the
+ storage status message when they changed.
+ @return void
+ @param tmpStorageUnitMsg storage unit status message
+ @param tmpStorageLevelsMsg stored data amount message of the same storage unit
+ */
+void SimpleTransmitter::addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg,
+                                            Message<DataStorageLevelsMsgPayload> *tmpStorageLevelsMsg){
+    this->addStorageUnitToTransmitter(tmpStorageUnitMsg);
+    this->storageUnitLevelsInMsgs.back() = tmpStorageLevelsMsg->addSubscriber();
+    return;
+}
 
-bool SimpleTransmitter::customReadMessages(){
 
-    DataStorageStatusMsgPayload nodeMsg;
+bool SimpleTransmitter::customReadMessages(){
 
-    this->storageUnitMsgs.clear();
+    //! - the local copies are overwritten in place, such that their vectors keep their memory
+    this->storageUnitMsgs.resize(this->storageUnitInMsgs.size());
 
     //! - read in the data node use/supply messages
     bool dataRead = true;
@@ -62,10 +77,23 @@ bool SimpleTransmitter::customReadMessages(){
         for(long unsigned int c=0; c<storageUnitInMsgs.size(); c++)
         {
             tmpDataRead = this->storageUnitInMsgs.at(c).isWritten();
-            nodeMsg = this->storageUnitInMsgs.at(c)();
             dataRead = dataRead && tmpDataRead;
 
-            this->storageUnitMsgs.push_back(nodeMsg);
+            if (c < this->storageUnitLevelsInMsgs.size() && this->storageUnitLevelsInMsgs.at(c).isLinked()) {
+                //! - copy the stored data amounts, and the data names only when the storage unit changed them
+                const DataStorageLevelsMsgPayload &levelsMsg = this->storageUnitLevelsInMsgs.at(c)();
+                DataStorageStatusMsgPayload &unitMsg = this->storageUnitMsgs[c];
+                unitMsg.storageLevel = levelsMsg.storageLevel;
+                unitMsg.storageCapacity = levelsMsg.storageCapacity;
+                unitMsg.currentNetBaud = levelsMsg.currentNetBaud;
+                unitMsg.storedData = levelsMsg.storedData;
+                if (levelsMsg.storedDataNameCount != this->storedDataNameCounts[c]) {
+                    unitMsg.storedDataName = this->storageUnitInMsgs.at(c)().storedDataName;
+                    this->storedDataNameCounts[c] = levelsMsg.storedDataNameCount;
+                }
+            } else {
+                this->storageUnitMsgs[c] = this->storageUnitInMsgs.at(c)();
+            }
         }
     }
     else {
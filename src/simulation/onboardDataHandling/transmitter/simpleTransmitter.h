@@ -29,6 +29,8 @@ public:
     SimpleTransmitter();
     ~SimpleTransmitter();
     void addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg);
+    void addStorageUnitToTransmitter(Message<DataStorageStatusMsgPayload> *tmpStorageUnitMsg,
+                                     Message<DataStorageLevelsMsgPayload> *tmpStorageLevelsMsg);
 
 private:
     void evaluateDataModel(DataNodeUsageMsgPayload *dataUsageMsg, double currentTime);
@@ -40,6 +42,7 @@ public:
     int numBuffers; //!< Number of buffers the transmitter can access
     int currentIndex; //!< Current partition that the transmitter is downlinking a packet for
     std::vector<ReadFunctor<DataStorageStatusMsgPayload>> storageUnitInMsgs;  //!< Vector of data node input message names
+    std::vector<ReadFunctor<DataStorageLevelsMsgPayload>> storageUnitLevelsInMsgs; //!< vector of optional stored data amount messages of the storage units
     std::vector<DataStorageStatusMsgPayload> storageUnitMsgs;   //!< local copies of input messages
     BSKLogger bskLogger;                                    //!< class variable
 
@@ -47,6 +50,7 @@ private:
     double packetTransmitted; //!< Amount of packet downlinked (bytes)
     double currentTimestep; //!< Current timestep tracked for data packet integration
     double previousTime; //!< Previous timestep tracked for data packet integration
+    std::vector<uint64_t> storedDataNameCounts; //!< storedDataNameCount of the storage unit names read last
 };
 
 
@@ -38,6 +38,7 @@ struct DataNodeUsageMsg_C;
 %include "architecture/msgPayloadDefC/DeviceCmdMsgPayload.h"
 struct DeviceCmdMsg_C;
 %include "architecture/msgPayloadDefCpp/DataStorageStatusMsgPayload.h"
+%include "architecture/msgPayloadDefCpp/DataStorageLevelsMsgPayload.h"
 
 %pythoncode %{
 import sys
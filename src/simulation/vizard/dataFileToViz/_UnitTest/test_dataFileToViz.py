@@ -445,6 +445,75 @@ def run(show_plots, convertPosUnits, attType, checkThruster, checkRW, verbose):
 
 
 #
+def replayDataFile(dataFileName, dtSeconds, simTimeSeconds, useDataFileTime):
+    """run the module on a data file of 2 spacecraft and return the recorded spacecraft positions"""
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask("unitTask", macros.sec2nano(dtSeconds)))
+
+    testModule = dataFileToViz.DataFileToViz()
+    testModule.ModelTag = "testModule"
+    testModule.setNumOfSatellites(2)
+    testModule.dataFileName = dataFileName
+    testModule.delimiter = ","
+    testModule.useDataFileTime = useDataFileTime
+    unitTestSim.AddModelToTask("unitTask", testModule)
+    dataLog = []
+    for scCounter in range(2):
+        dataLog.append(testModule.scStateOutMsgs[scCounter].recorder())
+        unitTestSim.AddModelToTask("unitTask", dataLog[-1])
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.ConfigureStopTime(macros.sec2nano(simTimeSeconds))
+    unitTestSim.ExecuteSimulation()
+    return [log.r_BN_N for log in dataLog]
+
+
+@pytest.mark.parametrize("fortranOrder", [False, True])
+def test_binaryDataFile(tmp_path, fortranOrder):
+    r"""
+    **Validation Test Description**
+
+    A text data file of two spacecraft is converted to a binary ``.npy`` data file, with either contiguous rows or
+    contiguous columns.  Read one row per update, the binary data file must give the same spacecraft states as the
+    text data file.  With ``useDataFileTime`` and an update period of three data rows, the module must write the
+    rows of the simulation times, and keep writing the last row past the end of the data file.
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    times = np.arange(21) * 0.1
+    rowIndex = np.arange(21)
+    zeros = np.zeros(21)
+    sc1 = np.column_stack([7000. + rowIndex, zeros, zeros, zeros, 7.5 + zeros, zeros,
+                           0.1 + zeros, 0.2 + zeros, 0.3 + zeros, zeros, zeros, zeros])
+    sc2 = np.column_stack([7000. + zeros, rowIndex, zeros, zeros, 7.5 + zeros, zeros,
+                           -0.1 + zeros, 0.1 + zeros, 0.3 + zeros, zeros, zeros, zeros])
+    textFileName = os.path.join(str(tmp_path), "data.txt")
+    np.savetxt(textFileName, np.column_stack([times, sc1, sc2]), delimiter=", ", header="time, sc1, sc2")
+
+    binaryFileName = dataFileToViz.convertTextDataFile(textFileName, delimiter=",")
+    assert binaryFileName == os.path.join(str(tmp_path), "data.npy")
+    if fortranOrder:
+        np.save(binaryFileName, np.asfortranarray(np.load(binaryFileName)))
+
+    textPos = replayDataFile(textFileName, 0.1, 2.0, False)
+    binaryPos = replayDataFile(binaryFileName, 0.1, 2.0, False)
+    np.testing.assert_allclose(textPos[0][:, 0], (7000. + rowIndex) * 1000.)
+    for scCounter in range(2):
+        np.testing.assert_array_equal(binaryPos[scCounter], textPos[scCounter])
+
+    timePos = replayDataFile(binaryFileName, 0.3, 2.4, True)
+    np.testing.assert_allclose(timePos[0][:, 0], (7000. + np.array([0, 3, 6, 9, 12, 15, 18, 20, 20])) * 1000.)
+    np.testing.assert_allclose(timePos[1][:, 1], np.array([0, 3, 6, 9, 12, 15, 18, 20, 20]) * 1000.)
+
+    # a data file written from arrays, such as recorded message data, is read the same way
+    writtenFileName = os.path.join(str(tmp_path), "written.npy")
+    dataFileToViz.writeDataFile(writtenFileName, times, sc1[:, 0:3], sc1[:, 3:6], sc1[:, 6:9], sc1[:, 9:12],
+                                sc2)
+    writtenPos = replayDataFile(writtenFileName, 0.1, 2.0, False)
+    for scCounter in range(2):
+        np.testing.assert_array_equal(writtenPos[scCounter], textPos[scCounter])
+
+
 # This statement below ensures that the unitTestScript can be run as a
 # stand-along python script
 #
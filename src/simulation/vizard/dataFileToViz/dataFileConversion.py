@@ -0,0 +1,59 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import os
+
+import numpy as np
+
+
+def writeDataFile(fileName, timeSeconds, *columns):
+    """
+    Write a binary ``.npy`` data file of :ref:`dataFileToViz`, with one row per time.  The columns are given in the
+    order of the text data file of the module, such that a data file can be written directly from recorded messages::
+
+        dataFileToViz.writeDataFile("data.npy", scLog.times() * macros.NANO2SEC,
+                                    scLog.r_BN_N / 1000., scLog.v_BN_N / 1000., scLog.sigma_BN, scLog.omega_BN_B)
+
+    :param fileName: name of the data file, which should have the ``.npy`` extension
+    :param timeSeconds: [s] times of the rows
+    :param columns: arrays with one value or one row of values per time
+    """
+    timeSeconds = np.asarray(timeSeconds, dtype=np.float64)
+    data = [timeSeconds.reshape(-1, 1)]
+    for column in columns:
+        data.append(np.asarray(column, dtype=np.float64).reshape(len(timeSeconds), -1))
+    np.save(fileName, np.ascontiguousarray(np.hstack(data), dtype='<f8'))
+
+
+def convertTextDataFile(textFileName, binaryFileName=None, delimiter=" ", headerLine=True):
+    """
+    Convert a text data file of :ref:`dataFileToViz` to a binary ``.npy`` data file, which the module reads
+    without parsing the text.
+
+    :param textFileName: name of the text data file
+    :param binaryFileName: name of the binary data file, the text file name with the ``.npy`` extension by default
+    :param delimiter: delimiter string that separates the values on a line, as ``delimiter`` of the module
+    :param headerLine: flag if the first line of the text data file is a header, as ``headerLine`` of the module
+    :return: name of the binary data file
+    """
+    if binaryFileName is None:
+        binaryFileName = os.path.splitext(textFileName)[0] + ".npy"
+    data = np.loadtxt(textFileName, delimiter=None if delimiter.isspace() else delimiter,
+                      skiprows=1 if headerLine else 0, ndmin=2)
+    np.save(binaryFileName, np.ascontiguousarray(data, dtype='<f8'))
+    return binaryFileName
@@ -20,6 +20,10 @@
 #include "architecture/utilities/linearAlgebra.h"
 #include "architecture/utilities/rigidBodyKinematics.h"
 #include "architecture/utilities/avsEigenSupport.h"
+#include "architecture/utilities/macroDefinitions.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
 #include <sstream>
 #include <string>
 #include <string.h>
@@ -33,6 +37,16 @@ DataFileToViz::DataFileToViz()
     this->convertPosToMeters = 1000.;       /* convert km to meters */
     this->headerLine = true;
     this->attitudeType = 0;
+    this->useDataFileTime = false;
+    this->binaryFile = false;
+    this->fortranOrder = false;
+    this->numRows = 0;
+    this->numColumns = 0;
+    this->dataOffset = 0;
+    this->filePosition = -1;
+    this->nextRow = 0;
+    this->loadedRow = -1;
+    this->rowDataIndex = 0;
 
     return;
 }
@@ -119,14 +133,33 @@ void DataFileToViz::Reset(uint64_t CurrentSimNanos)
         bskLogger.bskLog(BSK_INFORMATION, "DataFileToViz:\nclosed the file: %s.", this->dataFileName.c_str());
     }
     
-    /* open the data file*/
-    this->fileHandle.open(this->dataFileName);
+    /* open the data file, a file with the .npy extension is read as a binary numpy array file */
+    std::string extension = ".npy";
+    this->binaryFile = this->dataFileName.length() >= extension.length() &&
+        this->dataFileName.compare(this->dataFileName.length() - extension.length(), extension.length(), extension) == 0;
+    this->nextRow = 0;
+    this->loadedRow = -1;
+    if (this->binaryFile) {
+        this->fileHandle.open(this->dataFileName, std::ios::in | std::ios::binary);
+    } else {
+        this->fileHandle.open(this->dataFileName);
+    }
     if (this->fileHandle.fail()) {
         bskLogger.bskLog(BSK_ERROR, "DataFileToViz: was not able to load the file %s.", this->dataFileName.c_str());
     }
-    if (this->headerLine) {
-        std::string line;
-        getline(this->fileHandle, line);
+    if (this->binaryFile) {
+        if (this->fileHandle.is_open() && !this->openBinaryFile()) {
+            this->fileHandle.close();
+        }
+    } else {
+        if (this->useDataFileTime) {
+            bskLogger.bskLog(BSK_WARNING, "DataFileToViz: useDataFileTime is only used with binary .npy data files, "
+                                          "the text data file is read one line per update.");
+        }
+        if (this->headerLine) {
+            std::string line;
+            getline(this->fileHandle, line);
+        }
     }
 
     bskLogger.bskLog(BSK_INFORMATION, "DataFileToViz:\nloaded the file: %s.", this->dataFileName.c_str());
@@ -262,14 +295,11 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
 {
     /* ensure that a file was opened */
     if (this->fileHandle.is_open()) {
-        /* read in next line*/
-        std::string line;
-        if (getline(this->fileHandle, line)) {
-
-            std::istringstream iss(line);
+        /* read in next row */
+        if (this->readDataRow(CurrentSimNanos)) {
 
-            /* pull time, this is not used in the BSK msg */
-            pullScalar(&iss);
+            /* skip time, this is not used in the BSK msg */
+            this->rowDataIndex = 1;
 
             // create all the state output messages for each spacecraft
             for (long unsigned int scCounter=0; scCounter<this->scStateOutMsgs.size(); scCounter++) {
@@ -279,12 +309,12 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
                 scMsg = this->scStateOutMsgs.at(scCounter)->zeroMsgPayload;
 
                 /* get inertial position */
-                pullVector(&iss, scMsg.r_CN_N);
+                pullVector(scMsg.r_CN_N);
                 v3Scale(this->convertPosToMeters, scMsg.r_CN_N, scMsg.r_CN_N);
                 v3Copy(scMsg.r_CN_N, scMsg.r_BN_N);
 
                 /* get inertial velocity */
-                pullVector(&iss, scMsg.v_CN_N);
+                pullVector(scMsg.v_CN_N);
                 v3Scale(this->convertPosToMeters, scMsg.v_CN_N, scMsg.v_CN_N);
                 v3Copy(scMsg.v_CN_N, scMsg.v_BN_N);
 
@@ -292,10 +322,10 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
                 double att[4];
                 if (this->attitudeType != 1) {
                     /* 3D attitude coordinate set */
-                    pullVector(&iss, att);
+                    pullVector(att);
                 } else {
                     /* 4D attitude coordinate set */
-                    pullVector4(&iss, att);
+                    pullVector4(att);
                 }
                 switch (this->attitudeType) {
                     case 0:
@@ -314,7 +344,7 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
                         bskLogger.bskLog(BSK_ERROR, "DataFileToViz: unknown attitudeType encountered: %d", this->attitudeType);
                         break;
                 }
-                pullVector(&iss, scMsg.omega_BN_B);
+                pullVector(scMsg.omega_BN_B);
 
                 /* write spacecraft state message */
                 this->scStateOutMsgs.at(scCounter)->write(&scMsg, this->moduleID, CurrentSimNanos);
@@ -332,7 +362,7 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
 
                                 /* fill out the thruster state message */
                                 thrMsg.maxThrust = this->thrForceMaxList[thrCounter];
-                                thrMsg.thrustForce = pullScalar(&iss);
+                                thrMsg.thrustForce = pullScalar();
                                 eigenVector3d2CArray(this->thrPosList[thrCounter], thrMsg.thrusterLocation);
                                 eigenVector3d2CArray(this->thrDirList[thrCounter], thrMsg.thrusterDirection);
 
@@ -354,9 +384,9 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
                             rwOutMsg = this->rwScOutMsgs[scCounter].at(rwCounter)->zeroMsgPayload;
 
                             /* create RW message */
-                            rwOutMsg.Omega = pullScalar(&iss);
+                            rwOutMsg.Omega = pullScalar();
                             rwOutMsg.Omega_max = this->rwOmegaMaxList[rwCounter];
-                            rwOutMsg.u_current = pullScalar(&iss);
+                            rwOutMsg.u_current = pullScalar();
                             rwOutMsg.u_max = this->rwUMaxList[rwCounter];
                             eigenVector3d2CArray(this->rwPosList[rwCounter], rwOutMsg.rWB_B);
                             eigenVector3d2CArray(this->rwDirList[rwCounter], rwOutMsg.gsHat_B);
@@ -367,43 +397,263 @@ void DataFileToViz::UpdateState(uint64_t CurrentSimNanos)
                     }
                 }
             }
-        } else {
-            bskLogger.bskLog(BSK_INFORMATION, "DataFileToViz: reached end of file.");
         }
     }
 
     return;
 }
 
-/*! pull a 3-d set of double values from the input stream
+/*! Read the header of a binary numpy .npy data file.  The file must contain a 2-d array of little-endian
+ doubles with one row per time, such as written by ``numpy.save()``.
+ @return true if the header is valid
  */
-void DataFileToViz::pullVector(std::istringstream *iss, double vec[3]) {
+bool DataFileToViz::openBinaryFile()
+{
+    char magic[8];
+    uint8_t lengthBytes[4] = {0, 0, 0, 0};
+    int numLengthBytes;
+    uint32_t headerLength;
+    std::string header;
+    std::vector<int64_t> shape;
+    size_t pos;
+
+    /* the magic string is followed by the format version and the header length */
+    this->fileHandle.read(magic, sizeof(magic));
+    if (!this->fileHandle || memcmp(magic, "\x93NUMPY", 6) != 0) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: %s is not a numpy .npy file.", this->dataFileName.c_str());
+        return false;
+    }
+    numLengthBytes = (magic[6] == 1) ? 2 : 4;
+    this->fileHandle.read((char *) lengthBytes, numLengthBytes);
+    headerLength = (uint32_t) lengthBytes[0] | ((uint32_t) lengthBytes[1] << 8)
+                   | ((uint32_t) lengthBytes[2] << 16) | ((uint32_t) lengthBytes[3] << 24);
+    header.resize(headerLength);
+    this->fileHandle.read(&header[0], headerLength);
+    if (!this->fileHandle) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: the header of %s is not complete.", this->dataFileName.c_str());
+        return false;
+    }
+    this->dataOffset = (std::streamoff) (sizeof(magic) + numLengthBytes + headerLength);
+    this->filePosition = this->dataOffset;
+
+    /* the header is a Python dictionary literal with the data type, the memory order and the shape */
+    if (header.find("'descr': '<f8'") == std::string::npos) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: %s must contain little-endian float64 values.",
+                         this->dataFileName.c_str());
+        return false;
+    }
+    this->fortranOrder = header.find("'fortran_order': True") != std::string::npos;
+    pos = header.find("'shape'");
+    pos = (pos == std::string::npos) ? pos : header.find('(', pos);
+    if (pos != std::string::npos) {
+        const char *item = header.c_str() + pos + 1;
+        char *itemEnd;
+        while (true) {
+            int64_t value = strtoll(item, &itemEnd, 10);
+            if (itemEnd == item) {
+                break;
+            }
+            shape.push_back(value);
+            item = itemEnd;
+            while (*item == ',' || *item == ' ') {
+                item++;
+            }
+        }
+    }
+    if (shape.size() != 2) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: %s must contain a 2-d array with one row per time.",
+                         this->dataFileName.c_str());
+        return false;
+    }
+    this->numRows = shape[0];
+    this->numColumns = shape[1];
+
+    return true;
+}
+
+/*! Read the data file row that is written at this update into rowData.  A text data file and a binary data file
+ are read one row per update.  If useDataFileTime is set, the last row of a binary data file whose time is not past
+ the simulation time is read instead.
+ @param CurrentSimNanos The current sim time
+ @return true if a row was read
+ */
+bool DataFileToViz::readDataRow(uint64_t CurrentSimNanos)
+{
+    if (!this->binaryFile) {
+        std::string line;
+        if (!getline(this->fileHandle, line)) {
+            bskLogger.bskLog(BSK_INFORMATION, "DataFileToViz: reached end of file.");
+            return false;
+        }
+        this->parseTextLine(line);
+        return true;
+    }
+
+    int64_t row = this->nextRow;
+    if (this->useDataFileTime) {
+        /* the simulation time only moves forward, such that the first row past the simulation time is searched
+         after the prior row.  The search steps ahead with growing steps, and then bisects the last step, such that
+         only a few times are read. */
+        int64_t simNanos = (int64_t) CurrentSimNanos;
+        int64_t low = this->loadedRow + 1;
+        int64_t high = low;
+        int64_t step = 1;
+        while (high < this->numRows && llround(this->readBinaryTime(high) * SEC2NANO) <= simNanos) {
+            low = high + 1;
+            high += step;
+            step *= 2;
+        }
+        high = std::min(high, this->numRows);
+        while (low < high) {
+            int64_t middle = low + (high - low) / 2;
+            if (llround(this->readBinaryTime(middle) * SEC2NANO) <= simNanos) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+        row = low - 1;
+        if (row < 0) {
+            /* the data file starts after the current time */
+            return false;
+        }
+    } else if (row >= this->numRows) {
+        bskLogger.bskLog(BSK_INFORMATION, "DataFileToViz: reached end of file.");
+        return false;
+    }
+
+    if (row != this->loadedRow && !this->readBinaryRow(row)) {
+        return false;
+    }
+    this->nextRow = row + 1;
+
+    return true;
+}
+
+/*! Read a row of the binary data file into rowData
+ @param row row index
+ @return true if the row was read
+ */
+bool DataFileToViz::readBinaryRow(int64_t row)
+{
+    bool rowRead = true;
+
+    this->rowData.resize((size_t) this->numColumns);
+    if (this->fortranOrder) {
+        /* the values of a row are spaced by the number of rows */
+        for (int64_t c = 0; c < this->numColumns; c++) {
+            rowRead = rowRead && this->readBinaryValues((c * this->numRows + row) * (std::streamoff) sizeof(double),
+                                                        &this->rowData[(size_t) c], 1);
+        }
+    } else {
+        rowRead = this->readBinaryValues(row * this->numColumns * (std::streamoff) sizeof(double),
+                                         this->rowData.data(), this->numColumns);
+    }
+    if (!rowRead) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: was not able to read row %lld of %s.", (long long) row,
+                         this->dataFileName.c_str());
+        this->loadedRow = -1;
+        return false;
+    }
+    this->loadedRow = row;
+
+    return true;
+}
+
+/*! Read the time of a row of the binary data file, which is the first column
+ @param row row index
+ @return time in seconds
+ */
+double DataFileToViz::readBinaryTime(int64_t row)
+{
+    double time = 0.0;
+    int64_t index = this->fortranOrder ? row : row * this->numColumns;
+
+    this->readBinaryValues(index * (std::streamoff) sizeof(double), &time, 1);
+
+    return time;
+}
+
+/*! Read consecutive values of the binary data file.  The file is only repositioned if the values don't follow the
+ prior read values, as repositioning discards the buffered file data.
+ @param offset [bytes] offset of the first value from the first value of the file
+ @param values array the values are read into
+ @param count number of values
+ @return true if the values were read
+ */
+bool DataFileToViz::readBinaryValues(std::streamoff offset, double *values, int64_t count)
+{
+    std::streamsize numBytes = (std::streamsize) (count * (int64_t) sizeof(double));
+
+    if (this->dataOffset + offset != this->filePosition) {
+        this->fileHandle.clear();
+        this->fileHandle.seekg(this->dataOffset + offset);
+    }
+    this->fileHandle.read((char *) values, numBytes);
+    if (!this->fileHandle) {
+        this->filePosition = -1;
+        return false;
+    }
+    this->filePosition = this->dataOffset + offset + numBytes;
+
+    return true;
+}
+
+/*! Parse the delimited values of a text data file line into rowData
+ @param line data file line
+ */
+void DataFileToViz::parseTextLine(const std::string &line)
+{
+    const char delimiterString = *this->delimiter.c_str();
+    const char *item = line.c_str();
+    char *itemEnd;
+
+    this->rowData.clear();
+    while (true) {
+        double value = strtod(item, &itemEnd);
+        if (itemEnd == item) {
+            break;
+        }
+        this->rowData.push_back(value);
+        item = itemEnd;
+        while (*item == ' ' || *item == '\t') {
+            item++;
+        }
+        if (*item == delimiterString) {
+            item++;
+        }
+    }
+}
+
+/*! pull a 3-d set of double values from the current data row
+ */
+void DataFileToViz::pullVector(double vec[3]) {
     double x,y,z;
-    x = pullScalar(iss);
-    y = pullScalar(iss);
-    z = pullScalar(iss);
+    x = pullScalar();
+    y = pullScalar();
+    z = pullScalar();
     v3Set(x, y, z, vec);
 }
 
-/*! pull a 4-d set of double values from the input stream
+/*! pull a 4-d set of double values from the current data row
  */
-void DataFileToViz::pullVector4(std::istringstream *iss, double *vec) {
+void DataFileToViz::pullVector4(double *vec) {
     double q0, q1, q2, q3;
-    q0 = pullScalar(iss);
-    q1 = pullScalar(iss);
-    q2 = pullScalar(iss);
-    q3 = pullScalar(iss);
+    q0 = pullScalar();
+    q1 = pullScalar();
+    q2 = pullScalar();
+    q3 = pullScalar();
     v4Set(q0, q1, q2, q3, vec);
 }
 
 
-/*! pull a double from the input stream
+/*! pull a double from the current data row
 */
-double DataFileToViz::pullScalar(std::istringstream *iss) {
-    const char delimiterString = *this->delimiter.c_str();
-    std::string item;
-
-    getline(*iss, item, delimiterString);
+double DataFileToViz::pullScalar() {
+    if (this->rowDataIndex >= this->rowData.size()) {
+        bskLogger.bskLog(BSK_ERROR, "DataFileToViz: the data file row has fewer values than required.");
+        return 0.0;
+    }
 
-    return stod(item);
+    return this->rowData[this->rowDataIndex++];
 }
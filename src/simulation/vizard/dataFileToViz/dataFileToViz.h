@@ -50,9 +50,15 @@ public:
 
 
 private:
-    void pullVector(std::istringstream *iss, double *);
-    void pullVector4(std::istringstream *iss, double *);
-    double pullScalar(std::istringstream *iss);
+    bool openBinaryFile();
+    bool readDataRow(uint64_t CurrentSimNanos);
+    bool readBinaryRow(int64_t row);
+    double readBinaryTime(int64_t row);
+    bool readBinaryValues(std::streamoff offset, double *values, int64_t count);
+    void parseTextLine(const std::string &line);
+    void pullVector(double *);
+    void pullVector4(double *);
+    double pullScalar();
 
 public:
     std::string dataFileName;                   //!< Name of the simulation data file
@@ -62,6 +68,7 @@ public:
     double convertPosToMeters;                  //!< conversion factor to meters
     bool headerLine;                            //!< [bool] flag to mark first line as a header
     int attitudeType;                           //!< 0 - MRP, 1 - EP or quaternions (q0, q1, q2, q3), 2 - (3-2-1) Euler angles
+    bool useDataFileTime;                       //!< [bool] flag to write the last row of a binary data file whose time is not past the simulation time, instead of one row per update
 
     std::vector <std::vector <ThrClusterMap>> thrMsgDataSC;  //!< (Optional) vector of sets of thruster cluster mapping info
     std::vector <std::vector <Message<THROutputMsgPayload>*>> thrScOutMsgs;  //!< (Optional) vector of spacecraft thruster output message vectors
@@ -73,6 +80,16 @@ public:
 private:
     std::vector<std::vector<int>> numThrPerCluster;  //!< vector containing list of numbers of thruster per cluster per spacecraft
     std::ifstream fileHandle;                  //!< file handle to the simulation data input file
+    bool binaryFile;                            //!< [bool] flag if the data file is a binary numpy .npy file
+    bool fortranOrder;                          //!< [bool] flag if the columns of the binary data file are contiguous
+    int64_t numRows;                            //!< -- number of rows of the binary data file
+    int64_t numColumns;                         //!< -- number of columns of the binary data file
+    std::streamoff dataOffset;                  //!< [bytes] offset of the first value of the binary data file
+    std::streamoff filePosition;                //!< [bytes] position of the binary data file handle, -1 if unknown
+    int64_t nextRow;                            //!< -- binary data file row read at the next update
+    int64_t loadedRow;                          //!< -- binary data file row in rowData, -1 if none
+    std::vector <double> rowData;               //!< values of the current data file row
+    size_t rowDataIndex;                        //!< -- index of the next value pulled from rowData
     std::vector <Eigen::Vector3d> thrPosList;   //!< [m] vector of thrust positions
     std::vector <Eigen::Vector3d> thrDirList;   //!< [-] vector of thrust unit direction vectors in B-frame components
     std::vector <double> thrForceMaxList;       //!< [-] vector of thrust maximum force values
@@ -60,3 +60,4 @@ import sys
 protectAllClasses(sys.modules[__name__])
 %}
 
+%pythoncode "dataFileConversion.py"
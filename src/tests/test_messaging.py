@@ -34,6 +34,8 @@ from Basilisk.architecture import bskLogging
 from Basilisk.architecture import messaging
 
 import glob
+import pathlib
+import tempfile
 import Basilisk
 
 # uncomment this line is this test is to be skipped in the global unit test run, adjust message as needed
@@ -52,6 +54,10 @@ def messaging_unit_tests():
     test_c_msg_subscription_check()
     test_cpp_2_c_msg_subscription_check()
     test_c_2_cpp_msg_subscription_check()
+    test_recorder_buffer_views()
+    test_payload_field_layout()
+    with tempfile.TemporaryDirectory() as tmpDir:
+        test_recorder_modes(pathlib.Path(tmpDir))
 
 
 
@@ -322,6 +328,176 @@ def test_cpp_2_c_msg_subscription_check():
     assert(testFailCount == 0)
 
 
+def test_recorder_buffer_views():
+    # Check that recorded message fields are read as in-place views of the recorder buffer
+    import numpy as np
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    testFailCount = 0                       # zero unit test result counter
+    testMessages = []                       # create empty array to store test log messages
+
+    msg = messaging.SCStatesMsg()
+    rec = msg.recorder()
+    rec.Reset(0)
+    payload = messaging.SCStatesMsgPayload()
+    for i in range(5):
+        payload.r_BN_N = [i, 2. * i, 3. * i]
+        payload.MRPSwitchCount = i
+        msg.write(payload, 10 * i)
+        rec.UpdateState(10 * i)
+    r_BN_N = rec.r_BN_N
+    times = rec.times()
+
+    # keep recording after the views were taken, the views must keep pointing at valid data
+    for i in range(5, 100):
+        payload.r_BN_N = [i, 2. * i, 3. * i]
+        msg.write(payload, 10 * i)
+        rec.UpdateState(10 * i)
+
+    if not np.array_equal(r_BN_N, [[i, 2. * i, 3. * i] for i in range(5)]):
+        testFailCount += 1
+        testMessages.append("recorder r_BN_N view is not correct")
+    if not np.array_equal(times, 10 * np.arange(5)):
+        testFailCount += 1
+        testMessages.append("recorder times view is not correct")
+    if not np.array_equal(rec.MRPSwitchCount[:5], np.arange(5)):
+        testFailCount += 1
+        testMessages.append("recorder MRPSwitchCount view is not correct")
+    if rec.r_BN_N.shape != (100, 3) or rec.r_BN_N[-1, 2] != 297.:
+        testFailCount += 1
+        testMessages.append("recorder r_BN_N does not include the latest messages")
+    if r_BN_N.flags.writeable:
+        testFailCount += 1
+        testMessages.append("recorder views should be read-only")
+
+    rec.clear()
+    if len(rec.times()) != 0 or r_BN_N[4, 0] != 4.:
+        testFailCount += 1
+        testMessages.append("clearing the recorder should leave existing views untouched")
+
+    if testFailCount == 0:
+        print("PASSED")
+    else:
+        [print(msg) for msg in testMessages]
+    assert(testFailCount == 0)
+
+
+def test_payload_field_layout():
+    # Check that payload fields with default member initializers are viewed in place in the recorder buffer
+    import numpy as np
+    srcPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    sys.path.append(os.path.join(srcPath, "architecture", "messaging", "msgAutoSource"))
+    import generateSWIGModules
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    testFailCount = 0                       # zero unit test result counter
+    testMessages = []                       # create empty array to store test log messages
+
+    headerPath = os.path.join(srcPath, "architecture", "msgPayloadDefCpp", "THROutputMsgPayload.h")
+    fields = generateSWIGModules.parsePayloadFields(headerPath, "THROutputMsgPayload")
+    expectedFields = [("maxThrust", "f8", []), ("thrustFactor", "f8", []), ("thrustForce", "f8", []),
+                      ("thrustForce_B", "f8", ["3"]), ("thrustTorquePntB_B", "f8", ["3"]),
+                      ("thrusterLocation", "f8", ["3"]), ("thrusterDirection", "f8", ["3"])]
+    if fields != expectedFields:
+        testFailCount += 1
+        testMessages.append("THROutputMsgPayload fields with initializers are not parsed: " + str(fields))
+
+    msg = messaging.THROutputMsg()
+    rec = msg.recorder()
+    rec.Reset(0)
+    payload = messaging.THROutputMsgPayload()
+    for i in range(3):
+        payload.thrustForce = float(i)
+        payload.thrusterLocation = [i, 2. * i, 3. * i]
+        msg.write(payload, 10 * i)
+        rec.UpdateState(10 * i)
+    thrusterLocation = rec.thrusterLocation
+    if not np.array_equal(rec.thrustForce, np.arange(3)) \
+            or not np.array_equal(thrusterLocation, [[i, 2. * i, 3. * i] for i in range(3)]):
+        testFailCount += 1
+        testMessages.append("recorded THROutputMsgPayload fields are not correct")
+    if thrusterLocation.flags.writeable:
+        testFailCount += 1
+        testMessages.append("THROutputMsgPayload fields with initializers should be read-only recorder views")
+
+    if testFailCount == 0:
+        print("PASSED")
+    else:
+        [print(msg) for msg in testMessages]
+    assert(testFailCount == 0)
+
+
+def test_recorder_modes(tmp_path):
+    # Check the ring-buffer, decimation and spill file recording modes
+    import numpy as np
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+    testFailCount = 0                       # zero unit test result counter
+    testMessages = []                       # create empty array to store test log messages
+
+    msg = messaging.SCStatesMsg()
+    ringRec = msg.recorder()
+    ringRec.setRingBuffer(10)
+    decRec = msg.recorder().decimate(100)
+    spillFile = str(tmp_path / "scStates.bin")
+    spillRec = msg.recorder()
+    spillRec.setSpillFile(spillFile, 7)
+    recorders = [ringRec, decRec, spillRec]
+    for rec in recorders:
+        rec.Reset(0)
+
+    payload = messaging.SCStatesMsgPayload()
+    for i in range(95):
+        payload.r_BN_N = [i, 2. * i, 3. * i]
+        payload.MRPSwitchCount = i
+        msg.write(payload, 10 * i)
+        for rec in recorders:
+            rec.UpdateState(10 * i)
+
+    if not np.array_equal(ringRec.times(), 10 * np.arange(85, 95)) \
+            or not np.array_equal(ringRec.r_BN_N[:, 0], np.arange(85, 95)):
+        testFailCount += 1
+        testMessages.append("ring-buffer recorder should only keep the latest messages")
+    if len(ringRec.record()) != 10:
+        testFailCount += 1
+        testMessages.append("ring-buffer recorder record() should only return the latest messages")
+
+    # 9 complete windows of 10 messages, the window that is still open is not recorded
+    windows = np.arange(90).reshape(9, 10)
+    if not np.array_equal(decRec.times(), 100 * np.arange(9)):
+        testFailCount += 1
+        testMessages.append("decimating recorder times are not the window start times")
+    if not np.allclose(decRec.r_BN_N[:, 1], 2. * windows.mean(axis=1)) \
+            or not np.array_equal(decRec.windowMin("r_BN_N")[:, 1], 2. * windows.min(axis=1)) \
+            or not np.array_equal(decRec.windowMax("r_BN_N")[:, 1], 2. * windows.max(axis=1)):
+        testFailCount += 1
+        testMessages.append("decimating recorder window statistics are not correct")
+    if not np.array_equal(decRec.MRPSwitchCount, windows[:, -1]):
+        testFailCount += 1
+        testMessages.append("decimating recorder should keep the last value of integer variables")
+
+    # the open window of the last 5 messages is recorded when it is closed at the end of the simulation
+    decRec.closeDecimationWindow()
+    if not np.array_equal(decRec.times(), 100 * np.arange(10)) \
+            or decRec.r_BN_N[-1, 0] != np.arange(90, 95).mean() \
+            or decRec.windowMax("r_BN_N")[-1, 0] != 94.:
+        testFailCount += 1
+        testMessages.append("decimating recorder should record the open window when it is closed")
+
+    if len(spillRec.record()) >= 7:
+        testFailCount += 1
+        testMessages.append("spill file recorder keeps too many messages in memory")
+    if not np.array_equal(spillRec.times(), 10 * np.arange(95)) \
+            or not np.array_equal(spillRec.r_BN_N[:, 2], 3. * np.arange(95)):
+        testFailCount += 1
+        testMessages.append("spill file recorder data is not correct")
+
+    if testFailCount == 0:
+        print("PASSED")
+    else:
+        [print(msg) for msg in testMessages]
+    assert(testFailCount == 0)
+
 
 if __name__ == "__main__":
     messaging_unit_tests()
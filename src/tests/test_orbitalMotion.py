@@ -281,5 +281,123 @@ def test_orbitalMotion(show_plots):
     assert e_count < 1, str(e_count) + " functions failed in orbitalMotion.py script"
 
 
+def randomElementArray(numStates, seed=0):
+    """Random orbit element sets, covering the circular, equatorial and hyperbolic cases"""
+    rng = np.random.default_rng(seed)
+    oe = np.zeros(numStates, dtype=orbitalMotion.classicElementsDtype)
+    oe['a'] = rng.uniform(7000., 40000., numStates)
+    oe['e'] = rng.uniform(0., 0.9, numStates)
+    oe['i'] = rng.uniform(0., np.pi, numStates)
+    oe['Omega'] = rng.uniform(0., 2 * np.pi, numStates)
+    oe['omega'] = rng.uniform(0., 2 * np.pi, numStates)
+    oe['f'] = rng.uniform(-np.pi, np.pi, numStates)
+    quarter = numStates // 4
+    oe['e'][:quarter // 2] = 0.
+    oe['i'][quarter // 4:quarter] = 0.
+    hyperbolic = slice(quarter, 2 * quarter)
+    oe['e'][hyperbolic] = rng.uniform(1.1, 3., quarter)
+    oe['a'][hyperbolic] *= -1.
+    oe['f'][hyperbolic] = rng.uniform(-1., 1., quarter)
+    return oe
+
+
+def test_orbitalMotionArrays():
+    """Check the array versions of the orbitalMotion functions against the scalar functions"""
+    mu = orbitalMotion.MU_EARTH
+    oe = randomElementArray(400)
+    rng = np.random.default_rng(1)
+
+    rVec, vVec = orbitalMotion.elem2rvArray(mu, oe)
+    assert rVec.shape == (400, 3)
+    elements = orbitalMotion.rv2elemArray(mu, rVec, vVec)
+    for k in range(len(oe)):
+        rScalar, vScalar = orbitalMotion.elem2rv(mu, orbitalMotion.classicElementsFromArray(oe[k]))
+        np.testing.assert_array_equal(rVec[k], rScalar)
+        np.testing.assert_array_equal(vVec[k], vScalar)
+        oeScalar = orbitalMotion.rv2elem(mu, rVec[k], vVec[k])
+        for name in ['a', 'e', 'rmag', 'alpha', 'rPeriap', 'rApoap']:
+            assert elements[name][k] == getattr(oeScalar, name), name
+        for name in ['i', 'Omega', 'omega', 'f']:
+            assert elements[name][k] == pytest.approx(getattr(oeScalar, name), rel=0, abs=1e-14), name
+
+    # round trip of a structured array through ClassicElements objects
+    oeList = [orbitalMotion.classicElementsFromArray(record) for record in oe[:5]]
+    np.testing.assert_array_equal(orbitalMotion.classicElementsToArray(oeList), oe[:5])
+
+    # anomaly conversions and the Kepler equation solvers
+    e = rng.uniform(0., 0.99, 200)
+    eHyp = rng.uniform(1.01, 5., 200)
+    angle = rng.uniform(-1.5, 1.5, 200)
+    M = rng.uniform(-10., 10., 200)
+    for arrayFunction, scalarFunction, ecc, x in [(orbitalMotion.E2fArray, orbitalMotion.E2f, e, angle),
+                                                  (orbitalMotion.E2MArray, orbitalMotion.E2M, e, angle),
+                                                  (orbitalMotion.f2EArray, orbitalMotion.f2E, e, angle),
+                                                  (orbitalMotion.M2EArray, orbitalMotion.M2E, e, M),
+                                                  (orbitalMotion.f2HArray, orbitalMotion.f2H, eHyp, angle),
+                                                  (orbitalMotion.H2fArray, orbitalMotion.H2f, eHyp, angle),
+                                                  (orbitalMotion.H2NArray, orbitalMotion.H2N, eHyp, angle),
+                                                  (orbitalMotion.N2HArray, orbitalMotion.N2H, eHyp, M)]:
+        scalarValues = [scalarFunction(x[k], ecc[k]) for k in range(len(x))]
+        np.testing.assert_allclose(arrayFunction(x, ecc), scalarValues, rtol=1e-14, atol=1e-14,
+                                   err_msg=scalarFunction.__name__)
+    with pytest.raises(ValueError):
+        orbitalMotion.M2EArray(M, eHyp)
+
+    # Hill frame mappings
+    HN = orbitalMotion.hillFrameArray(rVec[:10], vVec[:10])
+    rho_H, rhoPrime_H = orbitalMotion.rv2hillArray(rVec[:10], vVec[:10], rVec[:10] + 1., vVec[:10] + 1e-3)
+    rd_N, vd_N = orbitalMotion.hill2rvArray(rVec[:10], vVec[:10], rho_H, rhoPrime_H)
+    for k in range(10):
+        np.testing.assert_allclose(HN[k], orbitalMotion.hillFrame(rVec[k], vVec[k]), rtol=0, atol=1e-15)
+        rhoScalar, rhoPrimeScalar = orbitalMotion.rv2hill(rVec[k], vVec[k], rVec[k] + 1., vVec[k] + 1e-3)
+        np.testing.assert_allclose(rho_H[k], rhoScalar, rtol=1e-12)
+        np.testing.assert_allclose(rhoPrime_H[k], rhoPrimeScalar, rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(rd_N[k], rVec[k] + 1., rtol=1e-14)
+        np.testing.assert_allclose(vd_N[k], vVec[k] + 1e-3, rtol=1e-12)
+
+
+def benchmarkOrbitalMotionArrays(numStates=100000):
+    """Time the array versions of elem2rv and rv2elem against calling the scalar functions per state"""
+    import time
+    mu = orbitalMotion.MU_EARTH
+    oe = randomElementArray(numStates)
+    rVec, vVec = orbitalMotion.elem2rvArray(mu, oe)
+
+    startTime = time.perf_counter()
+    for k in range(numStates):
+        orbitalMotion.rv2elem(mu, rVec[k], vVec[k])
+    scalarTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    orbitalMotion.rv2elemArray(mu, rVec, vVec)
+    arrayTime = time.perf_counter() - startTime
+    print('rv2elem: {0:d} states, scalar {1:.3f} s, array {2:.4f} s, speedup {3:.0f}x'.format(
+        numStates, scalarTime, arrayTime, scalarTime / arrayTime))
+
+    oeList = [orbitalMotion.classicElementsFromArray(record) for record in oe]
+    startTime = time.perf_counter()
+    for elements in oeList:
+        orbitalMotion.elem2rv(mu, elements)
+    scalarTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    orbitalMotion.elem2rvArray(mu, oe)
+    arrayTime = time.perf_counter() - startTime
+    print('elem2rv: {0:d} states, scalar {1:.3f} s, array {2:.4f} s, speedup {3:.0f}x'.format(
+        numStates, scalarTime, arrayTime, scalarTime / arrayTime))
+
+    rng = np.random.default_rng(2)
+    M = rng.uniform(-10., 10., numStates)
+    e = rng.uniform(0., 0.9, numStates)
+    startTime = time.perf_counter()
+    for k in range(numStates):
+        orbitalMotion.M2E(M[k], e[k])
+    scalarTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    orbitalMotion.M2EArray(M, e)
+    arrayTime = time.perf_counter() - startTime
+    print('M2E: {0:d} states, scalar {1:.3f} s, array {2:.4f} s, speedup {3:.0f}x'.format(
+        numStates, scalarTime, arrayTime, scalarTime / arrayTime))
+
+
 if __name__ == "__main__":
-    test_orbitalMotion(False)
\ No newline at end of file
+    test_orbitalMotion(False)
+    benchmarkOrbitalMotionArrays()
\ No newline at end of file
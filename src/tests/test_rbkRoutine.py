@@ -1004,5 +1004,94 @@ def test_rigidBodyKinematics(show_plots):
     assert e_count < 1, str(e_count) + " functions failed in RigidBodyKinematics.py script"
 
 
+def test_rigidBodyKinematicsArrays():
+    """Check the array versions of the attitude conversions against the scalar functions"""
+    rng = np.random.default_rng(0)
+    numSamples = 200
+    sigma1 = rng.uniform(-1., 1., (numSamples, 3))
+    sigma2 = rng.uniform(-1., 1., (numSamples, 3))
+    sigma2[:5] = -sigma1[:5]  # singular MRP differences switch to the shadow set
+    omega = rng.normal(size=(numSamples, 3))
+    C = rbk.MRP2CArray(sigma1)
+    ep1 = rbk.MRP2EPArray(sigma1)
+    ep2 = rbk.MRP2EPArray(sigma2)
+    prv1 = rbk.MRP2PRVArray(sigma1)
+    prv2 = rbk.MRP2PRVArray(np.roll(sigma2, 7, axis=0))  # avoid opposite rotations, singular in addPRV()
+    gibbs1 = rbk.MRP2GibbsArray(0.9 * sigma1)
+    gibbs2 = rbk.MRP2GibbsArray(0.9 * sigma2)
+
+    checks = [(rbk.MRP2CArray, rbk.MRP2C, [sigma1]),
+              (rbk.C2EPArray, rbk.C2EP, [C]),
+              (rbk.C2MRPArray, rbk.C2MRP, [C]),
+              (rbk.C2GibbsArray, rbk.C2Gibbs, [C]),
+              (rbk.C2PRVArray, rbk.C2PRV, [C]),
+              (rbk.EP2CArray, rbk.EP2C, [ep1]),
+              (rbk.EP2MRPArray, rbk.EP2MRP, [-ep1]),
+              (rbk.EP2GibbsArray, rbk.EP2Gibbs, [ep1]),
+              (rbk.EP2PRVArray, rbk.EP2PRV, [ep1]),
+              (rbk.MRP2EPArray, rbk.MRP2EP, [sigma1]),
+              (rbk.MRP2GibbsArray, rbk.MRP2Gibbs, [sigma1]),
+              (rbk.MRP2PRVArray, rbk.MRP2PRV, [sigma1]),
+              (rbk.PRV2CArray, rbk.PRV2C, [prv1]),
+              (rbk.PRV2EPArray, rbk.PRV2EP, [prv1]),
+              (rbk.PRV2MRPArray, rbk.PRV2MRP, [prv1]),
+              (rbk.PRV2GibbsArray, rbk.PRV2Gibbs, [prv1]),
+              (rbk.gibbs2CArray, rbk.gibbs2C, [gibbs1]),
+              (rbk.gibbs2EPArray, rbk.gibbs2EP, [gibbs1]),
+              (rbk.gibbs2MRPArray, rbk.gibbs2MRP, [gibbs1]),
+              (rbk.gibbs2PRVArray, rbk.gibbs2PRV, [gibbs1]),
+              (rbk.addEPArray, rbk.addEP, [ep1, ep2]),
+              (rbk.subEPArray, rbk.subEP, [ep1, ep2]),
+              (rbk.addMRPArray, rbk.addMRP, [sigma1, sigma2]),
+              (rbk.subMRPArray, rbk.subMRP, [sigma1, sigma2]),
+              (rbk.addGibbsArray, rbk.addGibbs, [gibbs1, gibbs2]),
+              (rbk.subGibbsArray, rbk.subGibbs, [gibbs1, gibbs2]),
+              (rbk.addPRVArray, rbk.addPRV, [prv1, prv2]),
+              (rbk.subPRVArray, rbk.subPRV, [prv1, prv2]),
+              (rbk.BmatMRPArray, rbk.BmatMRP, [sigma1]),
+              (rbk.BinvMRPArray, rbk.BinvMRP, [sigma1]),
+              (rbk.dMRPArray, rbk.dMRP, [sigma1, omega]),
+              (rbk.dMRP2OmegaArray, rbk.dMRP2Omega, [sigma1, omega]),
+              (rbk.v3TildeArray, rbk.v3Tilde, [omega]),
+              (lambda q: rbk.MRPswitchArray(q, 1.), lambda q: rbk.MRPswitch(q, 1.), [1.5 * sigma1])]
+    for sequence in ['121', '123', '131', '132', '212', '213', '231', '232', '312', '313', '321', '323']:
+        angles = rbk.C2EulerArray(C, sequence)
+        checks.append((lambda C, sequence=sequence: rbk.C2EulerArray(C, sequence),
+                       getattr(rbk, 'C2Euler' + sequence), [C]))
+        checks.append((lambda q, sequence=sequence: rbk.euler2CArray(q, sequence),
+                       getattr(rbk, 'euler' + sequence + '2C'), [angles]))
+
+    for arrayFunction, scalarFunction, args in checks:
+        scalarValues = np.array([scalarFunction(*[arg[k] for arg in args]) for k in range(numSamples)])
+        np.testing.assert_allclose(arrayFunction(*args), scalarValues, rtol=0, atol=1e-13,
+                                   err_msg=scalarFunction.__name__)
+
+    # single attitudes broadcast against arrays of attitudes
+    np.testing.assert_array_equal(rbk.MRP2CArray(sigma1[0]), rbk.MRP2C(sigma1[0]))
+    np.testing.assert_array_equal(rbk.subMRPArray(sigma1, sigma2[0]),
+                                  rbk.subMRPArray(sigma1, np.tile(sigma2[0], (numSamples, 1))))
+
+
+def benchmarkRigidBodyKinematicsArrays(numSamples=1000000):
+    """Time the attitude error history of recorded MRP data with the array and the scalar functions"""
+    import time
+    rng = np.random.default_rng(1)
+    sigma_BN = rng.uniform(-1., 1., (numSamples, 3))
+    sigma_RN = rng.uniform(-1., 1., (numSamples, 3))
+
+    startTime = time.perf_counter()
+    for k in range(numSamples):
+        sigma_BR = rbk.subMRP(sigma_BN[k], sigma_RN[k])
+        rbk.C2Euler321(rbk.MRP2C(sigma_BR))
+    scalarTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    sigma_BR = rbk.subMRPArray(sigma_BN, sigma_RN)
+    rbk.C2EulerArray(rbk.MRP2CArray(sigma_BR), 321)
+    arrayTime = time.perf_counter() - startTime
+    print('subMRP, MRP2C and C2Euler321: {0:d} samples, scalar {1:.2f} s, array {2:.3f} s, speedup {3:.0f}x'.format(
+        numSamples, scalarTime, arrayTime, scalarTime / arrayTime))
+
+
 if __name__ == "__main__":
-    test_rigidBodyKinematics(False)
\ No newline at end of file
+    test_rigidBodyKinematics(False)
+    benchmarkRigidBodyKinematicsArrays()
\ No newline at end of file
@@ -4,6 +4,7 @@ import numpy as np
 import time
 import glob
 from Basilisk.utilities import macros
+from Basilisk.utilities.MonteCarlo.ColumnStore import loadDataFrame, COLUMN_STORE_EXT
 try:
     import holoviews as hv
     from Basilisk.utilities.datashader_utilities import DS_Plot, curve_per_df_component
@@ -20,16 +21,29 @@ class mcAnalysisBaseClass:
         self.timeWindow = []
         self.data = None
 
-    def pull_and_format_df(path, varIdxLen):
-        df = pd.read_pickle(path)
+    @staticmethod
+    def pull_and_format_df(path, varIdxLen, runIdx=None):
+        df = loadDataFrame(path, runIdx)
         if len(np.unique(df.columns.codes[1])) is not varIdxLen:
             print("Warning: " + path + " not formatted correctly!")
-            newMultIndex = pd.MultiIndex.from_product([df.columns.codes[0], range(varIdxLen)],
+            # the run numbers rather than the level codes, which only match the run numbers when all runs are loaded
+            newMultIndex = pd.MultiIndex.from_product([df.columns.unique(level=0), range(varIdxLen)],
                                                       names=['runNum', 'varIdx'])
             indices = pd.Index([0, 1])  # Need multiple rows for curves
             df = df.reindex(columns=newMultIndex, index=indices)
         return df
 
+    def getVariableData(self, runIdx=None, varIdx=None):
+        """
+        Load the data of ``self.variableName`` from ``self.dataDir``.  If the data was stored in the columnar format
+        only the requested runs and components are read from disk.
+
+        :param runIdx: list of run indices to load, or None for all runs
+        :param varIdx: list of variable components to load, or None for all components
+        :return: (runNum, varIdx) MultiIndex dataframe
+        """
+        return loadDataFrame(self.dataDir + "/" + self.variableName + ".data", runIdx, varIdx)
+
     def getNominalRunIndices(self, maxNumber=50):
         """
         Find the specific MC run indices of the most nominal cases (by iteratively widdling away runs which
@@ -39,7 +53,7 @@ class mcAnalysisBaseClass:
         :return: list of run indices
         """
         if self.data is None:
-            self.data = pd.read_pickle(self.dataDir + "/" + self.variableName + ".data")
+            self.data = self.getVariableData()
 
         dataBar = self.data[np.abs(self.data - self.data.mean()) < 0.5 * self.data.std()]
         i = 5
@@ -60,7 +74,7 @@ class mcAnalysisBaseClass:
         :return: list of run indices
         """
         if self.data is None:
-            self.data = pd.read_pickle(self.dataDir + "/" + self.variableName + ".data")
+            self.data = self.getVariableData()
         times = self.data.index.tolist()
 
         # Find the closest indices to the time window requested
@@ -83,7 +97,7 @@ class mcAnalysisBaseClass:
         Not Tested.
         """
         if self.data is None:
-            self.data = pd.read_pickle(self.dataDir + "/" + self.variableName + ".data")
+            self.data = self.getVariableData()
 
         idx = pd.IndexSlice
         self.runs, self.varNum = self.data.columns.values[-1]
@@ -182,16 +196,16 @@ class mcAnalysisBaseClass:
         # If no data in subset (or the wrong data), extract and save the right data.
         print("Populating Subset Directory with Dataframes for runs: " + str(runIdx))
         # shutil.rmtree(dataDir + "/subset/")
-        filePaths = glob.glob(baseDir + "/*.data")
+        filePaths = glob.glob(baseDir + "/*.data") + glob.glob(baseDir + "/*" + COLUMN_STORE_EXT)
         for filePath in filePaths:
             if "MonteCarlo.data" in filePath:
                 continue
             if "run" in filePath and "overrun" not in filePath:
                 continue
-            df = pd.read_pickle(filePath)
-            dfSubSet = df.loc[idx[:], idx[runIdx, :]]
-            varName = filePath.rsplit("/")
-            pd.to_pickle(dfSubSet, baseDir + "/subset/" + varName[-1])
+            # only the requested runs are read from columnar data
+            dfSubSet = loadDataFrame(filePath, runIdx)
+            varName = os.path.splitext(filePath.rsplit("/")[-1])[0] + ".data"
+            pd.to_pickle(dfSubSet, baseDir + "/subset/" + varName)
         print("Finished Populating Subset Directory")
 
     def renderPlots(self, plotList):
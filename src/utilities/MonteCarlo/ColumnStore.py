@@ -0,0 +1,253 @@
+# ISC License
+#
+# Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Columnar storage of retained Monte Carlo data.
+#
+# Each retained variable is stored in its own ``<variableName>.col`` directory.  The data is held in chunk files
+# of shape (time x component x run) that are preallocated when the first run of that variable arrives and are
+# written in place through numpy memory maps.  A run's data thus never has to be re-read or concatenated, and the
+# reader can slice runs and components out of the memory maps without loading the whole data set.
+#
+
+import os
+import json
+import glob
+import numpy as np
+import pandas as pd
+
+
+COLUMN_STORE_EXT = ".col"
+META_FILE = "meta.json"
+TIME_FILE = "times.npy"
+
+
+def columnStorePath(path):
+    """
+    Return the column store directory associated with a retained data path.
+
+    :param path: path to either a ``<variableName>.data`` file or a ``<variableName>.col`` directory
+    :return: the ``.col`` directory path if it exists, otherwise None
+    """
+    path = path.rstrip("/")
+    if path.endswith(COLUMN_STORE_EXT) and os.path.isdir(path):
+        return path
+    colPath = os.path.splitext(path)[0] + COLUMN_STORE_EXT
+    if os.path.isdir(colPath):
+        return colPath
+    return None
+
+
+def loadDataFrame(path, runIdx=None, varIdx=None):
+    """
+    Load retained Monte Carlo data as a (runNum, varIdx) MultiIndex dataframe, regardless of whether it was
+    stored with the legacy pickle format or with the columnar format.
+
+    :param path: path to the ``<variableName>.data`` file (or the ``<variableName>.col`` directory)
+    :param runIdx: optional list of runs to load.  For columnar data only these runs are read from disk.
+    :param varIdx: optional list of variable components to load
+    :return: pandas dataframe indexed by ``time[ns]``
+    """
+    colPath = columnStorePath(path)
+    if colPath is None:
+        df = pd.read_pickle(path)
+        if runIdx is not None:
+            df = df.loc[:, pd.IndexSlice[list(runIdx), :]]
+        if varIdx is not None:
+            df = df.loc[:, pd.IndexSlice[:, list(varIdx)]]
+        return df
+    return ColumnStoreReader(colPath).toDataFrame(runIdx, varIdx)
+
+
+class ColumnStoreWriter:
+    """
+    Writes the retained data of each Monte Carlo run directly into preallocated, memory-mapped column files.
+
+    Args:
+        logDir: directory in which the ``<variableName>.col`` directories are created
+        runsPerChunk: number of runs stored in each chunk file
+        dtype: numpy data type of the stored values
+    """
+    def __init__(self, logDir, runsPerChunk=100, dtype=np.float64):
+        self.logDir = logDir
+        self.runsPerChunk = runsPerChunk
+        self.dtype = np.dtype(dtype)
+        self._meta = {}
+        self._chunks = {}
+
+    def write(self, itemName, runIdx, itemData):
+        """
+        Write the data of a single run into the column store of a variable.
+
+        :param itemName: name of the retained variable
+        :param runIdx: Monte Carlo run index
+        :param itemData: (time x (1 + components)) array where the first column contains the time in ns
+        """
+        itemData = np.asarray(itemData)
+        if itemData.ndim != 2 or itemData.shape[1] < 2:
+            return
+        colPath = os.path.join(self.logDir, itemName + COLUMN_STORE_EXT)
+        if itemName not in self._meta:
+            self._create(itemName, colPath, itemData)
+        meta = self._meta[itemName]
+
+        numTimes = min(itemData.shape[0], meta["numTimes"])
+        if itemData.shape[0] > meta["numTimes"]:
+            print("Warning: run " + str(runIdx) + " of " + itemName + " has more samples than the column store. "
+                  "Only the first " + str(meta["numTimes"]) + " samples are retained.")
+        chunk = self._getChunk(itemName, colPath, runIdx // self.runsPerChunk)
+        chunk[:numTimes, :, runIdx % self.runsPerChunk] = itemData[:numTimes, 1:1 + meta["numComponents"]]
+        meta["numRuns"] = max(meta["numRuns"], runIdx + 1)
+
+    def finalize(self):
+        """
+        Flush all memory maps to disk and write out the meta data of each variable.
+        """
+        for itemName, chunks in self._chunks.items():
+            for chunk in chunks.values():
+                chunk.flush()
+        for itemName, meta in self._meta.items():
+            colPath = os.path.join(self.logDir, itemName + COLUMN_STORE_EXT)
+            with open(os.path.join(colPath, META_FILE), "w") as metaFile:
+                json.dump(meta, metaFile)
+        self._chunks = {}
+
+    def _create(self, itemName, colPath, itemData):
+        if not os.path.exists(colPath):
+            os.mkdir(colPath)
+        meta = {"name": itemName,
+                "numTimes": itemData.shape[0],
+                "numComponents": itemData.shape[1] - 1,
+                "numRuns": 0,
+                "runsPerChunk": self.runsPerChunk,
+                "dtype": self.dtype.str}
+        np.save(os.path.join(colPath, TIME_FILE), itemData[:, 0].astype(np.int64))
+        with open(os.path.join(colPath, META_FILE), "w") as metaFile:
+            json.dump(meta, metaFile)
+        self._meta[itemName] = meta
+        self._chunks[itemName] = {}
+
+    def _getChunk(self, itemName, colPath, chunkIdx):
+        chunks = self._chunks[itemName]
+        if chunkIdx not in chunks:
+            meta = self._meta[itemName]
+            chunkFile = os.path.join(colPath, "chunk" + str(chunkIdx) + ".npy")
+            if os.path.exists(chunkFile):
+                chunks[chunkIdx] = np.load(chunkFile, mmap_mode="r+")
+            else:
+                chunk = np.lib.format.open_memmap(chunkFile, mode="w+", dtype=self.dtype,
+                                                  shape=(meta["numTimes"], meta["numComponents"],
+                                                         self.runsPerChunk))
+                chunk[:] = np.nan
+                chunks[chunkIdx] = chunk
+        return chunks[chunkIdx]
+
+
+class ColumnStoreReader:
+    """
+    Provides lazy, read-only access to a variable stored by :class:`ColumnStoreWriter`.  Only the chunks that
+    contain the requested runs are memory mapped, and only the requested slices are read from disk.
+
+    Args:
+        path: path to the ``<variableName>.col`` directory, or the ``<variableName>.data`` path of the variable
+    """
+    def __init__(self, path):
+        colPath = columnStorePath(path)
+        if colPath is None:
+            raise FileNotFoundError("No column store found for " + path)
+        self.path = colPath
+        with open(os.path.join(colPath, META_FILE), "r") as metaFile:
+            self.meta = json.load(metaFile)
+        self.runsPerChunk = self.meta["runsPerChunk"]
+        self.numComponents = self.meta["numComponents"]
+        self.numRuns = self.meta["numRuns"]
+        if self.numRuns == 0:
+            # meta data was not finalized, infer the run count from the chunk files present
+            numChunks = len(glob.glob(os.path.join(colPath, "chunk*.npy")))
+            self.numRuns = numChunks * self.runsPerChunk
+        self.times = np.load(os.path.join(colPath, TIME_FILE), mmap_mode="r")
+        self._chunks = {}
+
+    @property
+    def shape(self):
+        """(time x component x run) shape of the stored data"""
+        return (len(self.times), self.numComponents, self.numRuns)
+
+    def getRuns(self, runIdx=None, varIdx=None, timeIdx=None):
+        """
+        Read a subset of the stored data.
+
+        :param runIdx: list of run indices, or None for all runs
+        :param varIdx: list of component indices, or None for all components
+        :param timeIdx: slice or index array of the time samples, or None for all samples
+        :return: (time x component x run) numpy array
+        """
+        if runIdx is None:
+            runIdx = range(self.numRuns)
+        if varIdx is None:
+            varIdx = slice(None)
+        if timeIdx is None:
+            timeIdx = slice(None)
+        runIdx = np.asarray(list(runIdx), dtype=int)
+        varIdx = np.arange(self.numComponents)[varIdx]
+        numTimes = len(self.times[timeIdx])
+        out = np.full((numTimes, len(varIdx), len(runIdx)), np.nan, dtype=np.dtype(self.meta["dtype"]))
+        for chunkIdx in np.unique(runIdx // self.runsPerChunk):
+            chunk = self._getChunk(chunkIdx)
+            if chunk is None:
+                continue
+            sel = np.nonzero(runIdx // self.runsPerChunk == chunkIdx)[0]
+            out[:, :, sel] = chunk[timeIdx][:, varIdx][:, :, runIdx[sel] % self.runsPerChunk]
+        return out
+
+    def getRun(self, runIdx):
+        """
+        Read the data of a single run.
+
+        :param runIdx: run index
+        :return: (time x (1 + components)) array with the time in ns as the first column, matching the layout of
+            the data returned by ``RetentionPolicy.getDataForRetention``
+        """
+        return np.column_stack([self.times, self.getRuns([runIdx])[:, :, 0]])
+
+    def toDataFrame(self, runIdx=None, varIdx=None):
+        """
+        Read a subset of the stored data as a (runNum, varIdx) MultiIndex dataframe with the same layout as the
+        dataframes written by the legacy pickle storage.
+
+        :param runIdx: list of run indices, or None for all runs
+        :param varIdx: list of component indices, or None for all components
+        :return: pandas dataframe indexed by ``time[ns]``
+        """
+        if runIdx is None:
+            runIdx = range(self.numRuns)
+        if varIdx is None:
+            varIdx = range(self.numComponents)
+        runIdx = list(runIdx)
+        varIdx = list(varIdx)
+        data = self.getRuns(runIdx, varIdx)
+        columns = pd.MultiIndex.from_product([runIdx, varIdx], names=["runNum", "varIdx"])
+        # order the columns by run first, then by component
+        values = data.transpose(0, 2, 1).reshape(data.shape[0], -1)
+        df = pd.DataFrame(values, index=np.asarray(self.times), columns=columns)
+        df.index.name = 'time[ns]'
+        return df
+
+    def _getChunk(self, chunkIdx):
+        if chunkIdx not in self._chunks:
+            chunkFile = os.path.join(self.path, "chunk" + str(chunkIdx) + ".npy")
+            self._chunks[chunkIdx] = np.load(chunkFile, mmap_mode="r") if os.path.exists(chunkFile) else None
+        return self._chunks[chunkIdx]
@@ -43,6 +43,7 @@ import multiprocessing as mp
 import pickle as pickle
 from Basilisk.utilities.MonteCarlo.DataWriter import DataWriter
 from Basilisk.utilities.MonteCarlo.RetentionPolicy import RetentionPolicy
+from Basilisk.utilities.MonteCarlo.WorkerPool import WorkerPool
 from Basilisk.utilities.simulationProgessBar import SimulationProgressBar
 
 
@@ -59,7 +60,10 @@ class Controller:
         self.icDirectory = ""
         self.archiveDir = None
         self.varCast = None
+        self.dataStorageFormat = "pickle"
         self.numProcess = mp.cpu_count()
+        self.maxTasksPerWorker = 10
+        self.jobTimeout = None
 
         self.simParams = SimulationParameters(
             creationFunction=None,
@@ -187,6 +191,27 @@ class Controller:
         """
         self.numProcess = threads
 
+    def setMaxTasksPerWorker(self, maxTasks):
+        """
+        Set the number of runs a worker process executes before it is replaced by a fresh process.
+        Recycling the workers contains the memory that accumulates within a worker process over many runs.
+
+        Args:
+            maxTasks: int
+                Number of runs per worker process, or None to keep the worker processes for the whole campaign.
+        """
+        self.maxTasksPerWorker = maxTasks
+
+    def setJobTimeout(self, timeout):
+        """
+        Set the maximum wall clock time of a single run. Runs that take longer are killed and marked as failed.
+
+        Args:
+            timeout: float
+                Maximum run time in seconds, or None for no limit.
+        """
+        self.jobTimeout = timeout
+
     def setVerbose(self, verbose):
         """
         Use verbose output for this MonteCarlo run
@@ -232,6 +257,18 @@ class Controller:
         """
         self.varCast = varCast
 
+    def setDataStorageFormat(self, storageFormat):
+        """
+        Set how the retained data of all runs is stored in the archive directory
+
+        :param storageFormat: "pickle" (default) stores a ``<variableName>.data`` dataframe per retained variable.
+            "columnar" stores each retained variable in memory-mapped ``<variableName>.col`` column files of shape
+            (time x component x run) that are written as each run finishes, and are read lazily through
+            :class:`ColumnStoreReader`.
+        :return:
+        """
+        self.dataStorageFormat = storageFormat
+
     def setICDir(self, dirName):
         """
         Set-up archives containing IC data
@@ -398,6 +435,7 @@ class Controller:
                     shutil.rmtree(self.archiveDir)
                 os.mkdir(self.archiveDir)
                 self.dataWriter.setLogDir(self.archiveDir)
+                self.dataWriter.setStorageFormat(self.dataStorageFormat)
                 self.dataWriter.start()
             else:
                 print("ERROR: The archive directory is set as the icDirectory. Proceeding would have overwriten all data " \
@@ -431,37 +469,25 @@ class Controller:
             if self.numProcess > numSims:
                 print("Fewer MCs spawned than processes assigned (%d < %d). Changing processes count to %d." % (numSims, self.numProcess, numSims))
                 self.numProcess = numSims
-            for i in range(numSims//self.numProcess):
-                # If number of sims doesn't factor evenly into the number of processes:
-                if numSims % self.numProcess != 0 and i == len(list(range(numSims//self.numProcess)))-1:
-                    offset = numSims % self.numProcess
-                else:
-                    offset = 0
-
-                simGenerator = self.generateICSims(caseList[self.numProcess*i:self.numProcess*(i+1)+offset])
-                pool = mp.Pool(self.numProcess)
-                try:
-                    # yields results *as* the workers finish jobs
-                    for result in pool.imap_unordered(simulationExecutor, [(x, self.dataOutQueue) for x in simGenerator]):
-                        if result[0] is not True:  # workers return True on success
-                            failed.append(result[1])  # add failed jobs to the list of failures
-                            print("Job", result[1], "failed...")
-
-                        jobsFinished += 1
-                        progressBar.update(jobsFinished)
-                    pool.close()
-                except KeyboardInterrupt as e:
-                    print("Ctrl-C was hit, closing pool")
-                    # failed.extend(range(jobsFinished, numSims))  # fail all potentially running jobs...
-                    pool.terminate()
-                    raise e
-                except Exception as e:
-                    print("Unknown exception while running simulations:", e)
-                    # failed.extend(range(jobsFinished, numSims))  # fail all potentially running jobs...
-                    traceback.print_exc()
-                    pool.terminate()
-                finally:
-                    pool.join()
+            simGenerator = self.generateICSims(caseList)
+            pool = self.createWorkerPool()
+            try:
+                # yields results *as* the workers finish jobs, workers are handed a new job as soon as they are idle
+                for result in self.runWorkerPool(pool, simulationExecutor, simGenerator):
+                    if result[0] is not True:  # workers return True on success
+                        failed.append(result[1])  # add failed jobs to the list of failures
+                        print("Job", result[1], "failed...")
+
+                    jobsFinished += 1
+                    progressBar.update(jobsFinished)
+            except KeyboardInterrupt as e:
+                print("Ctrl-C was hit, closing pool")
+                pool.terminate()
+                raise e
+            except Exception as e:
+                print("Unknown exception while running simulations:", e)
+                traceback.print_exc()
+                pool.terminate()
 
         progressBar.markComplete()
         progressBar.close()
@@ -568,6 +594,29 @@ class Controller:
             for retentionPolicy in retentionPolicies:
                 retentionPolicy.executeCallback(data)
 
+    def createWorkerPool(self):
+        """
+        Create the persistent pool of worker processes used to execute the simulation runs in parallel
+
+        :return: WorkerPool
+        """
+        return WorkerPool(self.numProcess, self.maxTasksPerWorker, self.jobTimeout)
+
+    def runWorkerPool(self, pool, simulationExecutor, simGenerator):
+        """
+        Stream the simulations of ``simGenerator`` through the worker pool. The simulations are only generated when
+        a worker is idle, such that at most one simulation per worker exists at a time.
+
+        :return: generator of (success, index) tuples in the order the runs finish
+        """
+        for (simParams, _), result, status in pool.imap_unordered(simulationExecutor,
+                                                                   ((x, self.dataOutQueue) for x in simGenerator)):
+            if status == "timeout":
+                print("Job", simParams.index, "exceeded the timeout of", pool.jobTimeout, "s and was killed")
+            elif status == "crashed":
+                print("Job", simParams.index, "terminated its worker process")
+            yield result if result is not None else (False, simParams.index)
+
     def executeSimulations(self):
         """
         Execute simulations in parallel
@@ -601,6 +650,7 @@ class Controller:
         # start data writer process
         self.dataWriter.setLogDir(self.archiveDir)
         self.dataWriter.setVarCast(self.varCast)
+        self.dataWriter.setStorageFormat(self.dataStorageFormat)
         self.dataWriter.start()
 
         # Avoid building a full list of all simulations to run in memory,
@@ -618,9 +668,10 @@ class Controller:
 
         progressBar = SimulationProgressBar(numSims, self.simParams.showProgressBar)
 
-        # The outermost for-loop for both the serial and multiprocessed sim generator is not necessary. It
-        # is a temporary fix to a memory leak which is assumed to be a result of the simGenerator not collecting
-        # garbage properly. # TODO: Find a more permenant solution to the leak.
+        # The outermost for-loop of the serial sim generator is not necessary. It is a temporary fix to a memory
+        # leak which is assumed to be a result of the simGenerator not collecting garbage properly. In the parallel
+        # case the leak is contained by recycling the worker processes, see setMaxTasksPerWorker().
+        # TODO: Find a more permenant solution to the leak.
 
         if self.numProcess == 1:  # don't make child thread
             if self.simParams.verbose:
@@ -642,37 +693,29 @@ class Controller:
             if self.numProcess > numSims:
                 print("Fewer MCs spawned than processes assigned (%d < %d). Changing processes count to %d." % (numSims, self.numProcess, numSims))
                 self.numProcess = numSims
-            for i in range(numSims//self.numProcess):
-                # If number of sims doesn't factor evenly into the number of processes:
-                if numSims % self.numProcess != 0 and i == len(list(range(numSims//self.numProcess)))-1:
-                    offset = numSims % self.numProcess
-                else:
-                    offset = 0
-                simGenerator = self.generateSims(list(range(self.numProcess*i, self.numProcess*(i+1)+offset)))
-                pool = mp.Pool(self.numProcess)
-                try:
-                    # yields results *as* the workers finish jobs
-                    for result in pool.imap_unordered(simulationExecutor, [(x, self.dataOutQueue) for x in simGenerator]):
-                        if result[0] is not True:  # workers return True on success
-                            failed.append(result[1])  # add failed jobs to the list of failures
-                            print("Job", result[1], "failed...")
-
-                        jobsFinished += 1
-                        progressBar.update(jobsFinished)
-                    pool.close()
-                except KeyboardInterrupt as e:
-                    print("Ctrl-C was hit, closing pool")
-                    failed.extend(list(range(jobsFinished, numSims)))  # fail all potentially running jobs...
-                    pool.terminate()
-                    raise e
-                except Exception as e:
-                    print("Unknown exception while running simulations:", e)
-                    failed.extend(list(range(jobsFinished, numSims)))  # fail all potentially running jobs...
-                    traceback.print_exc()
-                    pool.terminate()
-                finally:
-                    # Wait until all data is logged from the spawned runs before proceeding with the next set.
-                    pool.join()
+            simGenerator = self.generateSims(range(numSims))
+            pool = self.createWorkerPool()
+            finished = set()
+            try:
+                # yields results *as* the workers finish jobs, workers are handed a new job as soon as they are idle
+                for result in self.runWorkerPool(pool, simulationExecutor, simGenerator):
+                    if result[0] is not True:  # workers return True on success
+                        failed.append(result[1])  # add failed jobs to the list of failures
+                        print("Job", result[1], "failed...")
+
+                    finished.add(result[1])
+                    jobsFinished += 1
+                    progressBar.update(jobsFinished)
+            except KeyboardInterrupt as e:
+                print("Ctrl-C was hit, closing pool")
+                failed.extend([i for i in range(numSims) if i not in finished])  # fail all unfinished jobs...
+                pool.terminate()
+                raise e
+            except Exception as e:
+                print("Unknown exception while running simulations:", e)
+                failed.extend([i for i in range(numSims) if i not in finished])  # fail all unfinished jobs...
+                traceback.print_exc()
+                pool.terminate()
 
         progressBar.markComplete()
         progressBar.close()
@@ -3,6 +3,7 @@ import pandas as pd
 import numpy as np
 import pickle
 import os
+from Basilisk.utilities.MonteCarlo.ColumnStore import ColumnStoreWriter
 
 class DataWriter(mp.Process):
     """ Class to be launched as separate process to pull data from queue and write out to .csv dataFrames
@@ -18,6 +19,9 @@ class DataWriter(mp.Process):
         self._varCast = None
         self._logDir = ""
         self._dataFiles = set()
+        self._storageFormat = "pickle"
+        self._runsPerChunk = 100
+        self._columnStore = None
 
     def run(self):
         """ The process run loop. Gets data from a queue and writes it out to per message csv files
@@ -26,6 +30,10 @@ class DataWriter(mp.Process):
             Returns:
                 Nil
         """
+        if self._storageFormat == "columnar":
+            self._runColumnar()
+            return
+
         while self._endToken is None:
             data, mcSimIndex, self._endToken = self._queue.get()
             print("Starting to log: " + str(mcSimIndex))
@@ -110,8 +118,49 @@ class DataWriter(mp.Process):
             allData.to_pickle(filePath)
         print("Finished concatenating dataframes")
 
+    def _runColumnar(self):
+        """ The process run loop for the columnar storage format. Each run's retained data is written directly
+            into the memory-mapped column files so no concatenation is required once all runs are finished.
+            Args:
+                Nil
+            Returns:
+                Nil
+        """
+        dtype = np.float32 if self._varCast is not None else np.float64
+        self._columnStore = ColumnStoreWriter(self._logDir, self._runsPerChunk, dtype)
+        while self._endToken is None:
+            data, mcSimIndex, self._endToken = self._queue.get()
+            if self._endToken:
+                continue
+            print("Logging columns from run " + str(mcSimIndex))
+            for dictName, dictData in data.items():
+                for itemName, itemData in dictData.items():
+                    if itemName == "OrbitalElements.Omega":  # Protects from OS that aren't case sensitive.
+                        itemName = "OrbitalElements.Omega_Capital"
+                    try:
+                        self._columnStore.write(itemName, mcSimIndex, np.asarray(itemData, dtype=np.float64))
+                    except (TypeError, ValueError):
+                        print("Warning: " + itemName + " is not numeric and can't be stored in columnar format")
+            print("Finished logging columns from run " + str(mcSimIndex))
+        self._columnStore.finalize()
+        print("Finished writing column stores")
+
     def setLogDir(self, logDir):
         self._logDir = logDir
 
     def setVarCast(self, varCast):
-        self._varCast = varCast
\ No newline at end of file
+        self._varCast = varCast
+
+    def setStorageFormat(self, storageFormat, runsPerChunk=100):
+        """ Selects how the retained data is stored
+            Args:
+                storageFormat: "pickle" to append per-run dataframes and concatenate them at the end (default), or
+                    "columnar" to write directly into memory-mapped column files (see ColumnStore.py)
+                runsPerChunk: number of runs stored per column file chunk when using the columnar format
+            Returns:
+                Nil
+        """
+        if storageFormat not in ["pickle", "columnar"]:
+            raise ValueError("Unknown storage format " + str(storageFormat))
+        self._storageFormat = storageFormat
+        self._runsPerChunk = runsPerChunk
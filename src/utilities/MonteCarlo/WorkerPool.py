@@ -0,0 +1,165 @@
+# ISC License
+#
+# Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Persistent worker pool used by the MonteCarlo Controller.
+#
+# The workers live for the whole Monte Carlo campaign and are handed a new job as soon as they finish the previous
+# one, so a slow run never stalls the other cores.  Workers are recycled after a given number of jobs to contain
+# memory growth within a worker, and jobs that exceed a timeout are killed together with their worker.
+#
+
+import time
+import signal
+import multiprocessing as mp
+from multiprocessing.connection import wait
+
+
+def _workerLoop(conn, function, maxTasks):
+    """ Run loop of a worker process. Receives jobs through ``conn`` and sends back their results until it
+        receives None, or until it has executed ``maxTasks`` jobs.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # On ctrl-c ignore the signal... let the parent deal with it.
+    numTasks = 0
+    while maxTasks is None or numTasks < maxTasks:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        conn.send(function(job))
+        numTasks += 1
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, function, maxTasks):
+        self.conn, childConn = mp.Pipe()
+        self.process = mp.Process(target=_workerLoop, args=(childConn, function, maxTasks))
+        self.process.daemon = True
+        self.process.start()
+        childConn.close()
+        self.job = None
+        self.startTime = None
+        self.numTasks = 0
+
+    def submit(self, job):
+        self.job = job
+        self.startTime = time.time()
+        self.conn.send(job)
+
+    def terminate(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    A pool of long-lived worker processes that pull jobs from a generator one at a time.
+
+    Args:
+        numProcess: number of worker processes
+        maxTasksPerWorker: number of jobs a worker executes before it is replaced by a fresh process,
+            or None to never recycle workers
+        jobTimeout: wall clock time [s] after which a running job is killed, or None for no timeout
+    """
+    def __init__(self, numProcess, maxTasksPerWorker=None, jobTimeout=None):
+        self.numProcess = numProcess
+        self.maxTasksPerWorker = maxTasksPerWorker
+        self.jobTimeout = jobTimeout
+        self._workers = []
+
+    def imap_unordered(self, function, jobs):
+        """
+        Execute ``function`` on every job of ``jobs`` and yield the results as the workers finish them.
+        The ``jobs`` iterable is only advanced when a worker is idle, so at most ``numProcess`` jobs exist at a time.
+
+        :param function: picklable callable executed in the worker processes
+        :param jobs: iterable of jobs
+        :return: generator of ``(job, result, status)`` tuples, where status is ``"done"``, ``"timeout"`` or
+            ``"crashed"``.  The result is None if the job did not finish.
+        """
+        jobs = iter(jobs)
+        jobsLeft = True
+        self._workers = [_Worker(function, self.maxTasksPerWorker) for _ in range(self.numProcess)]
+        try:
+            while True:
+                # hand out jobs to all idle workers
+                for worker in self._workers:
+                    if worker.job is None and jobsLeft:
+                        try:
+                            worker.submit(next(jobs))
+                        except StopIteration:
+                            jobsLeft = False
+                busy = [worker for worker in self._workers if worker.job is not None]
+                if not busy:
+                    break
+
+                waitTime = None
+                if self.jobTimeout is not None:
+                    waitTime = max(0., min(worker.startTime for worker in busy) + self.jobTimeout - time.time())
+                ready = wait([worker.conn for worker in busy] + [worker.process.sentinel for worker in busy],
+                             timeout=waitTime)
+
+                for i, worker in enumerate(self._workers):
+                    if worker.job is None:
+                        continue
+                    job = worker.job
+                    if worker.conn in ready:
+                        try:
+                            result = worker.conn.recv()
+                        except EOFError:
+                            self._replace(i, function)
+                            yield job, None, "crashed"
+                            continue
+                        worker.job = None
+                        worker.numTasks += 1
+                        if self.maxTasksPerWorker is not None and worker.numTasks >= self.maxTasksPerWorker:
+                            self._replace(i, function, graceful=True)
+                        yield job, result, "done"
+                    elif worker.process.sentinel in ready:
+                        self._replace(i, function)
+                        yield job, None, "crashed"
+                    elif self.jobTimeout is not None and time.time() - worker.startTime > self.jobTimeout:
+                        self._replace(i, function)
+                        yield job, None, "timeout"
+        finally:
+            self.terminate()
+
+    def terminate(self):
+        """
+        Kill all worker processes
+        """
+        for worker in self._workers:
+            worker.terminate()
+        self._workers = []
+
+    def _replace(self, i, function, graceful=False):
+        if graceful:
+            self._workers[i].stop()
+        else:
+            self._workers[i].terminate()
+        self._workers[i] = _Worker(function, self.maxTasksPerWorker)
@@ -0,0 +1,68 @@
+# ISC License
+#
+# Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Unit test of the columnar Monte Carlo data storage
+#
+
+import numpy as np
+import pytest
+
+from Basilisk.utilities.MonteCarlo.AnalysisBaseClass import mcAnalysisBaseClass
+from Basilisk.utilities.MonteCarlo.ColumnStore import ColumnStoreWriter, ColumnStoreReader, loadDataFrame
+
+
+@pytest.mark.parametrize("runsPerChunk", [1, 3, 100])
+def test_columnStore(tmp_path, runsPerChunk):
+    """Write retained data of several runs into the column store and read subsets back"""
+    numRuns = 7
+    times = np.arange(0, 50) * 1e9
+    runData = {}
+
+    writer = ColumnStoreWriter(str(tmp_path), runsPerChunk=runsPerChunk)
+    # runs arrive out of order from the worker pool, and run 4 failed
+    for runIdx in [2, 0, 6, 1, 5, 3]:
+        values = np.random.rand(len(times), 3) + runIdx
+        runData[runIdx] = values
+        writer.write("scStateMsg.r_BN_N", runIdx, np.column_stack([times, values]))
+    writer.finalize()
+
+    reader = ColumnStoreReader(str(tmp_path / "scStateMsg.r_BN_N.data"))
+    assert reader.shape == (len(times), 3, numRuns)
+    np.testing.assert_array_equal(reader.times, times)
+
+    subset = reader.getRuns([5, 2], varIdx=[1, 2])
+    np.testing.assert_array_equal(subset[:, :, 0], runData[5][:, 1:])
+    np.testing.assert_array_equal(subset[:, :, 1], runData[2][:, 1:])
+    assert np.all(np.isnan(reader.getRuns([4])))
+
+    np.testing.assert_array_equal(reader.getRun(6), np.column_stack([times, runData[6]]))
+
+    df = loadDataFrame(str(tmp_path / "scStateMsg.r_BN_N.data"), runIdx=[0, 3])
+    assert list(df.columns) == [(0, 0), (0, 1), (0, 2), (3, 0), (3, 1), (3, 2)]
+    assert df.index.name == 'time[ns]'
+    np.testing.assert_array_equal(df.loc[:, 3].values, runData[3])
+
+    # a subset of runs reformatted to more components keeps the run numbers
+    df = mcAnalysisBaseClass.pull_and_format_df(str(tmp_path / "scStateMsg.r_BN_N.data"), 4, runIdx=[2, 5])
+    assert list(df.columns.unique(level=0)) == [2, 5]
+    assert list(df.columns.unique(level=1)) == [0, 1, 2, 3]
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    test_columnStore(pathlib.Path(tempfile.mkdtemp()), 3)
@@ -0,0 +1,59 @@
+# ISC License
+#
+# Copyright (c) 2016, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Unit test of the persistent Monte Carlo worker pool
+#
+
+import os
+import time
+
+import pytest
+
+from Basilisk.utilities.MonteCarlo.WorkerPool import WorkerPool
+
+
+def slowJob(index):
+    if index == 3:
+        time.sleep(10)  # exceeds the job timeout
+    if index == 5:
+        os._exit(1)  # kills the worker process
+    return (True, index, os.getpid())
+
+
+@pytest.mark.parametrize("maxTasksPerWorker", [None, 2])
+def test_workerPool(maxTasksPerWorker):
+    """Run jobs through the worker pool, including a job that times out and a job that kills its worker"""
+    pool = WorkerPool(3, maxTasksPerWorker=maxTasksPerWorker, jobTimeout=2)
+    results = {job: (result, status) for job, result, status in pool.imap_unordered(slowJob, range(12))}
+
+    assert sorted(results.keys()) == list(range(12))
+    assert results[3] == (None, "timeout")
+    assert results[5] == (None, "crashed")
+    for job in set(range(12)) - {3, 5}:
+        assert results[job][1] == "done"
+        assert results[job][0][:2] == (True, job)
+
+    if maxTasksPerWorker is not None:
+        pidCount = {}
+        for result, status in results.values():
+            if result is not None:
+                pidCount[result[2]] = pidCount.get(result[2], 0) + 1
+        assert max(pidCount.values()) <= maxTasksPerWorker
+
+
+if __name__ == "__main__":
+    test_workerPool(2)
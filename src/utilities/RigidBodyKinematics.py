@@ -4302,3 +4302,536 @@ def v3Tilde(vector):
 
     return xTilde
 
+
+
+#
+# Array versions of the attitude parameter conversions.  These functions broadcast over stacks of attitudes,
+# such as (N,3) arrays of MRP, Gibbs or principal rotation vectors, (N,4) arrays of Euler parameters and
+# (N,3,3) arrays of direction cosine matrices, and evaluate the same expressions as the scalar functions above.
+#
+
+def _stackVector(*components):
+    return np.stack(np.broadcast_arrays(*components), axis=-1)
+
+
+def _stackMatrix(*rows):
+    return np.stack([_stackVector(*row) for row in rows], axis=-2)
+
+
+def rowDot(v1, v2):
+    """
+    Dot product of each row of the (N,n) arrays v1 and v2.  The stacked matmul reduces in the same order as np.dot,
+    such that the results match those of the scalar functions.
+
+    :param v1: (N,n) array of vectors
+    :param v2: (N,n) array of vectors
+    :return: (N,) array of dot products
+    """
+    return np.matmul(v1[..., None, :], v2[..., :, None])[..., 0, 0]
+
+
+def rowNorm(v):
+    """
+    Norm of each row of the (N,n) array v, computed like :func:`rowDot`.
+
+    :param v: (N,n) array of vectors
+    :return: (N,) array of norms
+    """
+    return np.sqrt(rowDot(v, v))
+
+
+def C2EPArray(C):
+    """
+    Array version of :func:`C2EP`, translates the (N,3,3) direction cosine matrices C into (N,4) Euler parameter
+    vectors with Beta_0 >= 0, using the Stanley method.
+    """
+    C = np.asarray(C, dtype=np.float64)
+    tr = np.trace(C, axis1=-2, axis2=-1)
+    b2 = _stackVector((1 + tr) / 4,
+                      (1 + 2 * C[..., 0, 0] - tr) / 4,
+                      (1 + 2 * C[..., 1, 1] - tr) / 4,
+                      (1 + 2 * C[..., 2, 2] - tr) / 4)
+    case = np.argmax(b2, axis=-1)
+    bCase = np.sqrt(np.take_along_axis(b2, case[..., None], axis=-1)[..., 0])
+
+    # C[i, j] - C[j, i] and C[i, j] + C[j, i] terms of each case
+    d12 = C[..., 1, 2] - C[..., 2, 1]
+    d20 = C[..., 2, 0] - C[..., 0, 2]
+    d01 = C[..., 0, 1] - C[..., 1, 0]
+    s01 = C[..., 0, 1] + C[..., 1, 0]
+    s20 = C[..., 2, 0] + C[..., 0, 2]
+    s12 = C[..., 1, 2] + C[..., 2, 1]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # the component computed from the square root is made positive with beta_0
+        b0 = np.choose(case, [bCase, d12 / 4 / bCase, d20 / 4 / bCase, d01 / 4 / bCase])
+        flip = np.logical_and(case > 0, b0 < 0)
+        bCase = np.where(flip, -bCase, bCase)
+        b0 = np.where(flip, -b0, b0)
+        b = np.choose(case[..., None], [
+            _stackVector(b0, d12 / 4 / bCase, d20 / 4 / bCase, d01 / 4 / bCase),
+            _stackVector(b0, bCase, s01 / 4 / bCase, s20 / 4 / bCase),
+            _stackVector(b0, s01 / 4 / bCase, bCase, s12 / 4 / bCase),
+            _stackVector(b0, s20 / 4 / bCase, s12 / 4 / bCase, bCase)])
+    return b
+
+
+def C2MRPArray(C):
+    """
+    Array version of :func:`C2MRP`, translates the (N,3,3) direction cosine matrices C into (N,3) MRP vectors
+    with :math:`|Q| <= 1`.
+    """
+    b = C2EPArray(C)
+    return b[..., 1:4] / (1 + b[..., 0:1])
+
+
+def C2GibbsArray(C):
+    """
+    Array version of :func:`C2Gibbs`, translates the (N,3,3) direction cosine matrices C into (N,3) Gibbs vectors.
+    """
+    b = C2EPArray(C)
+    return b[..., 1:4] / b[..., 0:1]
+
+
+def C2PRVArray(C):
+    """
+    Array version of :func:`C2PRV`, translates the (N,3,3) direction cosine matrices C into (N,3) principal
+    rotation vectors.
+    """
+    C = np.asarray(C, dtype=np.float64)
+    cp = (np.trace(C, axis1=-2, axis2=-1) - 1) / 2
+    p = np.arccos(cp)
+    sp = p / 2. / np.sin(p)
+    return _stackVector((C[..., 1, 2] - C[..., 2, 1]) * sp,
+                        (C[..., 2, 0] - C[..., 0, 2]) * sp,
+                        (C[..., 0, 1] - C[..., 1, 0]) * sp)
+
+
+def _eulerSequence(sequence):
+    axes = [int(axis) - 1 for axis in str(sequence)]
+    if len(axes) != 3 or any(axis not in [0, 1, 2] for axis in axes) or axes[0] == axes[1] or axes[1] == axes[2]:
+        raise ValueError('Euler angle sequence {0} is not valid'.format(sequence))
+    return axes
+
+
+def C2EulerArray(C, sequence):
+    """
+    Array version of the C2Euler functions, such as :func:`C2Euler321`, translates the (N,3,3) direction cosine
+    matrices C into (N,3) Euler angle sets of the given sequence.
+
+    :param C: (N,3,3) array of direction cosine matrices
+    :param sequence: Euler angle sequence, such as ``321`` or ``'313'``
+    :return: (N,3) array of Euler angles
+    """
+    C = np.asarray(C, dtype=np.float64)
+    i, j, k = _eulerSequence(sequence)
+    if i == k:
+        # symmetric sequences i-j-i, where k is the remaining axis
+        k = 3 - i - j
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+        return _stackVector(np.arctan2(C[..., i, j], -sign * C[..., i, k]),
+                            np.arccos(C[..., i, i]),
+                            np.arctan2(C[..., j, i], sign * C[..., k, i]))
+    # asymmetric sequences i-j-k
+    sign = 1.0 if (j - i) % 3 == 1 else -1.0
+    return _stackVector(np.arctan2(-sign * C[..., k, j], C[..., k, k]),
+                        np.arcsin(sign * C[..., k, i]),
+                        np.arctan2(-sign * C[..., j, i], C[..., i, i]))
+
+
+def eulerRotationArray(angles, axis):
+    """
+    Array version of :func:`euler1`, :func:`euler2` and :func:`euler3`, returns the (N,3,3) elementary rotation
+    matrices about the given body axis (1, 2 or 3).
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    c = np.cos(angles)
+    s = np.sin(angles)
+    one = np.ones(angles.shape)
+    zero = np.zeros(angles.shape)
+    if axis == 1:
+        return _stackMatrix((one, zero, zero), (zero, c, s), (zero, -s, c))
+    if axis == 2:
+        return _stackMatrix((c, zero, -s), (zero, one, zero), (s, zero, c))
+    if axis == 3:
+        return _stackMatrix((c, s, zero), (-s, c, zero), (zero, zero, one))
+    raise ValueError('eulerRotationArray() error: incorrect axis {0} selected'.format(axis))
+
+
+def euler2CArray(q, sequence):
+    """
+    Array version of the euler2C functions, such as :func:`euler3212C`, returns the (N,3,3) direction cosine
+    matrices of (N,3) Euler angle sets of the given sequence.
+
+    :param q: (N,3) array of Euler angles
+    :param sequence: Euler angle sequence, such as ``321`` or ``'313'``
+    :return: (N,3,3) array of direction cosine matrices
+    """
+    q = np.asarray(q, dtype=np.float64)
+    i, j, k = _eulerSequence(sequence)
+    return np.matmul(eulerRotationArray(q[..., 2], k + 1),
+                     np.matmul(eulerRotationArray(q[..., 1], j + 1), eulerRotationArray(q[..., 0], i + 1)))
+
+
+def EP2CArray(q):
+    """
+    Array version of :func:`EP2C`, returns the (N,3,3) direction cosine matrices of (N,4) Euler parameter vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q0, q1, q2, q3 = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return _stackMatrix((q0 * q0 + q1 * q1 - q2 * q2 - q3 * q3, 2 * (q1 * q2 + q0 * q3), 2 * (q1 * q3 - q0 * q2)),
+                        (2 * (q1 * q2 - q0 * q3), q0 * q0 - q1 * q1 + q2 * q2 - q3 * q3, 2 * (q2 * q3 + q0 * q1)),
+                        (2 * (q1 * q3 + q0 * q2), 2 * (q2 * q3 - q0 * q1), q0 * q0 - q1 * q1 - q2 * q2 + q3 * q3))
+
+
+def EP2MRPArray(q):
+    """
+    Array version of :func:`EP2MRP`, translates (N,4) Euler parameter vectors into (N,3) MRP vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q = np.where(q[..., 0:1] < 0, -q, q)
+    return q[..., 1:4] / (1 + q[..., 0:1])
+
+
+def EP2GibbsArray(q):
+    """
+    Array version of :func:`EP2Gibbs`, translates (N,4) Euler parameter vectors into (N,3) Gibbs vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    return q[..., 1:4] / q[..., 0:1]
+
+
+def EP2PRVArray(q):
+    """
+    Array version of :func:`EP2PRV`, translates (N,4) Euler parameter vectors into (N,3) principal rotation
+    vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    p = 2 * np.arccos(q[..., 0:1])
+    sp = np.sin(p / 2)
+    return q[..., 1:4] / sp * p
+
+
+def MRP2CArray(q):
+    """
+    Array version of :func:`MRP2C`, returns the (N,3,3) direction cosine matrices of (N,3) MRP vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q1, q2, q3 = q[..., 0], q[..., 1], q[..., 2]
+    qm = rowNorm(q)
+    d1 = qm * qm
+    S = 1 - d1
+    d = ((1 + d1) * (1 + d1))[..., None, None]
+    C = _stackMatrix((4 * (2 * q1 * q1 - d1) + S * S, 8 * q1 * q2 + 4 * q3 * S, 8 * q1 * q3 - 4 * q2 * S),
+                     (8 * q2 * q1 - 4 * q3 * S, 4 * (2 * q2 * q2 - d1) + S * S, 8 * q2 * q3 + 4 * q1 * S),
+                     (8 * q3 * q1 + 4 * q2 * S, 8 * q3 * q2 - 4 * q1 * S, 4 * (2 * q3 * q3 - d1) + S * S))
+    return C / d
+
+
+def MRP2EPArray(q1):
+    """
+    Array version of :func:`MRP2EP`, translates (N,3) MRP vectors into (N,4) Euler parameter vectors.
+    """
+    q1 = np.asarray(q1, dtype=np.float64)
+    qm = rowNorm(q1)
+    ps = 1 + qm * qm
+    return _stackVector((1 - qm * qm) / ps, 2 * q1[..., 0] / ps, 2 * q1[..., 1] / ps, 2 * q1[..., 2] / ps)
+
+
+def MRP2GibbsArray(q1):
+    """
+    Array version of :func:`MRP2Gibbs`, translates (N,3) MRP vectors into (N,3) Gibbs vectors.
+    """
+    q1 = np.asarray(q1, dtype=np.float64)
+    return 2 * q1 / (1 - rowDot(q1, q1))[..., None]
+
+
+def MRP2PRVArray(q):
+    """
+    Array version of :func:`MRP2PRV`, translates (N,3) MRP vectors into (N,3) principal rotation vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    tp = rowNorm(q)[..., None]
+    p = 4 * np.arctan(tp)
+    return q / tp * p
+
+
+def MRPswitchArray(q, s2):
+    """
+    Array version of :func:`MRPswitch`, maps each of the (N,3) MRP vectors Q whose norm is larger than s2
+    to its shadow set.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q2 = rowDot(q, q)[..., None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(q2 > s2 * s2, -q / q2, q)
+
+
+def PRV2elemArray(r):
+    """
+    Array version of :func:`PRV2elem`, translates (N,3) principal rotation vectors into (N,4) principal rotation
+    element sets.
+    """
+    r = np.asarray(r, dtype=np.float64)
+    q0 = rowNorm(r)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        q = _stackVector(q0, r[..., 0] / q0, r[..., 1] / q0, r[..., 2] / q0)
+    return np.where((q0 < 1e-12)[..., None], 0.0, q)
+
+
+def PRV2CArray(q):
+    """
+    Array version of :func:`PRV2C`, returns the (N,3,3) direction cosine matrices of (N,3) principal rotation
+    vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q0 = rowNorm(q)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        e = np.where((q0 == 0.0)[..., None], q, q / q0[..., None])
+    q1, q2, q3 = e[..., 0], e[..., 1], e[..., 2]
+    cp = np.cos(q0)
+    sp = np.sin(q0)
+    d1 = 1 - cp
+    return _stackMatrix((q1 * q1 * d1 + cp, q1 * q2 * d1 + q3 * sp, q1 * q3 * d1 - q2 * sp),
+                        (q2 * q1 * d1 - q3 * sp, q2 * q2 * d1 + cp, q2 * q3 * d1 + q1 * sp),
+                        (q3 * q1 * d1 + q2 * sp, q3 * q2 * d1 - q1 * sp, q3 * q3 * d1 + cp))
+
+
+def PRV2EPArray(qq1):
+    """
+    Array version of :func:`PRV2EP`, translates (N,3) principal rotation vectors into (N,4) Euler parameter
+    vectors.
+    """
+    q1 = PRV2elemArray(qq1)
+    sp = np.sin(q1[..., 0:1] / 2)
+    return np.concatenate([np.cos(q1[..., 0:1] / 2), q1[..., 1:4] * sp], axis=-1)
+
+
+def PRV2MRPArray(q):
+    """
+    Array version of :func:`PRV2MRP`, translates (N,3) principal rotation vectors into (N,3) MRP vectors.
+    """
+    q = PRV2elemArray(q)
+    return q[..., 1:4] * np.tan(q[..., 0:1] / 4)
+
+
+def PRV2GibbsArray(q):
+    """
+    Array version of :func:`PRV2Gibbs`, translates (N,3) principal rotation vectors into (N,3) Gibbs vectors.
+    """
+    q = PRV2elemArray(q)
+    return q[..., 1:4] * np.tan(q[..., 0:1] / 2)
+
+
+def gibbs2CArray(q):
+    """
+    Array version of :func:`gibbs2C`, returns the (N,3,3) direction cosine matrices of (N,3) Gibbs vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    q1, q2, q3 = q[..., 0], q[..., 1], q[..., 2]
+    qm = rowNorm(q)
+    d1 = qm * qm
+    C = _stackMatrix((1 + 2 * q1 * q1 - d1, 2 * (q1 * q2 + q3), 2 * (q1 * q3 - q2)),
+                     (2 * (q2 * q1 - q3), 1 + 2 * q2 * q2 - d1, 2 * (q2 * q3 + q1)),
+                     (2 * (q3 * q1 + q2), 2 * (q3 * q2 - q1), 1 + 2 * q3 * q3 - d1))
+    return C / (1 + d1)[..., None, None]
+
+
+def gibbs2EPArray(q1):
+    """
+    Array version of :func:`gibbs2EP`, translates (N,3) Gibbs vectors into (N,4) Euler parameter vectors.
+    """
+    q1 = np.asarray(q1, dtype=np.float64)
+    qm = rowNorm(q1)
+    ps = np.sqrt(1 + qm * qm)
+    return _stackVector(1 / ps, q1[..., 0] / ps, q1[..., 1] / ps, q1[..., 2] / ps)
+
+
+def gibbs2MRPArray(q1):
+    """
+    Array version of :func:`gibbs2MRP`, translates (N,3) Gibbs vectors into (N,3) MRP vectors.
+    """
+    q1 = np.asarray(q1, dtype=np.float64)
+    return q1 / (1 + np.sqrt(1 + rowDot(q1, q1)))[..., None]
+
+
+def gibbs2PRVArray(q):
+    """
+    Array version of :func:`gibbs2PRV`, translates (N,3) Gibbs vectors into (N,3) principal rotation vectors.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    tp = rowNorm(q)[..., None]
+    p = 2 * np.arctan(tp)
+    return q / tp * p
+
+
+def addEPArray(b1, b2):
+    """
+    Array version of :func:`addEP`, returns the (N,4) Euler parameter vectors of the successive rotations
+    B1 and B2.
+    """
+    b1, b2 = np.broadcast_arrays(np.asarray(b1, dtype=np.float64), np.asarray(b2, dtype=np.float64))
+    return _stackVector(
+        b2[..., 0] * b1[..., 0] - b2[..., 1] * b1[..., 1] - b2[..., 2] * b1[..., 2] - b2[..., 3] * b1[..., 3],
+        b2[..., 1] * b1[..., 0] + b2[..., 0] * b1[..., 1] + b2[..., 3] * b1[..., 2] - b2[..., 2] * b1[..., 3],
+        b2[..., 2] * b1[..., 0] - b2[..., 3] * b1[..., 1] + b2[..., 0] * b1[..., 2] + b2[..., 1] * b1[..., 3],
+        b2[..., 3] * b1[..., 0] + b2[..., 2] * b1[..., 1] - b2[..., 1] * b1[..., 2] + b2[..., 0] * b1[..., 3])
+
+
+def subEPArray(b1, b2):
+    """
+    Array version of :func:`subEP`, returns the (N,4) Euler parameter vectors of the relative rotations from
+    B2 to B1.
+    """
+    b1, b2 = np.broadcast_arrays(np.asarray(b1, dtype=np.float64), np.asarray(b2, dtype=np.float64))
+    return _stackVector(
+        b2[..., 0] * b1[..., 0] + b2[..., 1] * b1[..., 1] + b2[..., 2] * b1[..., 2] + b2[..., 3] * b1[..., 3],
+        -b2[..., 1] * b1[..., 0] + b2[..., 0] * b1[..., 1] + b2[..., 3] * b1[..., 2] - b2[..., 2] * b1[..., 3],
+        -b2[..., 2] * b1[..., 0] - b2[..., 3] * b1[..., 1] + b2[..., 0] * b1[..., 2] + b2[..., 1] * b1[..., 3],
+        -b2[..., 3] * b1[..., 0] + b2[..., 2] * b1[..., 1] - b2[..., 1] * b1[..., 2] + b2[..., 0] * b1[..., 3])
+
+
+def addMRPArray(q1, q2):
+    """
+    Array version of :func:`addMRP`, returns the (N,3) MRP vectors of the successive rotations Q1 and Q2.
+    The second set is switched to its shadow set where the composition is singular, and the result is mapped
+    to the shadow set if its norm is larger than 1.
+    """
+    q1, q2 = np.broadcast_arrays(np.asarray(q1, dtype=np.float64), np.asarray(q2, dtype=np.float64))
+    den = 1 + rowDot(q1, q1) * rowDot(q2, q2) - 2 * rowDot(q1, q2)
+    singular = np.abs(den) < 1e-5
+    if np.any(singular):
+        q2 = np.where(singular[..., None], -q2 / rowDot(q2, q2)[..., None], q2)
+        den = 1 + rowDot(q1, q1) * rowDot(q2, q2) - 2 * rowDot(q1, q2)
+    num = (1 - rowDot(q1, q1))[..., None] * q2 + (1 - rowDot(q2, q2))[..., None] * q1 + 2 * np.cross(q1, q2)
+    q = num / den[..., None]
+    return MRPswitchArray(q, 1.0)
+
+
+def subMRPArray(q1, q2):
+    """
+    Array version of :func:`subMRP`, returns the (N,3) MRP vectors of the relative rotations from Q2 to Q1.
+    The second set is switched to its shadow set where the difference is singular, and the result is mapped
+    to the shadow set if its norm is larger than 1.
+    """
+    q1, q2 = np.broadcast_arrays(np.asarray(q1, dtype=np.float64), np.asarray(q2, dtype=np.float64))
+    q2m = rowNorm(q2)
+    q1m = rowNorm(q1)
+    den = 1 + (q1m * q1m) * (q2m * q2m) + 2 * rowDot(q1, q2)
+    singular = den < 1e-5
+    if np.any(singular):
+        # as in subMRP(), the norm of the switched set is not updated
+        q2 = np.where(singular[..., None], -q2 / rowDot(q2, q2)[..., None], q2)
+        den = 1 + (q1m * q1m) * (q2m * q2m) + 2 * rowDot(q1, q2)
+    num = (1 - q2m * q2m)[..., None] * q1 - (1 - q1m * q1m)[..., None] * q2 + 2 * np.cross(q1, q2)
+    q = num / den[..., None]
+    return MRPswitchArray(q, 1.0)
+
+
+def addGibbsArray(q1, q2):
+    """
+    Array version of :func:`addGibbs`, returns the (N,3) Gibbs vectors of the successive rotations Q1 and Q2.
+    """
+    q1, q2 = np.broadcast_arrays(np.asarray(q1, dtype=np.float64), np.asarray(q2, dtype=np.float64))
+    return (q1 + q2 + np.cross(q1, q2)) / (1 - rowDot(q1, q2))[..., None]
+
+
+def subGibbsArray(q1, q2):
+    """
+    Array version of :func:`subGibbs`, returns the (N,3) Gibbs vectors of the relative rotations from Q2 to Q1.
+    """
+    q1, q2 = np.broadcast_arrays(np.asarray(q1, dtype=np.float64), np.asarray(q2, dtype=np.float64))
+    return (q1 - q2 + np.cross(q1, q2)) / (1. + rowDot(q1, q2))[..., None]
+
+
+def addPRVArray(qq1, qq2):
+    """
+    Array version of :func:`addPRV`, returns the (N,3) principal rotation vectors of the successive rotations
+    Q1 and Q2.
+    """
+    q1 = PRV2elemArray(qq1)
+    q2 = PRV2elemArray(qq2)
+    cp1 = np.cos(q1[..., 0:1] / 2.)
+    cp2 = np.cos(q2[..., 0:1] / 2.)
+    sp1 = np.sin(q1[..., 0:1] / 2.)
+    sp2 = np.sin(q2[..., 0:1] / 2.)
+    e1 = q1[..., 1:4]
+    e2 = q2[..., 1:4]
+    p = 2. * np.arccos(cp1 * cp2 - sp1 * sp2 * rowDot(e1, e2)[..., None])
+    sp = np.sin(p / 2.)
+    e = (cp1 * sp2 * e2 + cp2 * sp1 * e1 + sp1 * sp2 * np.cross(e1, e2))
+    return (p / sp) * e
+
+
+def subPRVArray(q1, q2):
+    """
+    Array version of :func:`subPRV`, returns the (N,3) principal rotation vectors of the relative rotations
+    from Q2 to Q1.
+    """
+    q1 = PRV2elemArray(q1)
+    q2 = PRV2elemArray(q2)
+    cp1 = np.cos(q1[..., 0:1] / 2)
+    cp2 = np.cos(q2[..., 0:1] / 2)
+    sp1 = np.sin(q1[..., 0:1] / 2)
+    sp2 = np.sin(q2[..., 0:1] / 2)
+    e1 = q1[..., 1:4]
+    e2 = q2[..., 1:4]
+    p = 2 * np.arccos(cp1 * cp2 + sp1 * sp2 * rowDot(e1, e2)[..., None])
+    sp = np.sin(p / 2)
+    e = (-cp1 * sp2 * e2 + cp2 * sp1 * e1 + sp1 * sp2 * np.cross(e1, e2)) / sp
+    return p * e
+
+
+def BmatMRPArray(q):
+    """
+    Array version of :func:`BmatMRP`, returns the (N,3,3) matrices B(Q) of (N,3) MRP vectors,
+    where dQ/dt = 1/4 [B(Q)] w.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    s2 = rowDot(q, q)
+    q0, q1, q2 = q[..., 0], q[..., 1], q[..., 2]
+    return _stackMatrix((1 - s2 + 2 * q0 * q0, 2 * (q0 * q1 - q2), 2 * (q0 * q2 + q1)),
+                        (2 * (q1 * q0 + q2), 1 - s2 + 2 * q1 * q1, 2 * (q1 * q2 - q0)),
+                        (2 * (q2 * q0 - q1), 2 * (q2 * q1 + q0), 1 - s2 + 2 * q2 * q2))
+
+
+def BinvMRPArray(q):
+    """
+    Array version of :func:`BinvMRP`, returns the (N,3,3) matrices [B(Q)]^(-1) of (N,3) MRP vectors,
+    where w = 4 [B(Q)]^(-1) dQ/dt.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    s2 = rowDot(q, q)
+    q0, q1, q2 = q[..., 0], q[..., 1], q[..., 2]
+    B = _stackMatrix((1 - s2 + 2 * q0 * q0, 2 * (q0 * q1 + q2), 2 * (q0 * q2 - q1)),
+                     (2 * (q1 * q0 - q2), 1 - s2 + 2 * q1 * q1, 2 * (q1 * q2 + q0)),
+                     (2 * (q2 * q0 + q1), 2 * (q2 * q1 - q0), 1 - s2 + 2 * q2 * q2))
+    return B / (1 + s2)[..., None, None] / (1 + s2)[..., None, None]
+
+
+def dMRPArray(q, w):
+    """
+    Array version of :func:`dMRP`, returns the (N,3) MRP derivatives of (N,3) MRP vectors Q and body angular
+    velocity vectors w.
+    """
+    w = np.asarray(w, dtype=np.float64)
+    return .25 * np.matmul(BmatMRPArray(q), w[..., None])[..., 0]
+
+
+def dMRP2OmegaArray(q, dq):
+    """
+    Array version of :func:`dMRP2Omega`, returns the (N,3) body angular velocity vectors of (N,3) MRP vectors Q
+    and MRP derivatives dQ.
+    """
+    dq = np.asarray(dq, dtype=np.float64)
+    return 4 * np.matmul(BinvMRPArray(q), dq[..., None])[..., 0]
+
+
+def v3TildeArray(vector):
+    """
+    Array version of :func:`v3Tilde`, returns the (N,3,3) skew-symmetric cross product matrices of (N,3) vectors.
+    """
+    vector = np.asarray(vector, dtype=np.float64)
+    x1, x2, x3 = vector[..., 0], vector[..., 1], vector[..., 2]
+    zero = np.zeros(x1.shape)
+    return _stackMatrix((zero, -x3, x2), (x3, zero, -x1), (-x2, x1, zero))
@@ -19,6 +19,8 @@
 
 # Import some architectural stuff that we will probably always use
 import sys, os, ast
+import operator
+import ctypes
 import six
 import matplotlib.pyplot as plt
 try:
@@ -32,7 +34,6 @@ except ImportError:
 from Basilisk.architecture import sim_model
 from Basilisk.architecture import alg_contain
 import numpy as np
-import array
 import xml.etree.ElementTree as ET
 import inspect
 import threading
@@ -45,6 +46,8 @@ except NameError:
 from Basilisk.utilities import simulationArchTypes
 from Basilisk.architecture import bskLogging
 from Basilisk.utilities.simulationProgessBar import SimulationProgressBar
+from Basilisk.utilities import executionProfiler
+from Basilisk.utilities.eventConditions import MessageCondition
 import warnings
 
 
@@ -54,6 +57,14 @@ taskColor = '\u001b[33m'
 moduleColor = '\u001b[36m'
 endColor = '\u001b[0m'
 
+# initial number of rows of the variable logging buffers, the buffers double in size when full
+LOG_BUFFER_START_SIZE = 1024
+
+# ctypes of the SWIG pointer types that can be logged through AddVariableForLogging()
+LOG_CTYPES = {'double': ctypes.c_double, 'float': ctypes.c_float, 'int': ctypes.c_int,
+              'unsigned int': ctypes.c_uint, 'long': ctypes.c_long, 'int64_t': ctypes.c_int64,
+              'uint64_t': ctypes.c_uint64, 'int32_t': ctypes.c_int32, 'uint32_t': ctypes.c_uint32}
+
 class LogBaseClass:
     """Logging Base class"""
     def __init__(self, ReplaceName, LogPeriod, RefFunction, DataCols=1):
@@ -61,15 +72,75 @@ class LogBaseClass:
         self.Name = ReplaceName
         self.PrevLogTime = None
         self.PrevValue = None
-        self.TimeValuePairs = array.array('d')
         self.ArrayDim = DataCols + 1
         self.CallableFunction = RefFunction
+        self.clearItem()
 
     def clearItem(self):
-        self.TimeValuePairs = array.array('d')
+        # a new buffer is allocated such that arrays returned by GetLogVariableData() are not overwritten
+        self.TimeValuePairs = np.zeros((LOG_BUFFER_START_SIZE, self.ArrayDim))
+        self.numRecords = 0
         self.PrevLogTime = None
         self.PrevValue = None
 
+    def record(self, CurrSimTime, CurrentVal):
+        """Store the time and the variable value(s) in the next row of the preallocated log buffer"""
+        if self.numRecords == self.TimeValuePairs.shape[0]:
+            newPairs = np.zeros((2 * self.numRecords, self.ArrayDim))
+            newPairs[:self.numRecords] = self.TimeValuePairs
+            self.TimeValuePairs = newPairs
+        row = self.TimeValuePairs[self.numRecords]
+        row[0] = CurrSimTime
+        row[1:] = CurrentVal
+        self.numRecords += 1
+
+    def getData(self):
+        """Return the (time, value(s)) rows logged so far as a read-only view of the log buffer"""
+        data = self.TimeValuePairs[:self.numRecords]
+        data.flags.writeable = False
+        return data
+
+
+def resolveLogAccessor(LogName):
+    """
+    Parse a logged variable path such as ``self.TaskList[0].TaskModels[1].omega_BN_B`` into a list of attribute and
+    index steps, and return a function that reads this path from the object the first name refers to.
+    Consecutive attribute steps are collapsed into a single ``operator.attrgetter`` call, such that the path is
+    only interpreted once when logging is set up.
+    """
+    steps = []
+    node = ast.parse(LogName.strip(), mode='eval').body
+    while not isinstance(node, ast.Name):
+        if isinstance(node, ast.Attribute):
+            steps.append(('attr', node.attr))
+            node = node.value
+        elif isinstance(node, ast.Subscript):
+            index = node.slice.value if isinstance(node.slice, getattr(ast, 'Index', ())) else node.slice
+            steps.append(('item', ast.literal_eval(index)))
+            node = node.value
+        else:
+            raise ValueError("Unsupported expression in logged variable name: " + LogName)
+    steps.reverse()
+
+    getters = []
+    for kind, key in steps:
+        if kind == 'attr' and getters and getters[-1][0] == 'attr':
+            getters[-1] = ('attr', getters[-1][1] + '.' + key)
+        else:
+            getters.append((kind, key))
+    getters = [operator.attrgetter(key) if kind == 'attr' else operator.itemgetter(key) for kind, key in getters]
+
+    if len(getters) == 1:
+        return getters[0]
+    if len(getters) == 0:
+        return lambda obj: obj
+
+    def accessor(obj):
+        for getter in getters:
+            obj = getter(obj)
+        return obj
+    return accessor
+
 
 class EventHandlerClass:
     """Event Handler Class"""
@@ -84,20 +155,34 @@ class EventHandlerClass:
         self.prevTime = -1
         self.checkCall = None
         self.operateCall = None
+        # events with only message conditions are checked by the scheduler once they have a compiled index
+        self.compiledIndex = None
+
+    def isCompilable(self):
+        """Return if all the conditions of the event are message conditions that the scheduler can check"""
+        return len(self.conditionList) > 0 and all(isinstance(cond, MessageCondition) for cond in self.conditionList)
 
     def methodizeEvent(self):
         if self.checkCall != None:
             return
+        stringConditions = [cond for cond in self.conditionList if not isinstance(cond, MessageCondition)]
+        messageConditions = [cond for cond in self.conditionList if isinstance(cond, MessageCondition)]
         funcString = 'def EVENT_check_' + self.eventName + '(self):\n'
         funcString += '    if('
-        for condValue in self.conditionList:
+        for condValue in stringConditions:
             funcString += ' ' + condValue + ' and'
-        funcString = funcString[:-3] + '):\n'
+        funcString = funcString[:-3] + '):\n' if stringConditions else funcString + ' True):\n'
         funcString += '        return 1\n'
         funcString += '    return 0'
 
         exec (funcString)
-        self.checkCall = eval('EVENT_check_' + self.eventName)
+        stringCheck = eval('EVENT_check_' + self.eventName)
+        if messageConditions:
+            def checkCall(parentSim, stringCheck=stringCheck):
+                return stringCheck(parentSim) and all(cond.evaluate() for cond in messageConditions)
+            self.checkCall = checkCall
+        else:
+            self.checkCall = stringCheck
         funcString = 'def EVENT_operate_' + self.eventName + '(self):\n'
         for actionValue in self.actionList:
             funcString += '    '
@@ -108,7 +193,7 @@ class EventHandlerClass:
 
     def checkEvent(self, parentSim):
         nextTime = int(-1)
-        if self.eventActive == False:
+        if self.eventActive == False or self.compiledIndex is not None:
             return(nextTime)
         nextTime = self.prevTime + self.eventRate - (self.prevTime%self.eventRate)
         if self.prevTime < 0 or (parentSim.TotalSim.CurrentNanos%self.eventRate == 0):
@@ -207,6 +292,10 @@ class SimBaseClass:
         self.bskLogger = bskLogging.BSKLogger()
         self.showProgressBar = False
         self.allModules = set()
+        self.threadExchangeLinks = []
+        self.profiler = None
+        self.pythonProfile = executionProfiler.ExecutionProfiler()
+        self.compiledEventList = []
 
     def SetProgressBar(self, value):
         """
@@ -415,63 +504,42 @@ class SimBaseClass:
         :param LogPeriod: update rate at which to record the variable [ns]
         :param StartIndex: starting index if the variable is an array
         :param StopIndex: end index if the variable is an idea
-        :param VarType:
+        :param VarType: C type of the array elements if the variable is a swig pointer to a C array, such as 'double'
         :return:
         """
         SplitName = VarName.split('.')
         Subname = '.'
         Subname = Subname.join(SplitName[1:])
-        NoDotName = ''
-        NoDotName = NoDotName.join(SplitName)
-        if six.PY2:
-            NoDotName = NoDotName.translate(None, "[]'()")
-        else:
-            tr = str.maketrans("","", "[]'()")
-            NoDotName = NoDotName.translate(tr)
-            #NoDotName = NoDotName.translate({ord(c): None for c in "[]'()"})
         inv_map = {v: k for k, v in list(self.NameReplace.items())}
         if SplitName[0] in inv_map:
             LogName = inv_map[SplitName[0]] + '.' + Subname
             if (LogName in self.VarLogList):
                 return
-            if (type(eval(LogName)).__name__ == 'SwigPyObject'):
-                RefFunctionString = 'def Get' + NoDotName + '(self):\n'
-                RefFunctionString += '   return ['
-                LoopTerminate = False
-                i = 0
-                while not LoopTerminate:
-                    RefFunctionString += 'sim_model.' + VarType + 'Array_getitem('
-                    RefFunctionString += LogName + ', ' + str(StartIndex + i) + '),'
-                    i += 1
-                    if (i > StopIndex - StartIndex):
-                        LoopTerminate = True
-                RefFunctionString = RefFunctionString[:-1] + ']'
-                exec (RefFunctionString)
-                methodHandle = eval('Get' + NoDotName)
-
-            elif (type(eval(LogName)).__name__ == 'list'):
-                RefFunctionString = 'def Get' + NoDotName + '(self):\n'
-                RefFunctionString += '   if isinstance(' + LogName + '[0], list):\n'
-                RefFunctionString += '      localList = sum(' + LogName + ',[])\n'
-                RefFunctionString += '   else:\n      localList = ' + LogName + '\n'
-                RefFunctionString += '   return ['
-                LoopTerminate = False
-                i = 0
-                while not LoopTerminate:
-                    RefFunctionString +=  'localList[' + str(StartIndex + i) + '],'
-                    i += 1
-                    if (i > StopIndex - StartIndex):
-                        LoopTerminate = True
-                RefFunctionString = RefFunctionString[:-1] + ']'
-                exec (RefFunctionString)
-                methodHandle = eval('Get' + NoDotName)
+            # resolve the variable path once, the logging loop only calls the resulting accessor
+            accessor = resolveLogAccessor(LogName)
+            numElements = StopIndex - StartIndex + 1
+            logValue = accessor(self)
+            if (type(logValue).__name__ == 'SwigPyObject'):
+                ctype = LOG_CTYPES.get(VarType)
+                if ctype is not None:
+                    # view the C array in place instead of pulling each element through swig
+                    def methodHandle(self, accessor=accessor, arrayType=ctype * numElements,
+                                     offset=StartIndex * ctypes.sizeof(ctype)):
+                        return np.ctypeslib.as_array(arrayType.from_address(int(accessor(self)) + offset))
+                else:
+                    getItem = getattr(sim_model, VarType + 'Array_getitem')
+
+                    def methodHandle(self, accessor=accessor, getItem=getItem):
+                        pointer = accessor(self)
+                        return [getItem(pointer, i) for i in range(StartIndex, StopIndex + 1)]
+
+            elif (type(logValue).__name__ == 'list'):
+                def methodHandle(self, accessor=accessor):
+                    return np.ravel(accessor(self))[StartIndex:StopIndex + 1]
             else:
-                RefFunctionString = 'def Get' + NoDotName + '(self):\n'
-                RefFunctionString += '   return ' + LogName
-                exec (RefFunctionString)
-                methodHandle = eval('Get' + NoDotName)
+                methodHandle = accessor
             self.VarLogList[VarName] = LogBaseClass(LogName, LogPeriod,
-                                                    methodHandle, StopIndex - StartIndex + 1)
+                                                    methodHandle, numElements)
         else:
             print("Could not find a structure that has the ModelTag: %(ModName)s" % \
                   {"ModName": SplitName[0]})
@@ -516,20 +584,10 @@ class SimBaseClass:
                 if(minNextTime < 0 or LocalPrev + LogValue.Period < minNextTime):
                     minNextTime = LocalPrev + LogValue.Period
                 continue
-            CurrentVal = LogValue.CallableFunction(self)
-            LocalTimeVal = LogValue.TimeValuePairs
-            if (LocalPrev != CurrentVal):
-                LocalTimeVal.append(CurrSimTime)
-                try:
-                    temp = (len(CurrentVal))
-                    for Value in CurrentVal:
-                        LocalTimeVal.append(Value)
-                except TypeError:
-                    LocalTimeVal.append(CurrentVal)
-                LogValue.PrevLogTime = CurrSimTime
-                LogValue.PrevValue = CurrentVal
-                if(minNextTime < 0 or CurrSimTime + LogValue.Period < minNextTime):
-                    minNextTime = CurrSimTime + LogValue.Period
+            LogValue.record(CurrSimTime, LogValue.CallableFunction(self))
+            LogValue.PrevLogTime = CurrSimTime
+            if(minNextTime < 0 or CurrSimTime + LogValue.Period < minNextTime):
+                minNextTime = CurrSimTime + LogValue.Period
         return minNextTime
 
     def ExecuteSimulation(self):
@@ -548,16 +606,34 @@ class SimBaseClass:
         progressBar = SimulationProgressBar(self.StopTime, self.showProgressBar)
         while self.TotalSim.NextTaskTime <= self.StopTime:
             if self.TotalSim.CurrentNanos >= self.nextEventTime >= 0:
-                self.nextEventTime = self.checkEvents()
-                self.nextEventTime = self.nextEventTime if self.nextEventTime >= self.TotalSim.NextTaskTime else self.TotalSim.NextTaskTime
+                if self.profiler is None:
+                    self.nextEventTime = self.checkEvents()
+                else:
+                    self.nextEventTime = self.profiler.timeCall(("SimBaseClass", "ExecuteSimulation", "checkEvents"),
+                                                                self.TotalSim.CurrentNanos, self.checkEvents)
+                # without active Python events the simulation only stops for the progress bar
+                if self.nextEventTime >= 0 or self.showProgressBar:
+                    self.nextEventTime = self.nextEventTime if self.nextEventTime >= self.TotalSim.NextTaskTime else self.TotalSim.NextTaskTime
             if 0 <= self.nextEventTime < nextStopTime:
                 nextStopTime = self.nextEventTime
                 nextPriority = -1
+            for compiledEvent in self.compiledEventList:
+                self.TotalSim.setCompiledEventActivity(compiledEvent.compiledIndex, compiledEvent.eventActive)
             self.TotalSim.StepUntilStop(nextStopTime, nextPriority)
+            firedEvents = self.TotalSim.popFiredEvents()
+            for eventIndex in firedEvents:
+                self.operateCompiledEvent(self.compiledEventList[eventIndex])
+            if firedEvents and self.nextEventTime < 0:
+                # the actions may have activated Python events
+                self.nextEventTime = self.TotalSim.CurrentNanos
             progressBar.update(self.TotalSim.NextTaskTime)
             nextPriority = -1
             nextStopTime = self.StopTime
-            nextLogTime = self.RecordLogVars()
+            if self.profiler is None:
+                nextLogTime = self.RecordLogVars()
+            else:
+                nextLogTime = self.profiler.timeCall(("SimBaseClass", "ExecuteSimulation", "RecordLogVars"),
+                                                     self.TotalSim.CurrentNanos, self.RecordLogVars)
             procStopTimes = []
             for pyProc in self.pyProcList:
                 nextCallTime = pyProc.nextCallTime()
@@ -576,15 +652,217 @@ class SimBaseClass:
         progressBar.markComplete()
         progressBar.close()
 
+    def partitionThreads(self, numThreads, warmupTime, imbalance=0.1):
+        """
+        Distribute the processes over threads based on their measured execution time and the messages they exchange.
+        The simulation is first run for ``warmupTime`` nano-seconds on the current threads, and the execution time of
+        each process is the sum of the task times in the execution profiles (see ``enableProfiling()``).  The warm up
+        calls are not kept in the profiles of the tasks that were not being profiled.  The processes are then assigned
+        to ``numThreads`` threads such that the thread execution times are balanced while the processes linked by many
+        messages share a thread.  A message read by a module in another thread is read through a buffer message that is
+        updated while all the threads wait, at every multiple of the shortest task period.  The module in the other
+        thread thus sees the message as it was at the start of the frame.  Must be called after
+        ``InitializeSimulation()``.
+
+        :param numThreads (int): Number of threads
+        :param warmupTime (int): [ns] Simulation time used to measure the process execution times
+        :param imbalance (float): Allowed relative excess of a thread execution time over the mean execution time
+        :return: dictionary with the thread index of each process name
+        """
+        from Basilisk.utilities import messageUtilities
+        from Basilisk.utilities import threadPartitioning
+
+        if not self.simulationInitialized:
+            self.bskLogger.bskLog(bskLogging.BSK_ERROR, "partitionThreads() must be called after "
+                                                        "InitializeSimulation().")
+            return {}
+
+        # restore the direct subscriptions of a previous partition
+        for inMsg, outMsg, bufferMsg in self.threadExchangeLinks:
+            inMsg.subscribeTo(outMsg)
+        self.threadExchangeLinks = []
+        self.TotalSim.clearMessageExchanges()
+
+        # measure the process execution times with the task execution profiles
+        processTasks = []
+        for proc in self.procList:
+            processTasks.append([proc.processData.processTasks[k].TaskPtr
+                                 for k in range(len(proc.processData.processTasks))])
+        wasProfiled = [[taskPtr.profileExecution for taskPtr in tasks] for tasks in processTasks]
+        startTimes = [[taskPtr.taskProfile.totalTime for taskPtr in tasks] for tasks in processTasks]
+        for tasks in processTasks:
+            for taskPtr in tasks:
+                taskPtr.profileExecution = True
+        stopTime = self.StopTime
+        self.ConfigureStopTime(self.TotalSim.CurrentNanos + warmupTime)
+        self.ExecuteSimulation()
+        self.ConfigureStopTime(stopTime)
+        costs = []
+        for tasks, taskProfiled, taskStartTimes in zip(processTasks, wasProfiled, startTimes):
+            costs.append(float(sum(taskPtr.taskProfile.totalTime - startTime
+                                   for taskPtr, startTime in zip(tasks, taskStartTimes))))
+            # the warm up calls are only kept in the profiles of the tasks that were already profiled
+            for taskPtr, profiled in zip(tasks, taskProfiled):
+                if not profiled:
+                    taskPtr.profileExecution = False
+                    taskPtr.clearProfile()
+
+        # collect the modules of each process
+        processModules = []
+        taskPeriods = []
+        for proc in self.procList:
+            modules = []
+            for k in range(len(proc.processData.processTasks)):
+                taskPtr = proc.processData.processTasks[k].TaskPtr
+                taskPeriods.append(taskPtr.TaskPeriod)
+                for Task in self.TaskList:
+                    if Task.Name == taskPtr.TaskName:
+                        modules.extend(Task.TaskModels)
+            processModules.append(modules)
+
+        links = threadPartitioning.findMessageLinks(processModules)
+        assignment = threadPartitioning.partitionProcesses(costs, [link[:2] for link in links], numThreads,
+                                                           imbalance)
+        self.TotalSim.resetThreads(max(assignment, default=0) + 1)
+        for proc, thread in zip(self.procList, assignment):
+            self.TotalSim.addProcessToThread(proc.processData, thread)
+        self.TotalSim.assignRemainingProcs()
+
+        # modules reading a message written in another thread read a buffer message instead
+        bufferMsgs = {}
+        for writeProc, readProc, msgType, outMsg, inMsg in links:
+            if assignment[writeProc] == assignment[readProc]:
+                continue
+            sourcePayload, sourceHeader, payloadSize = messageUtilities.messageAddresses(msgType, outMsg)
+            key = (sourcePayload, assignment[readProc])
+            if key not in bufferMsgs:
+                bufferMsg = messageUtilities.createBufferMessage(msgType)
+                bufferPayload, bufferHeader, _ = messageUtilities.messageAddresses(msgType, bufferMsg)
+                self.TotalSim.addMessageExchange(sourcePayload, sourceHeader, bufferPayload, bufferHeader,
+                                                 payloadSize)
+                bufferMsgs[key] = bufferMsg
+            inMsg.subscribeTo(bufferMsgs[key])
+            self.threadExchangeLinks.append((inMsg, outMsg, bufferMsgs[key]))
+        self.TotalSim.threadExchangePeriod = min(taskPeriods, default=0) if self.threadExchangeLinks else 0
+
+        return {proc.Name: thread for proc, thread in zip(self.procList, assignment)}
+
+    def enableProfiling(self, maxTraceEvents=0):
+        """
+        Time every module call from now on.  The C/C++ modules are timed by their task, the Python modules of the
+        Python processes, the event checks and the variable logging by the Python profiler.  Without profiling a
+        task only executes a single branch more.  The results are returned by ``getProfile()``.
+
+        :param maxTraceEvents (int): Number of calls of each task, and of the Python level calls, that are recorded
+            for ``writeProfileTrace()``
+        """
+        self.pythonProfile.maxTraceEvents = maxTraceEvents
+        self.profiler = self.pythonProfile
+        for Task in self.TaskList:
+            Task.TaskData.maxTraceEvents = maxTraceEvents
+            Task.TaskData.profileExecution = True
+        for pyProc in self.pyProcList:
+            for task in pyProc.taskList:
+                task.setProfiler(self.profiler, pyProc.Name)
+
+    def disableProfiling(self):
+        """
+        Stop timing the module calls.  The results collected so far are kept.
+        """
+        self.profiler = None
+        for Task in self.TaskList:
+            Task.TaskData.profileExecution = False
+        for pyProc in self.pyProcList:
+            for task in pyProc.taskList:
+                task.setProfiler(None)
+
+    def clearProfile(self):
+        """
+        Clear the profiling results collected so far.
+        """
+        self.pythonProfile.clear()
+        for Task in self.TaskList:
+            Task.TaskData.clearProfile()
+
+    def taskProcessNames(self):
+        """
+        Return a dictionary with the name of the process of each task, for the tasks added to a process
+        """
+        processNames = {}
+        for proc in self.procList:
+            for k in range(len(proc.processData.processTasks)):
+                processNames.setdefault(proc.processData.processTasks[k].TaskPtr.TaskName, proc.Name)
+        return processNames
+
+    def getProfile(self):
+        """
+        Return the execution time statistics collected since ``enableProfiling()`` as a pandas DataFrame.  There is
+        a row per module (``level`` is ``"module"``), per task and per process, with the number of calls, the
+        total, mean and maximum wall-clock time of a call in nano-seconds, and the histogram of the call times, where
+        bin ``k`` counts the calls that took between 2^k and 2^(k+1) ns.  The Python level calls of the simulation
+        itself are listed under the process ``SimBaseClass``.
+        """
+        import pandas as pd
+
+        processNames = self.taskProcessNames()
+        rows = []
+        processProfiles = {}
+        for Task in self.TaskList:
+            taskData = Task.TaskData
+            procName = processNames.get(Task.Name, "")
+            for k in range(len(taskData.TaskModels)):
+                rows.append(executionProfiler.profileRow("module", procName, Task.Name,
+                                                         taskData.TaskModels[k].ModelPtr.ModelTag,
+                                                         taskData.modelProfiles[k]))
+            rows.append(executionProfiler.profileRow("task", procName, Task.Name, "", taskData.taskProfile))
+            processProfiles.setdefault(procName, []).append(taskData.taskProfile)
+
+        pythonTaskProfiles = {}
+        for (procName, taskName, moduleName), profile in self.pythonProfile.profiles.items():
+            if procName == "SimBaseClass":
+                rows.append(executionProfiler.profileRow("module", procName, taskName, moduleName, profile))
+                pythonTaskProfiles.setdefault((procName, taskName), []).append(profile)
+            elif moduleName is None:
+                rows.append(executionProfiler.profileRow("task", procName, taskName, "", profile))
+                processProfiles.setdefault(procName, []).append(profile)
+            else:
+                rows.append(executionProfiler.profileRow("module", procName, taskName, moduleName, profile))
+        for (procName, taskName), profiles in pythonTaskProfiles.items():
+            profile = executionProfiler.mergeProfiles(profiles)
+            rows.append(executionProfiler.profileRow("task", procName, taskName, "", profile))
+            processProfiles.setdefault(procName, []).append(profile)
+
+        for procName, profiles in processProfiles.items():
+            rows.append(executionProfiler.profileRow("process", procName, "", "",
+                                                     executionProfiler.mergeProfiles(profiles)))
+        return pd.DataFrame(rows, columns=executionProfiler.PROFILE_COLUMNS)
+
+    def writeProfileTrace(self, fileName):
+        """
+        Write the calls recorded since ``enableProfiling(maxTraceEvents)`` as a Chrome trace file.  The file can be
+        opened with ``chrome://tracing`` or https://ui.perfetto.dev to see the module calls of each process as a flame
+        graph over time.
+
+        :param fileName (str): name of the trace file
+        """
+        processNames = self.taskProcessNames()
+        traceEvents = list(self.pythonProfile.traceEvents)
+        for Task in self.TaskList:
+            taskData = Task.TaskData
+            procName = processNames.get(Task.Name, "")
+            moduleNames = [taskData.TaskModels[k].ModelPtr.ModelTag for k in range(len(taskData.TaskModels))]
+            for event in taskData.traceEvents:
+                moduleName = moduleNames[event.modelIndex] if event.modelIndex >= 0 else None
+                traceEvents.append((procName, Task.Name, moduleName, event.startTime, event.duration, event.simTime))
+        executionProfiler.writeChromeTrace(fileName, traceEvents)
+
     def GetLogVariableData(self, LogName):
         """
         Pull the recorded module recorded variable.  The first column is the variable recording time in
-        nano-seconds, the additional column(s) are the message data columns.
+        nano-seconds, the additional column(s) are the message data columns.  The returned array is a read-only
+        view of the logging buffer and is not copied, use ``.copy()`` to get an array that can be modified.
         """
-        TheArray = np.array(self.VarLogList[LogName].TimeValuePairs)
-        ArrayDim = self.VarLogList[LogName].ArrayDim
-        TheArray = np.reshape(TheArray, (TheArray.shape[0] // ArrayDim, ArrayDim))
-        return TheArray
+        return self.VarLogList[LogName].getData()
 
     def disableTask(self, TaskName):
         """
@@ -619,7 +897,10 @@ class SimBaseClass:
     def createNewEvent(self, eventName, eventRate=int(1E9), eventActive=False,
                        conditionList=[], actionList=[]):
         """
-        Create an event sequence that contains a series of tasks to be executed.
+        Create an event sequence that contains a series of tasks to be executed.  The conditions are Python
+        expression strings, or :class:`~Basilisk.utilities.eventConditions.MessageCondition` comparisons of message
+        fields.  If all the conditions are message conditions, they are checked by the C++ scheduler and the
+        simulation only returns to Python when the event fires.
         """
         if (eventName in list(self.eventMap.keys())):
             return
@@ -632,14 +913,43 @@ class SimBaseClass:
         for key, value in self.eventMap.items():
             value.methodizeEvent()
             self.eventList.append(value)
+            if value.compiledIndex is None and value.isCompilable():
+                self.compileEvent(value)
         self.nextEventTime = 0
 
+    def compileEvent(self, event):
+        """
+        Hand the message conditions of an event over to the scheduler, which then checks them without returning to
+        Python.  The event stays a Python event if a message doesn't hold a payload yet.
+        """
+        if any(cond.payloadAddress() == 0 for cond in event.conditionList):
+            self.bskLogger.bskLog(bskLogging.BSK_WARNING, "The conditions of the event " + event.eventName +
+                                  " are checked in Python, as one of its messages has no payload yet.")
+            return
+        event.compiledIndex = self.TotalSim.addCompiledEvent(event.eventRate, event.eventActive)
+        for cond in event.conditionList:
+            cond.compile(self.TotalSim, event.compiledIndex)
+        self.compiledEventList.append(event)
+
+    def operateCompiledEvent(self, event):
+        """
+        Execute the actions of a compiled event that fired in the scheduler.
+        """
+        event.eventActive = False
+        event.prevTime = self.TotalSim.CurrentNanos
+        event.occurCounter += 1
+        event.operateCall(self)
+
     def checkEvents(self):
         nextTime = -1
         for localEvent in self.eventList:
             localNextTime = localEvent.checkEvent(self)
             if(localNextTime >= 0 and (localNextTime < nextTime or nextTime <0)):
                 nextTime = localNextTime
+        if nextTime < 0 and any(localEvent.eventActive and localEvent.compiledIndex is None
+                                for localEvent in self.eventList):
+            # an event was activated by the actions of an event checked after it
+            nextTime = self.TotalSim.CurrentNanos
         return nextTime
 
     def setEventActivity(self, eventName, activityCommand):
@@ -647,6 +957,13 @@ class SimBaseClass:
             print("You asked me to set the status of an event that I don't have.")
             return
         self.eventMap[eventName].eventActive = activityCommand
+        self.rearmEventChecks(self.eventMap[eventName])
+
+    def rearmEventChecks(self, event):
+        """Check the Python events again at the current time if ``event`` is an active Python event, as the event
+        checks stop while no Python event is active"""
+        if event.eventActive and event.compiledIndex is None:
+            self.nextEventTime = self.TotalSim.CurrentNanos
 
     def setAllButCurrentEventActivity(self, currentEventName, activityCommand, useIndex=False):
         """Set all event activity variables except for the currentEventName event. The ``useIndex`` flag can be used to
@@ -662,8 +979,10 @@ class SimBaseClass:
                 if useIndex:
                     if eventName.partition('_')[2] == index:
                         self.eventMap[eventName].eventActive = activityCommand
+                        self.rearmEventChecks(self.eventMap[eventName])
                 else:
                     self.eventMap[eventName].eventActive = activityCommand
+                    self.rearmEventChecks(self.eventMap[eventName])
 
     def setModelDataWrap(self, modelData):
         """
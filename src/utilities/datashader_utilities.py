@@ -9,12 +9,25 @@ with warnings.catch_warnings():
     from holoviews.streams import RangeXY
     from datashader.colors import Sets1to3
 from Basilisk.utilities import macros
+from Basilisk.utilities.MonteCarlo.ColumnStore import loadDataFrame
 
-def pull_and_format_df(path, varIdxLen):
-    df = pd.read_pickle(path)
+def pull_and_format_df(path, varIdxLen, runIdx=None):
+    """
+    Load the retained Monte Carlo data of a variable and make sure it has ``varIdxLen`` components.  The data can be
+    stored either as a pickled dataframe or in the columnar format, in which case only the runs in ``runIdx`` are
+    read from disk.
+
+    :param path: path to the ``<variableName>.data`` file
+    :param varIdxLen: number of components of the variable
+    :param runIdx: optional list of runs to load
+    :return: (runNum, varIdx) MultiIndex dataframe
+    """
+    df = loadDataFrame(path, runIdx)
     if len(np.unique(df.columns.codes[1])) is not varIdxLen:
         print("Warning: " + path + " not formatted correctly!")
-        newMultIndex = pd.MultiIndex.from_product([df.columns.codes[0], list(range(varIdxLen))], names=['runNum', 'varIdx'])
+        # the run numbers rather than the level codes, which only match the run numbers when all runs are loaded
+        newMultIndex = pd.MultiIndex.from_product([df.columns.unique(level=0), list(range(varIdxLen))],
+                                                  names=['runNum', 'varIdx'])
         indices = pd.Index([0,1]) # Need multiple rows for curves
         df = df.reindex(columns=newMultIndex, index=indices)
     return df
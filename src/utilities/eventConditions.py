@@ -0,0 +1,132 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+"""
+Event conditions on message fields that are evaluated by the simulation scheduler in C++.  An event of
+:meth:`SimulationBaseClass.SimBaseClass.createNewEvent` whose conditions are all :class:`MessageCondition` objects
+doesn't need to return to Python to check its conditions, Python only regains control when the event fires::
+
+    scSim.createNewEvent("lowAltitude", macros.sec2nano(1.), True,
+                         [MessageCondition(scObject.scStateOutMsg, "r_BN_N", "<", 6778e3, norm=True)],
+                         ["self.setEventActivity('raiseOrbit', True)"])
+
+Only the payload fields that are numbers or fixed size arrays of numbers can be compared.
+"""
+
+import importlib
+import operator
+
+import numpy as np
+
+from Basilisk.utilities import messageUtilities
+
+#: comparison operators of a condition with the name of the matching ``sim_model.EventComparison`` value
+COMPARISONS = {
+    "<": (operator.lt, "EVENT_LESS"),
+    "<=": (operator.le, "EVENT_LESS_EQUAL"),
+    ">": (operator.gt, "EVENT_GREATER"),
+    ">=": (operator.ge, "EVENT_GREATER_EQUAL"),
+    "==": (operator.eq, "EVENT_EQUAL"),
+    "!=": (operator.ne, "EVENT_NOT_EQUAL"),
+}
+
+#: ``sim_model.EventFieldType`` value name of the numpy (kind, item size) of a field element
+FIELD_TYPES = {
+    ("f", 8): "EVENT_FIELD_DOUBLE",
+    ("f", 4): "EVENT_FIELD_FLOAT",
+    ("i", 1): "EVENT_FIELD_INT8",
+    ("u", 1): "EVENT_FIELD_UINT8",
+    ("i", 2): "EVENT_FIELD_INT16",
+    ("u", 2): "EVENT_FIELD_UINT16",
+    ("i", 4): "EVENT_FIELD_INT32",
+    ("u", 4): "EVENT_FIELD_UINT32",
+    ("i", 8): "EVENT_FIELD_INT64",
+    ("u", 8): "EVENT_FIELD_UINT64",
+    ("b", 1): "EVENT_FIELD_BOOL",
+}
+
+
+class MessageCondition:
+    """Comparison of a message payload field with a threshold.
+
+    Args:
+        msg: C++ output message or C message whose payload is read
+        fieldName (str): name of the payload field
+        comparison (str): one of ``<``, ``<=``, ``>``, ``>=``, ``==`` and ``!=``
+        threshold (float): value the field is compared with
+        index (int or tuple): index of the compared element of an array field
+        norm (bool): compare the norm of all the elements of an array field
+    """
+    def __init__(self, msg, fieldName, comparison, threshold, index=None, norm=False):
+        self.msgType = messageUtilities.messageType(msg)
+        if self.msgType is None or type(msg).__name__.endswith("Reader"):
+            raise ValueError("A message condition needs a C++ output message or a C message.")
+        if comparison not in COMPARISONS:
+            raise ValueError("Unknown comparison " + str(comparison) + ", use one of " + ", ".join(COMPARISONS))
+        if norm and index is not None:
+            raise ValueError("A message condition compares either an array element or the norm of the array.")
+        self.msg = msg
+        self.fieldName = fieldName
+        self.comparison = comparison
+        self.threshold = threshold
+        self.index = index
+        self.norm = norm
+
+        payloadModule = importlib.import_module("Basilisk.architecture.messaging." + self.msgType + "Payload")
+        dtype = payloadModule._payloadDtype(self.msgType, getattr(payloadModule, self.msgType + "PayloadFields"),
+                                            getattr(payloadModule, self.msgType + "PayloadFieldLayout"))
+        if dtype.fields is None or fieldName not in dtype.fields:
+            raise ValueError(self.msgType + " has no field " + fieldName + " of numbers or arrays of numbers.")
+        fieldDtype, self.offset = dtype.fields[fieldName][:2]
+        self.shape = fieldDtype.shape
+        self.fieldType = FIELD_TYPES[(fieldDtype.base.kind, fieldDtype.base.itemsize)]
+        self.numElements = 1
+        if norm:
+            self.numElements = int(np.prod(self.shape))
+        elif index is not None:
+            self.offset += int(np.ravel_multi_index(np.atleast_1d(index), self.shape)) * fieldDtype.base.itemsize
+        elif len(self.shape) > 0:
+            raise ValueError("Give the index of the compared element of the array field " + fieldName + ".")
+
+    def value(self):
+        """Return the compared field value, read through Python"""
+        value = np.asarray(getattr(self.msg.read(), self.fieldName))
+        if self.norm:
+            return float(np.linalg.norm(value.ravel()))
+        if self.index is not None:
+            return value[self.index]
+        return value
+
+    def evaluate(self):
+        """Return if the condition holds, evaluated in Python"""
+        return bool(COMPARISONS[self.comparison][0](self.value(), self.threshold))
+
+    def payloadAddress(self):
+        """Return the address of the message payload, 0 if it can't be found, such as for a C message that is not
+        initialized yet or a C++ message that has no C message type"""
+        try:
+            return messageUtilities.messageAddresses(self.msgType, self.msg)[0]
+        except (ImportError, AttributeError):
+            return 0
+
+    def compile(self, simModel, eventIndex):
+        """Add the condition to the compiled event ``eventIndex`` of the ``sim_model.SimModel``"""
+        from Basilisk.architecture import sim_model
+
+        simModel.addEventCondition(eventIndex, self.payloadAddress() + self.offset, getattr(sim_model, self.fieldType),
+                                   self.numElements, getattr(sim_model, COMPARISONS[self.comparison][1]),
+                                   float(self.threshold))
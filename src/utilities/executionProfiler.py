@@ -0,0 +1,115 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+"""
+Support classes and functions for the execution profiling of a simulation, see
+:meth:`SimulationBaseClass.SimBaseClass.enableProfiling`.  The C/C++ modules are timed by their ``SysModelTask``,
+while the :class:`ExecutionProfiler` here times the Python modules and the Python level work of the simulation
+such as the event checks and the variable logging.
+"""
+
+import json
+import time
+
+#: Number of power of two bins of the execution time histograms, as ``PROFILE_HISTOGRAM_BINS`` in ``sys_model_task.h``
+HISTOGRAM_BINS = 64
+
+#: Columns of the profile data frame
+PROFILE_COLUMNS = ["level", "process", "task", "module", "calls", "totalTime", "meanTime", "maxTime", "histogram"]
+
+
+class CallProfile:
+    """Execution time statistics of a model or task, with the times in nano-seconds"""
+    def __init__(self):
+        self.callCount = 0
+        self.totalTime = 0
+        self.maxTime = 0
+        self.histogram = [0] * HISTOGRAM_BINS
+
+    def addCall(self, duration):
+        """Add a call of the given duration in nano-seconds"""
+        self.callCount += 1
+        self.totalTime += duration
+        self.maxTime = max(self.maxTime, duration)
+        self.histogram[max(duration, 1).bit_length() - 1] += 1
+
+
+class ExecutionProfiler:
+    """Times the Python level calls of a simulation.  The calls are grouped by (process, task, module) name, and the
+    first ``maxTraceEvents`` calls are recorded as (process, task, module, start time, duration, simulation time)."""
+    def __init__(self, maxTraceEvents=0):
+        self.maxTraceEvents = maxTraceEvents
+        self.profiles = {}
+        self.traceEvents = []
+
+    def clear(self):
+        """Clear the statistics and the recorded calls"""
+        self.profiles = {}
+        self.traceEvents = []
+
+    def timeCall(self, key, simTime, function, *args):
+        """Call ``function(*args)``, add its duration to the statistics of ``key`` and return its result"""
+        start = time.perf_counter_ns()
+        result = function(*args)
+        duration = time.perf_counter_ns() - start
+        self.profiles.setdefault(key, CallProfile()).addCall(duration)
+        if len(self.traceEvents) < self.maxTraceEvents:
+            self.traceEvents.append(key + (start, duration, simTime))
+        return result
+
+
+def profileRow(level, process, task, module, profile):
+    """Return the profile data frame row of a model, task or process profile"""
+    meanTime = profile.totalTime / profile.callCount if profile.callCount > 0 else 0.
+    return [level, process, task, module, int(profile.callCount), int(profile.totalTime), meanTime,
+            int(profile.maxTime), list(profile.histogram)]
+
+
+def mergeProfiles(profiles):
+    """Return the sum of a list of profiles, such as the profiles of the tasks of a process"""
+    merged = CallProfile()
+    for profile in profiles:
+        merged.callCount += profile.callCount
+        merged.totalTime += profile.totalTime
+        merged.maxTime = max(merged.maxTime, profile.maxTime)
+        merged.histogram = [a + b for a, b in zip(merged.histogram, profile.histogram)]
+    return merged
+
+
+def writeChromeTrace(fileName, traceEvents):
+    """Write calls as a Chrome trace file, which can be opened with ``chrome://tracing`` or https://ui.perfetto.dev
+    and shows each process as a flame graph over time.
+
+    Args:
+        fileName (str): name of the trace file
+        traceEvents (list): (process, task, module, start time, duration, simulation time) of each call, with the
+            times in nano-seconds and ``module`` set to None for the call of a whole task
+    """
+    t0 = min((event[3] for event in traceEvents), default=0)
+    processIds = {}
+    events = []
+    for process, task, module, start, duration, simTime in traceEvents:
+        pid = processIds.setdefault(process, len(processIds) + 1)
+        events.append({"name": task if module is None else module,
+                       "cat": "task" if module is None else "module",
+                       "ph": "X", "pid": pid, "tid": pid,
+                       "ts": (start - t0) / 1000., "dur": duration / 1000.,
+                       "args": {"task": task, "simTime": simTime}})
+    for process, pid in processIds.items():
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process}})
+    with open(fileName, "w") as traceFile:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, traceFile)
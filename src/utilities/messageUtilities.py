@@ -0,0 +1,61 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+"""
+Support functions to inspect the Python wrapped C++ and C messages, such as their message type and the addresses of
+their payload and header.  They are used by the thread partitioning of
+:meth:`SimulationBaseClass.SimBaseClass.partitionThreads` and by the event conditions of :mod:`eventConditions`.
+"""
+
+import importlib
+
+from Basilisk.architecture import messaging
+from Basilisk.architecture import sim_model
+
+
+def messageType(msg):
+    """Return the message type name, such as ``SCStatesMsg``, of a C++ message, a C++ message reader or a C message,
+    or None if the object is not a message."""
+    typeName = type(msg).__name__
+    if typeName.endswith("_C") and hasattr(msg, "payloadPointer"):
+        return typeName[:-2]
+    if typeName.endswith("MsgReader") and hasattr(msg, "isSubscribedTo"):
+        return typeName[:-len("Reader")]
+    if typeName.endswith("Msg") and hasattr(msg, "addSubscriber"):
+        return typeName
+    return None
+
+
+def messageAddresses(msgType, msg):
+    """Return the payload address, header address and payload size of a C++ or C output message"""
+    cMsgType = getattr(importlib.import_module("Basilisk.architecture.messaging." + msgType + "Payload"),
+                       msgType + "_C")
+    if type(msg) != cMsgType:
+        # a C message subscribed to a C++ message points to the C++ message payload and header
+        cMsg = cMsgType()
+        cMsg.subscribeTo(msg)
+        msg = cMsg
+    payloadSize = getattr(messaging, msgType)().getPayloadSize()
+    return (sim_model.getObjectAddress(msg.payloadPointer), sim_model.getObjectAddress(msg.headerPointer),
+            payloadSize)
+
+
+def createBufferMessage(msgType):
+    """Return a C message of the given type that holds its own payload, to be used as buffer message"""
+    cMsgType = getattr(importlib.import_module("Basilisk.architecture.messaging." + msgType + "Payload"),
+                       msgType + "_C")
+    return cMsgType().init()
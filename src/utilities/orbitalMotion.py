@@ -23,6 +23,7 @@ import sys
 import math
 import numpy as np
 from numpy import linalg as la
+from Basilisk.utilities.RigidBodyKinematics import rowDot, rowNorm
 
 
 class ClassicElements(object):
@@ -1186,3 +1187,367 @@ def hill2rv(rc_N, vc_N, rho_H, rhoPrime_H):
     return rd_N, vd_N
 
 
+#
+# Array versions of the orbit element and anomaly conversions.  These functions broadcast over numpy arrays,
+# e.g. (N,3) arrays of position and velocity vectors or structured arrays of orbit elements, and evaluate the
+# same expressions as the scalar functions above.
+#
+
+#: numpy structured type of a classical orbit element set, the array counterpart of :class:`ClassicElements`
+classicElementsDtype = np.dtype([('a', np.float64), ('e', np.float64), ('i', np.float64), ('Omega', np.float64),
+                                 ('omega', np.float64), ('f', np.float64), ('rmag', np.float64),
+                                 ('alpha', np.float64), ('rPeriap', np.float64), ('rApoap', np.float64)])
+
+
+def classicElementsToArray(elements):
+    """
+    Convert a :class:`ClassicElements` object, or a list of them, into a structured array of type
+    :data:`classicElementsDtype`.  Elements that are not set are stored as NaN.
+
+    :param elements: ClassicElements object or list of ClassicElements objects
+    :return: structured array of orbit elements
+    """
+    elementList = [elements] if isinstance(elements, ClassicElements) else list(elements)
+    elementArray = np.full(len(elementList), np.nan, dtype=classicElementsDtype)
+    for name in classicElementsDtype.names:
+        elementArray[name] = [np.nan if getattr(oe, name) is None else getattr(oe, name) for oe in elementList]
+    return elementArray
+
+
+def classicElementsFromArray(elementRecord):
+    """
+    Convert one record of a structured orbit element array into a :class:`ClassicElements` object.
+
+    :param elementRecord: record of type :data:`classicElementsDtype`
+    :return: ClassicElements object
+    """
+    elements = ClassicElements()
+    for name in classicElementsDtype.names:
+        setattr(elements, name, float(elementRecord[name]))
+    return elements
+
+
+def _checkEccentricityArray(e, functionName, elliptic):
+    if elliptic:
+        valid = np.logical_and(e >= 0.0, e < 1.0)
+        limits = '0 <= e < 1'
+    else:
+        valid = e > 1.0
+        limits = 'e > 1'
+    if not np.all(valid):
+        raise ValueError('Error: {0}() received e = {1}, the value of e should be {2}'.format(
+            functionName, str(np.asarray(e)[np.logical_not(valid)].ravel()[0]), limits))
+
+
+def E2fArray(Ecc, e):
+    """
+    Array version of :func:`E2f`, maps eccentric anomaly angles into true anomaly angles
+
+    :param Ecc: array of eccentric anomalies (rad)
+    :param e: array of eccentricities (0 <= e < 1), broadcast against Ecc
+    :return: f, array of true anomalies (rad)
+    """
+    Ecc, e = np.broadcast_arrays(np.asarray(Ecc, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'E2fArray', True)
+    return 2.0 * np.arctan2(np.sqrt(1.0 + e) * np.sin(Ecc / 2.0), np.sqrt(1.0 - e) * np.cos(Ecc / 2.0))
+
+
+def E2MArray(Ecc, e):
+    """
+    Array version of :func:`E2M`, maps eccentric anomaly angles into mean elliptic anomaly angles
+
+    :param Ecc: array of eccentric anomalies (rad)
+    :param e: array of eccentricities (0 <= e < 1), broadcast against Ecc
+    :return: M, array of mean elliptic anomalies (rad)
+    """
+    Ecc, e = np.broadcast_arrays(np.asarray(Ecc, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'E2MArray', True)
+    return Ecc - e * np.sin(Ecc)
+
+
+def f2EArray(f, e):
+    """
+    Array version of :func:`f2E`, maps true anomaly angles into eccentric anomaly angles
+
+    :param f: array of true anomalies (rad)
+    :param e: array of eccentricities (0 <= e < 1), broadcast against f
+    :return: Ecc, array of eccentric anomalies (rad)
+    """
+    f, e = np.broadcast_arrays(np.asarray(f, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'f2EArray', True)
+    return 2.0 * np.arctan2(np.sqrt(1.0 - e) * np.sin(f / 2.0), np.sqrt(1.0 + e) * np.cos(f / 2.0))
+
+
+def f2HArray(f, e):
+    """
+    Array version of :func:`f2H`, maps true anomaly angles into hyperbolic anomaly angles
+
+    :param f: array of true anomalies (rad)
+    :param e: array of eccentricities (e > 1), broadcast against f
+    :return: H, array of hyperbolic anomalies (rad)
+    """
+    f, e = np.broadcast_arrays(np.asarray(f, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'f2HArray', False)
+    return 2.0 * np.arctanh(np.sqrt((e - 1.0) / (e + 1.0)) * np.tan(f / 2.0))
+
+
+def H2fArray(H, e):
+    """
+    Array version of :func:`H2f`, maps hyperbolic anomaly angles into true anomaly angles
+
+    :param H: array of hyperbolic anomalies (rad)
+    :param e: array of eccentricities (e > 1), broadcast against H
+    :return: f, array of true anomalies (rad)
+    """
+    H, e = np.broadcast_arrays(np.asarray(H, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'H2fArray', False)
+    return 2.0 * np.arctan(np.sqrt((e + 1.0) / (e - 1.0)) * np.tanh(H / 2.0))
+
+
+def H2NArray(H, e):
+    """
+    Array version of :func:`H2N`, maps hyperbolic anomaly angles into mean hyperbolic anomaly angles
+
+    :param H: array of hyperbolic anomalies (rad)
+    :param e: array of eccentricities (e > 1), broadcast against H
+    :return: N, array of mean hyperbolic anomalies (rad)
+    """
+    H, e = np.broadcast_arrays(np.asarray(H, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'H2NArray', False)
+    return e * np.sinh(H) - H
+
+
+def _newtonArray(x0, step, functionName):
+    # Newton iteration that stops on each element after the same number of steps as the scalar iteration
+    x = np.array(x0, dtype=np.float64)
+    active = np.ones(x.shape, dtype=bool)
+    count = 0
+    while np.any(active):
+        dx = step(x[active], active)
+        x[active] -= dx
+        active[active] = np.fabs(dx) > eps
+        count += 1
+        if count > maxIteration:
+            print('Iteration error in {0}() for {1} elements'.format(functionName, np.count_nonzero(active)))
+            break
+    return x
+
+
+def M2EArray(M, e):
+    """
+    Array version of :func:`M2E`, solves Kepler's equation for the eccentric anomaly with a Newton iteration
+    that runs on all elements at once
+
+    :param M: array of mean elliptic anomalies (rad)
+    :param e: array of eccentricities (0 <= e < 1), broadcast against M
+    :return: Ecc, array of eccentric anomalies (rad)
+    """
+    M, e = np.broadcast_arrays(np.asarray(M, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'M2EArray', True)
+    return _newtonArray(M, lambda E1, active: (E1 - e[active] * np.sin(E1) - M[active])
+                                              / (1 - e[active] * np.cos(E1)), 'M2EArray')
+
+
+def N2HArray(N, e):
+    """
+    Array version of :func:`N2H`, solves the hyperbolic Kepler equation with a Newton iteration
+    that runs on all elements at once
+
+    :param N: array of mean hyperbolic anomalies (rad)
+    :param e: array of eccentricities (e > 1), broadcast against N
+    :return: H, array of hyperbolic anomalies (rad)
+    """
+    N, e = np.broadcast_arrays(np.asarray(N, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    _checkEccentricityArray(e, 'N2HArray', False)
+    return _newtonArray(N, lambda H1, active: (e[active] * np.sinh(H1) - H1 - N[active])
+                                              / (e[active] * np.cosh(H1) - 1.0), 'N2HArray')
+
+
+def elem2rvArray(mu, elements):
+    """
+    Array version of :func:`elem2rv`, translates orbit element sets into inertial Cartesian position and
+    velocity vectors.
+
+    :param mu: gravitational parameter
+    :param elements: structured array of type :data:`classicElementsDtype`, or any object with the
+        array attributes or fields ``a``, ``e``, ``i``, ``Omega``, ``omega`` and ``f``
+    :return: rVec, (N,3) array of position vectors
+    :return: vVec, (N,3) array of velocity vectors
+    """
+    getField = (lambda name: elements[name]) if isinstance(elements, np.ndarray) \
+        else (lambda name: getattr(elements, name))
+    a, e, inc, Omega, omega, f = np.broadcast_arrays(*[np.asarray(getField(name), dtype=np.float64)
+                                                      for name in ['a', 'e', 'i', 'Omega', 'omega', 'f']])
+
+    if np.any(1.0 + e * np.cos(f) < tolerance):
+        print('WARNING: Radius is near infinite in elem2rv conversion.')
+
+    # the trigonometric functions of each angle are evaluated once
+    cosOmega, sinOmega = np.cos(Omega), np.sin(Omega)
+    cosomega, sinomega = np.cos(omega), np.sin(omega)
+    cosi, sini = np.cos(inc), np.sin(inc)
+
+    # Calculate the semilatus rectum and the radius #
+    p = a * (1.0 - e * e)
+    r = p / (1.0 + e * np.cos(f))
+    theta = omega + f
+    costheta, sintheta = np.cos(theta), np.sin(theta)
+    rVec = np.empty(a.shape + (3,))
+    rVec[..., 0] = r * (costheta * cosOmega - cosi * sintheta * sinOmega)
+    rVec[..., 1] = r * (costheta * sinOmega + cosi * sintheta * cosOmega)
+    rVec[..., 2] = r * (sintheta * sini)
+
+    parabolic = np.fabs(p) < tolerance
+    if np.any(parabolic):
+        if np.any(np.fabs(1.0 - e[parabolic]) < tolerance):
+            # Rectilinear orbit #
+            raise ValueError('elem2rv does not support rectilinear orbits')
+        # Parabola #
+        p = np.where(parabolic, 2.0 * -a, p)
+
+    h = np.sqrt(mu * p)
+    vVec = np.empty(a.shape + (3,))
+    vVec[..., 0] = -mu / h * (cosOmega * (e * sinomega + sintheta) + cosi * (e * cosomega + costheta) * sinOmega)
+    vVec[..., 1] = -mu / h * (sinOmega * (e * sinomega + sintheta) - cosi * (e * cosomega + costheta) * cosOmega)
+    vVec[..., 2] = mu / h * (e * cosomega + costheta) * sini
+
+    return rVec, vVec
+
+
+def rv2elemArray(mu, rVec, vVec):
+    """
+    Array version of :func:`rv2elem`, translates inertial Cartesian position and velocity vectors into
+    classical orbit elements.  Rows with NaN position or velocity values return NaN elements.
+
+    :param mu: gravitational parameter
+    :param rVec: (N,3) array of position vectors
+    :param vVec: (N,3) array of velocity vectors
+    :return: structured array of type :data:`classicElementsDtype` with N orbit element sets
+    """
+    rVec, vVec = np.broadcast_arrays(np.asarray(rVec, dtype=np.float64), np.asarray(vVec, dtype=np.float64))
+    elements = np.empty(rVec.shape[:-1], dtype=classicElementsDtype)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Calculate the specific angular momentum and its magnitude #
+        hVec = np.cross(rVec, vVec)
+        h = rowNorm(hVec)
+        p = h * h / mu
+
+        # Calculate the line of nodes #
+        nVec = np.cross(np.array([0.0, 0.0, 1.0]), hVec)
+        n = rowNorm(nVec)
+
+        # Orbit eccentricity and energy #
+        r = rowNorm(rVec)
+        v = rowNorm(vVec)
+        rDotV = rowDot(rVec, vVec)
+        eVec = (v * v / mu - 1.0 / r)[..., None] * rVec
+        eVec = eVec - (rDotV / mu)[..., None] * vVec
+        e = rowNorm(eVec)
+        elements['e'] = e
+        elements['rmag'] = r
+        elements['rPeriap'] = p / (1.0 + e)
+
+        # compute semi-major axis #
+        alpha = 2.0 / r - v * v / mu
+        elements['alpha'] = alpha
+        conic = np.fabs(alpha) > eps
+        elements['a'] = np.where(conic, 1.0 / alpha, -(p / 2.))
+        elements['rApoap'] = np.where(conic, p / (1.0 - e), -1.0)
+
+        # Calculate the inclination #
+        inc = np.arccos(hVec[..., 2] / h)
+        elements['i'] = inc
+
+        eccentric = e >= 1e-11
+        inclined = inc >= 1e-11
+
+        # ascending node of the inclined orbits #
+        Omega = np.arccos(nVec[..., 0] / n)
+        Omega = np.where(nVec[..., 1] < 0.0, 2.0 * np.pi - Omega, Omega)
+        elements['Omega'] = np.where(inclined, Omega, 0.0)
+
+        # argument of periapsis, or true longitude of periapsis of the equatorial orbits #
+        omegaInclined = np.arccos(np.clip(rowDot(nVec, eVec) / n / e, a_min=-1.0, a_max=1.0))
+        omegaInclined = np.where(eVec[..., 2] < 0.0, 2.0 * np.pi - omegaInclined, omegaInclined)
+        omegaEquatorial = np.arccos(eVec[..., 0] / e)
+        omegaEquatorial = np.where(eVec[..., 1] < 0.0, 2.0 * np.pi - omegaEquatorial, omegaEquatorial)
+        elements['omega'] = np.where(eccentric, np.where(inclined, omegaInclined, omegaEquatorial), 0.0)
+
+        # true anomaly, argument of latitude of the circular inclined orbits, or true longitude #
+        fEccentric = np.arccos(np.clip(rowDot(eVec, rVec) / e / r, a_min=-1.0, a_max=1.0))
+        fEccentric = np.where(rDotV < 0.0, 2.0 * np.pi - fEccentric, fEccentric)
+        fCircInclined = np.arccos(np.clip(rowDot(nVec, rVec) / n / r, a_min=-1.0, a_max=1.0))
+        fCircInclined = np.where(rVec[..., 2] < 0.0, 2.0 * np.pi - fCircInclined, fCircInclined)
+        fCircEquatorial = np.arccos(rVec[..., 0] / r)
+        fCircEquatorial = np.where(rVec[..., 1] < 0, 2.0 * np.pi - fCircEquatorial, fCircEquatorial)
+        f = np.where(eccentric, fEccentric, np.where(inclined, fCircInclined, fCircEquatorial))
+        f = np.where(np.logical_and(e > 1.0, np.fabs(f) > np.pi), f - np.copysign(2.0 * np.pi, f), f)
+        elements['f'] = f
+
+    invalid = np.logical_or(np.isnan(np.sum(rVec, axis=-1)), np.isnan(np.sum(vVec, axis=-1)))
+    if np.any(invalid):
+        print("ERROR: received NAN rVec or vVec values.")
+        for name in classicElementsDtype.names:
+            elements[name][invalid] = np.nan
+
+    return elements
+
+
+def hillFrameArray(rc_N, vc_N):
+    """
+    Array version of :func:`hillFrame`, computes the Hill frame DCMs HN
+
+    :param rc_N: (N,3) array of inertial position vectors
+    :param vc_N: (N,3) array of inertial velocity vectors
+    :return: HN: (N,3,3) array of DCMs that map from the inertial frame N to the Hill (i.e. orbit) frame H
+    """
+    rc_N, vc_N = np.broadcast_arrays(np.asarray(rc_N, dtype=np.float64), np.asarray(vc_N, dtype=np.float64))
+    ir = rc_N / rowNorm(rc_N)[..., None]
+    h = np.cross(rc_N, vc_N)
+    ih = h / rowNorm(h)[..., None]
+    itheta = np.cross(ih, ir)
+
+    return np.stack([ir, itheta, ih], axis=-2)
+
+
+def rv2hillArray(rc_N, vc_N, rd_N, vd_N):
+    """
+    Array version of :func:`rv2hill`, expresses the deputy position and velocity vectors in the chief Hill frame.
+
+    :param rc_N: (N,3) array of chief inertial position vectors
+    :param vc_N: (N,3) array of chief inertial velocity vectors
+    :param rd_N: (N,3) array of deputy inertial position vectors
+    :param vd_N: (N,3) array of deputy inertial velocity vectors
+    :return: rho_H, rhoPrime_H: (N,3) arrays of Hill frame relative position and velocity vectors
+    """
+    rc_N, vc_N, rd_N, vd_N = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in [rc_N, vc_N, rd_N, vd_N]])
+    HN = hillFrameArray(rc_N, vc_N)
+    fDot = rowNorm(np.cross(rc_N, vc_N)) / (rowNorm(rc_N) ** 2)
+    omega_HN_H = np.zeros(rc_N.shape)
+    omega_HN_H[..., 2] = fDot
+    rho_H = np.matmul(HN, (rd_N - rc_N)[..., None])[..., 0]
+    rhoPrime_H = np.matmul(HN, (vd_N - vc_N)[..., None])[..., 0] - np.cross(omega_HN_H, rho_H)
+    return rho_H, rhoPrime_H
+
+
+def hill2rvArray(rc_N, vc_N, rho_H, rhoPrime_H):
+    """
+    Array version of :func:`hill2rv`, maps the deputy position and velocity vectors relative to the chief Hill frame
+    to the inertial frame.
+
+    :param rc_N: (N,3) array of chief inertial position vectors
+    :param vc_N: (N,3) array of chief inertial velocity vectors
+    :param rho_H: (N,3) array of deputy Hill relative position vectors
+    :param rhoPrime_H: (N,3) array of deputy Hill relative velocity vectors
+    :return: rd_N, vd_N: (N,3) arrays of deputy inertial position and velocity vectors
+    """
+    rc_N, vc_N, rho_H, rhoPrime_H = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64)
+                                                          for x in [rc_N, vc_N, rho_H, rhoPrime_H]])
+    NH = np.swapaxes(hillFrameArray(rc_N, vc_N), -1, -2)
+    fDot = rowNorm(np.cross(rc_N, vc_N)) / (rowNorm(rc_N) ** 2)
+    omega_HN_H = np.zeros(rc_N.shape)
+    omega_HN_H[..., 2] = fDot
+    rd_N = rc_N + np.matmul(NH, rho_H[..., None])[..., 0]
+    vd_N = vc_N + np.matmul(NH, (rhoPrime_H + np.cross(omega_HN_H, rho_H))[..., None])[..., 0]
+    return rd_N, vd_N
@@ -372,7 +372,7 @@ class gravBodyFactory(object):
 
 
 
-def loadGravFromFile(fileName, spherHarm, maxDeg=2):
+def loadGravFromFile(fileName, spherHarm, maxDeg=2, useCache=True):
     """
             Load the gravitational body spherical harmonics coefficients from a file.
 
@@ -384,6 +384,9 @@ def loadGravFromFile(fileName, spherHarm, maxDeg=2):
                 The spherical harmonics container of the gravity body.
             maxDeg : integer
                 maximum degree of spherical harmonics to load
+            useCache : bool
+                keep the parsed coefficients in the binary data cache, if the ``BSK_DATA_CACHE`` environment
+                variable sets its directory
 
 
             Notes
@@ -392,26 +395,27 @@ def loadGravFromFile(fileName, spherHarm, maxDeg=2):
             coefficients from a data file.  The default harmonic degree is 2 unless specified.
             Note that this function calls the gravityEffector function loadGravFromFile().
     """
-    loadGravFromFile_python(fileName, spherHarm, maxDeg)
+    loadGravFromFile_python(fileName, spherHarm, maxDeg, useCache)
 
-def loadPolyFromFile(fileName, poly):
+def loadPolyFromFile(fileName, poly, useCache=True):
     """
-            Load the gravitational body spherical harmonics coefficients from a file.
+            Load the gravitational body polyhedral shape model from a file.
 
             Parameters
             ----------
             fileName : string
                 The full path to the specified data file.
-            spherHarm:
-                The spherical harmonics container of the gravity body.
-            maxDeg : integer
-                maximum degree of spherical harmonics to load
+            poly:
+                The polyhedral container of the gravity body.
+            useCache : bool
+                keep the parsed shape model, facet normals and volume in the binary data cache, if the
+                ``BSK_DATA_CACHE`` environment variable sets its directory
 
 
             Notes
             -----
-            This function is a convenience utility for loading in the spherical harmonics
-            coefficients from a data file.  The default harmonic degree is 2 unless specified.
-            Note that this function calls the gravityEffector function loadGravFromFile().
+            This function is a convenience utility for loading in the polyhedral shape
+            model from a ``.tab``, ``.obj`` or ``.txt`` data file.
+            Note that this function calls the gravityEffector function loadPolyFromFile().
     """
-    loadPolyFromFile_python(fileName, poly)
+    loadPolyFromFile_python(fileName, poly, useCache)
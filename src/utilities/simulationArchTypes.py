@@ -114,6 +114,8 @@ class PythonTaskClass(object):
         self.nextTaskTime = 0
         self.taskActive = taskActive
         self.parentProc = parentProc
+        self.profiler = None
+        self.profileProcessName = ""
 
     def updateParentProc(self, newParentProc):
         self.parentProc = newParentProc
@@ -137,13 +139,27 @@ class PythonTaskClass(object):
             i += 1
         self.modelList.append(newModel)
 
+    def setProfiler(self, profiler, processName=""):
+        """Time the model calls with the given ExecutionProfiler, or stop timing them if it is None"""
+        self.profiler = profiler
+        self.profileProcessName = processName
+
     def executeModelList(self, currentTime):
         self.nextTaskTime = currentTime + self.rate
         if not self.taskActive:
             return
+        if self.profiler is not None:
+            self.profiler.timeCall((self.profileProcessName, self.name, None), currentTime,
+                                   self.executeProfiledModelList, currentTime)
+            return
         for model in self.modelList:
             model.updateState(currentTime)
 
+    def executeProfiledModelList(self, currentTime):
+        for model in self.modelList:
+            self.profiler.timeCall((self.profileProcessName, self.name, model.modelName), currentTime,
+                                   model.updateState, currentTime)
+
 
 class PythonProcessClass(ProcessBaseClass):
     def __init__(self, procName, priority=-1):
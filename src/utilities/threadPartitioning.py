@@ -0,0 +1,135 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2022, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+"""
+Support functions to distribute the processes of a simulation over threads, see
+:meth:`SimulationBaseClass.SimBaseClass.partitionThreads`.  The processes are connected by the messages their modules
+write and read.  The partition balances the measured execution time of the threads while it keeps the processes that
+exchange many messages on the same thread.
+"""
+
+from Basilisk.utilities import messageUtilities
+
+
+def findModuleMessages(module):
+    """Return the output messages and the input messages of a module as two lists of (message type, message).
+    The messages are found through the attributes whose name contains ``Msg``, including vectors of messages.
+    A C message is an output message if it holds its own payload, otherwise it is an input message."""
+    outMsgs = []
+    inMsgs = []
+    candidates = []
+    for name in dir(module):
+        if name.startswith("_") or "Msg" not in name:
+            continue
+        try:
+            attr = getattr(module, name)
+        except Exception:
+            continue
+        if messageUtilities.messageType(attr) is None and hasattr(attr, "__len__") and hasattr(attr, "__getitem__") \
+                and not isinstance(attr, str):
+            candidates.extend(attr[k] for k in range(len(attr)))
+        else:
+            candidates.append(attr)
+    for msg in candidates:
+        msgType = messageUtilities.messageType(msg)
+        if msgType is None:
+            continue
+        if type(msg).__name__.endswith("_C"):
+            (outMsgs if msg.isSubscribedTo(msg) else inMsgs).append((msgType, msg))
+        elif type(msg).__name__.endswith("Reader"):
+            inMsgs.append((msgType, msg))
+        else:
+            outMsgs.append((msgType, msg))
+    return outMsgs, inMsgs
+
+
+def findMessageLinks(processModules):
+    """Return the message links between the modules of the processes.  ``processModules`` holds the list of module
+    objects of each process.  Each link is a tuple (writing process index, reading process index, message type,
+    output message, input message)."""
+    writers = {}
+    readers = []
+    for procIndex, modules in enumerate(processModules):
+        for module in modules:
+            outMsgs, inMsgs = findModuleMessages(module)
+            for msgType, msg in outMsgs:
+                writers.setdefault(msgType, []).append((procIndex, msg))
+            for msgType, msg in inMsgs:
+                readers.append((procIndex, msgType, msg))
+    links = []
+    for readProc, msgType, inMsg in readers:
+        for writeProc, outMsg in writers.get(msgType, []):
+            if inMsg.isSubscribedTo(outMsg):
+                links.append((writeProc, readProc, msgType, outMsg, inMsg))
+                break
+    return links
+
+
+def partitionProcesses(costs, links, numThreads, imbalance=0.1):
+    """Assign the processes to threads and return the thread index of each process.
+
+    The processes are placed from the most to the least expensive one on the thread with which they share the most
+    message links, among the threads whose execution time stays below the balance limit, and otherwise on the least
+    loaded thread.  Single processes are then moved between threads as long as this removes cross-thread links
+    without exceeding the balance limit.
+
+    Args:
+        costs (list): execution time of each process
+        links (list): (writing process index, reading process index) of each message link
+        numThreads (int): number of threads
+        imbalance (float): allowed relative excess of the thread execution time over the mean execution time
+    """
+    numProcs = len(costs)
+    numThreads = max(1, min(numThreads, numProcs))
+    limit = max(sum(costs) / numThreads * (1.0 + imbalance), max(costs, default=0.0))
+    neighbors = [dict() for _ in range(numProcs)]
+    for writeProc, readProc in links:
+        if writeProc != readProc:
+            neighbors[writeProc][readProc] = neighbors[writeProc].get(readProc, 0) + 1
+            neighbors[readProc][writeProc] = neighbors[readProc].get(writeProc, 0) + 1
+
+    assignment = [-1] * numProcs
+    loads = [0.0] * numThreads
+
+    def affinity(proc, thread):
+        return sum(weight for other, weight in neighbors[proc].items() if assignment[other] == thread)
+
+    for proc in sorted(range(numProcs), key=lambda k: -costs[k]):
+        fitting = [t for t in range(numThreads) if loads[t] + costs[proc] <= limit]
+        if fitting:
+            thread = max(fitting, key=lambda t: (affinity(proc, t), -loads[t]))
+        else:
+            thread = min(range(numThreads), key=lambda t: loads[t])
+        assignment[proc] = thread
+        loads[thread] += costs[proc]
+
+    for _ in range(numProcs):
+        moved = False
+        for proc in range(numProcs):
+            current = assignment[proc]
+            for thread in range(numThreads):
+                if thread == current or loads[thread] + costs[proc] > limit:
+                    continue
+                if affinity(proc, thread) > affinity(proc, current):
+                    assignment[proc] = thread
+                    loads[current] -= costs[proc]
+                    loads[thread] += costs[proc]
+                    current = thread
+                    moved = True
+        if not moved:
+            break
+    return assignment